@@ -10,10 +10,11 @@ __email__ = 'fabio@ladder.dev.br'
 __license__ = 'MIT'
 
 # Exports principais
+from pypix_api.auth.async_oauth2 import AsyncOAuth2Client
 from pypix_api.auth.oauth2 import OAuth2Client
-from pypix_api.banks.bb import BBPixAPI
-from pypix_api.banks.sicoob import SicoobPixAPI
-from pypix_api.banks.sicredi import SicrediPixAPI
+from pypix_api.banks.bb import AsyncBBPixAPI, BBPixAPI
+from pypix_api.banks.sicoob import AsyncSicoobPixAPI, SicoobPixAPI
+from pypix_api.banks.sicredi import AsyncSicrediPixAPI, SicrediPixAPI
 from pypix_api.models.enums import (
     PoliticaRetentativa,
     StatusCob,
@@ -25,6 +26,10 @@ from pypix_api.models.pix import PixCobranca
 from pypix_api.utils.identificadores import gerar_id_rec
 
 __all__ = [
+    'AsyncBBPixAPI',
+    'AsyncOAuth2Client',
+    'AsyncSicoobPixAPI',
+    'AsyncSicrediPixAPI',
     'BBPixAPI',
     'OAuth2Client',
     'PixCobranca',
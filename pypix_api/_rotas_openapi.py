@@ -0,0 +1,55 @@
+"""Operações da API Pix do BACEN (``openapi.yaml``).
+
+Gerado por ``scripts/gera_rotas.py`` — não edite à mão.
+"""
+
+ROTAS_OPENAPI: tuple[tuple[str, str], ...] = (
+    ('PUT', '/cob/{txid}'),
+    ('PATCH', '/cob/{txid}'),
+    ('GET', '/cob/{txid}'),
+    ('POST', '/cob'),
+    ('GET', '/cob'),
+    ('PUT', '/cobv/{txid}'),
+    ('PATCH', '/cobv/{txid}'),
+    ('GET', '/cobv/{txid}'),
+    ('GET', '/cobv'),
+    ('PUT', '/lotecobv/{id}'),
+    ('PATCH', '/lotecobv/{id}'),
+    ('GET', '/lotecobv/{id}'),
+    ('GET', '/lotecobv'),
+    ('POST', '/locrec'),
+    ('GET', '/locrec'),
+    ('GET', '/locrec/{id}'),
+    ('DELETE', '/locrec/{id}/idRec'),
+    ('POST', '/loc'),
+    ('GET', '/loc'),
+    ('GET', '/loc/{id}'),
+    ('DELETE', '/loc/{id}/txid'),
+    ('GET', '/pix/{e2eid}'),
+    ('GET', '/pix'),
+    ('PUT', '/pix/{e2eid}/devolucao/{id}'),
+    ('GET', '/pix/{e2eid}/devolucao/{id}'),
+    ('PUT', '/webhook/{chave}'),
+    ('GET', '/webhook/{chave}'),
+    ('DELETE', '/webhook/{chave}'),
+    ('GET', '/webhook'),
+    ('PUT', '/webhookrec'),
+    ('GET', '/webhookrec'),
+    ('DELETE', '/webhookrec'),
+    ('PUT', '/webhookcobr'),
+    ('GET', '/webhookcobr'),
+    ('DELETE', '/webhookcobr'),
+    ('GET', '/rec/{idRec}'),
+    ('PATCH', '/rec/{idRec}'),
+    ('GET', '/rec'),
+    ('POST', '/rec'),
+    ('POST', '/solicrec'),
+    ('GET', '/solicrec/{idSolicRec}'),
+    ('PATCH', '/solicrec/{idSolicRec}'),
+    ('PUT', '/cobr/{txid}'),
+    ('PATCH', '/cobr/{txid}'),
+    ('GET', '/cobr/{txid}'),
+    ('POST', '/cobr'),
+    ('GET', '/cobr'),
+    ('POST', '/cobr/{txid}/retentativa/{data}'),
+)
@@ -0,0 +1,153 @@
+"""Timeout de leitura adaptativo, por banco e operação.
+
+Um único ``timeout`` serve mal a todas as operações: ``(5.0, 30.0)`` é folgado
+demais para ``GET /cob/{txid}``, que responde em ~200 ms, e pode ser apertado
+para a listagem de ``GET /pix`` ou o ``PUT /lotecobv``. Com
+:class:`AdaptiveTimeouts`, cada operação — o rótulo de
+:meth:`~pypix_api.banks.base.BankPixAPIBase.operacao`, como ``cob.item.get`` —
+tem o tempo de leitura ajustado a ``multiplier`` vezes o percentil
+``percentile`` das latências observadas, entre ``min_read`` e o timeout de
+leitura configurado no cliente. Uma consulta presa é cortada cedo, e um
+endpoint lento, mas saudável, continua com o tempo de que precisa.
+
+Até juntar ``min_samples`` latências, a operação usa o timeout configurado. O
+timeout de conexão não muda, e um ``timeout`` passado explicitamente na
+chamada também não.
+
+Uma requisição que estoura o tempo entra na janela com o próprio timeout como
+latência: se o PSP ficar mais lento de verdade, os timeouts empurram o
+percentil para cima e o limite cresce com ele, em vez de cortar todas as
+chamadas.
+
+O limite de cada operação é publicado como o *gauge*
+``adaptive_timeout.read`` no :class:`~pypix_api.metrics.MetricsCollector`,
+com as tags ``bank`` e ``operation``, quando muda e no máximo uma vez por
+segundo.
+"""
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+
+from pypix_api.metrics import ThrottledGauge
+
+
+@dataclass(frozen=True)
+class AdaptiveTimeoutPolicy:
+    """Como o timeout de leitura é derivado das latências.
+
+    Attributes:
+        percentile: Percentil (0 a 1) das latências usado como base
+        multiplier: Fator aplicado ao percentil
+        min_read: Piso do timeout de leitura, em segundos
+        min_samples: Latências observadas antes de o timeout adaptativo valer
+        window_size: Quantas latências recentes de cada operação são guardadas
+        recompute_every: A cada quantas latências novas o percentil é
+            recalculado
+    """
+
+    percentile: float = 0.99
+    multiplier: float = 3.0
+    min_read: float = 1.0
+    min_samples: int = 50
+    window_size: int = 500
+    recompute_every: int = 10
+
+    def __post_init__(self) -> None:
+        if not 0 < self.percentile < 1:
+            raise ValueError('percentile deve estar em (0, 1).')
+        if self.multiplier < 1:
+            raise ValueError('multiplier deve ser ao menos 1.')
+        if self.min_read <= 0:
+            raise ValueError('min_read deve ser positivo.')
+        if not 1 <= self.min_samples <= self.window_size:
+            raise ValueError('min_samples deve estar entre 1 e window_size.')
+        if self.recompute_every < 1:
+            raise ValueError('recompute_every deve ser ao menos 1.')
+
+
+class _Janela:
+    """Latências recentes de uma operação e o limite calculado sobre elas."""
+
+    __slots__ = ('gauge', 'latencias', 'limite', 'novas')
+
+    def __init__(self, tamanho: int, gauge: ThrottledGauge) -> None:
+        self.latencias: deque[float] = deque(maxlen=tamanho)
+        self.limite: float | None = None
+        self.novas = 0
+        self.gauge = gauge
+
+
+class AdaptiveTimeouts:
+    """Latências e timeouts de leitura por ``(banco, operação)``.
+
+    Seguro entre threads. Compartilhe a mesma instância entre os clientes de
+    um processo para que todos aprendam com as mesmas latências.
+
+    Args:
+        policy: Política aplicada a todas as operações
+    """
+
+    def __init__(self, policy: AdaptiveTimeoutPolicy | None = None) -> None:
+        self.policy = policy or AdaptiveTimeoutPolicy()
+        self._janelas: dict[tuple[str, str], _Janela] = {}
+        self._lock = threading.Lock()
+
+    def leitura(self, banco: str, operacao: str, teto: float | None) -> float | None:
+        """Timeout de leitura de ``(banco, operacao)``.
+
+        Args:
+            banco: Código do banco
+            operacao: Rótulo da operação (ex.: ``'cob.item.get'``)
+            teto: Timeout de leitura configurado no cliente; ``None`` se
+                ilimitado
+
+        Returns:
+            float | None: O limite adaptativo, ou ``None`` enquanto não houver
+            latências suficientes
+        """
+        janela = self._janelas.get((banco, operacao))
+        if janela is None or janela.limite is None:
+            return None
+        if teto is not None and janela.limite > teto:
+            return teto
+        return janela.limite
+
+    def observa(self, banco: str, operacao: str, duracao: float) -> None:
+        """Registra a latência de uma requisição (ou o timeout que ela estourou)."""
+        politica = self.policy
+        chave = (banco, operacao)
+        with self._lock:
+            janela = self._janelas.get(chave)
+            if janela is None:
+                janela = self._janelas[chave] = _Janela(
+                    politica.window_size,
+                    ThrottledGauge(
+                        'adaptive_timeout.read',
+                        {'bank': banco, 'operation': operacao},
+                    ),
+                )
+            janela.latencias.append(duracao)
+            janela.novas += 1
+            if (
+                len(janela.latencias) < politica.min_samples
+                or janela.novas < politica.recompute_every
+            ):
+                return
+            janela.novas = 0
+            ordenadas = sorted(janela.latencias)
+            posicao = min(len(ordenadas) - 1, int(politica.percentile * len(ordenadas)))
+            janela.limite = max(
+                politica.min_read, ordenadas[posicao] * politica.multiplier
+            )
+            limite = janela.limite
+        janela.gauge.set(limite)
+
+    def timeouts(self) -> dict[tuple[str, str], float]:
+        """Limites já calculados, por ``(banco, operação)``, antes do teto."""
+        with self._lock:
+            return {
+                chave: janela.limite
+                for chave, janela in self._janelas.items()
+                if janela.limite is not None
+            }
@@ -0,0 +1,193 @@
+"""Cliente OAuth2 assíncrono, sobre ``httpx.AsyncClient``.
+
+Reaproveita do :class:`~pypix_api.auth.oauth2.OAuth2Client` tudo o que não é
+E/S — cache por conjunto canônico de escopos, montagem do corpo, validação da
+resposta e mapeamento de erros —, trocando apenas o transporte.
+"""
+
+import asyncio
+from typing import Any, BinaryIO
+
+from pypix_api.auth.mtls import get_ssl_context_with_mtls
+from pypix_api.auth.oauth2 import OAuth2Client
+from pypix_api.deadline import limita_timeout, tempo_restante
+from pypix_api.exceptions import PixConexaoException, PixTimeoutException
+from pypix_api.http import (
+    Timeout,
+    importa_httpx,
+    resposta_httpx_para_requests,
+    timeout_httpx,
+)
+from pypix_api.http2 import TRANSPORTE_H2, TRANSPORTE_HTTP1, valida_transporte
+from pypix_api.pool import PoolConfig
+from pypix_api.rate_limit import RECURSO_OAUTH, RateLimiter
+
+
+class AsyncOAuth2Client(OAuth2Client):
+    """Cliente OAuth2 com ``get_token`` assíncrono.
+
+    Aceita os mesmos parâmetros do :class:`OAuth2Client`. A sessão é um
+    ``httpx.AsyncClient`` compartilhado pelos clientes de banco assíncronos
+    construídos sobre ele; feche-o com :meth:`aclose` (ou ``async with``).
+
+    Requisições concorrentes pelo mesmo conjunto de escopos esperam um único
+    ``POST`` de token, em vez de cada uma disparar o seu — com milhares de
+    chamadas em voo, um token expirado viraria uma rajada contra o PSP.
+
+    Args:
+        limits: ``httpx.Limits`` do pool de conexões. ``None`` usa o padrão
+            do ``httpx`` (100 conexões)
+        transport: ``'http1'`` (padrão) ou ``'h2'``, que habilita HTTP/2 no
+            ``httpx.AsyncClient`` (requer o extra ``http2``). Os transportes
+            síncronos de :mod:`pypix_api.transport` não se aplicam
+        rate_limiter: Mesmo formato de :class:`OAuth2Client`; a espera é um
+            ``asyncio.sleep``
+    """
+
+    def __init__(
+        self,
+        token_url: str,
+        client_id: str | None = None,
+        cert: str | None = None,
+        pvk: str | None = None,
+        cert_pfx: str | bytes | BinaryIO | None = None,
+        pwd_pfx: str | None = None,
+        sandbox_mode: bool = False,
+        client_secret: str | None = None,
+        timeout: Timeout | None = None,
+        limits: Any = None,
+        transport: str = TRANSPORTE_HTTP1,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        httpx = importa_httpx()
+        self._limits = limits if limits is not None else httpx.Limits()
+        if valida_transporte(transport) not in (TRANSPORTE_HTTP1, TRANSPORTE_H2):
+            raise ValueError(
+                f'Cliente assíncrono: transport deve ser {TRANSPORTE_HTTP1!r} ou '
+                f'{TRANSPORTE_H2!r}, não {transport!r}.'
+            )
+        self._http2 = transport == TRANSPORTE_H2
+        self._locks_de_token: dict[str, asyncio.Lock] = {}
+        super().__init__(
+            token_url=token_url,
+            client_id=client_id,
+            cert=cert,
+            pvk=pvk,
+            cert_pfx=cert_pfx,
+            pwd_pfx=pwd_pfx,
+            sandbox_mode=sandbox_mode,
+            client_secret=client_secret,
+            timeout=timeout,
+            rate_limiter=rate_limiter,
+        )
+        self.transport = transport
+        if self.sandbox_mode:
+            # Sem mTLS no sandbox, como no cliente síncrono.
+            self.session = httpx.AsyncClient(limits=self._limits, http2=self._http2)
+
+    def _cria_sessao(self) -> Any:
+        httpx = importa_httpx()
+        contexto = get_ssl_context_with_mtls(
+            cert=self.cert,
+            pvk=self.pvk,
+            cert_pfx=self.cert_pfx,
+            pwd_pfx=self.pwd_pfx,
+        )
+        return httpx.AsyncClient(
+            verify=contexto, limits=self._limits, http2=self._http2
+        )
+
+    async def get_token(self, scope: str | None = None) -> str:  # type: ignore[override]
+        """Obtém ou renova o token de acesso para o escopo especificado.
+
+        Mesma semântica de :meth:`OAuth2Client.get_token`.
+
+        Returns:
+            str: Token de acesso válido para o escopo solicitado
+        """
+        if scope is None:
+            scope = 'cco_extrato cco_consulta'
+
+        chave = self._chave_de_cache(scope)
+        token = self._token_valido(chave)
+        if token is not None:
+            return token
+
+        lock = self._locks_de_token.setdefault(chave, asyncio.Lock())
+        async with lock:
+            # Quem esperou o lock encontra o token obtido por quem o segurava.
+            if chave in self.token_cache and not self._is_token_expired(chave):
+                return self.token_cache[chave]['access_token']
+            return await self._solicita_token(chave, scope)
+
+    async def _solicita_token(self, chave: str, scope: str) -> str:
+        httpx = importa_httpx()
+        token_data, headers = self._requisicao_de_token(scope)
+        # O requests descarta campos None do formulário; o httpx os enviaria
+        # vazios.
+        corpo = {
+            campo: valor for campo, valor in token_data.items() if valor is not None
+        }
+        if self.rate_limiter is not None:
+            try:
+                espera = self.rate_limiter.reserva(
+                    self.bank_code, RECURSO_OAUTH, tempo_restante()
+                )
+            except TimeoutError as exc:
+                raise PixTimeoutException(
+                    detail=f'Prazo esgotado antes da vez do token: {exc}'
+                ) from exc
+            await asyncio.sleep(espera)
+        timeout = limita_timeout(self.timeout, 'o POST de token')
+
+        try:
+            resposta = await self.token_session.post(
+                self.token_url,
+                data=corpo,
+                headers=headers,
+                timeout=timeout_httpx(timeout),
+            )
+        except httpx.TimeoutException as exc:
+            raise PixTimeoutException(
+                detail=f'Requisição de token excedeu o tempo limite '
+                f'({self.timeout}): {exc}'
+            ) from exc
+        except httpx.HTTPError as exc:
+            raise PixConexaoException(
+                detail=f'Falha ao solicitar token em {self.token_url}: {exc}'
+            ) from exc
+
+        return self._registra_token(
+            chave, scope, resposta_httpx_para_requests(resposta)
+        )
+
+    def _nova_sessao(self, pool: PoolConfig | None) -> Any:
+        """``httpx.AsyncClient`` novo, com os ``limits`` deste cliente.
+
+        Raises:
+            TypeError: Se ``pool`` for informado: o pool do cliente assíncrono
+                é configurado pelos ``limits``
+        """
+        if pool is not None:
+            raise TypeError('Cliente assíncrono: o pool é configurado por `limits`')
+        if self.sandbox_mode:
+            return importa_httpx().AsyncClient(limits=self._limits, http2=self._http2)
+        return self._cria_sessao()
+
+    def close(self) -> None:
+        """Use :meth:`aclose`: o ``httpx.AsyncClient`` só fecha com ``await``."""
+        raise TypeError('Cliente assíncrono: use `await aclose()`')
+
+    async def aclose(self) -> None:
+        """Fecha o ``httpx.AsyncClient``, os das faixas de tráfego e suas conexões."""
+        await self.session.aclose()
+        with self._lock_faixas:
+            faixas = list(self._faixas.values())
+        for sessao in faixas:
+            await sessao.aclose()
+
+    async def __aenter__(self) -> 'AsyncOAuth2Client':
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
@@ -1,7 +1,178 @@
-from typing import BinaryIO
+"""Sessões e ``SSLContext`` com certificado de cliente (mTLS).
+
+Decodificar um PFX — descriptografar a chave, validar a expiração e montar o
+``SSLContext`` — custa dezenas de milissegundos, e carregar o bundle de CAs no
+contexto outros ~30 ms. Com centenas de clientes de lojistas no mesmo
+processo, isso dominava o tempo de construção e a memória. Os contextos agora
+são compartilhados no processo: clientes com o mesmo certificado e a mesma
+senha recebem o mesmo ``SSLContext``, com as CAs já carregadas. A chave do
+cache é o SHA-256 do certificado e um HMAC da senha com uma chave aleatória do
+processo, e não um *hash* da senha, que seria reversível por dicionário. O
+contexto vive enquanto algum cliente o usa.
+"""
+
+import hashlib
+import hmac
+import os
+import ssl
+import threading
+import weakref
+from collections.abc import Callable
+from typing import Any, BinaryIO
 
 import requests
 import requests_pkcs12
+from requests.utils import DEFAULT_CA_BUNDLE_PATH
+
+#: Mensagem comum aos dois modos de mTLS quando falta o material do certificado.
+_CERTIFICADO_AUSENTE = (
+    'É necessário fornecer certificado e chave privada (PEM) ou certificado PFX e senha'
+)
+
+#: Chave do HMAC da senha na chave do cache; muda a cada processo.
+_CHAVE_DO_PROCESSO = os.urandom(32)
+
+_contextos: 'weakref.WeakValueDictionary[tuple[str, ...], ssl.SSLContext]' = (
+    weakref.WeakValueDictionary()
+)
+_lock_contextos = threading.Lock()
+
+
+class AdapterMtls(requests_pkcs12.Pkcs12Adapter):
+    """``Pkcs12Adapter`` sobre um ``SSLContext`` compartilhado.
+
+    O ``Pkcs12Adapter`` decodifica o PFX no construtor; este recebe o contexto
+    de :func:`contexto_pkcs12`, que já traz o bundle de CAs do ``requests``.
+    Por isso, com ``verify=True`` o bundle não é repassado ao ``urllib3``, que
+    o recarregaria no contexto a cada conexão nova.
+
+    Só as requisições com ``verify=True`` usam o contexto compartilhado. Com
+    ``verify=False`` o ``Pkcs12Adapter`` desliga a verificação *no contexto*
+    durante o envio, e com um bundle próprio o ``urllib3`` carrega essas CAs
+    nele — nos dois casos, valeria para todos os clientes que o compartilham.
+    Essas requisições passam por um ``Pkcs12Adapter`` só deste adapter,
+    criado no primeiro uso a partir de ``pfx``.
+
+    Args:
+        ssl_context: Contexto compartilhado
+        pfx: Conteúdo e senha do PFX, para o adapter próprio
+    """
+
+    def __init__(
+        self, ssl_context: ssl.SSLContext, pfx: tuple[bytes, bytes], **kwargs: Any
+    ) -> None:
+        self.ssl_context = ssl_context
+        self._pfx = pfx
+        self._proprio: requests_pkcs12.Pkcs12Adapter | None = None
+        requests.adapters.HTTPAdapter.__init__(self, **kwargs)
+
+    def cert_verify(self, conn: Any, url: str, verify: Any, cert: Any) -> None:
+        super().cert_verify(conn, url, verify, cert)
+        if conn.ca_certs == DEFAULT_CA_BUNDLE_PATH:
+            conn.ca_certs = None
+
+    def send(self, request: Any, *args: Any, **kwargs: Any) -> requests.Response:
+        if kwargs.get('verify', True) is True:
+            return super().send(request, *args, **kwargs)
+        if self._proprio is None:
+            dados, senha = self._pfx
+            self._proprio = requests_pkcs12.Pkcs12Adapter(
+                pkcs12_data=dados,
+                pkcs12_password=senha,
+                pool_connections=self._pool_connections,
+                pool_maxsize=self._pool_maxsize,
+                pool_block=self._pool_block,
+            )
+        return self._proprio.send(request, *args, **kwargs)
+
+    def close(self) -> None:
+        super().close()
+        if self._proprio is not None:
+            self._proprio.close()
+
+
+def _compartilhado(
+    chave: tuple[str, ...], fabrica: Callable[[], ssl.SSLContext]
+) -> ssl.SSLContext:
+    """O contexto de ``chave`` em uso no processo, ou um novo de ``fabrica``."""
+    with _lock_contextos:
+        contexto = _contextos.get(chave)
+        if contexto is None:
+            contexto = fabrica()
+            _contextos[chave] = contexto
+        return contexto
+
+
+def contexto_pkcs12(
+    cert_pfx: str | bytes | BinaryIO, pwd_pfx: str | bytes
+) -> ssl.SSLContext:
+    """``SSLContext`` de um certificado PFX, compartilhado no processo.
+
+    Já traz o bundle de CAs do ``requests``. Não altere o contexto devolvido:
+    ele é o mesmo de todos os clientes com esse certificado.
+
+    Args:
+        cert_pfx: Caminho ou conteúdo do PFX
+        pwd_pfx: Senha do PFX
+
+    Raises:
+        ValueError: Se a senha não abrir o PFX
+    """
+    return _contexto_pkcs12(*_material_pfx(cert_pfx, pwd_pfx))
+
+
+def _material_pfx(
+    cert_pfx: str | bytes | BinaryIO, pwd_pfx: str | bytes
+) -> tuple[bytes, bytes]:
+    """Conteúdo e senha do PFX, em bytes."""
+    if isinstance(cert_pfx, bytes):
+        dados = cert_pfx
+    elif isinstance(cert_pfx, str):
+        with open(cert_pfx, 'rb') as arquivo:
+            dados = arquivo.read()
+    else:
+        dados = cert_pfx.read()
+    senha = pwd_pfx.encode('utf-8') if isinstance(pwd_pfx, str) else pwd_pfx
+    return dados, senha
+
+
+def _contexto_pkcs12(dados: bytes, senha: bytes) -> ssl.SSLContext:
+    chave = (
+        'pkcs12',
+        hashlib.sha256(dados).hexdigest(),
+        hmac.new(_CHAVE_DO_PROCESSO, senha, hashlib.sha256).hexdigest(),
+    )
+
+    def cria() -> ssl.SSLContext:
+        # O requests_pkcs12 já valida a expiração do certificado
+        contexto = requests_pkcs12.Pkcs12Adapter(
+            pkcs12_data=dados, pkcs12_password=senha
+        ).ssl_context
+        contexto.load_verify_locations(DEFAULT_CA_BUNDLE_PATH)
+        return contexto
+
+    return _compartilhado(chave, cria)
+
+
+def _contexto_pem(cert: str, pvk: str) -> ssl.SSLContext:
+    """``SSLContext`` de um certificado e chave PEM, compartilhado no processo."""
+    digestos = []
+    for caminho in (cert, pvk):
+        with open(caminho, 'rb') as arquivo:
+            digestos.append(hashlib.sha256(arquivo.read()).hexdigest())
+
+    def cria() -> ssl.SSLContext:
+        contexto = ssl.create_default_context(cafile=DEFAULT_CA_BUNDLE_PATH)
+        contexto.load_cert_chain(cert, pvk)
+        return contexto
+
+    return _compartilhado(('pem', *digestos), cria)
+
+
+def contextos_em_cache() -> int:
+    """Quantos ``SSLContext`` compartilhados estão vivos no processo."""
+    with _lock_contextos:
+        return len(_contextos)
 
 
 def get_session_with_mtls(
@@ -15,20 +186,37 @@ def get_session_with_mtls(
 
     if not sandbox_mode:
         if cert_pfx and pwd_pfx:
-            # Configura autenticação com PFX
-            pkcs12_adapter = requests_pkcs12.Pkcs12Adapter(
-                pkcs12_data=cert_pfx if isinstance(cert_pfx, bytes) else None,
-                pkcs12_filename=cert_pfx if isinstance(cert_pfx, str) else None,
-                pkcs12_password=pwd_pfx,
-            )
-            session.mount('https://', pkcs12_adapter)
+            # Configura autenticação com PFX, sobre o contexto compartilhado
+            pfx = _material_pfx(cert_pfx, pwd_pfx)
+            session.mount('https://', AdapterMtls(_contexto_pkcs12(*pfx), pfx))
         elif cert and pvk:
             # Configura autenticação com PEM (manter compatibilidade)
             session.cert = (cert, pvk)
         else:
-            raise ValueError(
-                'É necessário fornecer certificado e chave privada (PEM) '
-                'ou certificado PFX e senha'
-            )
+            raise ValueError(_CERTIFICADO_AUSENTE)
 
     return session
+
+
+def get_ssl_context_with_mtls(
+    cert: str | None = None,
+    pvk: str | None = None,
+    cert_pfx: str | bytes | BinaryIO | None = None,
+    pwd_pfx: str | None = None,
+) -> ssl.SSLContext:
+    """Monta um ``SSLContext`` com o certificado de cliente, para transportes
+    que não são o ``requests`` (ex.: ``httpx``).
+
+    Aceita as mesmas formas de certificado de :func:`get_session_with_mtls` e
+    confia no mesmo bundle de CAs usado pelo ``requests``, para que os dois
+    caminhos validem o PSP da mesma forma. O contexto é compartilhado com os
+    demais clientes do processo que usam o mesmo certificado.
+
+    Raises:
+        ValueError: Se não houver certificado PEM nem PFX com senha
+    """
+    if cert_pfx and pwd_pfx:
+        return contexto_pkcs12(cert_pfx, pwd_pfx)
+    if cert and pvk:
+        return _contexto_pem(cert, pvk)
+    raise ValueError(_CERTIFICADO_AUSENTE)
@@ -1,13 +1,17 @@
 import base64
+import functools
 import logging
 import os
+import ssl
+import threading
 import time
 from typing import Any, BinaryIO
 
 import requests
 from dotenv import load_dotenv
 
-from pypix_api.auth.mtls import get_session_with_mtls
+from pypix_api.auth.mtls import get_session_with_mtls, get_ssl_context_with_mtls
+from pypix_api.deadline import limita_timeout, tempo_restante
 from pypix_api.exceptions import (
     PixAPIException,
     PixConexaoException,
@@ -16,6 +20,22 @@ from pypix_api.exceptions import (
     excecao_para_status,
 )
 from pypix_api.http import DEFAULT_TIMEOUT, Timeout, texto_do_corpo
+from pypix_api.http2 import (
+    TRANSPORTE_H2,
+    TRANSPORTE_HTTP1,
+    TRANSPORTE_URLLIB3,
+    Http2Session,
+    valida_transporte,
+)
+from pypix_api.lanes import TOKEN
+from pypix_api.pool import (
+    EstatisticasPool,
+    PoolConfig,
+    configura_pool,
+    estatisticas_do_pool,
+)
+from pypix_api.rate_limit import QUALQUER, RECURSO_OAUTH, RateLimiter
+from pypix_api.transport import Transport, TransportSession, Urllib3Transport
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +59,9 @@ class OAuth2Client:
         sandbox_mode: bool = False,
         client_secret: str | None = None,
         timeout: Timeout | None = None,
+        pool: PoolConfig | None = None,
+        transport: str | Transport = TRANSPORTE_HTTP1,
+        rate_limiter: RateLimiter | None = None,
     ) -> None:
         """Inicializa o cliente OAuth2
 
@@ -61,6 +84,26 @@ class OAuth2Client:
                 ``requests``: um número ou a tupla ``(conexão, leitura)``.
                 ``None`` usa :data:`DEFAULT_TIMEOUT`. Para leitura sem limite,
                 use ``(5.0, None)``.
+            pool: Dimensionamento do pool de conexões da sessão (ver
+                :class:`~pypix_api.pool.PoolConfig`). ``None`` mantém o padrão
+                do ``requests``: 10 conexões por host. A sessão é compartilhada
+                com os clientes de banco construídos sobre este cliente
+            transport: ``'http1'`` (padrão, ``requests``), ``'h2'``, que
+                multiplexa as requisições em poucas conexões HTTP/2 (ver
+                :class:`~pypix_api.http2.Http2Session`), ``'urllib3'``, que
+                dispensa o ``requests`` e envia direto pelo ``urllib3`` (ver
+                :class:`~pypix_api.transport.Urllib3Transport`), ou um
+                :class:`~pypix_api.transport.Transport` próprio, que deve já
+                trazer o mTLS e é compartilhado pelas faixas de tráfego. Vale
+                para o token e para os bancos construídos sobre este cliente
+            rate_limiter: Limita as requisições de token pelo recurso
+                ``'oauth'`` (ver :class:`~pypix_api.rate_limit.RateLimiter`).
+                Só a requisição ao PSP espera: token em cache sai na hora. Um
+                banco construído com ``rate_limiter`` o repassa a este cliente,
+                junto com o código do banco
+
+        Raises:
+            ValueError: Se ``transport`` não for reconhecido
         """
         load_dotenv()
 
@@ -81,15 +124,119 @@ class OAuth2Client:
         self.timeout: Timeout = DEFAULT_TIMEOUT if timeout is None else timeout
 
         self.sandbox_mode = sandbox_mode
+        self.transport: str | Transport = valida_transporte(transport)
+        self.rate_limiter: RateLimiter | None = rate_limiter
+        # Banco do limite de token; definido pelo banco que usa este cliente.
+        self.bank_code: str = QUALQUER
+        # Sessões das faixas de tráfego (ver `lane_session`), por nome
+        self._faixas: dict[str, Any] = {}
+        # Criação das faixas: duas threads pedindo a mesma faixa abririam duas
+        # sessões, e a descartada nunca seria fechada
+        self._lock_faixas = threading.Lock()
+
+        if self.transport == TRANSPORTE_H2:
+            self.session = self._cria_sessao_http2(pool)
+        elif self.transport != TRANSPORTE_HTTP1:
+            self.session = self._cria_sessao_de_transporte(pool)
+        else:
+            if not self.sandbox_mode:
+                self.session = self._cria_sessao()
+            if pool is not None:
+                configura_pool(self.session, pool)
+
+    def _cria_sessao(self) -> requests.Session:
+        """Cria a sessão HTTP com mTLS usada fora do ``sandbox_mode``.
 
-        if not self.sandbox_mode:
-            self.session = get_session_with_mtls(
-                cert=self.cert,
-                pvk=self.pvk,
-                cert_pfx=self.cert_pfx,
-                pwd_pfx=self.pwd_pfx,
-                sandbox_mode=self.sandbox_mode,
+        Ponto de extensão para clientes com outro transporte (ver
+        :class:`pypix_api.auth.async_oauth2.AsyncOAuth2Client`).
+        """
+        return get_session_with_mtls(
+            cert=self.cert,
+            pvk=self.pvk,
+            cert_pfx=self.cert_pfx,
+            pwd_pfx=self.pwd_pfx,
+            sandbox_mode=self.sandbox_mode,
+        )
+
+    def _cria_sessao_http2(self, pool: PoolConfig | None) -> Any:
+        """Cria a :class:`~pypix_api.http2.Http2Session`, com o mesmo mTLS."""
+        return Http2Session(ssl_context=self._contexto_mtls(), pool=pool)
+
+    def _contexto_mtls(self) -> ssl.SSLContext | None:
+        """``SSLContext`` com o certificado de cliente; ``None`` no sandbox."""
+        if self.sandbox_mode:
+            return None
+        return get_ssl_context_with_mtls(
+            cert=self.cert,
+            pvk=self.pvk,
+            cert_pfx=self.cert_pfx,
+            pwd_pfx=self.pwd_pfx,
+        )
+
+    def _cria_sessao_de_transporte(self, pool: PoolConfig | None) -> TransportSession:
+        """:class:`~pypix_api.transport.TransportSession` sobre o
+        ``urllib3``, com o mesmo mTLS, ou sobre o transporte próprio."""
+        if self.transport == TRANSPORTE_URLLIB3:
+            return TransportSession(
+                Urllib3Transport(ssl_context=self._contexto_mtls(), pool=pool)
             )
+        return TransportSession(self.transport)
+
+    def pool_stats(self) -> EstatisticasPool:
+        """Estatísticas do pool de conexões da sessão (ver
+        :func:`pypix_api.pool.estatisticas_do_pool`)."""
+        return estatisticas_do_pool(self.session)
+
+    @property
+    def token_session(self) -> Any:
+        """Sessão das requisições de token: a da faixa :data:`~pypix_api.lanes.TOKEN`,
+        depois que há faixas, ou a sessão compartilhada."""
+        return self._faixas.get(TOKEN, self.session)
+
+    def lane_session(self, name: str, pool: PoolConfig | None = None) -> Any:
+        """Sessão própria da faixa de tráfego ``name`` (ver :mod:`pypix_api.lanes`).
+
+        Criada no primeiro pedido, com o mesmo certificado e transporte da
+        sessão compartilhada, e reaproveitada nos seguintes. A primeira faixa
+        cria também a de token.
+
+        Args:
+            name: Nome da faixa (ex.: ``'critical'``, ``'bulk'``)
+            pool: Pool de conexões da faixa. Num pedido seguinte, reconfigura
+                o pool existente. ``None`` mantém o padrão (ou o atual)
+        """
+        sessao = self._faixas.get(name)
+        if sessao is None:
+            with self._lock_faixas:
+                sessao = self._faixas.get(name)
+                if sessao is None:
+                    if TOKEN not in self._faixas:
+                        self._faixas[TOKEN] = self._nova_sessao(None)
+                    sessao = self._faixas[name] = self._nova_sessao(pool)
+                    # Já criada com o pool pedido
+                    pool = None
+        if pool is not None and isinstance(sessao, requests.Session | TransportSession):
+            configura_pool(sessao, pool)
+        return sessao
+
+    def _nova_sessao(self, pool: PoolConfig | None) -> Any:
+        """Sessão nova, com o certificado e o transporte deste cliente."""
+        if self.transport == TRANSPORTE_H2:
+            return self._cria_sessao_http2(pool)
+        if self.transport != TRANSPORTE_HTTP1:
+            return self._cria_sessao_de_transporte(pool)
+        sessao = requests.Session() if self.sandbox_mode else self._cria_sessao()
+        if pool is not None:
+            configura_pool(sessao, pool)
+        return sessao
+
+    def close(self) -> None:
+        """Fecha a sessão compartilhada e as das faixas de tráfego."""
+        self.session.close()
+        with self._lock_faixas:
+            faixas = list(self._faixas.values())
+        for sessao in faixas:
+            sessao.close()
 
     def get_token(self, scope: str | None = None) -> str:
         """Obtém ou renova o token de acesso para o escopo especificado
@@ -109,9 +256,70 @@ class OAuth2Client:
 
         # Verifica se já existe token válido para este escopo
         chave = self._chave_de_cache(scope)
-        if chave in self.token_cache and not self._is_token_expired(chave):
-            return self.token_cache[chave]['access_token']
+        token = self._token_valido(chave)
+        if token is not None:
+            return token
+        return self._busca_token(chave, scope)
+
+    def renew_token(self, scope: str) -> str:
+        """Obtém um token novo para ``scope`` mesmo que o do cache seja válido.
+
+        O token em cache continua servindo as requisições até o novo chegar —
+        é o que permite renovar antes do vencimento sem que nenhuma requisição
+        espere pelo ``POST`` de token (ver
+        :class:`~pypix_api.registry.ClientRegistry`).
+        """
+        return self._busca_token(self._chave_de_cache(scope), scope)
+
+    def token_ttl(self, scope: str) -> float:
+        """Segundos até o token em cache de ``scope`` vencer; 0 sem token."""
+        entrada = self.token_cache.get(self._chave_de_cache(scope))
+        if entrada is None or 'expires_at' not in entrada:
+            return 0.0
+        return max(entrada['expires_at'] - time.time(), 0.0)
+
+    def _busca_token(self, chave: str, scope: str) -> str:
+        """``POST`` de token e registro no cache."""
+        token_data, headers = self._requisicao_de_token(scope)
+        if self.rate_limiter is not None:
+            try:
+                self.rate_limiter.adquire(
+                    self.bank_code, RECURSO_OAUTH, tempo_restante()
+                )
+            except TimeoutError as exc:
+                raise PixTimeoutException(
+                    detail=f'Prazo esgotado antes da vez do token: {exc}'
+                ) from exc
+        # Dentro de um `deadline`, o POST de token gasta do prazo da chamada
+        timeout = limita_timeout(self.timeout, 'o POST de token')
 
+        try:
+            response = self.token_session.post(
+                self.token_url,
+                data=token_data,
+                headers=headers,
+                timeout=timeout,
+            )
+        except requests.Timeout as exc:
+            raise PixTimeoutException(
+                detail=f'Requisição de token excedeu o tempo limite '
+                f'({self.timeout}): {exc}'
+            ) from exc
+        except requests.RequestException as exc:
+            raise PixConexaoException(
+                detail=f'Falha ao solicitar token em {self.token_url}: {exc}'
+            ) from exc
+
+        return self._registra_token(chave, scope, response)
+
+    def _requisicao_de_token(
+        self, scope: str
+    ) -> tuple[dict[str, str | None], dict[str, str]]:
+        """Monta o corpo e os headers do ``POST`` de token.
+
+        Returns:
+            tuple: ``(corpo do formulário, headers)``
+        """
         token_data: dict[str, str | None] = {
             'grant_type': 'client_credentials',
             'scope': scope,
@@ -130,23 +338,25 @@ class OAuth2Client:
             # autenticado via mTLS. Comportamento inalterado.
             token_data['client_id'] = self.client_id
 
-        try:
-            response = self.session.post(
-                self.token_url,
-                data=token_data,
-                headers=headers,
-                timeout=self.timeout,
-            )
-        except requests.Timeout as exc:
-            raise PixTimeoutException(
-                detail=f'Requisição de token excedeu o tempo limite '
-                f'({self.timeout}): {exc}'
-            ) from exc
-        except requests.RequestException as exc:
-            raise PixConexaoException(
-                detail=f'Falha ao solicitar token em {self.token_url}: {exc}'
-            ) from exc
+        return token_data, headers
+
+    def _registra_token(
+        self, chave: str, scope: str, response: requests.Response
+    ) -> str:
+        """Valida a resposta de token e a guarda no cache.
+
+        Args:
+            chave: Chave canônica do cache (ver :meth:`_chave_de_cache`)
+            scope: Escopos solicitados, para o aviso de escopo negado
+            response: Resposta do endpoint de token
+
+        Returns:
+            str: O ``access_token`` concedido
 
+        Raises:
+            PixAPIException: Se o endpoint de token devolver erro ou uma
+                resposta fora do contrato
+        """
         if not response.ok:
             raise self._erro_do_token(response)
 
@@ -160,6 +370,7 @@ class OAuth2Client:
         return token_info['access_token']
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _chave_de_cache(scope: str) -> str:
         """Chave canônica do cache para um conjunto de escopos.
 
@@ -170,6 +381,7 @@ class OAuth2Client:
         requisições de token a bloqueio por IP. A ordem original é preservada no
         que se envia ao PSP; só a chave do cache é normalizada.
         """
+        # Em cache: cada requisição de negócio canoniza a mesma string de escopos
         return ' '.join(sorted(set(scope.split())))
 
     def _avisa_escopos_ausentes(self, solicitado: str, concedido: Any) -> None:
@@ -274,6 +486,19 @@ class OAuth2Client:
             ) from exc
         return dados
 
+    def _token_valido(self, chave: str) -> str | None:
+        """Token em cache ainda válido para a ``chave`` canônica, ou ``None``.
+
+        Caminho de toda requisição de negócio: uma consulta ao dicionário, sem
+        canonizar os escopos de novo como :meth:`_is_token_expired`.
+        """
+        entrada = self.token_cache.get(chave)
+        if entrada is None or 'expires_at' not in entrada:
+            return None
+        if time.time() >= entrada['expires_at'] - 60:  # 60s de margem
+            return None
+        return entrada['access_token']
+
     def _is_token_expired(self, scope: str) -> bool:
         """Verifica se o token para o escopo especificado expirou.
 
@@ -0,0 +1,484 @@
+"""Base dos clientes Pix assíncronos.
+
+Os mixins de métodos (``CobMethods``, ``PixMethods``, ...) são os mesmos do
+cliente síncrono: cada método monta a requisição, chama ``_request`` e entrega
+a resposta a ``_json``/``_json_opcional``/``_sucesso``. Aqui ``_request`` é uma
+corrotina e esses três decodificadores a aguardam — assim todo método dos
+mixins devolve um *awaitable*, sem duplicar nenhum deles:
+
+.. code-block:: python
+
+    async with AsyncSicoobPixAPI(oauth=oauth) as banco:
+        cobranca = await banco.consultar_cob(txid)
+
+Validações de argumento (ex.: CPF e CNPJ juntos em ``consultar_cobs``)
+continuam levantando no momento da chamada, antes do ``await``.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Sequence
+from typing import Any
+
+import requests
+
+from pypix_api.adaptive_timeout import AdaptiveTimeouts
+from pypix_api.auth.async_oauth2 import AsyncOAuth2Client
+from pypix_api.banks.base import (
+    BankPixAPIBase,
+    _valida_extra_headers,
+    recurso_do_path,
+)
+from pypix_api.circuit_breaker import CircuitBreakerRegistry
+from pypix_api.compression import CompressionPolicy
+from pypix_api.concurrency import STATUS_DE_SOBRECARGA, ConcurrencyPolicy
+from pypix_api.deadline import Prazo, prazo_atual, tempo_restante
+from pypix_api.deadline import deadline as abre_prazo
+from pypix_api.exceptions import (
+    PixConexaoException,
+    PixErroTransporteException,
+    PixTimeoutException,
+)
+from pypix_api.hedge import HedgePolicy, Hedger
+from pypix_api.http import (
+    Timeout,
+    importa_httpx,
+    resposta_httpx_para_requests,
+    timeout_httpx,
+)
+from pypix_api.interceptors import (
+    CallNextAsync,
+    Interceptor,
+    RequestCall,
+    monta_cadeia_async,
+)
+from pypix_api.json_codec import JsonCodec
+from pypix_api.pool import RelatorioAquecimento
+from pypix_api.rate_limit import RateLimiter
+from pypix_api.retry import RetryPolicy
+from pypix_api.scopes import ScopeGroup
+from pypix_api.single_flight import SingleFlight, chave_da_consulta
+from pypix_api.streaming_body import CorpoEmPartesAsync, PartesDoCorpo, StreamingBody
+
+
+class AsyncBankPixAPIBase(BankPixAPIBase):
+    """Classe base dos clientes Pix assíncronos.
+
+    Expõe todos os métodos dos mixins como corrotinas, com o mesmo tratamento
+    de erro de :meth:`BankPixAPIBase._handle_error_response`. As classes
+    concretas combinam esta base com a classe síncrona do banco, de onde vêm
+    URLs, código do banco e resolução de endpoint.
+
+    Args:
+        oauth: Instância configurada de :class:`AsyncOAuth2Client`. O
+            ``httpx.AsyncClient`` dela é compartilhado pelo banco
+        sandbox_mode: Se True, usa modo sandbox com token fixo (default: False)
+        timeout: Mesmo formato de :class:`BankPixAPIBase`
+        scopes: Mesmo formato de :class:`BankPixAPIBase`
+        retry: Mesmo formato de :class:`BankPixAPIBase`. A espera entre
+            tentativas é um ``asyncio.sleep``, que não bloqueia o *event loop*
+        circuit_breaker: Mesmo formato de :class:`BankPixAPIBase`. O registro
+            pode ser compartilhado com clientes síncronos
+        rate_limiter: Mesmo formato de :class:`BankPixAPIBase`; a espera é um
+            ``asyncio.sleep``
+        hedge: Mesmo formato de :class:`BankPixAPIBase`. Original e cópia são
+            tarefas do *event loop*, e a perdedora é cancelada de fato
+        single_flight: Mesmo formato de :class:`BankPixAPIBase`. Cancelar uma
+            das consultas coalescidas não cancela as outras
+        json_codec: Mesmo formato de :class:`BankPixAPIBase`
+        deadline: Mesmo formato de :class:`BankPixAPIBase`. O prazo vale para
+            a tarefa que fez a chamada
+        adaptive_timeout: Mesmo formato de :class:`BankPixAPIBase`; o registro
+            pode ser compartilhado com clientes síncronos
+        concurrency: Mesmo formato de :class:`BankPixAPIBase`; a espera por
+            vaga não bloqueia o *event loop*
+        priority: Mesmo formato de :class:`BankPixAPIBase`. A sessão da faixa
+            é um ``httpx.AsyncClient`` próprio, com os ``limits`` do ``oauth``
+        interceptors: Mesmo formato de :class:`BankPixAPIBase`; a cadeia usa
+            :meth:`~pypix_api.interceptors.Interceptor.intercept_async`
+        compression: Mesmo formato de :class:`BankPixAPIBase`; o gzip do
+            corpo roda no *event loop*, então mantenha ``min_size`` para os
+            corpos que valem a compressão
+    """
+
+    oauth: AsyncOAuth2Client  # type: ignore[assignment]
+    session: Any  # httpx.AsyncClient
+
+    def __init__(
+        self,
+        oauth: AsyncOAuth2Client,
+        sandbox_mode: bool = False,
+        timeout: Timeout | None = None,
+        scopes: str | ScopeGroup | list[str | ScopeGroup] | None = None,
+        retry: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreakerRegistry | None = None,
+        rate_limiter: RateLimiter | None = None,
+        hedge: HedgePolicy | None = None,
+        single_flight: bool = False,
+        json_codec: JsonCodec | str | None = None,
+        deadline: float | None = None,
+        adaptive_timeout: AdaptiveTimeouts | None = None,
+        concurrency: ConcurrencyPolicy | None = None,
+        priority: str | None = None,
+        interceptors: Sequence[Interceptor] | None = None,
+        compression: CompressionPolicy | None = None,
+    ) -> None:
+        super().__init__(
+            oauth=oauth,  # type: ignore[arg-type]
+            sandbox_mode=sandbox_mode,
+            timeout=timeout,
+            scopes=scopes,
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+            rate_limiter=rate_limiter,
+            hedge=hedge,
+            single_flight=single_flight,
+            json_codec=json_codec,
+            deadline=deadline,
+            adaptive_timeout=adaptive_timeout,
+            concurrency=concurrency,
+            priority=priority,
+            interceptors=interceptors,
+            compression=compression,
+        )
+
+    async def warmup(  # type: ignore[override]
+        self, connections: int = 1, token_connections: int = 1
+    ) -> RelatorioAquecimento:
+        """Versão assíncrona de :meth:`BankPixAPIBase.warmup`.
+
+        O ``httpx`` não abre conexões sem uma requisição: aqui só o token é
+        obtido, e ``connections``/``token_connections`` são aceitos apenas
+        pela compatibilidade com o cliente síncrono.
+        """
+        inicio = time.perf_counter()
+        await self._create_headers()
+        return RelatorioAquecimento(fases={'token': time.perf_counter() - inicio})
+
+    def _novo_executor_hedge(self) -> None:
+        """Sem threads: original e cópia são tarefas do *event loop*."""
+        return None
+
+    async def _create_headers(self) -> dict[str, str]:  # type: ignore[override]
+        if self.sandbox_mode:
+            token = self._token_do_sandbox()
+        else:
+            token = await self.oauth.get_token(self._scopes_do_token())
+        return self._headers_com_token(token)
+
+    async def _request(  # type: ignore[override]
+        self,
+        method: str,
+        path: str,
+        *,
+        extra_headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Versão assíncrona de :meth:`BankPixAPIBase._request`.
+
+        A resposta do ``httpx`` é convertida em ``requests.Response`` antes do
+        tratamento de erro, para que as duas famílias de cliente levantem
+        exatamente as mesmas exceções.
+
+        Raises:
+            ValueError: Se ``extra_headers`` tentar redefinir um header de
+                autenticação
+            PixTimeoutException: Se a requisição exceder o tempo limite
+            PixConexaoException: Se houver falha de conexão
+            PixAPIException: Para os erros devolvidos pelo PSP
+        """
+        _valida_extra_headers(extra_headers)
+        if self.deadline is None:
+            return await self._intercepta(method, path, extra_headers, kwargs)
+        with abre_prazo(self.deadline):
+            return await self._intercepta(method, path, extra_headers, kwargs)
+
+    async def _intercepta(  # type: ignore[override]
+        self,
+        method: str,
+        path: str,
+        extra_headers: dict[str, str] | None,
+        kwargs: dict[str, Any],
+    ) -> requests.Response:
+        """Versão assíncrona de :meth:`BankPixAPIBase._intercepta`."""
+        if self._cadeia is None:
+            return await self._coalesce_request(method, path, extra_headers, kwargs)
+        return await self._cadeia(self._chamada(method, path, extra_headers, kwargs))
+
+    def _monta_cadeia(self) -> CallNextAsync:  # type: ignore[override]
+        async def final(call: RequestCall) -> requests.Response:
+            _valida_extra_headers(call.extra_headers)
+            return await self._coalesce_request(
+                call.method, call.path, call.extra_headers, dict(call.kwargs)
+            )
+
+        return monta_cadeia_async(self.interceptors, final)
+
+    async def _coalesce_request(  # type: ignore[override]
+        self,
+        method: str,
+        path: str,
+        extra_headers: dict[str, str] | None,
+        kwargs: dict[str, Any],
+    ) -> requests.Response:
+        """Versão assíncrona de :meth:`BankPixAPIBase._coalesce_request`."""
+        if self._voos is None or method != 'GET':
+            return await self._executa_request(method, path, extra_headers, kwargs)
+
+        chave = chave_da_consulta(path, kwargs.get('params'), extra_headers)
+        try:
+            response, compartilhado = await self._voos.executa_async(
+                chave,
+                lambda: self._executa_request(method, path, extra_headers, kwargs),
+                tempo_restante(),
+            )
+        except asyncio.TimeoutError as exc:
+            raise PixTimeoutException(
+                detail=f'Prazo esgotado esperando a consulta idêntica a {path}'
+            ) from exc
+        if compartilhado:
+            SingleFlight.conta(self.get_bank_code(), recurso_do_path(path))
+        return response
+
+    def _partes_do_corpo(self, corpo: StreamingBody) -> PartesDoCorpo:
+        """As partes de ``corpo`` como iterável assíncrono, que é o que o
+        ``httpx.AsyncClient`` aceita em ``content=``."""
+        return CorpoEmPartesAsync(lambda: corpo.chunks(self.json_codec))
+
+    async def _executa_request(  # type: ignore[override]
+        self,
+        method: str,
+        path: str,
+        extra_headers: dict[str, str] | None,
+        kwargs: dict[str, Any],
+    ) -> requests.Response:
+        """Corpo de :meth:`_request`: headers, tentativas e tratamento de erro."""
+        headers = await self._create_headers()
+        if extra_headers:
+            headers.update(extra_headers)
+        if 'timeout' in kwargs:
+            timeout = kwargs.pop('timeout')
+        else:
+            timeout = self._timeout_padrao(method, path)
+        reenviavel = self._codifica_corpo(kwargs, 'content')
+        if self.compression is not None:
+            self._comprime_corpo(method, path, headers, kwargs, 'content')
+
+        url = self._endpoint_url(path)
+        if self._orcamento_retry is not None:
+            self._orcamento_retry.deposita()
+
+        tentativa = 0
+        while True:
+            try:
+                response = await self._envia_hedge_async(
+                    method, path, url, headers, timeout, kwargs
+                )
+            except PixErroTransporteException:
+                espera = self._espera_para_repetir(
+                    method, path, tentativa, reenviavel=reenviavel
+                )
+                if espera is None:
+                    raise
+            else:
+                espera = self._espera_para_repetir(
+                    method, path, tentativa, response, reenviavel=reenviavel
+                )
+                if espera is None:
+                    return self._aceita_resposta(method, path, response)
+            await asyncio.sleep(espera)
+            tentativa += 1
+
+    async def _envia_hedge_async(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        headers: dict[str, str],
+        timeout: Timeout,
+        kwargs: dict[str, Any],
+    ) -> requests.Response:
+        """Versão assíncrona de :meth:`BankPixAPIBase._envia_hedge`."""
+        if self._hedger is None or method != 'GET':
+            return await self._envia_async(method, path, url, headers, timeout, kwargs)
+        recurso = recurso_do_path(path)
+        atraso = self._hedger.atraso(recurso)
+        if atraso is None:
+            return await self._envia_medido_async(
+                method, path, url, headers, timeout, kwargs
+            )
+
+        def envia() -> asyncio.Task:
+            return asyncio.ensure_future(
+                self._envia_medido_async(method, path, url, headers, timeout, kwargs)
+            )
+
+        original = envia()
+        pendentes = {original}
+        try:
+            feitos, _ = await asyncio.wait(pendentes, timeout=atraso)
+            if feitos or not self._hedger.pode_duplicar():
+                return await original
+            banco = self.get_bank_code()
+            Hedger.conta('sent', banco, recurso)
+            copia = envia()
+            pendentes.add(copia)
+            while pendentes:
+                feitos, pendentes = await asyncio.wait(
+                    pendentes, return_when=asyncio.FIRST_COMPLETED
+                )
+                for tarefa in feitos:
+                    if tarefa.exception() is None:
+                        if tarefa is copia:
+                            Hedger.conta('won', banco, recurso)
+                        return tarefa.result()
+            return original.result()
+        finally:
+            # A perdedora — ou as duas, se quem espera for cancelado
+            for tarefa in pendentes:
+                tarefa.cancel()
+
+    async def _envia_medido_async(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        headers: dict[str, str],
+        timeout: Timeout,
+        kwargs: dict[str, Any],
+    ) -> requests.Response:
+        """:meth:`_envia_async`, alimentando as latências do ``hedge``."""
+        inicio = time.perf_counter()
+        response = await self._envia_async(method, path, url, headers, timeout, kwargs)
+        self._hedger.observa(recurso_do_path(path), time.perf_counter() - inicio)
+        return response
+
+    async def _envia_async(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        headers: dict[str, str],
+        timeout: Timeout,
+        kwargs: dict[str, Any],
+    ) -> requests.Response:
+        """Uma tentativa da requisição, já convertida em ``requests.Response``."""
+        httpx = importa_httpx()
+        # A vez no limitador vem antes do circuito: a espera na fila não pode
+        # prender a vaga de sondagem do circuito meio-aberto.
+        prazo = prazo_atual()
+        if self.rate_limiter is not None:
+            try:
+                espera = self.rate_limiter.reserva(
+                    self.get_bank_code(),
+                    recurso_do_path(path),
+                    None if prazo is None else prazo.restante(),
+                )
+            except TimeoutError as exc:
+                raise PixTimeoutException(
+                    detail=f'Prazo esgotado antes da vez de {method} {url}: {exc}'
+                ) from exc
+            await asyncio.sleep(espera)
+        if self.concurrency_limiter is None:
+            return await self._envia_ao_psp_async(
+                method, path, url, headers, timeout, kwargs, prazo
+            )
+
+        try:
+            ficha = await self.concurrency_limiter.adquire_async(
+                self._espera_por_vaga(prazo)
+            )
+        except TimeoutError as exc:
+            raise PixTimeoutException(
+                detail=f'Sem vaga para {method} {url}: {exc}'
+            ) from exc
+        latencia: float | None = None
+        sobrecarga = False
+        inicio = time.perf_counter()
+        try:
+            response = await self._envia_ao_psp_async(
+                method, path, url, headers, timeout, kwargs, prazo
+            )
+            latencia = time.perf_counter() - inicio
+            sobrecarga = response.status_code in STATUS_DE_SOBRECARGA
+            return response
+        except PixTimeoutException as exc:
+            sobrecarga = isinstance(exc.__cause__, httpx.TimeoutException)
+            raise
+        finally:
+            self.concurrency_limiter.libera(ficha, latencia, sobrecarga)
+
+    async def _envia_ao_psp_async(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        headers: dict[str, str],
+        timeout: Timeout,
+        kwargs: dict[str, Any],
+        prazo: Prazo | None,
+    ) -> requests.Response:
+        """A requisição em si, com prazo, circuito e latências."""
+        httpx = importa_httpx()
+        if prazo is not None:
+            timeout = prazo.limita(timeout, f'{method} {url}')
+        circuito = self._circuito(path)
+        geracao = circuito.antes() if circuito is not None else 0
+        inicio = time.perf_counter()
+        # Cancelamento e erros do chamador deixam ``None``: não contam como
+        # falha do PSP, só liberam a vaga do circuito.
+        falhou: bool | None = None
+        try:
+            resposta = await self.session.request(
+                method, url, headers=headers, timeout=timeout_httpx(timeout), **kwargs
+            )
+            falhou = resposta.status_code >= 500
+            if self.adaptive_timeout is not None:
+                self._observa_latencia(method, path, time.perf_counter() - inicio)
+        except httpx.TimeoutException as exc:
+            falhou = True
+            if (
+                self.adaptive_timeout is not None
+                and prazo is None
+                and isinstance(exc, httpx.ReadTimeout)
+            ):
+                self._observa_timeout(method, path, timeout)
+            raise PixTimeoutException(
+                detail=f'{method} {url} excedeu o tempo limite ({timeout}): {exc}'
+            ) from exc
+        except httpx.HTTPError as exc:
+            falhou = isinstance(exc, (httpx.NetworkError, httpx.RemoteProtocolError))
+            raise PixConexaoException(detail=f'{method} {url} falhou: {exc}') from exc
+        finally:
+            if circuito is not None:
+                circuito.registra(geracao, falhou, time.perf_counter() - inicio)
+        return resposta_httpx_para_requests(resposta)
+
+    async def _json(  # type: ignore[override]
+        self, response: Awaitable[requests.Response]
+    ) -> dict[str, Any]:
+        return BankPixAPIBase._json(self, await response)
+
+    async def _json_opcional(  # type: ignore[override]
+        self, response: Awaitable[requests.Response]
+    ) -> dict[str, Any]:
+        return BankPixAPIBase._json_opcional(self, await response)
+
+    async def _sucesso(  # type: ignore[override]
+        self, response: Awaitable[requests.Response]
+    ) -> bool:
+        return BankPixAPIBase._sucesso(self, await response)
+
+    def close(self) -> None:
+        """Use :meth:`aclose`: o ``httpx.AsyncClient`` só fecha com ``await``."""
+        raise TypeError('Cliente assíncrono: use `await aclose()`')
+
+    async def aclose(self) -> None:
+        """Fecha a sessão compartilhada com o :class:`AsyncOAuth2Client`."""
+        await self.oauth.aclose()
+
+    async def __aenter__(self) -> 'AsyncBankPixAPIBase':
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
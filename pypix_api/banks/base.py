@@ -1,8 +1,13 @@
+import functools
+import time
 from abc import ABC
-from typing import Any
+from collections.abc import Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, ClassVar
 
 import requests
 
+from pypix_api.adaptive_timeout import AdaptiveTimeouts
 from pypix_api.auth.oauth2 import OAuth2Client
 from pypix_api.banks.methods.cob_methods import CobMethods
 from pypix_api.banks.methods.cobr_methods import CobRMethods
@@ -16,30 +21,79 @@ from pypix_api.banks.methods.solic_rec_methods import SolicRecMethods
 from pypix_api.banks.methods.webhook_cobr_methods import WebHookCobrMethods
 from pypix_api.banks.methods.webhook_methods import WebHookMethods
 from pypix_api.banks.methods.webhook_rec_methods import WebHookRecMethods
+from pypix_api.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from pypix_api.compression import (
+    CompressionPolicy,
+    conta_bytes,
+    eh_listagem,
+    gzip_do_corpo,
+    gzip_em_partes,
+    tamanho_transferido,
+)
+from pypix_api.concurrency import (
+    STATUS_DE_SOBRECARGA,
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyPolicy,
+)
+from pypix_api.deadline import Prazo, prazo_atual, tempo_restante
+from pypix_api.deadline import deadline as abre_prazo
 from pypix_api.exceptions import (
     PixAcessoNegadoException,
     PixAPIException,
     PixConexaoException,
+    PixErroTransporteException,
     PixErroValidacaoException,
     PixRecursoNaoEncontradoException,
     PixRespostaInvalidaError,
     PixTimeoutException,
     excecao_para_status,
 )
-from pypix_api.http import DEFAULT_TIMEOUT, Timeout, texto_do_corpo
+from pypix_api.hedge import ExecutorDeHedge, HedgePolicy, Hedger
+from pypix_api.http import (
+    DEFAULT_TIMEOUT,
+    Timeout,
+    texto_do_corpo,
+    timeout_de_conexao,
+)
+from pypix_api.interceptors import CallNext, Interceptor, RequestCall, monta_cadeia
+from pypix_api.json_codec import JsonCodec, StdlibJsonCodec, resolve_codec
+from pypix_api.lanes import valida_faixa
+from pypix_api.pool import (
+    EstatisticasPool,
+    PoolConfig,
+    RelatorioAquecimento,
+    abre_conexoes,
+    configura_pool,
+    estatisticas_do_pool,
+)
+from pypix_api.rate_limit import RateLimiter
+from pypix_api.retry import OrcamentoRetry, RetryPolicy, retry_after
+from pypix_api.routes import TabelaDeRotas
 from pypix_api.scopes import ScopeGroup, get_pix_scopes
+from pypix_api.single_flight import SingleFlight, chave_da_consulta
+from pypix_api.streaming_body import CorpoEmPartes, PartesDoCorpo, StreamingBody
 
 #: Headers montados por `_create_headers` que ``extra_headers`` não pode
 #: redefinir — trocá-los quebraria a autenticação da requisição.
 _HEADERS_PROTEGIDOS = frozenset({'authorization', 'client_id'})
 
+#: Exceções do ``requests`` que indicam falha do PSP ou da rede — as únicas,
+#: além do timeout, contadas pelo circuit breaker. ``InvalidURL``,
+#: ``InvalidJSONError`` e afins são erros do chamador.
+FALHAS_DE_CONEXAO = (
+    requests.ConnectionError,
+    requests.exceptions.ChunkedEncodingError,
+)
+
 
+@functools.lru_cache(maxsize=64)
 def _e_json(content_type: str) -> bool:
     """Reconhece qualquer subtipo JSON no ``Content-Type``.
 
     Os corpos de erro da especificação do BACEN vêm em
     ``application/problem+json`` (RFC 7807), não em ``application/json`` — e um
-    PSP pode ainda usar um tipo de fornecedor terminado em ``+json``.
+    PSP pode ainda usar um tipo de fornecedor terminado em ``+json``. Em cache:
+    um PSP usa sempre os mesmos poucos valores.
     """
     tipo = content_type.split(';', 1)[0].strip().lower()
     return tipo.endswith('/json') or tipo.endswith('+json')
@@ -53,6 +107,12 @@ def _para_int(valor: Any, padrao: int) -> int:
         return padrao
 
 
+def _descarta_resposta(futuro: Future) -> None:
+    """Fecha a resposta de uma cópia perdedora, devolvendo a conexão ao pool."""
+    if not futuro.cancelled() and futuro.exception() is None:
+        futuro.result().close()
+
+
 #: Mensagem do `TypeError` de `_normaliza_scopes`, que nomeia o parâmetro — sem
 #: ela, o erro chega como um `AttributeError` de `.split()`, sem pista da causa.
 _TIPO_SCOPES_INVALIDO = (
@@ -114,6 +174,32 @@ def _normaliza_scopes(
     return ' '.join(unicos)
 
 
+def recurso_do_path(path: str) -> str:
+    """Recurso da API a que o caminho pertence: o primeiro segmento.
+
+    ``/cob/{txid}`` → ``cob``; ``/pix/{e2eid}/devolucao/{id}`` → ``pix``.
+    """
+    return path.strip('/').split('/', 1)[0]
+
+
+def _valida_extra_headers(extra_headers: dict[str, str] | None) -> None:
+    """Recusa ``extra_headers`` que redefinam um header de autenticação.
+
+    Raises:
+        ValueError: Se algum header de :data:`_HEADERS_PROTEGIDOS` for informado
+    """
+    if not extra_headers:
+        return
+    conflitos = sorted(
+        chave for chave in extra_headers if chave.lower() in _HEADERS_PROTEGIDOS
+    )
+    if conflitos:
+        raise ValueError(
+            'Headers de autenticação não podem ser redefinidos via '
+            f'extra_headers: {", ".join(conflitos)}'
+        )
+
+
 def _classe_da_excecao(status: int, type_: str) -> type[PixAPIException]:
     """Resolve a exceção de um erro devolvido pelo PSP.
 
@@ -156,6 +242,9 @@ class BankPixAPIBase(
     BASE_URL: str | None = None
     TOKEN_URL: str | None = None
 
+    # Compilada por `rotas()`, uma por classe
+    _tabela_de_rotas: ClassVar[TabelaDeRotas | None] = None
+
     # Atributos de instância com type hints
     sandbox_mode: bool
     oauth: OAuth2Client
@@ -163,6 +252,18 @@ class BankPixAPIBase(
     client_id: str | None
     timeout: Timeout
     scopes: str | None
+    retry: RetryPolicy | None
+    circuit_breaker: CircuitBreakerRegistry | None
+    rate_limiter: RateLimiter | None
+    hedge: HedgePolicy | None
+    single_flight: bool
+    json_codec: JsonCodec | None
+    deadline: float | None
+    adaptive_timeout: AdaptiveTimeouts | None
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None
+    priority: str | None
+    interceptors: tuple[Interceptor, ...]
+    compression: CompressionPolicy | None
 
     def __init__(
         self,
@@ -170,6 +271,19 @@ class BankPixAPIBase(
         sandbox_mode: bool = False,
         timeout: Timeout | None = None,
         scopes: str | ScopeGroup | list[str | ScopeGroup] | None = None,
+        pool: PoolConfig | None = None,
+        retry: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreakerRegistry | None = None,
+        rate_limiter: RateLimiter | None = None,
+        hedge: HedgePolicy | None = None,
+        single_flight: bool = False,
+        json_codec: JsonCodec | str | None = None,
+        deadline: float | None = None,
+        adaptive_timeout: AdaptiveTimeouts | None = None,
+        concurrency: ConcurrencyPolicy | None = None,
+        priority: str | None = None,
+        interceptors: Sequence[Interceptor] | None = None,
+        compression: CompressionPolicy | None = None,
     ) -> None:
         """Inicializa o cliente Pix do banco.
 
@@ -187,10 +301,73 @@ class BankPixAPIBase(
                 quando a credencial tiver apenas parte das modalidades
                 contratadas junto ao PSP — ver
                 :func:`pypix_api.scopes.compose_scopes`
+            pool: Redimensiona o pool de conexões da sessão (ver
+                :class:`~pypix_api.pool.PoolConfig`). A sessão é a do
+                ``oauth``: a configuração vale também para a requisição de
+                token e para outros bancos construídos sobre o mesmo cliente.
+                ``None`` mantém a configuração atual da sessão
+            retry: Repete automaticamente as falhas transitórias das
+                requisições idempotentes (ver :class:`~pypix_api.retry.RetryPolicy`).
+                O orçamento de repetições é desta instância. ``None`` (padrão)
+                não repete: a primeira falha é levantada
+            circuit_breaker: Circuitos por banco e recurso (ver
+                :class:`~pypix_api.circuit_breaker.CircuitBreakerRegistry`).
+                Compartilhe o mesmo registro entre os clientes do processo.
+                Com o circuito aberto, a requisição falha na hora com
+                :class:`~pypix_api.exceptions.PixCircuitoAbertoException`.
+                ``None`` (padrão) desliga o circuit breaker
+            rate_limiter: Limites de taxa por banco e recurso (ver
+                :class:`~pypix_api.rate_limit.RateLimiter`). Cada tentativa
+                espera sua vez antes de sair. Se o ``oauth`` não tiver
+                limitador próprio, passa a usar este no recurso ``'oauth'``.
+                ``None`` (padrão) não limita
+            hedge: Duplica as consultas ``GET`` que demoram além do atraso da
+                política e usa a primeira resposta (ver
+                :class:`~pypix_api.hedge.HedgePolicy`). ``None`` (padrão) nunca
+                duplica
+            single_flight: Se True, consultas ``GET`` idênticas (mesmo caminho,
+                ``params`` e headers extras) em andamento ao mesmo tempo nesta
+                instância compartilham uma única requisição ao PSP (ver
+                :mod:`pypix_api.single_flight`). Default: False
+            json_codec: Codec JSON dos corpos enviados e recebidos: ``'auto'``
+                (``orjson`` ou ``msgspec``, se instalados), o nome de um codec
+                ou uma instância (ver :mod:`pypix_api.json_codec`). ``None``
+                (padrão) deixa o JSON com o ``requests``
+            deadline: Prazo, em segundos, de cada chamada de ponta a ponta:
+                token, espera pelo limitador, tentativas e intervalos entre
+                elas dividem esse tempo (ver :mod:`pypix_api.deadline`).
+                Esgotado, levanta
+                :class:`~pypix_api.exceptions.PixTimeoutException`. ``None``
+                (padrão) só aplica o ``timeout`` de cada requisição
+            adaptive_timeout: Ajusta o tempo de leitura de cada operação às
+                latências observadas, com o de ``timeout`` como teto (ver
+                :class:`~pypix_api.adaptive_timeout.AdaptiveTimeouts`).
+                Compartilhe o mesmo registro entre os clientes do processo.
+                ``None`` (padrão) usa sempre o ``timeout``
+            concurrency: Limita as requisições simultâneas desta instância a
+                um limite que se ajusta às respostas do PSP (ver
+                :class:`~pypix_api.concurrency.ConcurrencyPolicy`). O que
+                passa do limite espera vaga. ``None`` (padrão) não limita
+            priority: Faixa de tráfego desta instância (ex.: ``'critical'``,
+                ``'bulk'``; ver :mod:`pypix_api.lanes`). As requisições saem
+                pela sessão da faixa, com pool de conexões próprio — ``pool``
+                passa a configurar esse pool —, e o token passa a ser pedido
+                numa sessão só dele. ``None`` (padrão) usa a sessão
+                compartilhada do ``oauth``
+            interceptors: Cadeia de interceptadores em volta de cada chamada,
+                o primeiro por fora (ver :mod:`pypix_api.interceptors`).
+                ``None`` (padrão) não intercepta
+            compression: Comprime em gzip os corpos grandes enviados e pede
+                as listagens comprimidas (ver
+                :class:`~pypix_api.compression.CompressionPolicy`). Só ligue
+                para um PSP que aceite ``Content-Encoding: gzip``. ``None``
+                (padrão) envia os corpos como estão
 
         Raises:
             ValueError: Se BASE_URL ou TOKEN_URL não forem definidos na
-                subclasse, ou se ``scopes`` for informado e vazio
+                subclasse, se ``scopes`` for informado e vazio, se
+                ``deadline`` não for positivo ou se ``priority`` for vazio ou
+                ``'token'``
             TypeError: Se ``scopes`` não for ``str``, :class:`ScopeGroup` nem
                 lista desses tipos
         """
@@ -198,37 +375,199 @@ class BankPixAPIBase(
             raise ValueError(
                 'BASE_URL, TOKEN_URL e SCOPES devem ser definidos na subclasse.'
             )
+        if deadline is not None and deadline <= 0:
+            raise ValueError('deadline deve ser positivo.')
         self.sandbox_mode = sandbox_mode
         self.oauth = oauth
-        self.session = self.oauth.session
+        self.priority = None if priority is None else valida_faixa(priority)
+        if self.priority is None:
+            self.session = self.oauth.session
+        else:
+            self.session = self.oauth.lane_session(self.priority, pool)
         self.client_id = self.oauth.client_id
         self.timeout = DEFAULT_TIMEOUT if timeout is None else timeout
         # O agregado do banco continua sendo resolvido em `_create_headers`, e
         # não aqui: um banco fora do ScopeRegistry ou em `sandbox_mode` nunca
         # chega a pedir token, e não deve falhar na construção.
         self.scopes = None if scopes is None else _normaliza_scopes(scopes)
+        # Resolvidos aqui, e não a cada requisição: `load_dotenv` lê arquivo
+        self._token_fixo = self._token_sandbox() if sandbox_mode else None
+        self._headers_do_token: tuple[str, dict[str, str]] | None = None
+        self._scopes_do_banco: str | None = None
+        if pool is not None and self.priority is None:
+            configura_pool(self.session, pool)
+        self.retry = retry
+        self._orcamento_retry = None if retry is None else OrcamentoRetry(retry)
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+        if rate_limiter is not None and self.oauth.rate_limiter is None:
+            self.oauth.rate_limiter = rate_limiter
+            self.oauth.bank_code = self.get_bank_code()
+        self.json_codec = resolve_codec(json_codec)
+        self.single_flight = single_flight
+        self._voos = SingleFlight() if single_flight else None
+        self.deadline = deadline
+        self.adaptive_timeout = adaptive_timeout
+        self.concurrency_limiter = (
+            None
+            if concurrency is None
+            else AdaptiveConcurrencyLimiter(
+                concurrency, name=self.get_bank_code(), lane=self.priority
+            )
+        )
+        self.hedge = hedge
+        self._hedger = None if hedge is None else Hedger(hedge)
+        self._executor_hedge = self._novo_executor_hedge()
+        self.interceptors = tuple(interceptors or ())
+        self._cadeia = self._monta_cadeia() if self.interceptors else None
+        self.compression = compression
+        self._rotas = self.rotas()
+
+    def _novo_executor_hedge(self) -> ExecutorDeHedge | None:
+        """Threads da original e da cópia das consultas com ``hedge``."""
+        if self.hedge is None:
+            return None
+        return ExecutorDeHedge(self.hedge.max_workers)
+
+    def pool_stats(self) -> EstatisticasPool:
+        """Estatísticas do pool de conexões da sessão (ver
+        :func:`pypix_api.pool.estatisticas_do_pool`)."""
+        return estatisticas_do_pool(self.session)
+
+    def close(self) -> None:
+        """Fecha a sessão compartilhada com o :class:`OAuth2Client` e as
+        threads do *hedge*."""
+        self.session.close()
+        if self._executor_hedge is not None:
+            self._executor_hedge.shutdown(wait=False)
+
+    def __enter__(self) -> 'BankPixAPIBase':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def warmup(
+        self, connections: int = 1, token_connections: int = 1
+    ) -> RelatorioAquecimento:
+        """Aquece o cliente antes das primeiras requisições.
+
+        Abre ``connections`` conexões com o host da API e
+        ``token_connections`` com o do ``TOKEN_URL`` (DNS, TCP e handshake
+        mTLS, sem enviar requisição) e obtém o token dos escopos do banco.
+        Pensado para o *readiness probe* de um *worker* recém-iniciado: depois
+        dele, a primeira requisição de um cliente não paga nenhum desses
+        custos. Pode ser chamado de novo; conexões e token já prontos não são
+        refeitos.
+
+        Só as sessões HTTP/1.1 (``requests`` e ``transport='urllib3'``) têm
+        conexões aquecidas; com ``transport='h2'`` apenas o token é obtido.
+
+        Args:
+            connections: Conexões com a API; limitado ao ``pool_maxsize``.
+                Dimensione pelo número de requisições simultâneas esperadas
+            token_connections: Conexões com o endpoint de token. No
+                ``sandbox_mode``, que não pede token, nenhuma é aberta
+
+        Returns:
+            RelatorioAquecimento: Conexões abertas e duração de cada fase
+
+        Raises:
+            PixTimeoutException: Se uma conexão exceder o tempo limite
+            PixConexaoException: Se uma conexão falhar
+            PixAPIException: Se a obtenção do token falhar
+        """
+        fases: dict[str, float] = {}
+        inicio = time.perf_counter()
+        conexoes_api = self._abre_conexoes(
+            self.session,
+            self.get_base_url(),
+            connections,
+            timeout_de_conexao(self.timeout),
+        )
+        fases['conexoes_api'] = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        conexoes_token = 0
+        if not self.sandbox_mode:
+            conexoes_token = self._abre_conexoes(
+                self.oauth.token_session,
+                self.oauth.token_url,
+                token_connections,
+                timeout_de_conexao(self.oauth.timeout),
+            )
+        fases['conexoes_token'] = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        self._create_headers()
+        fases['token'] = time.perf_counter() - inicio
+        return RelatorioAquecimento(conexoes_api, conexoes_token, fases)
+
+    @staticmethod
+    def _abre_conexoes(session: Any, url: str, quantidade: int, timeout: float) -> int:
+        """:func:`~pypix_api.pool.abre_conexoes`, com as exceções da biblioteca."""
+        try:
+            return abre_conexoes(session, url, quantidade, timeout)
+        except TimeoutError as exc:
+            raise PixTimeoutException(
+                detail=f'Conexão com {url} excedeu o tempo limite ({timeout}): {exc}'
+            ) from exc
+        except OSError as exc:
+            raise PixConexaoException(
+                detail=f'Conexão com {url} falhou: {exc}'
+            ) from exc
 
     def _create_headers(self) -> dict[str, str]:
         """
         Cria os headers necessários para as requisições.
         """
         if self.sandbox_mode:
-            import os
+            token = self._token_do_sandbox()
+        else:
+            token = self.oauth.get_token(self._scopes_do_token())
+        return self._headers_com_token(token)
 
-            from dotenv import load_dotenv
+    def _token_do_sandbox(self) -> str:
+        """:meth:`_token_sandbox`, lido uma vez por instância.
 
-            load_dotenv()
+        Lido na construção quando ``sandbox_mode=True``; aqui só para quem
+        liga o ``sandbox_mode`` depois.
+        """
+        if self._token_fixo is None:
+            self._token_fixo = self._token_sandbox()
+        return self._token_fixo
 
-            token = os.getenv('SANDBOX_TOKEN', 'sandbox-token')
-        else:
-            token = self.oauth.get_token(self._scopes_do_token())
+    @staticmethod
+    def _token_sandbox() -> str:
+        """Token fixo do ``sandbox_mode``, lido de ``SANDBOX_TOKEN``."""
+        import os
+
+        from dotenv import load_dotenv
+
+        load_dotenv()
+
+        return os.getenv('SANDBOX_TOKEN', 'sandbox-token')
 
-        return {
-            'Authorization': f'Bearer {token}',
-            'Content-Type': 'application/json',
-            'User-Agent': 'PyPixAPIClient/0.1',
-            'client_id': self.client_id or '',
-        }
+    def _headers_com_token(self, token: str) -> dict[str, str]:
+        """Headers de toda requisição de negócio, autenticados com ``token``.
+
+        O mapa é montado uma vez por token e copiado a cada chamada — quem
+        recebe pode acrescentar ``extra_headers`` sem afetar as outras.
+        """
+        em_cache = self._headers_do_token
+        if em_cache is None or em_cache[0] != token:
+            # Uma tupla, trocada de uma vez: outra thread nunca vê o token de
+            # um par com os headers do outro
+            em_cache = self._headers_do_token = (
+                token,
+                {
+                    'Authorization': f'Bearer {token}',
+                    'Content-Type': 'application/json',
+                    'User-Agent': 'PyPixAPIClient/0.1',
+                    'client_id': self.client_id or '',
+                },
+            )
+        return em_cache[1].copy()
 
     def _scopes_do_token(self) -> str:
         """Escopos a solicitar ao PSP nesta instância.
@@ -236,23 +575,43 @@ class BankPixAPIBase(
         Devolve os escopos informados em ``scopes=`` quando houver; do
         contrário, o grupo Pix completo do banco — resolvido aqui, e não na
         construção, para que a instância só dependa do ``ScopeRegistry`` no
-        momento em que realmente pede um token.
+        momento em que realmente pede um token. O grupo é resolvido uma vez.
         """
         if self.scopes is not None:
             return self.scopes
-        return get_pix_scopes(self.get_bank_code())
+        if self._scopes_do_banco is None:
+            self._scopes_do_banco = get_pix_scopes(self.get_bank_code())
+        return self._scopes_do_banco
 
     def get_bank_code(self) -> str:
         raise NotImplementedError('get_bank_code not implemented')
 
+    @classmethod
+    def rotas(cls) -> TabelaDeRotas:
+        """Tabela de rotas da API Pix para este banco, compilada uma vez."""
+        tabela = cls.__dict__.get('_tabela_de_rotas')
+        if tabela is None:
+            tabela = TabelaDeRotas(cls._prefixo_de_versao)
+            cls._tabela_de_rotas = tabela
+        return tabela
+
+    @classmethod
+    def _prefixo_de_versao(cls, path: str) -> str:
+        """Prefixo de versão do banco para ``path`` (ex.: ``'/v2'``).
+
+        Por padrão vazio: a URL base do banco já traz a versão. Bancos com
+        versionamento por recurso (ex.: Sicredi) sobrescrevem. Chamado uma
+        vez por caminho da especificação, na compilação de :meth:`rotas`, e
+        a cada requisição apenas para caminhos fora dela.
+        """
+        return ''
+
     def _endpoint_url(self, path: str) -> str:
         """Monta a URL absoluta de um endpoint a partir do caminho relativo.
 
-        Por padrão concatena o caminho à URL base única do banco
-        (``get_base_url()``), preservando o comportamento histórico. Bancos
-        cuja API utilize versionamento por recurso (ex.: Sicredi, com ``cob``
-        em v3 e demais recursos em v2/v1) devem sobrescrever este método para
-        resolver a versão correta a partir do ``path``.
+        O prefixo de versão vem da tabela de :meth:`rotas`; caminhos fora da
+        especificação (endpoints próprios do banco) caem em
+        :meth:`_prefixo_de_versao`.
 
         Args:
             path: Caminho do endpoint relativo à base, iniciado por ``/``
@@ -261,7 +620,21 @@ class BankPixAPIBase(
         Returns:
             str: URL absoluta do endpoint.
         """
-        return f'{self.get_base_url()}{path}'
+        prefixo = self._rotas.prefixo(path)
+        if prefixo is None:
+            prefixo = self._prefixo_de_versao(path)
+        return f'{self.get_base_url()}{prefixo}{path}'
+
+    def operacao(self, method: str, path: str) -> str:
+        """Rótulo de métrica da requisição (``'cob.item.put'``).
+
+        Fora da especificação, ``{recurso}.{verbo}`` — nunca inclui os
+        identificadores do caminho.
+        """
+        rota = self._rotas.resolve(method, path)
+        if rota is not None:
+            return rota.nome
+        return f'{recurso_do_path(path)}.{method.lower()}'
 
     def _request(
         self,
@@ -274,7 +647,9 @@ class BankPixAPIBase(
         """Executa uma requisição à API do banco.
 
         Ponto único de saída HTTP da biblioteca: garante o timeout, monta os
-        headers de autenticação e trata a resposta de erro. Devolve o
+        headers de autenticação, repete as falhas transitórias quando há
+        ``retry`` configurado, coalesce as consultas idênticas quando há
+        ``single_flight`` e trata a resposta de erro. Devolve o
         ``Response`` cru — há métodos que dependem do ``status_code`` (204 na
         exclusão de webhook) e não apenas do corpo JSON.
 
@@ -284,7 +659,10 @@ class BankPixAPIBase(
             extra_headers: Headers adicionais. Os headers de autenticação
                 (``Authorization`` e ``client_id``) não são sobrescrevíveis:
                 informá-los aqui levanta ``ValueError``
-            **kwargs: Repassados ao ``requests`` (``json``, ``params``, ...)
+            **kwargs: Repassados ao ``requests`` (``json``, ``params``, ...).
+                ``json`` em ``bytes`` é um corpo já codificado, enviado como está;
+                um :class:`~pypix_api.streaming_body.StreamingBody` é enviado
+                em partes, com ``Transfer-Encoding: chunked``
 
         Returns:
             requests.Response: Resposta já validada por
@@ -293,39 +671,509 @@ class BankPixAPIBase(
         Raises:
             ValueError: Se ``extra_headers`` tentar redefinir um header de
                 autenticação
-            PixTimeoutException: Se a requisição exceder o tempo limite
+            PixTimeoutException: Se a requisição exceder o tempo limite (na
+                última tentativa, quando há repetição)
             PixConexaoException: Se houver falha de conexão
             PixAPIException: Para os erros devolvidos pelo PSP
         """
         # Validado antes de `_create_headers`, que pode disparar uma requisição
         # de token: um erro de programação não deve custar um token ao PSP.
-        if extra_headers:
-            conflitos = sorted(
-                chave for chave in extra_headers if chave.lower() in _HEADERS_PROTEGIDOS
+        _valida_extra_headers(extra_headers)
+        if self.deadline is None:
+            return self._intercepta(method, path, extra_headers, kwargs)
+        with abre_prazo(self.deadline):
+            return self._intercepta(method, path, extra_headers, kwargs)
+
+    def _intercepta(
+        self,
+        method: str,
+        path: str,
+        extra_headers: dict[str, str] | None,
+        kwargs: dict[str, Any],
+    ) -> requests.Response:
+        """:meth:`_coalesce_request`, passando pelos ``interceptors``."""
+        if self._cadeia is None:
+            return self._coalesce_request(method, path, extra_headers, kwargs)
+        return self._cadeia(self._chamada(method, path, extra_headers, kwargs))
+
+    def _chamada(
+        self,
+        method: str,
+        path: str,
+        extra_headers: dict[str, str] | None,
+        kwargs: dict[str, Any],
+    ) -> RequestCall:
+        return RequestCall(
+            method=method,
+            path=path,
+            operation=self.operacao(method, path),
+            bank=self.get_bank_code(),
+            extra_headers=extra_headers,
+            kwargs=kwargs,
+        )
+
+    def _monta_cadeia(self) -> CallNext:
+        def final(call: RequestCall) -> requests.Response:
+            # Um interceptador pode ter mexido nos headers; e uma repetição
+            # chama de novo com os mesmos kwargs, que `_executa_request` altera
+            _valida_extra_headers(call.extra_headers)
+            return self._coalesce_request(
+                call.method, call.path, call.extra_headers, dict(call.kwargs)
             )
-            if conflitos:
-                raise ValueError(
-                    'Headers de autenticação não podem ser redefinidos via '
-                    f'extra_headers: {", ".join(conflitos)}'
-                )
 
+        return monta_cadeia(self.interceptors, final)
+
+    def _coalesce_request(
+        self,
+        method: str,
+        path: str,
+        extra_headers: dict[str, str] | None,
+        kwargs: dict[str, Any],
+    ) -> requests.Response:
+        """:meth:`_executa_request`, pegando carona numa consulta idêntica em
+        andamento quando há ``single_flight``."""
+        if self._voos is None or method != 'GET':
+            return self._executa_request(method, path, extra_headers, kwargs)
+
+        chave = chave_da_consulta(path, kwargs.get('params'), extra_headers)
+        try:
+            response, compartilhado = self._voos.executa(
+                chave,
+                lambda: self._executa_request(method, path, extra_headers, kwargs),
+                tempo_restante(),
+            )
+        except TimeoutError as exc:
+            raise PixTimeoutException(
+                detail=f'Prazo esgotado esperando a consulta idêntica a {path}'
+            ) from exc
+        if compartilhado:
+            SingleFlight.conta(self.get_bank_code(), recurso_do_path(path))
+        return response
+
+    def _codifica_corpo(self, kwargs: dict[str, Any], destino: str) -> bool:
+        """Troca o ``json`` de ``kwargs`` pelo corpo em ``bytes``, em
+        ``kwargs[destino]`` (``'data'`` no ``requests``, ``'content'`` no
+        ``httpx``), quando ele já vem codificado ou há ``json_codec``, ou
+        pelas partes de um :class:`~pypix_api.streaming_body.StreamingBody`.
+
+        O Content-Type já vem de :meth:`_headers_com_token`.
+
+        Returns:
+            bool: Se o corpo pode ser enviado de novo numa repetição
+        """
+        corpo = kwargs.get('json')
+        if isinstance(corpo, bytes):
+            # Já codificado (ver `pypix_api.body_template`): vai como está
+            kwargs[destino] = kwargs.pop('json')
+        elif isinstance(corpo, StreamingBody):
+            kwargs.pop('json')
+            kwargs[destino] = self._partes_do_corpo(corpo)
+            return corpo.replayable
+        elif self.json_codec is not None and corpo is not None:
+            kwargs[destino] = self.json_codec.dumps(kwargs.pop('json'))
+        return True
+
+    def _partes_do_corpo(self, corpo: StreamingBody) -> PartesDoCorpo:
+        """As partes de ``corpo`` como o ``data=`` da sessão as aceita."""
+        return CorpoEmPartes(lambda: corpo.chunks(self.json_codec))
+
+    def _comprime_corpo(
+        self,
+        method: str,
+        path: str,
+        headers: dict[str, str],
+        kwargs: dict[str, Any],
+        destino: str,
+    ) -> None:
+        """Aplica a ``compression``: pede a listagem comprimida ou comprime
+        o corpo já em ``kwargs[destino]`` (ver :meth:`_codifica_corpo`)."""
+        politica = self.compression
+        operacao = self.operacao(method, path)
+        if eh_listagem(method, operacao):
+            if politica.accept_encoding is not None:
+                headers['Accept-Encoding'] = politica.accept_encoding
+            return
+        if kwargs.get('json') is not None:
+            # Sem `json_codec`: o tamanho só se sabe com o corpo codificado
+            kwargs[destino] = StdlibJsonCodec().dumps(kwargs.pop('json'))
+        corpo = kwargs.get(destino)
+        if isinstance(corpo, PartesDoCorpo):
+            self._comprime_partes(operacao, headers, kwargs, destino)
+            return
+        if not isinstance(corpo, bytes) or not politica.comprime(operacao, corpo):
+            return
+        comprimido = gzip_do_corpo(corpo, politica.level)
+        kwargs[destino] = comprimido
+        headers['Content-Encoding'] = 'gzip'
+        conta_bytes(
+            'request', self.get_bank_code(), operacao, len(corpo), len(comprimido)
+        )
+
+    def _comprime_partes(
+        self,
+        operacao: str,
+        headers: dict[str, str],
+        kwargs: dict[str, Any],
+        destino: str,
+    ) -> None:
+        """Comprime, conforme são enviadas, as partes de um corpo de
+        tamanho desconhecido; o ``min_size`` não se aplica."""
+        politica = self.compression
+        if not politica.comprime(operacao):
+            return
+        banco = self.get_bank_code()
+
+        def comprime(partes: Iterator[bytes]) -> Iterator[bytes]:
+            return gzip_em_partes(
+                partes,
+                politica.level,
+                lambda original, comprimido: conta_bytes(
+                    'request', banco, operacao, original, comprimido
+                ),
+            )
+
+        kwargs[destino] = kwargs[destino].transforma(comprime)
+        headers['Content-Encoding'] = 'gzip'
+
+    def _aceita_resposta(
+        self, method: str, path: str, response: requests.Response
+    ) -> requests.Response:
+        """Resposta final da chamada, já validada por
+        :meth:`_handle_error_response`."""
+        self._handle_error_response(response)
+        if self.compression is not None:
+            self._conta_resposta(method, path, response)
+        return response
+
+    def _conta_resposta(
+        self, method: str, path: str, response: requests.Response
+    ) -> None:
+        """Registra os tamanhos de uma listagem que chegou comprimida."""
+        codificacao = response.headers.get('Content-Encoding', 'identity')
+        operacao = self.operacao(method, path)
+        if codificacao == 'identity' or not eh_listagem(method, operacao):
+            return
+        transferido = tamanho_transferido(response)
+        if transferido is not None:
+            conta_bytes(
+                'response',
+                self.get_bank_code(),
+                operacao,
+                len(response.content),
+                transferido,
+            )
+
+    def _executa_request(
+        self,
+        method: str,
+        path: str,
+        extra_headers: dict[str, str] | None,
+        kwargs: dict[str, Any],
+    ) -> requests.Response:
+        """Corpo de :meth:`_request`: headers, tentativas e tratamento de erro."""
         headers = self._create_headers()
         if extra_headers:
             headers.update(extra_headers)
-        kwargs.setdefault('timeout', self.timeout)
+        if 'timeout' not in kwargs:
+            kwargs['timeout'] = self._timeout_padrao(method, path)
+        reenviavel = self._codifica_corpo(kwargs, 'data')
+        if self.compression is not None:
+            self._comprime_corpo(method, path, headers, kwargs, 'data')
 
         url = self._endpoint_url(path)
+        if self._orcamento_retry is not None:
+            self._orcamento_retry.deposita()
+
+        tentativa = 0
+        while True:
+            try:
+                response = self._envia_hedge(method, path, url, headers, kwargs)
+            except PixErroTransporteException:
+                espera = self._espera_para_repetir(
+                    method, path, tentativa, reenviavel=reenviavel
+                )
+                if espera is None:
+                    raise
+            else:
+                espera = self._espera_para_repetir(
+                    method, path, tentativa, response, reenviavel=reenviavel
+                )
+                if espera is None:
+                    return self._aceita_resposta(method, path, response)
+            time.sleep(espera)
+            tentativa += 1
+
+    def _envia_hedge(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        headers: dict[str, str],
+        kwargs: dict[str, Any],
+    ) -> requests.Response:
+        """:meth:`_envia`, com cópia da consulta quando há ``hedge``.
+
+        A original e a cópia rodam no executor do cliente; a primeira resposta
+        vence. O ``requests`` não interrompe uma requisição em andamento: a
+        perdedora segue até o fim em segundo plano e sua resposta é fechada e
+        descartada. Se as duas falharem, levanta a falha da original.
+
+        O executor não enfileira: sem thread livre, a original vai pela thread
+        de quem chamou, sem cópia, e a cópia não sai.
+        """
+        if self._hedger is None or method != 'GET':
+            return self._envia(method, path, url, headers, kwargs)
+        recurso = recurso_do_path(path)
+        atraso = self._hedger.atraso(recurso)
+        envia = self._envia_medido
+        if atraso is None:
+            return envia(method, path, url, headers, kwargs)
+
+        executor = self._executor_hedge
+        original = executor.envia(envia, method, path, url, headers, kwargs)
+        if original is None:
+            return envia(method, path, url, headers, kwargs)
+        feitos, _ = wait([original], timeout=atraso)
+        copia = None
+        if not feitos:
+            copia = executor.envia(
+                envia,
+                method,
+                path,
+                url,
+                headers,
+                kwargs,
+                permitido=self._hedger.pode_duplicar,
+            )
+        if copia is None:
+            return original.result()
+        return self._primeira_resposta(original, copia, recurso)
+
+    def _primeira_resposta(
+        self,
+        original: Future[requests.Response],
+        copia: Future[requests.Response],
+        recurso: str,
+    ) -> requests.Response:
+        """A primeira resposta entre a original e a cópia já enviada; a
+        perdedora é descartada ao terminar."""
+        banco = self.get_bank_code()
+        Hedger.conta('sent', banco, recurso)
+        pendentes = {original, copia}
+        while pendentes:
+            feitos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in feitos:
+                if futuro.exception() is None:
+                    if futuro is copia:
+                        Hedger.conta('won', banco, recurso)
+                    for perdedor in pendentes:
+                        perdedor.cancel()
+                        perdedor.add_done_callback(_descarta_resposta)
+                    return futuro.result()
+        return original.result()
+
+    def _envia_medido(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        headers: dict[str, str],
+        kwargs: dict[str, Any],
+    ) -> requests.Response:
+        """:meth:`_envia`, alimentando as latências do ``hedge``."""
+        inicio = time.perf_counter()
+        response = self._envia(method, path, url, headers, kwargs)
+        self._hedger.observa(recurso_do_path(path), time.perf_counter() - inicio)
+        return response
+
+    def _envia(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        headers: dict[str, str],
+        kwargs: dict[str, Any],
+    ) -> requests.Response:
+        """Uma tentativa da requisição, com as falhas de transporte já mapeadas.
+
+        Raises:
+            PixCircuitoAbertoException: Se o circuito do recurso estiver aberto
+            PixTimeoutException: Se a requisição exceder o tempo limite ou se
+                a vaga em ``concurrency_limiter`` não vier a tempo
+            PixConexaoException: Se houver falha de conexão
+        """
+        prazo = prazo_atual()
+        # A vez no limitador vem antes do circuito: a espera na fila não pode
+        # prender a vaga de sondagem do circuito meio-aberto.
+        if self.rate_limiter is not None:
+            try:
+                self.rate_limiter.adquire(
+                    self.get_bank_code(),
+                    recurso_do_path(path),
+                    None if prazo is None else prazo.restante(),
+                )
+            except TimeoutError as exc:
+                raise PixTimeoutException(
+                    detail=f'Prazo esgotado antes da vez de {method} {url}: {exc}'
+                ) from exc
+        if self.concurrency_limiter is None:
+            return self._envia_ao_psp(method, path, url, headers, kwargs, prazo)
+
+        ficha = self._adquire_vaga(method, url, prazo)
+        latencia: float | None = None
+        sobrecarga = False
+        inicio = time.perf_counter()
+        try:
+            response = self._envia_ao_psp(method, path, url, headers, kwargs, prazo)
+            latencia = time.perf_counter() - inicio
+            sobrecarga = response.status_code in STATUS_DE_SOBRECARGA
+            return response
+        except PixTimeoutException as exc:
+            # Só o timeout do PSP; o prazo esgotado antes de enviar não
+            sobrecarga = isinstance(exc.__cause__, requests.Timeout)
+            raise
+        finally:
+            self.concurrency_limiter.libera(ficha, latencia, sobrecarga)
+
+    def _adquire_vaga(self, method: str, url: str, prazo: Prazo | None) -> float:
+        """Vaga no ``concurrency_limiter``.
+
+        Raises:
+            PixTimeoutException: Se a vaga não vier a tempo
+        """
+        try:
+            return self.concurrency_limiter.adquire(self._espera_por_vaga(prazo))
+        except TimeoutError as exc:
+            raise PixTimeoutException(
+                detail=f'Sem vaga para {method} {url}: {exc}'
+            ) from exc
+
+    def _espera_por_vaga(self, prazo: Prazo | None) -> float | None:
+        """Espera máxima por vaga: o ``max_wait`` da política ou o que resta do
+        prazo, o que for menor."""
+        limites = [self.concurrency_limiter.policy.max_wait]
+        if prazo is not None:
+            limites.append(prazo.restante())
+        return min((t for t in limites if t is not None), default=None)
+
+    def _envia_ao_psp(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        headers: dict[str, str],
+        kwargs: dict[str, Any],
+        prazo: Prazo | None,
+    ) -> requests.Response:
+        """A requisição em si, com prazo, circuito e latências."""
+        if prazo is not None:
+            # Cópia: o `kwargs` é o mesmo em todas as tentativas e no hedge
+            etapa = f'{method} {url}'
+            kwargs = {**kwargs, 'timeout': prazo.limita(kwargs['timeout'], etapa)}
+        circuito = self._circuito(path)
+        geracao = circuito.antes() if circuito is not None else 0
+        inicio = time.perf_counter()
+        # Só timeout, conexão e 5xx são falhas do PSP; qualquer outra exceção
+        # (ex.: corpo que não serializa) deixa ``None`` e não conta.
+        falhou: bool | None = None
         try:
             response = self.session.request(method, url, headers=headers, **kwargs)
+            falhou = response.status_code >= 500
+            if self.adaptive_timeout is not None:
+                self._observa_latencia(method, path, time.perf_counter() - inicio)
+            return response
         except requests.Timeout as exc:
+            falhou = True
+            # Um timeout encurtado pelo prazo não diz nada sobre a operação
+            if (
+                self.adaptive_timeout is not None
+                and prazo is None
+                and isinstance(exc, requests.ReadTimeout)
+            ):
+                self._observa_timeout(method, path, kwargs['timeout'])
             raise PixTimeoutException(
                 detail=f'{method} {url} excedeu o tempo limite ({self.timeout}): {exc}'
             ) from exc
         except requests.RequestException as exc:
+            falhou = isinstance(exc, FALHAS_DE_CONEXAO)
             raise PixConexaoException(detail=f'{method} {url} falhou: {exc}') from exc
+        finally:
+            if circuito is not None:
+                circuito.registra(geracao, falhou, time.perf_counter() - inicio)
 
-        self._handle_error_response(response)
-        return response
+    def _timeout_padrao(self, method: str, path: str) -> Timeout:
+        """``timeout`` das requisições que não informam o seu: o do cliente,
+        com a leitura de ``adaptive_timeout`` quando houver."""
+        if self.adaptive_timeout is None:
+            return self.timeout
+        if isinstance(self.timeout, tuple):
+            conexao, leitura = self.timeout
+        else:
+            conexao = leitura = self.timeout
+        adaptativo = self.adaptive_timeout.leitura(
+            self.get_bank_code(), self.operacao(method, path), leitura
+        )
+        return self.timeout if adaptativo is None else (conexao, adaptativo)
+
+    def _observa_latencia(self, method: str, path: str, duracao: float) -> None:
+        self.adaptive_timeout.observa(
+            self.get_bank_code(), self.operacao(method, path), duracao
+        )
+
+    def _observa_timeout(self, method: str, path: str, timeout: Timeout) -> None:
+        """Registra o tempo de leitura estourado como latência da operação."""
+        leitura = timeout[1] if isinstance(timeout, tuple) else timeout
+        if leitura is not None:
+            self._observa_latencia(method, path, leitura)
+
+    def _circuito(self, path: str) -> CircuitBreaker | None:
+        """Circuito do recurso de ``path``, ou ``None`` sem circuit breaker."""
+        if self.circuit_breaker is None:
+            return None
+        return self.circuit_breaker.circuito(
+            self.get_bank_code(), recurso_do_path(path)
+        )
+
+    def _espera_para_repetir(
+        self,
+        method: str,
+        path: str,
+        tentativa: int,
+        response: requests.Response | None = None,
+        *,
+        reenviavel: bool = True,
+    ) -> float | None:
+        """Segundos a esperar antes de repetir, ou ``None`` se não for repetir.
+
+        Args:
+            method: Verbo HTTP
+            path: Caminho relativo à base
+            tentativa: Repetições já feitas
+            response: Resposta recebida; ``None`` quando a tentativa falhou no
+                transporte (timeout, conexão)
+            reenviavel: Se o corpo pode ser enviado de novo (ver
+                :attr:`~pypix_api.streaming_body.StreamingBody.replayable`)
+        """
+        politica = self.retry
+        if politica is None or self._orcamento_retry is None or not reenviavel:
+            return None
+        if response is not None and response.status_code not in politica.status:
+            return None
+        if tentativa >= politica.max_retries or not politica.idempotente(method, path):
+            return None
+
+        pedido = None if response is None else retry_after(response)
+        if pedido is not None and pedido > politica.retry_after_max:
+            return None
+        espera = politica.backoff(tentativa) if pedido is None else pedido
+        # Dentro de um prazo, não espera por uma tentativa que não caberia nele
+        restante = tempo_restante()
+        if restante is not None and espera >= restante:
+            return None
+        # O saque fica por último: só gasta orçamento a repetição que vai acontecer.
+        if not self._orcamento_retry.saca():
+            return None
+        return espera
 
     def _handle_error_response(
         self, response: requests.Response, **kwargs: Any
@@ -393,7 +1241,7 @@ class BankPixAPIBase(
                 response.status_code,
                 'Resposta sem corpo onde a especificação exige um',
             )
-        return response.json()
+        return self._decodifica(response)
 
     def _json_opcional(self, response: requests.Response) -> dict[str, Any]:
         """Corpo JSON de uma resposta que pode vir vazia.
@@ -404,17 +1252,34 @@ class BankPixAPIBase(
         """
         if not response.content:
             return {}
-        return response.json()
+        return self._decodifica(response)
 
-    @staticmethod
-    def _extrai_erro(response: requests.Response) -> dict[str, Any]:
+    def _sucesso(self, response: requests.Response) -> bool:
+        """Indica se a resposta foi um 2xx.
+
+        Usado pelas exclusões, que devolvem ``bool`` em vez de corpo. Como
+        `_request` já levantou em caso de erro, na prática é sempre ``True``.
+        """
+        return response.ok
+
+    def _decodifica(self, response: requests.Response) -> Any:
+        """Corpo JSON da resposta, pelo ``json_codec`` quando houver.
+
+        Raises:
+            ValueError: Se o corpo não for JSON válido
+        """
+        if self.json_codec is None:
+            return response.json()
+        return self.json_codec.loads(response.content)
+
+    def _extrai_erro(self, response: requests.Response) -> dict[str, Any]:
         """Extrai o corpo de erro, tolerando JSON válido que não seja um objeto.
 
         ``null`` e listas são JSON válidos e não levantam ``ValueError``; sem
         esta checagem, o acesso aos campos estouraria com ``AttributeError``.
         """
         try:
-            dados = response.json()
+            dados = self._decodifica(response)
         except ValueError:
             return {}
         return dados if isinstance(dados, dict) else {}
@@ -1,3 +1,4 @@
+from pypix_api.banks.async_base import AsyncBankPixAPIBase
 from pypix_api.banks.base import BankPixAPIBase
 from pypix_api.banks.methods.pix_bb_methods import PixBBMethods
 
@@ -35,3 +36,11 @@ class BBPixAPI(PixBBMethods, BankPixAPIBase):
         if self.sandbox_mode:
             return self.SANDBOX_BASE_URL
         return self.BASE_URL
+
+
+class AsyncBBPixAPI(AsyncBankPixAPIBase, BBPixAPI):
+    """Cliente assíncrono da API PIX do Banco do Brasil.
+
+    Mesmos métodos de :class:`BBPixAPI`, como corrotinas. Recebe um
+    :class:`~pypix_api.auth.async_oauth2.AsyncOAuth2Client`.
+    """
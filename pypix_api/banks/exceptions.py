@@ -8,6 +8,7 @@ from pypix_api.exceptions import (
     EXCECOES_POR_STATUS,
     PixAcessoNegadoException,
     PixAPIException,
+    PixCircuitoAbertoException,
     PixConexaoException,
     PixErroDesconhecidoException,
     PixErroServicoIndisponivelException,
@@ -25,6 +26,7 @@ __all__ = [
     'EXCECOES_POR_STATUS',
     'PixAPIException',
     'PixAcessoNegadoException',
+    'PixCircuitoAbertoException',
     'PixConexaoException',
     'PixErroDesconhecidoException',
     'PixErroServicoIndisponivelException',
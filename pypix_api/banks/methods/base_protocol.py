@@ -39,6 +39,10 @@ class PixAPIProtocol(Protocol):
         """Corpo JSON de uma resposta que pode vir vazia."""
         ...
 
+    def _sucesso(self, response: requests.Response) -> bool:
+        """Indica se a resposta foi um 2xx."""
+        ...
+
     def get_base_url(self) -> str:
         """Obtém a URL base da API."""
         ...
@@ -36,7 +36,7 @@ class CobMethods:  # pylint: disable=E1101
     Esta classe é herdada pela BankPixAPIBase.
     """
 
-    def criar_cob(self, txid: str, body: dict[str, Any]) -> dict[str, Any]:
+    def criar_cob(self, txid: str, body: dict[str, Any] | bytes) -> dict[str, Any]:
         """
         Criar cobrança imediata com txid específico.
 
@@ -44,7 +44,8 @@ class CobMethods:  # pylint: disable=E1101
 
         Args:
             txid: Identificador da transação
-            body: Dados da cobrança imediata
+            body: Dados da cobrança imediata, ou o JSON já codificado (``bytes``; ver
+                :mod:`pypix_api.body_template`)
 
         Returns:
             dict contendo os dados da cobrança criada
@@ -55,14 +56,15 @@ class CobMethods:  # pylint: disable=E1101
         resp = self._request('PUT', f'/cob/{txid}', json=body)
         return self._json(resp)
 
-    def criar_cob_auto_txid(self, body: dict[str, Any]) -> dict[str, Any]:
+    def criar_cob_auto_txid(self, body: dict[str, Any] | bytes) -> dict[str, Any]:
         """
         Criar cobrança imediata com txid automático.
 
         Endpoint para criar uma cobrança imediata onde o txid é definido pelo PSP.
 
         Args:
-            body: Dados da cobrança imediata
+            body: Dados da cobrança imediata, ou o JSON já codificado (``bytes``; ver
+                :mod:`pypix_api.body_template`)
 
         Returns:
             dict contendo os dados da cobrança criada
@@ -73,7 +75,7 @@ class CobMethods:  # pylint: disable=E1101
         resp = self._request('POST', '/cob', json=body)
         return self._json(resp)
 
-    def revisar_cob(self, txid: str, body: dict[str, Any]) -> dict[str, Any]:
+    def revisar_cob(self, txid: str, body: dict[str, Any] | bytes) -> dict[str, Any]:
         """
         Revisar cobrança imediata.
 
@@ -82,7 +84,8 @@ class CobMethods:  # pylint: disable=E1101
 
         Args:
             txid: Identificador da transação
-            body: Dados da cobrança revisada
+            body: Dados da cobrança revisada, ou o JSON já codificado (``bytes``; ver
+                :mod:`pypix_api.body_template`)
 
         Returns:
             dict contendo os dados da cobrança revisada
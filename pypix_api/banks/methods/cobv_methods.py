@@ -28,16 +28,18 @@ class CobVMethods:  # pylint: disable=E1101
     Métodos para lidar com cobrança Pix com vencimento (CobV).
     """
 
-    def criar_cobv(self, txid: str, body: dict[str, Any]) -> dict[str, Any]:
+    def criar_cobv(self, txid: str, body: dict[str, Any] | bytes) -> dict[str, Any]:
         """
-        Cria uma cobrança com vencimento (CobV).
+        Cria uma cobrança com vencimento (CobV). ``body`` pode vir já
+        codificado em JSON (``bytes``; ver :mod:`pypix_api.body_template`).
         """
         resp = self._request('PUT', f'/cobv/{txid}', json=body)
         return self._json(resp)
 
-    def revisar_cobv(self, txid: str, body: dict[str, Any]) -> dict[str, Any]:
+    def revisar_cobv(self, txid: str, body: dict[str, Any] | bytes) -> dict[str, Any]:
         """
-        Revisa uma cobrança com vencimento (CobV).
+        Revisa uma cobrança com vencimento (CobV). ``body`` pode vir já
+        codificado em JSON (``bytes``).
         """
         resp = self._request('PATCH', f'/cobv/{txid}', json=body)
         return self._json(resp)
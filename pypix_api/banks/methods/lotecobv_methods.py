@@ -36,6 +36,8 @@ Exemplo de uso:
 
 from typing import Any
 
+from pypix_api.streaming_body import StreamingBody, em_partes
+
 
 class LoteCobVMethods:  # pylint: disable=E1101
     """
@@ -43,7 +45,9 @@ class LoteCobVMethods:  # pylint: disable=E1101
     Esta classe é herdada pela BankPixAPIBase.
     """
 
-    def criar_lote_cobv(self, id_lote: str, body: dict[str, Any]) -> dict[str, Any]:
+    def criar_lote_cobv(
+        self, id_lote: str, body: dict[str, Any] | bytes | StreamingBody
+    ) -> dict[str, Any]:
         """
         Criar lote de cobranças com vencimento.
 
@@ -53,7 +57,13 @@ class LoteCobVMethods:  # pylint: disable=E1101
             id_lote: Identificador do lote de cobranças com vencimento
             body: Dados do lote contendo:
                 - descricao (str): Descrição do lote de cobranças
-                - cobsv (list): Array de cobranças com vencimento
+                - cobsv (list): Array de cobranças com vencimento. Um
+                  iterador (ex.: gerador) é codificado e enviado em partes,
+                  sem o lote inteiro na memória (ver
+                  :mod:`pypix_api.streaming_body`)
+
+                Ou o JSON já codificado (``bytes``; ver
+                :mod:`pypix_api.body_template`)
 
         Returns:
             dict contendo os dados do lote criado com status HTTP 202 (Accepted)
@@ -65,10 +75,12 @@ class LoteCobVMethods:  # pylint: disable=E1101
             Este endpoint retorna status 202 (Accepted) pois a criação do lote
             é processada de forma assíncrona.
         """
-        resp = self._request('PUT', f'/lotecobv/{id_lote}', json=body)
+        resp = self._request('PUT', f'/lotecobv/{id_lote}', json=em_partes(body))
         return self._json_opcional(resp)
 
-    def alterar_lote_cobv(self, id_lote: str, body: dict[str, Any]) -> dict[str, Any]:
+    def alterar_lote_cobv(
+        self, id_lote: str, body: dict[str, Any] | bytes | StreamingBody
+    ) -> dict[str, Any]:
         """
         Alterar lote de cobranças com vencimento.
 
@@ -81,7 +93,13 @@ class LoteCobVMethods:  # pylint: disable=E1101
             id_lote: Identificador do lote de cobranças com vencimento
             body: Dados do lote revisado contendo:
                 - descricao (str): Descrição do lote de cobranças
-                - cobsv (list): Array de cobranças com vencimento
+                - cobsv (list): Array de cobranças com vencimento. Um
+                  iterador (ex.: gerador) é codificado e enviado em partes,
+                  sem o lote inteiro na memória (ver
+                  :mod:`pypix_api.streaming_body`)
+
+                Ou o JSON já codificado (``bytes``; ver
+                :mod:`pypix_api.body_template`)
 
         Returns:
             dict contendo os dados do lote alterado com status HTTP 202 (Accepted)
@@ -93,7 +111,7 @@ class LoteCobVMethods:  # pylint: disable=E1101
             Uma vez criado um lote, não se pode remover ou adicionar cobranças
             a este lote. Apenas alterações nas cobranças existentes são permitidas.
         """
-        resp = self._request('PATCH', f'/lotecobv/{id_lote}', json=body)
+        resp = self._request('PATCH', f'/lotecobv/{id_lote}', json=em_partes(body))
         return self._json_opcional(resp)
 
     def consultar_lote_cobv(self, id_lote: str) -> dict[str, Any]:
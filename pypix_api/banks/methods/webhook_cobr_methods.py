@@ -85,4 +85,4 @@ class WebHookCobrMethods:  # pylint: disable=E1101
         # `_request` já levantou em caso de erro: qualquer 2xx é exclusão
         # bem-sucedida. A especificação prevê 204, mas um PSP que responda
         # 200 não deve ser lido como "não excluiu".
-        return resp.ok
+        return self._sucesso(resp)
@@ -1,3 +1,4 @@
+from pypix_api.banks.async_base import AsyncBankPixAPIBase
 from pypix_api.banks.base import BankPixAPIBase
 
 
@@ -36,3 +37,11 @@ class SicoobPixAPI(BankPixAPIBase):
         if self.sandbox_mode:
             return self.SANDBOX_BASE_URL
         return self.BASE_URL
+
+
+class AsyncSicoobPixAPI(AsyncBankPixAPIBase, SicoobPixAPI):
+    """Cliente assíncrono da API PIX do Sicoob.
+
+    Mesmos métodos de :class:`SicoobPixAPI`, como corrotinas. Recebe um
+    :class:`~pypix_api.auth.async_oauth2.AsyncOAuth2Client`.
+    """
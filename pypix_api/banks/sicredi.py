@@ -1,5 +1,6 @@
 from typing import ClassVar
 
+from pypix_api.banks.async_base import AsyncBankPixAPIBase
 from pypix_api.banks.base import BankPixAPIBase
 
 
@@ -12,7 +13,8 @@ class SicrediPixAPI(BankPixAPIBase):
     (``cobv``, ``pix``, ``webhook``, ``loc``, ``lotecobv``) em ``v2`` e todo o
     Pix Automático (``cobr``, ``rec``, ``locrec``, ``solicrec``,
     ``webhookcobr``, ``webhookrec``) em ``v1``. Por isso ``BASE_URL`` aponta
-    apenas para a raiz ``/api`` e a versão é injetada em ``_endpoint_url``.
+    apenas para a raiz ``/api`` e a versão entra na tabela de rotas do banco
+    (ver :meth:`_prefixo_de_versao`).
 
     A autenticação exige mTLS + OAuth2 ``client_credentials`` com
     ``Authorization: Basic base64(client_id:client_secret)``. Passe o
@@ -36,7 +38,7 @@ class SicrediPixAPI(BankPixAPIBase):
         e o certificado de homologação.
     """
 
-    # Raiz da API (sem versão) — a versão é resolvida por recurso em _endpoint_url.
+    # Raiz da API (sem versão) — a versão é resolvida por recurso nas rotas.
     BASE_URL = 'https://api-pix.sicredi.com.br/api'
     SANDBOX_BASE_URL = 'https://api-pix-h.sicredi.com.br/api'
     TOKEN_URL = 'https://api-pix.sicredi.com.br/oauth/token'  # noqa: S105
@@ -80,19 +82,25 @@ class SicrediPixAPI(BankPixAPIBase):
             return self.SANDBOX_BASE_URL
         return self.BASE_URL
 
-    def _endpoint_url(self, path: str) -> str:
-        """Resolve a URL absoluta injetando a versão correta do recurso.
+    @classmethod
+    def _prefixo_de_versao(cls, path: str) -> str:
+        """Versão do recurso de ``path``, como prefixo (``'/v3'``).
 
         Args:
             path: Caminho do endpoint relativo à base, iniciado por ``/``
                 (ex.: ``/cob/{txid}``).
-
-        Returns:
-            str: URL absoluta no formato ``{raiz}/{versão}{path}``.
         """
         segments = path.strip('/').split('/')
         resource = segments[0] if segments else ''
-        version = self.RESOURCE_VERSIONS.get(resource, self.DEFAULT_VERSION)
-        if len(segments) > 1 and resource in self.RESOURCE_ITEM_VERSIONS:
-            version = self.RESOURCE_ITEM_VERSIONS[resource]
-        return f'{self.get_base_url()}/{version}{path}'
+        version = cls.RESOURCE_VERSIONS.get(resource, cls.DEFAULT_VERSION)
+        if len(segments) > 1 and resource in cls.RESOURCE_ITEM_VERSIONS:
+            version = cls.RESOURCE_ITEM_VERSIONS[resource]
+        return f'/{version}'
+
+
+class AsyncSicrediPixAPI(AsyncBankPixAPIBase, SicrediPixAPI):
+    """Cliente assíncrono da API PIX do Sicredi.
+
+    Mesmos métodos de :class:`SicrediPixAPI`, como corrotinas. Recebe um
+    :class:`~pypix_api.auth.async_oauth2.AsyncOAuth2Client`.
+    """
@@ -0,0 +1,114 @@
+"""Corpos JSON pré-codificados, com campos preenchidos a cada chamada.
+
+Um checkout cria dezenas de milhares de cobranças por hora que só diferem em
+``valor.original`` e ``solicitacaoPagador``: chave, expiração e demais campos
+são os mesmos. :class:`BodyTemplate` codifica a parte fixa uma vez e, a cada
+chamada, só codifica os campos variáveis e os junta aos pedaços prontos::
+
+    modelo = BodyTemplate({
+        'calendario': {'expiracao': 3600},
+        'valor': {'original': Placeholder('valor')},
+        'chave': 'chave@loja.com.br',
+        'solicitacaoPagador': Placeholder('mensagem'),
+    })
+    banco.criar_cob(txid, modelo.render(valor='10.00', mensagem='Pedido 123'))
+
+``criar_cob``, ``criar_cob_auto_txid``, ``revisar_cob``, ``criar_cobv``,
+``revisar_cobv``, ``criar_lote_cobv`` e ``alterar_lote_cobv`` aceitam ``bytes`` no lugar do
+``dict``: o corpo vai ao PSP como está, sem passar pelo ``json_codec`` do
+banco. O ``Content-Type: application/json`` continua o dos headers padrão.
+"""
+
+import json
+import re
+import uuid
+from collections.abc import Mapping
+from json.encoder import encode_basestring
+from typing import Any
+
+
+class Placeholder:
+    """Campo de um :class:`BodyTemplate` preenchido a cada :meth:`~BodyTemplate.render`.
+
+    Args:
+        name: Nome do argumento de :meth:`~BodyTemplate.render`
+    """
+
+    __slots__ = ('name',)
+
+    def __init__(self, name: str) -> None:
+        if not name.isidentifier():
+            raise ValueError(f'Nome de campo inválido: {name!r}')
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f'Placeholder({self.name!r})'
+
+
+def _codifica(valor: Any) -> bytes:
+    """JSON compacto e UTF-8, como os codecs de :mod:`pypix_api.json_codec`."""
+    if type(valor) is str:
+        # O caso comum (``valor.original``, ``solicitacaoPagador``), sem o
+        # custo de montar um encoder a cada campo
+        return encode_basestring(valor).encode('utf-8')
+    return json.dumps(
+        valor, separators=(',', ':'), ensure_ascii=False, allow_nan=False
+    ).encode('utf-8')
+
+
+class BodyTemplate:
+    """Corpo JSON com a parte fixa já codificada.
+
+    Args:
+        structure: O corpo, com :class:`Placeholder` no lugar dos valores que
+            mudam a cada chamada. Um mesmo nome pode aparecer mais de uma vez
+
+    Raises:
+        ValueError: Se ``structure`` não tiver nenhum :class:`Placeholder`
+        TypeError: Se a parte fixa não for serializável em JSON
+    """
+
+    def __init__(self, structure: Mapping[str, Any]) -> None:
+        # Cada campo vira uma string única; depois de codificado, o corpo é
+        # cortado nas posições dessas strings
+        marcas: dict[str, str] = {}
+
+        def marca(no: Any) -> Any:
+            if isinstance(no, Placeholder):
+                return marcas.setdefault(no.name, f'pypix-{uuid.uuid4().hex}')
+            if isinstance(no, Mapping):
+                return {chave: marca(valor) for chave, valor in no.items()}
+            if isinstance(no, list | tuple):
+                return [marca(valor) for valor in no]
+            return no
+
+        codificado = _codifica(marca(structure))
+        if not marcas:
+            raise ValueError('O modelo não tem nenhum Placeholder.')
+        por_marca = {_codifica(m): nome for nome, m in marcas.items()}
+        # Com o grupo, `split` alterna parte fixa e marca: fixa, marca, fixa...
+        padrao = b'(' + b'|'.join(re.escape(m) for m in por_marca) + b')'
+        pedacos = re.split(padrao, codificado)
+        self._partes: list[bytes] = pedacos[::2]
+        self._campos: list[str] = [por_marca[m] for m in pedacos[1::2]]
+        self.fields = frozenset(marcas)
+
+    def render(self, **values: Any) -> bytes:
+        """Corpo pronto, com os campos preenchidos por ``values``.
+
+        Raises:
+            TypeError: Se faltar ou sobrar um campo, ou se um valor não for
+                serializável em JSON
+            ValueError: Se um valor for ``NaN`` ou infinito
+        """
+        if values.keys() != self.fields:
+            faltam = sorted(self.fields - values.keys())
+            sobram = sorted(values.keys() - self.fields)
+            raise TypeError(f'Campos do modelo: faltam {faltam}, sobram {sobram}')
+        codificados = {nome: _codifica(valor) for nome, valor in values.items()}
+        partes = self._partes
+        corpo = [partes[0]]
+        for indice, nome in enumerate(self._campos, start=1):
+            corpo.append(codificados[nome])
+            corpo.append(partes[indice])
+        return b''.join(corpo)
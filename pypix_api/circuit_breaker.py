@@ -0,0 +1,256 @@
+"""Circuit breaker por PSP e recurso.
+
+Com o PSP degradado, cada requisição espera o tempo limite inteiro de leitura
+antes de falhar — e prende uma thread durante esse tempo. O circuit breaker
+observa as últimas chamadas de cada par (banco, recurso) e, quando a fração de
+falhas ou de chamadas lentas passa do limite, **abre**: as chamadas seguintes
+falham na hora com :class:`~pypix_api.exceptions.PixCircuitoAbertoException`,
+sem sair da máquina.
+
+Passado ``open_duration``, o circuito fica **meio-aberto** e deixa passar
+``half_open_max_calls`` chamadas de sondagem. Se todas derem certo, ele fecha e
+o tráfego volta; se uma falhar, abre de novo. Uma sondagem que não devolve
+resultado em ``open_duration`` é abandonada e outra é liberada.
+
+Só contam como falha do PSP o timeout, a falha de conexão e o status 5xx. Um
+erro do próprio chamador (ex.: corpo que não serializa em JSON) ou o
+cancelamento da chamada não entram na conta.
+
+O recurso é o primeiro segmento do caminho (``/cob/{txid}`` → ``cob``): um
+problema na API de cobrança com vencimento não bloqueia a de Pix recebidos.
+
+O estado de cada circuito é publicado no
+:class:`~pypix_api.metrics.MetricsCollector` como o gauge
+``circuit_breaker.state`` (0 fechado, 1 meio-aberto, 2 aberto), com as tags
+``bank`` e ``resource``, além dos contadores ``circuit_breaker.transitions`` e
+``circuit_breaker.rejected``.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+
+from pypix_api.exceptions import PixCircuitoAbertoException
+from pypix_api.metrics import MetricsCollector
+
+FECHADO = 'closed'
+MEIO_ABERTO = 'half_open'
+ABERTO = 'open'
+
+#: Valor do gauge ``circuit_breaker.state`` para cada estado.
+VALOR_DO_ESTADO = {FECHADO: 0, MEIO_ABERTO: 1, ABERTO: 2}
+
+
+@dataclass(frozen=True)
+class CircuitBreakerConfig:
+    """Limites de abertura e de recuperação do circuito.
+
+    Attributes:
+        window_size: Quantas chamadas recentes são observadas
+        minimum_calls: Chamadas mínimas na janela antes de o circuito poder
+            abrir — evita abrir com uma única falha logo após a partida
+        failure_rate_threshold: Fração de falhas (timeout, falha de conexão ou
+            status 5xx) na janela que abre o circuito
+        slow_call_duration: Chamadas mais demoradas que isto, em segundos,
+            contam como lentas. ``None`` desliga o critério de latência
+        slow_call_rate_threshold: Fração de chamadas lentas na janela que abre
+            o circuito
+        open_duration: Segundos que o circuito fica aberto antes de sondar o
+            PSP
+        half_open_max_calls: Chamadas de sondagem permitidas no estado
+            meio-aberto; todas precisam dar certo para o circuito fechar
+    """
+
+    window_size: int = 20
+    minimum_calls: int = 10
+    failure_rate_threshold: float = 0.5
+    slow_call_duration: float | None = None
+    slow_call_rate_threshold: float = 0.8
+    open_duration: float = 30.0
+    half_open_max_calls: int = 1
+
+    def __post_init__(self) -> None:
+        if self.window_size < 1 or self.half_open_max_calls < 1:
+            raise ValueError('window_size e half_open_max_calls devem ser positivos.')
+        if not 0 < self.minimum_calls <= self.window_size:
+            raise ValueError('minimum_calls deve estar entre 1 e window_size.')
+        if not 0 < self.failure_rate_threshold <= 1:
+            raise ValueError('failure_rate_threshold deve estar em (0, 1].')
+        if not 0 < self.slow_call_rate_threshold <= 1:
+            raise ValueError('slow_call_rate_threshold deve estar em (0, 1].')
+
+
+class CircuitBreaker:
+    """Circuito de um par (banco, recurso). Seguro entre threads.
+
+    Cada chamada pede autorização a :meth:`antes`, que devolve a *geração* do
+    circuito, e entrega o resultado a :meth:`registra` com essa geração. A
+    geração muda a cada troca de estado: o resultado de uma chamada autorizada
+    numa geração anterior (ex.: uma resposta lenta de antes da abertura que
+    chega durante a sondagem) é descartado, em vez de decidir o estado atual.
+    """
+
+    def __init__(
+        self,
+        banco: str,
+        recurso: str,
+        config: CircuitBreakerConfig,
+    ) -> None:
+        self.banco = banco
+        self.recurso = recurso
+        self.config = config
+        self._agora = time.monotonic
+        self._lock = threading.Lock()
+        # Cada chamada da janela: (falhou, lenta)
+        self._janela: deque[tuple[bool, bool]] = deque(maxlen=config.window_size)
+        self._estado = FECHADO
+        self._geracao = 0
+        self._mudou_em = 0.0
+        self._sondagens = 0
+        self._sondagens_ok = 0
+        self._publica_estado()
+
+    @property
+    def estado(self) -> str:
+        """``'closed'``, ``'half_open'`` ou ``'open'``."""
+        with self._lock:
+            self._avanca_se_expirou()
+            return self._estado
+
+    def antes(self) -> int:
+        """Autoriza uma chamada.
+
+        Returns:
+            int: Geração do circuito, a devolver em :meth:`registra`
+
+        Raises:
+            PixCircuitoAbertoException: Se o circuito estiver aberto, ou
+                meio-aberto com todas as sondagens em andamento
+        """
+        with self._lock:
+            self._avanca_se_expirou()
+            if self._estado == FECHADO:
+                return self._geracao
+            if (
+                self._estado == MEIO_ABERTO
+                and self._sondagens < self.config.half_open_max_calls
+            ):
+                self._sondagens += 1
+                return self._geracao
+            restante = max(
+                0.0, self._mudou_em + self.config.open_duration - self._agora()
+            )
+        MetricsCollector().increment('circuit_breaker.rejected', tags=self._tags())
+        raise PixCircuitoAbertoException(self.banco, self.recurso, restante)
+
+    def registra(self, geracao: int, falhou: bool | None, duracao: float) -> None:
+        """Registra o resultado de uma chamada autorizada por :meth:`antes`.
+
+        Args:
+            geracao: Valor devolvido por :meth:`antes`
+            falhou: Se o PSP falhou (timeout, conexão ou 5xx). ``None`` quando
+                a chamada foi interrompida por outro motivo (erro do chamador,
+                cancelamento): a vaga de sondagem é liberada e nada é contado
+            duracao: Duração da chamada, em segundos
+        """
+        limite = self.config.slow_call_duration
+        lenta = limite is not None and duracao > limite
+        with self._lock:
+            if geracao != self._geracao:
+                return
+            if self._estado == MEIO_ABERTO:
+                if falhou is None:
+                    self._sondagens -= 1
+                elif falhou or lenta:
+                    self._muda_para(ABERTO)
+                else:
+                    self._sondagens_ok += 1
+                    if self._sondagens_ok >= self.config.half_open_max_calls:
+                        self._muda_para(FECHADO)
+                return
+            if self._estado == FECHADO and falhou is not None:
+                self._janela.append((falhou, lenta))
+                if self._deve_abrir():
+                    self._muda_para(ABERTO)
+
+    def _deve_abrir(self) -> bool:
+        total = len(self._janela)
+        if total < self.config.minimum_calls:
+            return False
+        falhas = sum(1 for falhou, _ in self._janela if falhou)
+        if falhas / total >= self.config.failure_rate_threshold:
+            return True
+        if self.config.slow_call_duration is None:
+            return False
+        lentas = sum(1 for _, lenta in self._janela if lenta)
+        return lentas / total >= self.config.slow_call_rate_threshold
+
+    def _avanca_se_expirou(self) -> None:
+        if self._agora() - self._mudou_em < self.config.open_duration:
+            return
+        if self._estado == ABERTO:
+            self._muda_para(MEIO_ABERTO)
+        elif (
+            self._estado == MEIO_ABERTO
+            and self._sondagens >= self.config.half_open_max_calls
+        ):
+            # Sondagem sem resultado há `open_duration`: quem a levou não
+            # voltou (thread morta, chamada perdida). Uma nova geração libera
+            # as vagas e descarta o resultado que ainda chegar.
+            self._muda_para(MEIO_ABERTO)
+
+    def _muda_para(self, estado: str) -> None:
+        self._estado = estado
+        self._geracao += 1
+        self._mudou_em = self._agora()
+        self._sondagens = 0
+        self._sondagens_ok = 0
+        if estado == FECHADO:
+            self._janela.clear()
+        metricas = MetricsCollector()
+        metricas.increment(
+            'circuit_breaker.transitions', tags={**self._tags(), 'to': estado}
+        )
+        self._publica_estado()
+
+    def _publica_estado(self) -> None:
+        MetricsCollector().gauge(
+            'circuit_breaker.state', VALOR_DO_ESTADO[self._estado], tags=self._tags()
+        )
+
+    def _tags(self) -> dict[str, str]:
+        return {'bank': self.banco, 'resource': self.recurso}
+
+
+class CircuitBreakerRegistry:
+    """Conjunto de circuitos, um por par (banco, recurso).
+
+    Compartilhe a mesma instância entre os clientes de um processo para que
+    todos enxerguem o mesmo estado do PSP: quando o circuito de um abre, os
+    outros também param de esperar pelo tempo limite.
+
+    Args:
+        config: Limites aplicados a todos os circuitos do registro
+    """
+
+    def __init__(self, config: CircuitBreakerConfig | None = None) -> None:
+        self.config = config or CircuitBreakerConfig()
+        self._circuitos: dict[tuple[str, str], CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def circuito(self, banco: str, recurso: str) -> CircuitBreaker:
+        """Circuito de ``(banco, recurso)``, criado fechado no primeiro uso."""
+        chave = (banco, recurso)
+        circuito = self._circuitos.get(chave)
+        if circuito is None:
+            with self._lock:
+                circuito = self._circuitos.get(chave)
+                if circuito is None:
+                    circuito = CircuitBreaker(banco, recurso, self.config)
+                    self._circuitos[chave] = circuito
+        return circuito
+
+    def estados(self) -> dict[tuple[str, str], str]:
+        """Estado de cada circuito já usado, por ``(banco, recurso)``."""
+        return {chave: c.estado for chave, c in list(self._circuitos.items())}
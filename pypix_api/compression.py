@@ -0,0 +1,151 @@
+"""Compressão gzip dos corpos enviados e das listagens recebidas.
+
+``criar_lote_cobv`` e ``alterar_lote_cobv`` enviam milhares de ``cobsv`` num
+único ``PUT``/``PATCH`` — vários MB de JSON, que o gzip reduz a uma fração.
+Com ``compression=CompressionPolicy()`` no banco, todo corpo a partir de
+``min_size`` bytes vai comprimido, com ``Content-Encoding: gzip``::
+
+    banco = SicoobPixAPI(oauth=oauth, compression=CompressionPolicy(
+        min_size=64 * 1024, operations={'lotecobv.item.put'},
+    ))
+
+Nem todo PSP aceita corpo comprimido — um que não aceita costuma responder
+``400`` ou ``415`` —, por isso a política é por banco e fica desligada por
+padrão. ``operations`` restringe a compressão às operações informadas (ver
+:meth:`~pypix_api.banks.base.BankPixAPIBase.operacao`). Um corpo gerado em
+partes (ver :mod:`pypix_api.streaming_body`) não tem tamanho conhecido antes
+de ir: é sempre comprimido, também em partes, quando a operação está em
+``operations``.
+
+Nas listagens (``GET`` sem identificador, como ``cob.get`` e
+``lotecobv.get``), a política pede a resposta comprimida com
+``Accept-Encoding``. O ``requests`` e o ``httpx`` já mandam
+``gzip, deflate`` por padrão; o header explícito vale para transportes
+próprios (ver :mod:`pypix_api.transport`) e para quem quiser outro valor.
+
+Os tamanhos vão para o :class:`~pypix_api.metrics.MetricsCollector` como
+contadores, com as tags ``bank`` e ``operation``:
+
+- ``compression.request.uncompressed_bytes`` e
+  ``compression.request.compressed_bytes``, a cada corpo comprimido;
+- ``compression.response.uncompressed_bytes`` e
+  ``compression.response.compressed_bytes``, a cada listagem que chegou
+  comprimida e cujo tamanho transferido é conhecido.
+"""
+
+import gzip
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from pypix_api.metrics import MetricsCollector
+
+#: Codificações que o cliente sabe descomprimir em qualquer transporte.
+ACCEPT_ENCODING_PADRAO = 'gzip, deflate'
+
+
+@dataclass(frozen=True)
+class CompressionPolicy:
+    """Quando comprimir o corpo das requisições de um banco.
+
+    Attributes:
+        min_size: Tamanho mínimo, em bytes, do corpo codificado para ser
+            comprimido. Abaixo dele o gzip custa mais do que economiza
+        level: Nível do gzip, de 1 (mais rápido) a 9 (menor)
+        operations: Operações cujo corpo pode ser comprimido
+            (``'lotecobv.item.put'``). ``None`` comprime o corpo de qualquer
+            operação
+        accept_encoding: ``Accept-Encoding`` pedido nas listagens. ``None``
+            deixa o header com o transporte
+    """
+
+    min_size: int = 16 * 1024
+    level: int = 6
+    operations: Iterable[str] | None = None
+    accept_encoding: str | None = ACCEPT_ENCODING_PADRAO
+
+    def __post_init__(self) -> None:
+        if self.min_size < 0:
+            raise ValueError('min_size não pode ser negativo.')
+        if not 1 <= self.level <= 9:
+            raise ValueError('level deve estar entre 1 e 9.')
+        if self.operations is not None:
+            operacoes = frozenset(self.operations)
+            if not operacoes:
+                raise ValueError('operations não pode ser vazio.')
+            object.__setattr__(self, 'operations', operacoes)
+
+    def comprime(self, operacao: str, corpo: bytes | None = None) -> bool:
+        """Se o ``corpo`` de ``operacao`` deve ir comprimido. Sem ``corpo``
+        (gerado em partes, de tamanho desconhecido), só confere a operação."""
+        if corpo is not None and len(corpo) < self.min_size:
+            return False
+        return self.operations is None or operacao in self.operations
+
+
+def eh_listagem(method: str, operacao: str) -> bool:
+    """Se a operação é uma listagem: ``GET`` sem identificador no caminho."""
+    return method == 'GET' and 'item' not in operacao.split('.')
+
+
+def gzip_do_corpo(corpo: bytes, nivel: int) -> bytes:
+    """``corpo`` comprimido em gzip, sem data no cabeçalho (``mtime=0``):
+    o mesmo corpo sempre dá os mesmos bytes."""
+    return gzip.compress(corpo, compresslevel=nivel, mtime=0)
+
+
+def gzip_em_partes(
+    partes: Iterable[bytes], nivel: int, ao_fim: Callable[[int, int], None]
+) -> Iterator[bytes]:
+    """As ``partes`` comprimidas em gzip conforme são consumidas.
+
+    Args:
+        partes: Corpo original, em partes
+        nivel: Nível do gzip
+        ao_fim: Chamada depois da última parte com os totais original e
+            comprimido, em bytes
+    """
+    # wbits=31: formato gzip, com mtime zerado no cabeçalho
+    compressor = zlib.compressobj(nivel, zlib.DEFLATED, 31)
+    original = comprimido = 0
+    for parte in partes:
+        original += len(parte)
+        saida = compressor.compress(parte)
+        if saida:
+            comprimido += len(saida)
+            yield saida
+    saida = compressor.flush()
+    comprimido += len(saida)
+    yield saida
+    ao_fim(original, comprimido)
+
+
+def tamanho_transferido(response: Any) -> int | None:
+    """Bytes do corpo como vieram do PSP, antes de descomprimir.
+
+    O ``Content-Length`` quando houver; na falta dele (resposta em
+    *chunks*), o que o ``urllib3`` leu do socket. ``None`` quando não há
+    como saber.
+    """
+    tamanho = response.headers.get('Content-Length')
+    if tamanho is not None and tamanho.isdigit():
+        return int(tamanho)
+    lido = getattr(getattr(response, 'raw', None), 'tell', None)
+    if callable(lido):
+        try:
+            return int(lido())
+        except (OSError, TypeError, ValueError):
+            return None
+    return None
+
+
+def conta_bytes(
+    sentido: str, banco: str, operacao: str, original: int, comprimido: int
+) -> None:
+    """Incrementa ``compression.{sentido}.uncompressed_bytes`` e
+    ``compression.{sentido}.compressed_bytes``."""
+    metricas = MetricsCollector()
+    tags = {'bank': banco, 'operation': operacao}
+    metricas.increment(f'compression.{sentido}.uncompressed_bytes', original, tags)
+    metricas.increment(f'compression.{sentido}.compressed_bytes', comprimido, tags)
@@ -0,0 +1,291 @@
+"""Limite adaptativo de requisições simultâneas por PSP (AIMD).
+
+Um número fixo de *workers* erra para todo PSP: o Sicoob satura perto de 20
+chamadas em paralelo, e o BB aguenta mais de 100. Com
+:class:`AdaptiveConcurrencyLimiter`, cada cliente descobre o próprio limite:
+
+- cada resposta sem sinal de sobrecarga, com o limite em uso, soma
+  ``1/limite`` — o limite cresce uma unidade por "janela" de respostas
+  (aumento aditivo);
+- um ``429``, um ``503``, um timeout ou, com ``latency_tolerance``, uma
+  latência muito acima da menor observada multiplica o limite por ``backoff``
+  (redução multiplicativa). Só a primeira sobrecarga de uma rajada reduz: as
+  respostas de requisições que já estavam em voo antes da redução não reduzem
+  de novo.
+
+Uma requisição que encontra o limite ocupado espera na fila, por ordem de
+chegada, até uma vaga ser liberada. Um *job* em lote pode disparar quantas
+chamadas quiser: o que passa do limite espera, e a vazão se acomoda na maior
+que o PSP sustenta.
+
+O limite e o tamanho da fila são publicados como os *gauges*
+``concurrency.limit`` e ``concurrency.queue`` no
+:class:`~pypix_api.metrics.MetricsCollector`, com a tag ``bank``. O limite,
+a cada mudança; a fila, que muda a cada requisição enfileirada, no máximo uma
+vez por segundo (e sempre que esvazia).
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+from pypix_api.metrics import MetricsCollector, ThrottledGauge
+
+#: Status que indicam sobrecarga do PSP.
+STATUS_DE_SOBRECARGA = frozenset({429, 503})
+
+
+@dataclass(frozen=True)
+class ConcurrencyPolicy:
+    """Como o limite de requisições simultâneas se ajusta.
+
+    Attributes:
+        initial_limit: Limite antes de qualquer resposta
+        min_limit: Piso do limite
+        max_limit: Teto do limite
+        backoff: Fator aplicado ao limite a cada sobrecarga, em (0, 1)
+        latency_tolerance: Se definido, uma resposta mais lenta que esse
+            múltiplo da menor latência recente conta como sobrecarga. ``None``
+            só reage a ``429``, ``503`` e timeouts
+        window_size: Quantas latências recentes entram na menor latência
+        max_wait: Espera máxima por uma vaga, em segundos. Esgotada, a
+            requisição levanta
+            :class:`~pypix_api.exceptions.PixTimeoutException` sem ser
+            enviada. ``None`` espera o quanto for preciso (ou o que restar do
+            prazo da chamada)
+    """
+
+    initial_limit: int = 10
+    min_limit: int = 1
+    max_limit: int = 200
+    backoff: float = 0.9
+    latency_tolerance: float | None = None
+    window_size: int = 100
+    max_wait: float | None = None
+
+    def __post_init__(self) -> None:
+        if not 1 <= self.min_limit <= self.initial_limit <= self.max_limit:
+            raise ValueError(
+                'Os limites devem obedecer 1 <= min_limit <= initial_limit <= max_limit.'
+            )
+        if not 0 < self.backoff < 1:
+            raise ValueError('backoff deve estar em (0, 1).')
+        if self.latency_tolerance is not None and self.latency_tolerance <= 1:
+            raise ValueError('latency_tolerance deve ser maior que 1.')
+        if self.window_size < 1:
+            raise ValueError('window_size deve ser ao menos 1.')
+        if self.max_wait is not None and self.max_wait <= 0:
+            raise ValueError('max_wait deve ser positivo.')
+
+
+class _Espera:
+    """Uma requisição na fila: uma thread ou uma tarefa ``asyncio``."""
+
+    __slots__ = ('concedida', 'evento', 'ficha', 'futuro', 'laco')
+
+    def __init__(
+        self,
+        evento: threading.Event | None = None,
+        laco: asyncio.AbstractEventLoop | None = None,
+    ) -> None:
+        self.evento = evento
+        self.laco = laco
+        self.futuro = None if laco is None else laco.create_future()
+        self.concedida = False
+        self.ficha = 0.0
+
+    def acorda(self) -> None:
+        if self.evento is not None:
+            self.evento.set()
+        else:
+            self.laco.call_soon_threadsafe(_resolve, self.futuro)
+
+
+def _resolve(futuro: asyncio.Future) -> None:
+    if not futuro.done():
+        futuro.set_result(None)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Vagas de requisição simultânea, com limite AIMD. Seguro entre threads.
+
+    Cada vaga é obtida com :meth:`adquire` (ou :meth:`adquire_async`) e
+    devolvida com :meth:`libera`, que informa como a requisição terminou.
+
+    Args:
+        policy: Política de ajuste do limite
+        name: Valor da tag ``bank`` das métricas
+        lane: Valor da tag ``lane`` das métricas (ver :mod:`pypix_api.lanes`);
+            ``None`` omite a tag
+    """
+
+    def __init__(
+        self,
+        policy: ConcurrencyPolicy | None = None,
+        name: str = 'default',
+        lane: str | None = None,
+    ) -> None:
+        self.policy = policy or ConcurrencyPolicy()
+        self.name = name
+        self._tags = {'bank': name} if lane is None else {'bank': name, 'lane': lane}
+        self._limite = float(self.policy.initial_limit)
+        self._em_voo = 0
+        self._fila: deque[_Espera] = deque()
+        self._latencias: deque[float] = deque(maxlen=self.policy.window_size)
+        self._reduzido_em = float('-inf')
+        self._lock = threading.Lock()
+        self._gauge_fila = ThrottledGauge('concurrency.queue', self._tags)
+
+    @property
+    def limit(self) -> int:
+        """Requisições simultâneas permitidas agora."""
+        return int(self._limite)
+
+    @property
+    def in_flight(self) -> int:
+        """Vagas ocupadas."""
+        return self._em_voo
+
+    @property
+    def queued(self) -> int:
+        """Requisições esperando vaga."""
+        return len(self._fila)
+
+    def adquire(self, timeout: float | None = None) -> float:
+        """Ocupa uma vaga, esperando na fila se o limite estiver tomado.
+
+        Args:
+            timeout: Espera máxima, em segundos. ``None`` espera sem limite
+
+        Returns:
+            float: A ficha da vaga, a devolver em :meth:`libera`
+
+        Raises:
+            TimeoutError: Se a vaga não vier em ``timeout``
+        """
+        with self._lock:
+            ficha = self._ocupa_livre()
+            if ficha is not None:
+                return ficha
+            espera = _Espera(evento=threading.Event())
+            fila = self._enfileira(espera)
+        self._publica_fila(fila)
+        espera.evento.wait(timeout)
+        return self._desenfileira(espera, timeout)
+
+    async def adquire_async(self, timeout: float | None = None) -> float:
+        """:meth:`adquire` para corrotinas: a espera não bloqueia o *event loop*.
+
+        Raises:
+            TimeoutError: Se a vaga não vier em ``timeout``
+        """
+        with self._lock:
+            ficha = self._ocupa_livre()
+            if ficha is not None:
+                return ficha
+            espera = _Espera(laco=asyncio.get_running_loop())
+            fila = self._enfileira(espera)
+        self._publica_fila(fila)
+        try:
+            await asyncio.wait_for(asyncio.shield(espera.futuro), timeout)
+        except asyncio.TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            # Cancelada depois de receber a vaga: a vaga volta para a fila
+            if self._desiste(espera):
+                self.libera(espera.ficha)
+            raise
+        return self._desenfileira(espera, timeout)
+
+    def libera(
+        self, ficha: float, latency: float | None = None, overloaded: bool = False
+    ) -> None:
+        """Devolve a vaga e ajusta o limite pelo desfecho da requisição.
+
+        Args:
+            ficha: Devolvida por :meth:`adquire`
+            latency: Duração da requisição, em segundos. ``None`` (requisição
+                não enviada ou erro que não diz nada sobre o PSP) só devolve a
+                vaga
+            overloaded: Se a resposta indicou sobrecarga (``429``, ``503``,
+                timeout)
+        """
+        politica = self.policy
+        with self._lock:
+            antes = self.limit
+            self._em_voo -= 1
+            if latency is not None and not overloaded:
+                self._latencias.append(latency)
+                overloaded = (
+                    politica.latency_tolerance is not None
+                    and len(self._latencias) == politica.window_size
+                    and latency > politica.latency_tolerance * min(self._latencias)
+                )
+                # Só cresce quem está usando o limite: uma fila vazia com
+                # poucas requisições em voo não prova que o PSP aguenta mais
+                if not overloaded and self._em_voo + 1 >= self._limite / 2:
+                    self._limite = min(
+                        float(politica.max_limit), self._limite + 1 / self._limite
+                    )
+            if overloaded and ficha > self._reduzido_em:
+                self._limite = max(
+                    float(politica.min_limit), self._limite * politica.backoff
+                )
+                self._reduzido_em = time.monotonic()
+            limite = self.limit
+            fila_antes = len(self._fila)
+            self._concede()
+            fila = len(self._fila)
+        if limite != antes:
+            self._publica('concurrency.limit', limite)
+        if fila != fila_antes:
+            self._publica_fila(fila)
+
+    def _ocupa_livre(self) -> float | None:
+        """Ocupa uma vaga livre sem fila na frente; ``None`` se não houver.
+
+        Chamado com ``_lock``.
+        """
+        if self._fila or self._em_voo >= self.limit:
+            return None
+        self._em_voo += 1
+        return time.monotonic()
+
+    def _enfileira(self, espera: _Espera) -> int:
+        """Põe ``espera`` na fila e devolve o tamanho dela. Chamado com ``_lock``."""
+        self._fila.append(espera)
+        return len(self._fila)
+
+    def _concede(self) -> None:
+        """Passa as vagas livres às primeiras da fila. Chamado com ``_lock``."""
+        while self._fila and self._em_voo < self.limit:
+            espera = self._fila.popleft()
+            self._em_voo += 1
+            espera.concedida = True
+            espera.ficha = time.monotonic()
+            espera.acorda()
+
+    def _desiste(self, espera: _Espera) -> bool:
+        """Sai da fila. Devolve se a vaga já tinha sido concedida."""
+        with self._lock:
+            if espera.concedida:
+                return True
+            self._fila.remove(espera)
+            fila = len(self._fila)
+        self._publica_fila(fila)
+        return False
+
+    def _desenfileira(self, espera: _Espera, timeout: float | None) -> float:
+        # A vaga pode ter sido concedida entre o fim da espera e o lock
+        if self._desiste(espera):
+            return espera.ficha
+        raise TimeoutError(f'Sem vaga de requisição simultânea em {timeout}s')
+
+    def _publica(self, nome: str, valor: Any) -> None:
+        MetricsCollector().gauge(nome, valor, tags=self._tags)
+
+    def _publica_fila(self, fila: int) -> None:
+        self._gauge_fila.set(fila, force=not fila)
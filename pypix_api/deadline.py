@@ -0,0 +1,134 @@
+"""Prazo de ponta a ponta para as chamadas à API (*deadline*).
+
+O ``timeout`` vale para cada requisição HTTP isoladamente: uma chamada que
+precisa de token pode esperar o tempo limite do ``POST`` de token e, depois, o
+da requisição — e mais um de cada repetição. Com um prazo, todas essas etapas
+dividem o mesmo orçamento:
+
+- o ``POST`` de token, a espera pelo limitador de taxa, cada tentativa e o
+  intervalo entre tentativas só começam se ainda houver prazo;
+- o timeout de conexão e de leitura de cada requisição é reduzido ao que resta;
+- uma repetição que só terminaria depois do prazo não é feita.
+
+Esgotado o prazo, a chamada levanta :class:`~pypix_api.exceptions.PixTimeoutException`.
+
+O prazo vale para o contexto (``contextvars``): para a thread ou a tarefa
+``asyncio`` que o abriu e para o que ela chamar. Prazos aninhados só podem
+encurtar o prazo em vigor::
+
+    with deadline(10.0):
+        cob = api.criar_cob(txid, corpo)
+        api.consultar_cob(txid)  # usa o que sobrou dos 10 s
+
+Para aplicar um prazo a cada chamada de um cliente, use o parâmetro
+``deadline`` do banco.
+
+O ``requests`` aplica o timeout de leitura a cada leitura do *socket*, e não à
+resposta inteira: um PSP que envia o corpo aos poucos ainda pode passar do
+prazo por até um timeout de leitura.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from pypix_api.exceptions import PixTimeoutException
+from pypix_api.http import Timeout
+
+
+class Prazo:
+    """Instante-limite de uma chamada, no relógio monotônico.
+
+    Args:
+        segundos: Duração do prazo a partir de agora
+    """
+
+    __slots__ = ('expira_em', 'segundos')
+
+    def __init__(self, segundos: float) -> None:
+        self.segundos = segundos
+        self.expira_em = time.monotonic() + segundos
+
+    def restante(self) -> float:
+        """Segundos até o fim do prazo; 0 se já acabou."""
+        return max(self.expira_em - time.monotonic(), 0.0)
+
+    def verifica(self, etapa: str, espera: float = 0.0) -> float:
+        """Garante que ainda há prazo para ``etapa`` depois de ``espera`` segundos.
+
+        Returns:
+            float: Os segundos restantes
+
+        Raises:
+            PixTimeoutException: Se o prazo acabou ou acabaria durante a espera
+        """
+        restante = self.restante()
+        if restante <= espera:
+            raise PixTimeoutException(
+                detail=f'Prazo de {self.segundos}s esgotado antes de {etapa}'
+            )
+        return restante
+
+    def limita(self, timeout: Timeout, etapa: str) -> Timeout:
+        """``timeout`` reduzido ao que resta do prazo.
+
+        Raises:
+            PixTimeoutException: Se o prazo já acabou
+        """
+        restante = self.verifica(etapa)
+        if isinstance(timeout, tuple):
+            conexao, leitura = timeout
+            return (
+                min(conexao, restante),
+                restante if leitura is None else min(leitura, restante),
+            )
+        return min(timeout, restante)
+
+
+_prazo: ContextVar[Prazo | None] = ContextVar('pypix_prazo', default=None)
+
+
+def prazo_atual() -> Prazo | None:
+    """O prazo em vigor no contexto, ou ``None``."""
+    return _prazo.get()
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[Prazo]:
+    """Abre um prazo de ``seconds`` para as chamadas feitas dentro do bloco.
+
+    Se já houver um prazo mais curto em vigor, ele continua valendo.
+
+    Raises:
+        ValueError: Se ``seconds`` não for positivo
+    """
+    if seconds <= 0:
+        raise ValueError('O prazo deve ser positivo')
+    prazo = Prazo(seconds)
+    atual = _prazo.get()
+    if atual is not None and atual.expira_em <= prazo.expira_em:
+        prazo = atual
+    marca = _prazo.set(prazo)
+    try:
+        yield prazo
+    finally:
+        _prazo.reset(marca)
+
+
+def tempo_restante() -> float | None:
+    """Segundos que restam do prazo em vigor; ``None`` sem prazo."""
+    prazo = _prazo.get()
+    return None if prazo is None else prazo.restante()
+
+
+def limita_timeout(timeout: Timeout, etapa: str) -> Timeout:
+    """``timeout`` reduzido ao prazo em vigor; inalterado sem prazo.
+
+    Raises:
+        PixTimeoutException: Se o prazo em vigor já acabou
+    """
+    prazo = _prazo.get()
+    if prazo is None:
+        return timeout
+    return prazo.limita(timeout, etapa)
@@ -12,8 +12,10 @@ from datetime import datetime
 from functools import wraps
 from typing import Any
 
+from pypix_api.exceptions import PixAPIException, PixErroTransporteException
 from pypix_api.logging import PIXLogger
 from pypix_api.metrics import MetricsCollector
+from pypix_api.retry import STATUS_TRANSITORIOS
 
 
 class PIXError(Exception):
@@ -348,10 +350,23 @@ class ErrorRecovery:
 
     @staticmethod
     def should_retry(error: Exception, max_retries: int = 3) -> bool:
-        """Determine if an operation should be retried."""
+        """Determine if an operation should be retried.
+
+        Recognizes the exceptions actually raised by the bank clients:
+        transport failures and the transient statuses of
+        :data:`pypix_api.retry.STATUS_TRANSITORIOS`. It knows nothing about
+        idempotency — for requests to the PSP, prefer ``retry=RetryPolicy()``
+        on the client, which only retries idempotent requests.
+        """
         if isinstance(error, NetworkError | APIError | RateLimitError):
             return True
 
+        if isinstance(error, PixErroTransporteException):
+            return True
+
+        if isinstance(error, PixAPIException):
+            return error.status in STATUS_TRANSITORIOS
+
         if isinstance(error, APIError) and error.details.get('status_code', 0) >= 500:
             return True
 
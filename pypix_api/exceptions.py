@@ -130,6 +130,33 @@ class PixConexaoException(PixErroTransporteException):
         super().__init__(detail=detail, title='Falha de conexão')
 
 
+class PixCircuitoAbertoException(PixAPIException):
+    """O circuit breaker do recurso está aberto: a requisição nem foi enviada.
+
+    O PSP vinha falhando ou respondendo devagar nesse recurso (ver
+    :mod:`pypix_api.circuit_breaker`). Ao contrário de um timeout, aqui o
+    resultado é conhecido — nada chegou ao PSP — e a operação pode ser
+    repetida depois de ``reabre_em`` segundos.
+
+    Attributes:
+        banco: Código do banco
+        recurso: Primeiro segmento do caminho (``cob``, ``pix``, ...)
+        reabre_em: Segundos até o circuito voltar a sondar o PSP
+    """
+
+    def __init__(self, banco: str, recurso: str, reabre_em: float):
+        self.banco = banco
+        self.recurso = recurso
+        self.reabre_em = reabre_em
+        super().__init__(
+            title='Circuito aberto',
+            detail=(
+                f'Circuit breaker aberto para o banco {banco}, recurso {recurso!r}: '
+                f'requisição não enviada. Nova sondagem em {reabre_em:.1f}s.'
+            ),
+        )
+
+
 #: Exceção correspondente a cada status HTTP de erro.
 EXCECOES_POR_STATUS: dict[int, type[PixAPIException]] = {
     400: PixErroValidacaoException,
@@ -0,0 +1,193 @@
+"""Requisições GET duplicadas (*hedging*) para cortar a cauda de latência.
+
+Quando a maior parte das consultas volta rápido e só uma fração fica presa num
+PSP lento, o p99 é decidido por essa fração. Com :class:`HedgePolicy`, uma
+consulta ``GET`` que passa de um atraso sem resposta ganha uma cópia, enviada
+por outra conexão do pool; vale a resposta que chegar primeiro, e a outra é
+cancelada.
+
+O atraso é fixo (``delay``) ou o percentil ``percentile`` das latências
+observadas do recurso — por padrão o p95, de modo que só ~5% das consultas
+chegam a ser duplicadas. A taxa de duplicação também tem teto: cada consulta
+deposita ``max_hedge_ratio`` no saldo e cada cópia saca uma unidade, então a
+carga extra sobre o PSP nunca passa dessa fração, nem mesmo com o PSP inteiro
+degradado (quando todas as consultas passariam do p95).
+
+Só ``GET`` é duplicado: é o único verbo da API Pix sem efeito no PSP.
+
+Métricas no :class:`~pypix_api.metrics.MetricsCollector`, com as tags
+``bank`` e ``resource``: ``hedge.sent`` (cópias enviadas) e ``hedge.won``
+(cópias que responderam antes da original).
+"""
+
+import contextvars
+import threading
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from pypix_api.metrics import MetricsCollector
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """Quando e quanto duplicar as consultas.
+
+    Attributes:
+        delay: Atraso fixo, em segundos, antes de enviar a cópia. ``None`` usa
+            o percentil ``percentile`` das latências observadas
+        percentile: Percentil (0 a 1) das latências do recurso usado como
+            atraso
+        min_samples: Latências observadas antes de o percentil valer; até lá,
+            sem ``delay``, nada é duplicado
+        window_size: Quantas latências recentes de cada recurso são guardadas
+        max_hedge_ratio: Fração máxima das consultas que pode ganhar cópia
+        budget_max: Teto do saldo de cópias — limita a rajada de cópias
+            depois de um período calmo
+        max_workers: Threads do cliente síncrono para as consultas duplicáveis
+            (original e cópia). Dimensione para o dobro das consultas
+            simultâneas esperadas: com todas ocupadas, a consulta vai pela
+            thread de quem chamou, sem cópia
+    """
+
+    delay: float | None = None
+    percentile: float = 0.95
+    min_samples: int = 20
+    window_size: int = 200
+    max_hedge_ratio: float = 0.05
+    budget_max: float = 10.0
+    max_workers: int = 32
+
+    def __post_init__(self) -> None:
+        if self.delay is not None and self.delay < 0:
+            raise ValueError('delay não pode ser negativo.')
+        if not 0 < self.percentile < 1:
+            raise ValueError('percentile deve estar em (0, 1).')
+        if not 1 <= self.min_samples <= self.window_size:
+            raise ValueError('min_samples deve estar entre 1 e window_size.')
+        if not 0 <= self.max_hedge_ratio <= 1:
+            raise ValueError('max_hedge_ratio deve estar em [0, 1].')
+        if self.budget_max < 1:
+            raise ValueError('budget_max deve ser ao menos 1.')
+        if self.max_workers < 2:
+            raise ValueError('max_workers deve ser ao menos 2.')
+
+
+class Hedger:
+    """Estado do *hedging* de um cliente: latências e saldo de cópias.
+
+    Seguro entre threads.
+
+    Args:
+        policy: Política aplicada
+    """
+
+    def __init__(self, policy: HedgePolicy) -> None:
+        self.policy = policy
+        self._latencias: dict[str, deque[float]] = {}
+        # Começa com uma cópia disponível, como o orçamento de retry
+        self._saldo = 1.0
+        self._lock = threading.Lock()
+
+    def atraso(self, recurso: str) -> float | None:
+        """Segundos a esperar pela original antes da cópia.
+
+        Deposita a fração ``max_hedge_ratio`` no saldo: chame uma vez por
+        consulta. ``None`` quando ainda não há latências suficientes.
+        """
+        with self._lock:
+            self._saldo = min(
+                self._saldo + self.policy.max_hedge_ratio, self.policy.budget_max
+            )
+            if self.policy.delay is not None:
+                return self.policy.delay
+            latencias = self._latencias.get(recurso)
+            if latencias is None or len(latencias) < self.policy.min_samples:
+                return None
+            ordenadas = sorted(latencias)
+        posicao = min(len(ordenadas) - 1, int(self.policy.percentile * len(ordenadas)))
+        return ordenadas[posicao]
+
+    def pode_duplicar(self) -> bool:
+        """Saca uma cópia do saldo; ``False`` se o teto foi atingido."""
+        with self._lock:
+            if self._saldo < 1:
+                return False
+            self._saldo -= 1
+            return True
+
+    def observa(self, recurso: str, duracao: float) -> None:
+        """Registra a latência de uma consulta que obteve resposta."""
+        with self._lock:
+            latencias = self._latencias.get(recurso)
+            if latencias is None:
+                latencias = deque(maxlen=self.policy.window_size)
+                self._latencias[recurso] = latencias
+            latencias.append(duracao)
+
+    @staticmethod
+    def conta(metrica: str, banco: str, recurso: str) -> None:
+        """Incrementa ``hedge.sent`` ou ``hedge.won``."""
+        MetricsCollector().increment(
+            f'hedge.{metrica}', tags={'bank': banco, 'resource': recurso}
+        )
+
+
+class ExecutorDeHedge:
+    """Threads das consultas duplicáveis do cliente síncrono, sem fila.
+
+    Uma tarefa só entra com uma thread livre. Numa fila, a espera local
+    contaria no atraso como lentidão do PSP e dispararia cópias por causa da
+    carga do próprio processo — que também iriam para a fila. Sem thread
+    livre, :meth:`envia` devolve ``None`` e quem chamou segue sem executor.
+
+    Args:
+        max_workers: Número de threads
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self._livres = threading.BoundedSemaphore(max_workers)
+        # As threads só são criadas no primeiro uso
+        self._executor = ThreadPoolExecutor(
+            max_workers, thread_name_prefix='pypix-hedge'
+        )
+
+    def envia(
+        self,
+        funcao: Callable[..., Any],
+        *args: Any,
+        permitido: Callable[[], bool] | None = None,
+    ) -> Future[Any] | None:
+        """Roda ``funcao(*args)`` numa thread livre, com o contexto de quem
+        chamou (e o prazo em vigor).
+
+        Args:
+            funcao: Tarefa
+            *args: Argumentos da tarefa
+            permitido: Consultado depois de reservada a thread (ex.: o saldo
+                de cópias, que só é sacado se a cópia puder sair)
+
+        Returns:
+            O ``Future`` da tarefa, ou ``None`` sem thread livre ou sem
+            permissão
+        """
+        if not self._livres.acquire(blocking=False):
+            return None
+        try:
+            if permitido is not None and not permitido():
+                self._livres.release()
+                return None
+            futuro = self._executor.submit(
+                contextvars.copy_context().run, funcao, *args
+            )
+        except BaseException:
+            self._livres.release()
+            raise
+        futuro.add_done_callback(lambda _: self._livres.release())
+        return futuro
+
+    def shutdown(self) -> None:
+        """Encerra as threads sem esperar as tarefas em andamento."""
+        self._executor.shutdown(wait=False)
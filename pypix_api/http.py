@@ -1,6 +1,9 @@
 """Configurações comuns das requisições HTTP da biblioteca."""
 
+from typing import Any
+
 import requests
+from requests.structures import CaseInsensitiveDict
 
 #: Quantos caracteres do corpo cru são preservados em `detail`.
 LIMITE_CORPO_CRU = 500
@@ -29,3 +32,58 @@ Timeout = float | tuple[float, float] | tuple[float, None]
 #: O ``requests`` não define timeout algum por padrão — sem isto, uma resposta
 #: que nunca chega prende o processo indefinidamente, sem log nem métrica.
 DEFAULT_TIMEOUT: tuple[float, float] = (5.0, 30.0)
+
+
+def timeout_de_conexao(timeout: Timeout) -> float:
+    """Parte de conexão de um ``timeout`` no formato do ``requests``."""
+    return timeout[0] if isinstance(timeout, tuple) else timeout
+
+
+def importa_httpx() -> Any:
+    """Importa o ``httpx``, dependência opcional dos clientes assíncronos.
+
+    Raises:
+        ImportError: Se o ``httpx`` não estiver instalado, indicando o extra
+            que o instala
+    """
+    try:
+        import httpx
+    except ImportError as exc:  # pragma: no cover - depende do ambiente
+        raise ImportError(
+            'Os clientes assíncronos dependem do httpx. Instale com: '
+            "pip install 'pypix-api[async]'"
+        ) from exc
+    return httpx
+
+
+def timeout_httpx(timeout: Timeout) -> Any:
+    """Converte o ``timeout`` no formato do ``requests`` para ``httpx.Timeout``.
+
+    No ``httpx`` o tempo de leitura também vale para a escrita e para a espera
+    por uma conexão livre no pool; só a conexão tem limite próprio.
+    """
+    httpx = importa_httpx()
+    if isinstance(timeout, tuple):
+        conexao, leitura = timeout
+        return httpx.Timeout(leitura, connect=conexao)
+    return httpx.Timeout(timeout)
+
+
+def resposta_httpx_para_requests(resposta: Any) -> requests.Response:
+    """Converte um ``httpx.Response`` já lido em ``requests.Response``.
+
+    Os clientes assíncronos reaproveitam todo o tratamento de resposta dos
+    síncronos (``_handle_error_response``, ``_json``, erro de token), que foi
+    escrito — e testado — sobre o ``requests.Response``. Converter aqui garante
+    o mesmo mapeamento de erros nos dois caminhos.
+    """
+    response = requests.Response()
+    response.status_code = resposta.status_code
+    response._content = resposta.content
+    response.headers = CaseInsensitiveDict(resposta.headers)
+    # Só o charset declarado: sem ele, `texto_do_corpo` assume UTF-8, como no
+    # caminho síncrono.
+    response.encoding = resposta.charset_encoding
+    response.reason = resposta.reason_phrase
+    response.url = str(resposta.url)
+    return response
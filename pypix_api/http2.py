@@ -0,0 +1,157 @@
+"""Transporte HTTP/2 opcional, sobre ``httpx``.
+
+No HTTP/1.1 cada requisição simultânea ao PSP ocupa uma conexão — e cada
+conexão nova paga um handshake mTLS completo. No HTTP/2 as requisições são
+multiplexadas como *streams* de poucas conexões. :class:`Http2Session` expõe a
+parte da interface de ``requests.Session`` que a biblioteca usa, de modo que
+``BankPixAPIBase._request`` e ``OAuth2Client.get_token`` funcionam sobre ela sem
+mudança alguma — inclusive o mapeamento de timeout e falha de conexão.
+
+Ative com ``OAuth2Client(..., transport='h2')``. Requer o extra ``http2``
+(``pip install 'pypix-api[http2]'``). Se o PSP não negociar HTTP/2 via ALPN, a
+conexão segue em HTTP/1.1.
+"""
+
+import importlib.util
+import ssl
+from collections.abc import Mapping
+from typing import Any
+
+import requests
+
+from pypix_api.http import (
+    Timeout,
+    importa_httpx,
+    resposta_httpx_para_requests,
+    timeout_httpx,
+)
+from pypix_api.pool import PoolConfig
+
+#: Transporte padrão: ``requests`` sobre HTTP/1.1.
+TRANSPORTE_HTTP1 = 'http1'
+#: Transporte HTTP/2 multiplexado (:class:`Http2Session`).
+TRANSPORTE_H2 = 'h2'
+#: HTTP/1.1 direto sobre o ``urllib3`` (ver :mod:`pypix_api.transport`).
+TRANSPORTE_URLLIB3 = 'urllib3'
+TRANSPORTES = (TRANSPORTE_HTTP1, TRANSPORTE_H2, TRANSPORTE_URLLIB3)
+
+
+def valida_transporte(transport: Any) -> Any:
+    """Confere o nome do transporte.
+
+    Aceita também um objeto com ``send`` (ver
+    :class:`~pypix_api.transport.Transport`).
+
+    Raises:
+        ValueError: Se ``transport`` não for um de :data:`TRANSPORTES` nem um
+            transporte
+    """
+    if not isinstance(transport, str) and callable(getattr(transport, 'send', None)):
+        return transport
+    if transport not in TRANSPORTES:
+        raise ValueError(
+            f'Transporte desconhecido: {transport!r}. Use um de: {", ".join(TRANSPORTES)}.'
+        )
+    return transport
+
+
+class Http2Session:
+    """Sessão HTTP/2 com a interface de ``requests.Session`` usada pela biblioteca.
+
+    Devolve ``requests.Response`` e levanta ``requests.Timeout`` e
+    ``requests.ConnectionError``, como o ``requests`` — o tratamento de erro
+    de quem a usa é o mesmo do caminho HTTP/1.1.
+
+    Args:
+        ssl_context: Contexto com o certificado de cliente (ver
+            :func:`pypix_api.auth.mtls.get_ssl_context_with_mtls`). ``None``
+            usa a validação padrão, sem mTLS (``sandbox_mode``)
+        pool: Limites de conexão. Como cada conexão HTTP/2 carrega várias
+            requisições, ``pool_maxsize`` limita conexões, não requisições
+            simultâneas. ``max_idle`` vira o ``keepalive_expiry`` do
+            ``httpx``; ``tcp_keepalive``, ``retry_on_reset`` e
+            ``source_addresses`` não se aplicam
+        client: ``httpx.Client`` já configurado, no lugar do criado aqui
+            (ex.: HTTP/2 sem TLS, com ``http1=False``, contra um servidor local)
+    """
+
+    def __init__(
+        self,
+        ssl_context: ssl.SSLContext | None = None,
+        pool: PoolConfig | None = None,
+        client: Any = None,
+    ) -> None:
+        httpx = importa_httpx()
+        self.headers: dict[str, str] = {}
+        if client is not None:
+            self.client = client
+            return
+        if importlib.util.find_spec('h2') is None:  # pragma: no cover
+            raise ImportError(
+                'O transporte HTTP/2 depende do pacote h2. Instale com: '
+                "pip install 'pypix-api[http2]'"
+            )
+        limits = httpx.Limits()
+        if pool is not None:
+            limits = httpx.Limits(
+                max_connections=pool.pool_maxsize if pool.pool_block else None,
+                max_keepalive_connections=pool.pool_maxsize,
+                keepalive_expiry=pool.max_idle
+                if pool.max_idle is not None
+                else limits.keepalive_expiry,
+            )
+        self.client = httpx.Client(
+            http2=True,
+            verify=ssl_context if ssl_context is not None else True,
+            limits=limits,
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        params: Any = None,
+        json: Any = None,
+        data: Any = None,
+        timeout: Timeout | None = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Executa a requisição, com a semântica de ``requests.Session.request``.
+
+        Raises:
+            requests.Timeout: Se a requisição exceder o tempo limite
+            requests.ConnectionError: Para as demais falhas de transporte
+        """
+        httpx = importa_httpx()
+        conteudo: dict[str, Any] = {}
+        if isinstance(data, Mapping):
+            # Como o requests, campos None não vão no formulário.
+            conteudo['data'] = {k: v for k, v in data.items() if v is not None}
+        elif data is not None:
+            # `bytes`, `str` ou as partes de um corpo gerado sob demanda
+            conteudo['content'] = data
+        try:
+            resposta = self.client.request(
+                method,
+                url,
+                headers={**self.headers, **(headers or {})},
+                params=params,
+                json=json,
+                timeout=timeout_httpx(timeout),
+                **conteudo,
+                **kwargs,
+            )
+        except httpx.TimeoutException as exc:
+            raise requests.Timeout(str(exc)) from exc
+        except httpx.HTTPError as exc:
+            raise requests.ConnectionError(str(exc)) from exc
+        return resposta_httpx_para_requests(resposta)
+
+    def post(self, url: str, data: Any = None, **kwargs: Any) -> requests.Response:
+        return self.request('POST', url, data=data, **kwargs)
+
+    def close(self) -> None:
+        """Fecha as conexões abertas."""
+        self.client.close()
@@ -0,0 +1,282 @@
+"""Cadeia de interceptadores das chamadas à API (*middleware*).
+
+Cache, métricas, repetições ou *tracing* próprios não exigem mais uma
+subclasse que sobrescreva ``_request``: a lista ``interceptors`` do banco
+forma uma cadeia, na ordem dada, em volta de cada chamada. O primeiro
+interceptador é o mais externo: vê a chamada antes de todos e a resposta
+depois de todos::
+
+    api = SicoobPixAPI(
+        oauth,
+        interceptors=[LoggingInterceptor(slow_threshold=1.0), MetricsInterceptor()],
+    )
+
+Um interceptador implementa :meth:`Interceptor.before`,
+:meth:`Interceptor.after` e :meth:`Interceptor.on_exception` — ganchos
+síncronos, que valem igualmente para os clientes assíncronos — ou, para
+controlar a chamada, sobrescreve :meth:`Interceptor.intercept` (e
+:meth:`Interceptor.intercept_async`): pode responder sem chamar o próximo
+(cache), chamá-lo mais de uma vez (repetição) ou alterar ``call.kwargs`` e
+``call.extra_headers`` antes de seguir. A resposta que chega aos
+interceptadores já passou pelo tratamento de erro: um ``4xx`` ou ``5xx``
+chega como exceção em ``on_exception``.
+
+A cadeia fica dentro do ``deadline`` do banco e fora do ``single_flight``, das
+repetições do ``retry`` e dos limitadores: cada interceptador vê uma chamada
+por método da API. Sem interceptadores, nenhum objeto é criado por chamada.
+"""
+
+import logging
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import requests
+
+from pypix_api.exceptions import PixAPIException
+from pypix_api.metrics import MetricsCollector
+
+
+@dataclass
+class RequestCall:
+    """Uma chamada à API, como os interceptadores a veem.
+
+    Attributes:
+        method: Verbo HTTP
+        path: Caminho relativo à base, iniciado por ``/``
+        operation: Rótulo da operação (ex.: ``'cob.item.get'``; ver
+            :meth:`~pypix_api.banks.base.BankPixAPIBase.operacao`)
+        bank: Código do banco
+        extra_headers: Headers adicionais. Os de autenticação continuam
+            proibidos e são verificados de novo ao fim da cadeia
+        kwargs: Repassados ao transporte (``json``, ``params``, ...)
+        elapsed: Duração da chamada em segundos, preenchida pelo
+            :class:`TimingInterceptor`
+        attributes: Espaço livre para os interceptadores trocarem dados
+    """
+
+    method: str
+    path: str
+    operation: str
+    bank: str
+    extra_headers: dict[str, str] | None
+    kwargs: dict[str, Any]
+    elapsed: float | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
+CallNext = Callable[[RequestCall], requests.Response]
+CallNextAsync = Callable[[RequestCall], Awaitable[requests.Response]]
+
+
+class Interceptor:
+    """Elo da cadeia. Sem sobrescrever nada, só repassa a chamada."""
+
+    def before(self, call: RequestCall) -> None:
+        """Antes de a chamada seguir para o próximo elo."""
+
+    def after(self, call: RequestCall, response: requests.Response) -> None:
+        """Depois de uma resposta de sucesso."""
+
+    def on_exception(self, call: RequestCall, exc: Exception) -> None:
+        """Depois de uma falha; a exceção continua se propagando."""
+
+    def intercept(self, call: RequestCall, call_next: CallNext) -> requests.Response:
+        """Executa a chamada com os ganchos em volta de ``call_next``."""
+        self.before(call)
+        try:
+            response = call_next(call)
+        except Exception as exc:
+            self.on_exception(call, exc)
+            raise
+        self.after(call, response)
+        return response
+
+    async def intercept_async(
+        self, call: RequestCall, call_next: CallNextAsync
+    ) -> requests.Response:
+        """:meth:`intercept` dos clientes assíncronos."""
+        self.before(call)
+        try:
+            response = await call_next(call)
+        except Exception as exc:
+            self.on_exception(call, exc)
+            raise
+        self.after(call, response)
+        return response
+
+
+def monta_cadeia(interceptors: Sequence[Interceptor], final: CallNext) -> CallNext:
+    """Compõe ``interceptors`` em volta de ``final``, o primeiro por fora."""
+    proximo = final
+    for interceptor in reversed(interceptors):
+        proximo = _elo(interceptor, proximo)
+    return proximo
+
+
+def monta_cadeia_async(
+    interceptors: Sequence[Interceptor], final: CallNextAsync
+) -> CallNextAsync:
+    """:func:`monta_cadeia` com :meth:`Interceptor.intercept_async`."""
+    proximo = final
+    for interceptor in reversed(interceptors):
+        proximo = _elo_async(interceptor, proximo)
+    return proximo
+
+
+def _elo(interceptor: Interceptor, proximo: CallNext) -> CallNext:
+    def elo(call: RequestCall) -> requests.Response:
+        return interceptor.intercept(call, proximo)
+
+    return elo
+
+
+def _elo_async(interceptor: Interceptor, proximo: CallNextAsync) -> CallNextAsync:
+    async def elo(call: RequestCall) -> requests.Response:
+        return await interceptor.intercept_async(call, proximo)
+
+    return elo
+
+
+def _status(resultado: requests.Response | Exception) -> int | None:
+    if isinstance(resultado, requests.Response):
+        return resultado.status_code
+    if isinstance(resultado, PixAPIException):
+        return resultado.status
+    return None
+
+
+class TimingInterceptor(Interceptor):
+    """Mede a chamada e preenche ``call.elapsed``.
+
+    Os interceptadores internos a ele, na cadeia, não veem ``elapsed``: só
+    os externos, depois da resposta. :class:`LoggingInterceptor` e
+    :class:`MetricsInterceptor` medem por conta própria.
+
+    Args:
+        callback: Chamado com a ``call`` ao fim, com sucesso ou falha
+    """
+
+    def __init__(self, callback: Callable[[RequestCall], None] | None = None) -> None:
+        self.callback = callback
+
+    def intercept(self, call: RequestCall, call_next: CallNext) -> requests.Response:
+        self.before(call)
+        inicio = time.perf_counter()
+        try:
+            response = call_next(call)
+        except Exception as exc:
+            call.elapsed = time.perf_counter() - inicio
+            self.on_exception(call, exc)
+            raise
+        call.elapsed = time.perf_counter() - inicio
+        self.after(call, response)
+        return response
+
+    async def intercept_async(
+        self, call: RequestCall, call_next: CallNextAsync
+    ) -> requests.Response:
+        self.before(call)
+        inicio = time.perf_counter()
+        try:
+            response = await call_next(call)
+        except Exception as exc:
+            call.elapsed = time.perf_counter() - inicio
+            self.on_exception(call, exc)
+            raise
+        call.elapsed = time.perf_counter() - inicio
+        self.after(call, response)
+        return response
+
+    def after(self, call: RequestCall, response: requests.Response) -> None:
+        if self.callback is not None:
+            self.callback(call)
+
+    def on_exception(self, call: RequestCall, exc: Exception) -> None:
+        if self.callback is not None:
+            self.callback(call)
+
+
+class LoggingInterceptor(TimingInterceptor):
+    """Registra cada chamada em log: operação, status e duração.
+
+    Nunca registra headers nem corpos — carregam token e dados do pagador.
+
+    Args:
+        logger: Logger de destino. ``None`` usa ``pypix_api.interceptors``
+        level: Nível das chamadas bem-sucedidas
+        slow_threshold: Segundos a partir dos quais uma chamada bem-sucedida
+            é registrada como ``WARNING``. ``None`` não destaca as lentas
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger | None = None,
+        level: int = logging.DEBUG,
+        slow_threshold: float | None = None,
+    ) -> None:
+        super().__init__()
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self.level = level
+        self.slow_threshold = slow_threshold
+
+    def after(self, call: RequestCall, response: requests.Response) -> None:
+        super().after(call, response)
+        lenta = self.slow_threshold is not None and call.elapsed >= self.slow_threshold
+        nivel = logging.WARNING if lenta else self.level
+        if self.logger.isEnabledFor(nivel):
+            self.logger.log(
+                nivel,
+                '%s %s (%s) -> %s em %.3fs%s',
+                call.method,
+                call.path,
+                call.operation,
+                response.status_code,
+                call.elapsed,
+                ' (lenta)' if lenta else '',
+                extra={'bank': call.bank, 'operation': call.operation},
+            )
+
+    def on_exception(self, call: RequestCall, exc: Exception) -> None:
+        super().on_exception(call, exc)
+        self.logger.warning(
+            '%s %s (%s) falhou em %.3fs: %s: %s',
+            call.method,
+            call.path,
+            call.operation,
+            call.elapsed,
+            type(exc).__name__,
+            exc,
+            extra={'bank': call.bank, 'operation': call.operation},
+        )
+
+
+class MetricsInterceptor(TimingInterceptor):
+    """Registra cada chamada com
+    :meth:`~pypix_api.metrics.MetricsCollector.record_api_call`.
+
+    O ``endpoint`` registrado é o rótulo da operação, e não o caminho: o
+    caminho traz ``txid`` e ``e2eid``, e cada um viraria uma série.
+    """
+
+    def after(self, call: RequestCall, response: requests.Response) -> None:
+        super().after(call, response)
+        self._registra(call, response, None)
+
+    def on_exception(self, call: RequestCall, exc: Exception) -> None:
+        super().on_exception(call, exc)
+        self._registra(call, exc, type(exc).__name__)
+
+    @staticmethod
+    def _registra(
+        call: RequestCall, resultado: requests.Response | Exception, erro: str | None
+    ) -> None:
+        MetricsCollector().record_api_call(
+            call.method,
+            call.operation,
+            _status(resultado) or 0,
+            call.elapsed,
+            call.bank,
+            erro,
+        )
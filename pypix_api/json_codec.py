@@ -0,0 +1,147 @@
+"""Codificação e decodificação JSON dos corpos das requisições.
+
+Por padrão os bancos deixam o JSON com o ``requests`` (``json=body`` na ida,
+``response.json()`` na volta), que usa o ``json`` da biblioteca padrão. Em
+páginas grandes de ``consultar_pix``/``listar_cobv`` e em lotes de 1000
+cobranças do ``lotecobv``, codificar e decodificar vira uma fatia mensurável do
+tempo de CPU. Com ``json_codec=`` no banco, os dois sentidos passam pelo codec
+escolhido:
+
+- :class:`OrjsonCodec`, com o ``orjson`` instalado;
+- :class:`MsgspecCodec`, com o ``msgspec`` instalado;
+- :class:`StdlibJsonCodec`, sempre disponível.
+
+``json_codec='auto'`` escolhe o primeiro disponível nessa ordem (ver
+:func:`detecta_codec`). Todos geram JSON compacto — sem espaços após ``,`` e
+``:`` — e UTF-8 sem escapes ``\\uXXXX``, e todos levantam ``ValueError`` para
+um corpo que não é JSON, como o ``response.json()`` — a tolerância a corpos de
+erro malformados não muda.
+"""
+
+import json
+from typing import Any, Protocol
+
+
+class JsonCodec(Protocol):
+    """Interface de um codec: objeto Python ↔ bytes JSON."""
+
+    nome: str
+
+    def dumps(self, obj: Any) -> bytes:
+        """Codifica ``obj`` em JSON compacto, UTF-8."""
+        ...
+
+    def loads(self, dados: bytes) -> Any:
+        """Decodifica ``dados``.
+
+        Raises:
+            ValueError: Se ``dados`` não for JSON válido
+        """
+        ...
+
+
+class StdlibJsonCodec:
+    """Codec sobre o ``json`` da biblioteca padrão."""
+
+    nome = 'json'
+
+    def dumps(self, obj: Any) -> bytes:
+        # allow_nan=False, como o requests: NaN não é JSON
+        return json.dumps(
+            obj, separators=(',', ':'), ensure_ascii=False, allow_nan=False
+        ).encode('utf-8')
+
+    def loads(self, dados: bytes) -> Any:
+        return json.loads(dados)
+
+
+class OrjsonCodec:
+    """Codec sobre o ``orjson``.
+
+    Raises:
+        ImportError: Se o ``orjson`` não estiver instalado
+    """
+
+    nome = 'orjson'
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+    def loads(self, dados: bytes) -> Any:
+        # orjson.JSONDecodeError já é subclasse de ValueError
+        return self._orjson.loads(dados)
+
+
+class MsgspecCodec:
+    """Codec sobre o ``msgspec.json``.
+
+    Raises:
+        ImportError: Se o ``msgspec`` não estiver instalado
+    """
+
+    nome = 'msgspec'
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._erro = msgspec.DecodeError
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, dados: bytes) -> Any:
+        try:
+            return self._decoder.decode(dados)
+        except self._erro as exc:
+            # msgspec.DecodeError não é ValueError; quem chama espera um
+            raise ValueError(str(exc)) from exc
+
+
+#: Codecs na ordem de preferência de :func:`detecta_codec`.
+_CODECS: dict[str, type] = {
+    OrjsonCodec.nome: OrjsonCodec,
+    MsgspecCodec.nome: MsgspecCodec,
+    StdlibJsonCodec.nome: StdlibJsonCodec,
+}
+
+
+def detecta_codec() -> JsonCodec:
+    """O codec mais rápido instalado: ``orjson``, ``msgspec`` ou ``json``."""
+    for classe in _CODECS.values():
+        try:
+            return classe()
+        except ImportError:
+            continue
+    return StdlibJsonCodec()  # pragma: no cover - o último sempre importa
+
+
+def resolve_codec(codec: JsonCodec | str | None) -> JsonCodec | None:
+    """Resolve o parâmetro ``json_codec`` dos bancos.
+
+    Args:
+        codec: ``None`` (JSON a cargo do ``requests``), ``'auto'``, o nome de
+            um codec (``'orjson'``, ``'msgspec'``, ``'json'``) ou uma
+            instância
+
+    Raises:
+        ValueError: Para um nome desconhecido
+        ImportError: Se o codec pedido pelo nome não estiver instalado
+    """
+    if codec is None or not isinstance(codec, str):
+        return codec
+    if codec == 'auto':
+        return detecta_codec()
+    classe = _CODECS.get(codec)
+    if classe is None:
+        raise ValueError(
+            f'Codec JSON desconhecido: {codec!r}. Use '
+            f"'auto' ou um de {sorted(_CODECS)}."
+        )
+    return classe()
@@ -0,0 +1,45 @@
+"""Faixas de tráfego (*bulkheads*) sobre o mesmo :class:`~pypix_api.auth.oauth2.OAuth2Client`.
+
+Uma exportação noturna de ``consultar_pix`` ou uma varredura de
+``listar_cobv`` compartilha, por padrão, a sessão e o pool de conexões com o
+``criar_cob`` do checkout: com o pool tomado pelo relatório, o checkout espera
+na fila. Com ``priority``, cada cliente de banco usa a sessão da sua faixa,
+com pool de conexões próprio::
+
+    checkout = SicoobPixAPI(oauth, priority='critical', pool=PoolConfig(pool_maxsize=16))
+    relatorio = SicoobPixAPI(
+        oauth,
+        priority='bulk',
+        pool=PoolConfig(pool_maxsize=4, pool_block=True),
+        concurrency=ConcurrencyPolicy(initial_limit=4, max_limit=8),
+        rate_limiter=RateLimiter({('756', '*'): RateLimit(rate=5)}),
+    )
+
+O limite de concorrência e o orçamento de taxa já são de cada cliente: dê a
+cada faixa os seus. Clientes da mesma faixa sobre o mesmo ``OAuth2Client``
+compartilham a sessão dela.
+
+Ao criar a primeira faixa, o ``OAuth2Client`` também passa a pedir tokens numa
+sessão própria (:data:`TOKEN`): a renovação de token nunca espera conexão atrás
+do tráfego em lote. O token continua único e compartilhado pelas faixas.
+"""
+
+#: Tráfego de tempo real (ex.: ``criar_cob`` no checkout).
+CRITICAL = 'critical'
+#: Exportações, varreduras e relatórios.
+BULK = 'bulk'
+#: Faixa reservada às requisições de token.
+TOKEN = 'token'  # noqa: S105
+
+
+def valida_faixa(nome: str) -> str:
+    """Valida o nome de uma faixa de tráfego de cliente de banco.
+
+    Raises:
+        ValueError: Se o nome for vazio ou for o da faixa de token
+    """
+    if not isinstance(nome, str) or not nome:
+        raise ValueError('priority deve ser o nome de uma faixa (ex.: "critical").')
+    if nome == TOKEN:
+        raise ValueError(f'A faixa "{TOKEN}" é reservada às requisições de token.')
+    return nome
@@ -66,7 +66,7 @@ class MetricsCollector:
         self.gauges: dict[str, float] = {}
         self.histograms: dict[str, list[float]] = defaultdict(list)
         self.start_time = datetime.now()
-        self._lock = threading.Lock()
+        self._lock = threading.RLock()
 
         # Enable/disable metrics collection
         self.enabled = os.getenv('PYPIX_METRICS_ENABLED', 'true').lower() == 'true'
@@ -357,6 +357,45 @@ class MetricsCollector:
             self.histograms.clear()
 
 
+class ThrottledGauge:
+    """Gauge publicado no maximo uma vez a cada ``interval`` segundos.
+
+    Para valores que mudam no caminho da requisicao (tamanho de fila, limites
+    adaptativos): cada ``MetricsCollector.gauge`` entra no buffer, e o buffer
+    cheio e exportado na hora, na thread da requisicao. Um valor repetido nao
+    e publicado; ``force`` publica mesmo dentro do intervalo (ex.: a fila que
+    esvaziou, para o gauge nao ficar parado no ultimo pico).
+
+    Args:
+        name: Nome do gauge
+        tags: Tags do gauge
+        interval: Intervalo minimo entre publicacoes, em segundos
+    """
+
+    def __init__(
+        self, name: str, tags: dict[str, str] | None = None, interval: float = 1.0
+    ) -> None:
+        self.name = name
+        self.tags = tags
+        self.interval = interval
+        self._valor: float | None = None
+        self._publicado_em = float('-inf')
+        self._lock = threading.Lock()
+
+    def set(self, value: float, force: bool = False) -> bool:
+        """Publica ``value`` se for a hora; devolve se publicou."""
+        agora = time.monotonic()
+        with self._lock:
+            if value == self._valor or (
+                not force and agora - self._publicado_em < self.interval
+            ):
+                return False
+            self._valor = value
+            self._publicado_em = agora
+        MetricsCollector().gauge(self.name, value, tags=self.tags)
+        return True
+
+
 def timed_function(metric_name: str | None = None, tags: dict[str, str] | None = None):
     """Decorator to automatically time function execution."""
 
@@ -468,6 +507,7 @@ __all__ = [
     'MetricEntry',
     'MetricsCollector',
     'PerformanceTracker',
+    'ThrottledGauge',
     'clear_metrics',
     'export_metrics',
     'get_metrics_summary',
@@ -0,0 +1,696 @@
+"""Dimensionamento e inspeção do pool de conexões da sessão HTTP.
+
+O ``requests`` monta, por padrão, um pool de 10 conexões por host. Com dezenas
+de threads compartilhando o mesmo :class:`~pypix_api.auth.oauth2.OAuth2Client`,
+as excedentes abrem uma conexão nova — com handshake mTLS completo — e a
+descartam ao final, porque o pool está cheio. :class:`PoolConfig` ajusta esse
+pool e :func:`estatisticas_do_pool` mostra como ele está sendo usado.
+:func:`abre_conexoes` enche o pool antes do primeiro uso (ver
+``BankPixAPIBase.warmup``).
+
+Balanceadores de carga dos PSPs costumam derrubar em silêncio conexões
+*keep-alive* ociosas (tipicamente após 60 s a 350 s), sem enviar ``FIN``. A
+próxima requisição na conexão morta falha com ``Connection reset by peer``.
+``PoolConfig.max_idle`` descarta, ao retirá-la do pool, a conexão ociosa há
+mais tempo que isso; ``tcp_keepalive`` liga as sondas de *keep-alive* do TCP,
+que mantêm a conexão viva no balanceador sem gastar cota de requisições do
+PSP; e ``retry_on_reset`` reenvia uma vez, em outra conexão, a requisição de
+verbo idempotente que encontrou uma conexão reaproveitada derrubada.
+
+Alguns PSPs (o Sicredi, por exemplo) limitam e bloqueiam por IP de origem.
+Num *host* com vários IPs de saída, ``PoolConfig.source_addresses`` prende
+cada conexão a um desses endereços e distribui as requisições entre eles —
+em rodízio ou pelo de menos requisições em andamento —, de modo que a vazão
+cresce com o número de endereços, e não com a cota de um só IP.
+:attr:`EstatisticasPool.por_endereco_local` conta as requisições de cada
+endereço.
+"""
+
+import functools
+import ipaddress
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+import requests
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3 import PoolManager
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import (
+    ConnectTimeoutError,
+    HTTPError,
+    NewConnectionError,
+    ProtocolError,
+)
+
+#: Verbos que podem ser reenviados após um *reset* sem risco de efeito
+#: duplicado (RFC 9110, seção 9.2.2).
+METODOS_IDEMPOTENTES = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+
+#: Distribuição das requisições entre os ``source_addresses``: rodízio ou o
+#: endereço com menos requisições em andamento.
+BALANCEAMENTOS = ('round_robin', 'least_load')
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Configuração do pool de conexões de uma sessão.
+
+    Attributes:
+        pool_connections: Quantos hosts distintos têm pool mantido em cache
+            (API e endpoint de token costumam ser hosts diferentes)
+        pool_maxsize: Conexões mantidas abertas por host. Dimensione pelo
+            número de threads que fazem chamadas simultâneas ao mesmo PSP
+        pool_block: Se True, uma thread que encontra o pool esgotado espera
+            uma conexão ser devolvida, em vez de abrir uma conexão avulsa que
+            será descartada. Limita as conexões abertas com o PSP a
+            ``pool_maxsize``
+        keep_alive: Se False, pede ao PSP que feche a conexão após cada
+            resposta (``Connection: close``) — cada requisição paga um
+            handshake novo
+        max_idle: Segundos que uma conexão pode ficar ociosa no pool. Ao ser
+            retirada depois disso, é fechada e substituída por uma nova.
+            Use um valor abaixo do tempo ocioso do balanceador do PSP.
+            ``None`` reaproveita a conexão pelo tempo que for
+        tcp_keepalive: Se definido, liga as sondas de *keep-alive* do TCP
+            após esse número de segundos sem tráfego (e a cada esse intervalo
+            depois disso). As sondas não são requisições HTTP
+        retry_on_reset: Se True, uma requisição ``GET``, ``HEAD``,
+            ``OPTIONS``, ``PUT`` ou ``DELETE`` que falha porque a conexão
+            reaproveitada foi derrubada é reenviada uma vez, em outra conexão.
+            Corpos em *stream* não são reenviados
+        source_addresses: IPs locais de saída. Cada conexão é aberta a partir
+            de um deles, e cada requisição sai por uma conexão do endereço
+            escolhido por ``source_balancing``. ``None`` deixa a escolha com
+            o sistema
+        source_balancing: ``'round_robin'`` (padrão) alterna os endereços a
+            cada requisição; ``'least_load'`` escolhe o de menos requisições
+            em andamento, com o rodízio como desempate
+    """
+
+    pool_connections: int = DEFAULT_POOLSIZE
+    pool_maxsize: int = DEFAULT_POOLSIZE
+    pool_block: bool = DEFAULT_POOLBLOCK
+    keep_alive: bool = True
+    max_idle: float | None = None
+    tcp_keepalive: float | None = None
+    retry_on_reset: bool = False
+    source_addresses: tuple[str, ...] | None = None
+    source_balancing: str = 'round_robin'
+
+    def __post_init__(self) -> None:
+        if self.pool_connections < 1 or self.pool_maxsize < 1:
+            raise ValueError('pool_connections e pool_maxsize devem ser positivos.')
+        if self.max_idle is not None and self.max_idle <= 0:
+            raise ValueError('max_idle deve ser positivo.')
+        if self.tcp_keepalive is not None and self.tcp_keepalive < 1:
+            raise ValueError('tcp_keepalive deve ser de ao menos 1 segundo.')
+        if self.source_balancing not in BALANCEAMENTOS:
+            raise ValueError(
+                f'source_balancing deve ser um de {", ".join(BALANCEAMENTOS)}.'
+            )
+        if self.source_addresses is not None:
+            object.__setattr__(
+                self, 'source_addresses', _valida_enderecos(self.source_addresses)
+            )
+
+
+def _valida_enderecos(enderecos: Any) -> tuple[str, ...]:
+    if isinstance(enderecos, str):
+        raise TypeError('source_addresses deve ser uma sequência de IPs.')
+    normalizados = []
+    for endereco in enderecos:
+        try:
+            normalizados.append(str(ipaddress.ip_address(endereco)))
+        except ValueError as exc:
+            raise ValueError(f'Endereço de origem inválido: {endereco!r}') from exc
+    if not normalizados:
+        raise ValueError('source_addresses não pode ser vazio.')
+    if len(set(normalizados)) != len(normalizados):
+        raise ValueError('source_addresses tem endereços repetidos.')
+    return tuple(normalizados)
+
+
+@dataclass(frozen=True)
+class EstatisticasPool:
+    """Retrato do uso do pool de conexões.
+
+    Attributes:
+        maxsize: Soma do tamanho máximo dos pools
+        em_uso: Conexões retiradas do pool e ainda não devolvidas. Com
+            ``pool_block=False``, as conexões avulsas abertas além de
+            ``pool_maxsize`` não entram nesta conta
+        ociosas: Conexões abertas aguardando reúso
+        conexoes_criadas: Conexões novas abertas desde a criação do pool — cada
+            uma é um handshake TCP/TLS. Crescendo junto com ``requisicoes``,
+            indica pool subdimensionado
+        requisicoes: Requisições feitas pelo pool
+        recicladas: Conexões fechadas por passarem de ``max_idle`` ociosas
+        reenvios: Requisições reenviadas após o *reset* de uma conexão
+            reaproveitada (``retry_on_reset``)
+        por_endereco_local: Requisições por IP local de saída, com
+            ``source_addresses``
+        por_host: As mesmas estatísticas por origem (``https://host:porta``)
+    """
+
+    maxsize: int = 0
+    em_uso: int = 0
+    ociosas: int = 0
+    conexoes_criadas: int = 0
+    requisicoes: int = 0
+    recicladas: int = 0
+    reenvios: int = 0
+    por_endereco_local: dict[str, int] = field(default_factory=dict)
+    por_host: dict[str, 'EstatisticasPool'] = field(default_factory=dict)
+
+
+def configura_pool(session: Any, config: PoolConfig) -> None:
+    """Aplica ``config`` aos adapters já montados na sessão.
+
+    Reconfigura o adapter existente em vez de montar um novo: o
+    ``Pkcs12Adapter`` do mTLS guarda o ``SSLContext`` já decodificado e o
+    reinjeta ao recriar o pool, sem decodificar o PFX de novo. Conexões
+    abertas no pool anterior são fechadas.
+
+    Numa :class:`~pypix_api.transport.TransportSession`, reconfigura o
+    transporte, se ele souber (ver
+    :meth:`~pypix_api.transport.Urllib3Transport.reconfigura`).
+    """
+    transporte = getattr(session, 'transport', None)
+    if callable(getattr(type(transporte), 'reconfigura', None)):
+        transporte.reconfigura(config)
+        return
+    for adapter in session.adapters.values():
+        if not isinstance(adapter, HTTPAdapter):
+            continue
+        adapter.poolmanager.clear()
+        # Os atributos privados são o estado que o próprio HTTPAdapter usa ao
+        # ser serializado e ao recriar o pool (ver `HTTPAdapter.__setstate__`).
+        adapter._pool_connections = config.pool_connections
+        adapter._pool_maxsize = config.pool_maxsize
+        adapter._pool_block = config.pool_block
+        extras: dict[str, Any] = {}
+        if config.tcp_keepalive is not None:
+            extras['socket_options'] = opcoes_keepalive(config.tcp_keepalive)
+        adapter.init_poolmanager(
+            config.pool_connections,
+            config.pool_maxsize,
+            block=config.pool_block,
+            **extras,
+        )
+        classes = classes_de_pool(config)
+        if classes is not None:
+            adapter.poolmanager.pool_classes_by_scheme = classes
+
+    if config.keep_alive:
+        session.headers.pop('Connection', None)
+    else:
+        session.headers['Connection'] = 'close'
+
+
+def classes_de_pool(config: PoolConfig) -> dict[str, Any] | None:
+    """``pool_classes_by_scheme`` de um ``PoolManager`` com ``max_idle``,
+    ``retry_on_reset`` e ``source_addresses``; ``None`` se ``config`` não usa
+    nenhum deles."""
+    opcoes: dict[str, Any] = {
+        'max_idle': config.max_idle,
+        'retry_on_reset': config.retry_on_reset,
+    }
+    if config.source_addresses is not None:
+        opcoes['source_addresses'] = config.source_addresses
+        opcoes['source_balancing'] = config.source_balancing
+        return {
+            'http': functools.partial(PoolHTTPComOrigens, **opcoes),
+            'https': functools.partial(PoolHTTPSComOrigens, **opcoes),
+        }
+    if config.max_idle is None and not config.retry_on_reset:
+        return None
+    return {
+        'http': functools.partial(PoolHTTPReciclavel, **opcoes),
+        'https': functools.partial(PoolHTTPSReciclavel, **opcoes),
+    }
+
+
+def opcoes_keepalive(intervalo: float) -> list[tuple[int, int, int]]:
+    """Opções de *socket* que ligam as sondas de *keep-alive* do TCP.
+
+    Mantém as opções padrão do urllib3 (``TCP_NODELAY``). Onde o sistema não
+    expõe o ajuste fino (``TCP_KEEPIDLE`` no Linux, ``TCP_KEEPALIVE`` no
+    macOS), vale o intervalo padrão do sistema.
+    """
+    segundos = int(intervalo)
+    opcoes = [
+        *HTTPConnection.default_socket_options,
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    ocioso = getattr(socket, 'TCP_KEEPIDLE', getattr(socket, 'TCP_KEEPALIVE', None))
+    if ocioso is not None:
+        opcoes.append((socket.IPPROTO_TCP, ocioso, segundos))
+    if hasattr(socket, 'TCP_KEEPINTVL'):
+        opcoes.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, segundos))
+    if hasattr(socket, 'TCP_KEEPCNT'):
+        opcoes.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3))
+    return opcoes
+
+
+def _conexao_derrubada(exc: ProtocolError) -> bool:
+    """Se o ``ProtocolError`` veio do PSP ter fechado a conexão."""
+    causa = exc.args[-1] if exc.args else None
+    return isinstance(causa, (ConnectionResetError, BrokenPipeError))
+
+
+class _Reciclagem:
+    """Idade ociosa das conexões e reenvio após *reset*, sobre um pool do urllib3.
+
+    ``urlopen`` é chamado pelo ``HTTPAdapter`` com ``Retry(0, read=False)``:
+    o ``ProtocolError`` de uma conexão derrubada chega até aqui sem ter sido
+    repetido.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        max_idle: float | None = None,
+        retry_on_reset: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.max_idle = max_idle
+        self.retry_on_reset = retry_on_reset
+        self.num_recicladas = 0
+        self.num_reenvios = 0
+        # O pool é compartilhado entre threads e `+=` não é atômico
+        self._lock_contadores = threading.Lock()
+        # Se a última conexão retirada por esta thread já tinha sido usada
+        self._local = threading.local()
+
+    def _get_conn(self, timeout: float | None = None) -> Any:
+        return self._renova_se_ociosa(super()._get_conn(timeout))
+
+    def _renova_se_ociosa(self, conexao: Any) -> Any:
+        """``conexao``, ou uma nova no lugar dela se passou de ``max_idle``."""
+        reaproveitada = conexao.sock is not None
+        devolvida_em = getattr(conexao, '_pypix_devolvida_em', None)
+        if (
+            reaproveitada
+            and self.max_idle is not None
+            and devolvida_em is not None
+            and time.monotonic() - devolvida_em > self.max_idle
+        ):
+            # Uma conexão nova, e não a mesma reaberta: `conexoes_criadas`
+            # continua contando os handshakes
+            conexao.close()
+            conexao = self._new_conn()
+            with self._lock_contadores:
+                self.num_recicladas += 1
+            reaproveitada = False
+        self._local.reaproveitada = reaproveitada
+        return conexao
+
+    def _put_conn(self, conn: Any) -> None:
+        if conn is not None:
+            conn._pypix_devolvida_em = time.monotonic()
+        super()._put_conn(conn)
+
+    def urlopen(
+        self, method: str, url: str, body: Any = None, *args: Any, **kwargs: Any
+    ) -> Any:
+        self._local.reaproveitada = False
+        try:
+            return super().urlopen(method, url, body, *args, **kwargs)
+        except ProtocolError as exc:
+            if not (
+                self.retry_on_reset
+                and getattr(self._local, 'reaproveitada', False)
+                and method.upper() in METODOS_IDEMPOTENTES
+                and (body is None or isinstance(body, (bytes, str)))
+                and _conexao_derrubada(exc)
+            ):
+                raise
+        with self._lock_contadores:
+            self.num_reenvios += 1
+        return super().urlopen(method, url, body, *args, **kwargs)
+
+
+class PoolHTTPReciclavel(_Reciclagem, HTTPConnectionPool):
+    """``HTTPConnectionPool`` com ``max_idle`` e ``retry_on_reset``."""
+
+
+class PoolHTTPSReciclavel(_Reciclagem, HTTPSConnectionPool):
+    """``HTTPSConnectionPool`` com ``max_idle`` e ``retry_on_reset``."""
+
+
+class EnderecosDeOrigem:
+    """Escolha do IP local de cada requisição de um pool, com contadores.
+
+    Args:
+        enderecos: IPs locais de saída
+        balanceamento: Um de :data:`BALANCEAMENTOS`
+
+    Attributes:
+        requisicoes: Requisições enviadas por endereço
+        em_andamento: Requisições em andamento por endereço
+    """
+
+    def __init__(self, enderecos: tuple[str, ...], balanceamento: str) -> None:
+        self.enderecos = enderecos
+        self._menor_carga = balanceamento == 'least_load'
+        self._lock = threading.Lock()
+        self._proximo = 0
+        self.requisicoes = dict.fromkeys(enderecos, 0)
+        self.em_andamento = dict.fromkeys(enderecos, 0)
+
+    def proximo(self) -> str:
+        """Endereço da vez no rodízio, sem contar requisição (ex.: conexões
+        abertas pelo ``warmup``)."""
+        with self._lock:
+            return self._avanca()
+
+    def adquire(self) -> str:
+        """Endereço de uma requisição que vai sair; devolva com :meth:`libera`."""
+        with self._lock:
+            if self._menor_carga:
+                # `min` fica com o primeiro dos empatados: a partir da vez do
+                # rodízio, os empates se alternam
+                total = len(self.enderecos)
+                candidatos = (
+                    self.enderecos[(self._proximo + i) % total] for i in range(total)
+                )
+                endereco = min(candidatos, key=self.em_andamento.__getitem__)
+                self._proximo = (self.enderecos.index(endereco) + 1) % total
+            else:
+                endereco = self._avanca()
+            self.requisicoes[endereco] += 1
+            self.em_andamento[endereco] += 1
+        return endereco
+
+    def libera(self, endereco: str) -> None:
+        with self._lock:
+            self.em_andamento[endereco] -= 1
+
+    def _avanca(self) -> str:
+        endereco = self.enderecos[self._proximo]
+        self._proximo = (self._proximo + 1) % len(self.enderecos)
+        return endereco
+
+
+class _Origens:
+    """Conexões presas a endereços locais de origem, sobre um pool do urllib3.
+
+    Cada requisição escolhe um endereço em :class:`EnderecosDeOrigem` e sai
+    por uma conexão dele: uma nova nasce presa ao endereço da vez, e uma
+    ociosa de outro endereço é trocada, na fila do pool, por uma do escolhido.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        source_addresses: tuple[str, ...] = (),
+        source_balancing: str = 'round_robin',
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.origens = EnderecosDeOrigem(source_addresses, source_balancing)
+        # Endereço da requisição em andamento nesta thread
+        self._origem = threading.local()
+
+    def urlopen(
+        self, method: str, url: str, body: Any = None, *args: Any, **kwargs: Any
+    ) -> Any:
+        endereco = self.origens.adquire()
+        self._origem.endereco = endereco
+        try:
+            return super().urlopen(method, url, body, *args, **kwargs)
+        finally:
+            self._origem.endereco = None
+            self.origens.libera(endereco)
+
+    def _endereco_da_vez(self) -> str:
+        endereco = getattr(self._origem, 'endereco', None)
+        return endereco if endereco is not None else self.origens.proximo()
+
+    def _get_conn(self, timeout: float | None = None) -> Any:
+        endereco = self._endereco_da_vez()
+        # `_new_conn`, chamado pelo pool na falta de uma ociosa, usa este
+        self._origem.nova = endereco
+        try:
+            conexao = super()._get_conn(timeout)
+        finally:
+            self._origem.nova = None
+        return self._do_endereco(conexao, (endereco, 0))
+
+    def _new_conn(self) -> Any:
+        conexao = super()._new_conn()
+        endereco = getattr(self._origem, 'nova', None)
+        if endereco is None:
+            endereco = self._endereco_da_vez()
+        conexao.source_address = (endereco, 0)
+        return conexao
+
+    def _do_endereco(self, conexao: Any, origem: tuple[str, int]) -> Any:
+        """``conexao``, se for de ``origem``; senão, uma que seja."""
+        if conexao.source_address == origem:
+            return conexao
+        if conexao.sock is None:
+            conexao.source_address = origem
+            return conexao
+        fila = self.pool
+        with fila.mutex:
+            # A fila tem sempre `maxsize` posições (`None` é posição livre):
+            # trocar uma pela outra não muda a conta do pool. Primeiro uma
+            # ociosa do endereço; na falta, uma posição livre
+            posicao = next(
+                (
+                    indice
+                    for indice, ociosa in enumerate(fila.queue)
+                    if ociosa is not None and ociosa.source_address == origem
+                ),
+                None,
+            )
+            if posicao is None:
+                posicao = next(
+                    (i for i, ociosa in enumerate(fila.queue) if ociosa is None), None
+                )
+            if posicao is not None:
+                ociosa = fila.queue[posicao]
+                fila.queue[posicao] = conexao
+        if posicao is None:
+            # Pool cheio de conexões de outros endereços: esta é refeita
+            conexao.close()
+            conexao.source_address = origem
+            self._local.reaproveitada = False
+            return conexao
+        if ociosa is not None:
+            # Passa pelo `max_idle`, como a que saiu da fila pelo pool; se
+            # renovada, a nova nasce presa a `origem`
+            self._origem.nova = origem[0]
+            try:
+                return self._renova_se_ociosa(ociosa)
+            finally:
+                self._origem.nova = None
+        nova = super()._new_conn()
+        nova.source_address = origem
+        # Para o `retry_on_reset` de `_Reciclagem`: a conexão é nova
+        self._local.reaproveitada = False
+        return nova
+
+
+class PoolHTTPComOrigens(_Origens, PoolHTTPReciclavel):
+    """``HTTPConnectionPool`` com ``source_addresses`` (e ``max_idle`` e
+    ``retry_on_reset``)."""
+
+
+class PoolHTTPSComOrigens(_Origens, PoolHTTPSReciclavel):
+    """``HTTPSConnectionPool`` com ``source_addresses`` (e ``max_idle`` e
+    ``retry_on_reset``)."""
+
+
+@dataclass(frozen=True)
+class RelatorioAquecimento:
+    """Resultado de ``warmup()``.
+
+    Attributes:
+        conexoes_api: Conexões abertas com o host da API
+        conexoes_token: Conexões abertas com o host do ``TOKEN_URL``
+        fases: Duração de cada fase, em segundos, na ordem em que rodaram:
+            ``'conexoes_api'``, ``'conexoes_token'`` e ``'token'``
+    """
+
+    conexoes_api: int = 0
+    conexoes_token: int = 0
+    fases: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def total(self) -> float:
+        """Duração total do aquecimento, em segundos."""
+        return sum(self.fases.values())
+
+
+def abre_conexoes(
+    session: Any, url: str, quantidade: int, timeout: float | None = None
+) -> int:
+    """Abre até ``quantidade`` conexões com o host de ``url`` e as deixa no pool.
+
+    Cada conexão paga DNS, TCP e o handshake TLS (com o certificado de cliente
+    do adapter, no mTLS) sem enviar nenhuma requisição. O pool é obtido pelo
+    mesmo caminho do ``requests`` ao enviar — mesmas opções de verificação,
+    proxy e certificado —, então as conexões são as que a próxima requisição
+    vai reaproveitar. Conexões já abertas no pool contam.
+
+    Args:
+        session: ``requests.Session`` ou
+            :class:`~pypix_api.transport.TransportSession` sobre o
+            ``urllib3``. Outros tipos de sessão (HTTP/2, cliente assíncrono)
+            não são aquecidos
+        url: Qualquer URL do host
+        quantidade: Conexões desejadas; limitada ao ``pool_maxsize``
+        timeout: Tempo limite de cada conexão, em segundos
+
+    Returns:
+        int: Conexões abertas no pool ao final
+
+    Raises:
+        TimeoutError: Se uma conexão exceder ``timeout``
+        OSError: Se uma conexão falhar (DNS, recusa, TLS)
+    """
+    if quantidade < 1:
+        return 0
+    gerenciador = _poolmanager_do_transporte(session)
+    if gerenciador is not None:
+        return _abre_no_pool(gerenciador.connection_from_url(url), quantidade, timeout)
+    if not isinstance(session, requests.Session):
+        return 0
+    requisicao = session.prepare_request(requests.Request('GET', url))
+    opcoes = session.merge_environment_settings(requisicao.url, {}, None, None, None)
+    adapter = session.get_adapter(requisicao.url)
+    if not isinstance(adapter, HTTPAdapter):
+        return 0
+    if hasattr(adapter, 'get_connection_with_tls_context'):
+        pool = adapter.get_connection_with_tls_context(
+            requisicao, opcoes['verify'], proxies=opcoes['proxies'], cert=opcoes['cert']
+        )
+    else:  # requests < 2.32.2
+        pool = adapter.get_connection(requisicao.url, opcoes['proxies'])
+    adapter.cert_verify(pool, requisicao.url, opcoes['verify'], opcoes['cert'])
+    return _abre_no_pool(pool, quantidade, timeout)
+
+
+def _abre_no_pool(pool: Any, quantidade: int, timeout: float | None) -> int:
+    quantidade = min(quantidade, pool.pool.maxsize)
+
+    # Todas ficam retiradas até o fim: devolvida, uma conexão seria retirada
+    # de novo pela próxima, e o pool terminaria com uma só.
+    conexoes = [pool._get_conn() for _ in range(quantidade)]
+    try:
+        with ThreadPoolExecutor(quantidade, thread_name_prefix='pypix-warmup') as ex:
+            if timeout is not None:
+                for conexao in conexoes:
+                    conexao.timeout = timeout
+            list(ex.map(_conecta, conexoes))
+    finally:
+        for conexao in conexoes:
+            pool._put_conn(conexao)
+    return quantidade
+
+
+def _conecta(conexao: Any) -> None:
+    if conexao.sock is not None:
+        return
+    try:
+        conexao.connect()
+    except NewConnectionError as exc:
+        # Subclasse de ConnectTimeoutError no urllib3, mas é recusa ou DNS
+        raise OSError(str(exc)) from exc
+    except ConnectTimeoutError as exc:
+        raise TimeoutError(str(exc)) from exc
+    except HTTPError as exc:
+        raise OSError(str(exc)) from exc
+
+
+def _poolmanager_do_transporte(session: Any) -> Any:
+    """``PoolManager`` do transporte de uma
+    :class:`~pypix_api.transport.TransportSession`, se houver."""
+    gerenciador = getattr(getattr(session, 'transport', None), 'poolmanager', None)
+    return gerenciador if isinstance(gerenciador, PoolManager) else None
+
+
+def _estatisticas_de_um_pool(pool: Any) -> EstatisticasPool:
+    fila = pool.pool
+    recicladas = getattr(pool, 'num_recicladas', 0)
+    reenvios = getattr(pool, 'num_reenvios', 0)
+    origens = getattr(pool, 'origens', None)
+    por_endereco = {} if origens is None else dict(origens.requisicoes)
+    if fila is None:  # pool fechado
+        return EstatisticasPool(
+            conexoes_criadas=pool.num_connections,
+            requisicoes=pool.num_requests,
+            recicladas=recicladas,
+            reenvios=reenvios,
+            por_endereco_local=por_endereco,
+        )
+    with fila.mutex:
+        # A fila começa com `maxsize` posições `None`: uma conexão retirada
+        # libera a posição, e uma devolvida volta como objeto.
+        ociosas = sum(1 for conexao in fila.queue if conexao is not None)
+        livres = len(fila.queue)
+    return EstatisticasPool(
+        maxsize=fila.maxsize,
+        em_uso=max(fila.maxsize - livres, 0),
+        ociosas=ociosas,
+        conexoes_criadas=pool.num_connections,
+        requisicoes=pool.num_requests,
+        recicladas=recicladas,
+        reenvios=reenvios,
+        por_endereco_local=por_endereco,
+    )
+
+
+def estatisticas_do_pool(session: Any) -> EstatisticasPool:
+    """Agrega as estatísticas de todos os pools da sessão.
+
+    Args:
+        session: ``requests.Session`` ou
+            :class:`~pypix_api.transport.TransportSession` sobre o
+            ``urllib3``. Outros tipos de sessão (ex.: a do cliente
+            assíncrono) devolvem estatísticas zeradas
+
+    Returns:
+        EstatisticasPool: Totais da sessão, com o detalhe em ``por_host``
+    """
+    por_host: dict[str, EstatisticasPool] = {}
+    adapters = getattr(session, 'adapters', {})
+    gerenciadores = [
+        getattr(adapter, 'poolmanager', None)
+        for adapter in {id(a): a for a in adapters.values()}.values()
+    ]
+    gerenciadores.append(_poolmanager_do_transporte(session))
+    for gerenciador in gerenciadores:
+        if gerenciador is None:
+            continue
+        pools = gerenciador.pools
+        for chave in pools.keys():
+            pool = pools.get(chave)
+            if pool is None:
+                continue
+            origem = f'{pool.scheme}://{pool.host}:{pool.port}'
+            por_host[origem] = _estatisticas_de_um_pool(pool)
+
+    por_endereco: dict[str, int] = {}
+    for estatisticas in por_host.values():
+        for endereco, requisicoes in estatisticas.por_endereco_local.items():
+            por_endereco[endereco] = por_endereco.get(endereco, 0) + requisicoes
+    return EstatisticasPool(
+        maxsize=sum(e.maxsize for e in por_host.values()),
+        em_uso=sum(e.em_uso for e in por_host.values()),
+        ociosas=sum(e.ociosas for e in por_host.values()),
+        conexoes_criadas=sum(e.conexoes_criadas for e in por_host.values()),
+        requisicoes=sum(e.requisicoes for e in por_host.values()),
+        recicladas=sum(e.recicladas for e in por_host.values()),
+        reenvios=sum(e.reenvios for e in por_host.values()),
+        por_endereco_local=por_endereco,
+        por_host=por_host,
+    )
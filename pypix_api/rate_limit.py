@@ -0,0 +1,167 @@
+"""Limitador de taxa do lado do cliente, por PSP e por recurso.
+
+Os PSPs limitam o volume de requisições: BB e Sicoob respondem ``429`` e o
+Guia Técnico do Sicredi associa volume de requisições — inclusive de token — a
+bloqueio por IP. :class:`RateLimiter` mantém o tráfego logo abaixo da cota, em
+vez de deixá-lo bater no limite e voltar.
+
+Cada limite é um *token bucket*: ``rate`` requisições por segundo, com rajadas
+de até ``burst``. Quem chega com o balde vazio reserva a próxima vaga e espera
+por ela — as chamadas excedentes formam uma fila espaçada de ``1/rate``
+segundos, sem picos nem rejeições.
+
+Os limites são configurados por ``(banco, recurso)``, onde o banco é o código
+de :meth:`~pypix_api.banks.base.BankPixAPIBase.get_bank_code` e o recurso é o
+primeiro segmento do caminho (``cob``, ``pix``, ``lotecobv``, ...) ou
+:data:`RECURSO_OAUTH` para o endpoint de token. ``'*'`` vale para qualquer
+banco ou recurso, e o limite mais específico é o aplicado::
+
+    limitador = RateLimiter({
+        ('748', 'cob'): RateLimit(rate=20, burst=40),
+        ('748', 'oauth'): RateLimit(rate=1, burst=2),
+        ('748', '*'): RateLimit(rate=50),
+    })
+
+Para que o limite valha no processo inteiro, passe a **mesma instância** a
+todos os clientes.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+
+from pypix_api.metrics import MetricsCollector
+
+#: Recurso do endpoint de token (``OAuth2Client.get_token``).
+RECURSO_OAUTH = 'oauth'
+#: Curinga de banco ou de recurso.
+QUALQUER = '*'
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Limite de um balde.
+
+    Attributes:
+        rate: Requisições por segundo, em regime
+        burst: Requisições que podem sair de uma vez com o balde cheio.
+            ``None`` usa ``max(1, rate)`` — um segundo de cota
+    """
+
+    rate: float
+    burst: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError('rate deve ser positivo.')
+        if self.burst is not None and self.burst < 1:
+            raise ValueError('burst deve ser ao menos 1.')
+
+    @property
+    def capacidade(self) -> float:
+        """Tamanho do balde."""
+        return self.burst if self.burst is not None else max(1.0, self.rate)
+
+
+class TokenBucket:
+    """Balde de fichas seguro entre threads."""
+
+    def __init__(self, limite: RateLimit) -> None:
+        self.limite = limite
+        self._fichas = limite.capacidade
+        self._atualizado_em = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserva(self) -> float:
+        """Reserva uma ficha e devolve quantos segundos esperar por ela.
+
+        A ficha é descontada na hora, mesmo que o saldo fique negativo: quem
+        chega depois reserva a vaga seguinte, e a fila se forma na ordem de
+        chegada.
+        """
+        with self._lock:
+            agora = time.monotonic()
+            decorrido = agora - self._atualizado_em
+            self._atualizado_em = agora
+            self._fichas = min(
+                self.limite.capacidade, self._fichas + decorrido * self.limite.rate
+            )
+            self._fichas -= 1
+            if self._fichas >= 0:
+                return 0.0
+            return -self._fichas / self.limite.rate
+
+    def devolve(self) -> None:
+        """Devolve a ficha de uma reserva que não vai ser usada."""
+        with self._lock:
+            self._fichas = min(self.limite.capacidade, self._fichas + 1)
+
+
+class RateLimiter:
+    """Conjunto de baldes por ``(banco, recurso)``. Seguro entre threads.
+
+    Args:
+        limites: Limite por ``(banco, recurso)``; ``'*'`` é curinga. Pares sem
+            limite aplicável não esperam
+    """
+
+    def __init__(self, limites: dict[tuple[str, str], RateLimit] | None = None) -> None:
+        self.limites = dict(limites or {})
+        self._baldes = {
+            chave: TokenBucket(limite) for chave, limite in self.limites.items()
+        }
+
+    def balde(self, banco: str, recurso: str) -> TokenBucket | None:
+        """Balde aplicado a ``(banco, recurso)``: o do limite mais específico."""
+        for chave in (
+            (banco, recurso),
+            (banco, QUALQUER),
+            (QUALQUER, recurso),
+            (QUALQUER, QUALQUER),
+        ):
+            balde = self._baldes.get(chave)
+            if balde is not None:
+                return balde
+        return None
+
+    def reserva(self, banco: str, recurso: str, max_wait: float | None = None) -> float:
+        """Reserva uma vaga e devolve os segundos de espera, sem esperar.
+
+        Para quem espera por conta própria (ex.: ``asyncio.sleep``).
+
+        Args:
+            banco: Código do banco
+            recurso: Recurso da requisição
+            max_wait: Espera máxima aceita (ex.: o que resta do prazo da
+                chamada). ``None`` aceita qualquer espera
+
+        Raises:
+            TimeoutError: Se a vaga só viria depois de ``max_wait``; a reserva
+                é desfeita
+        """
+        balde = self.balde(banco, recurso)
+        if balde is None:
+            return 0.0
+        espera = balde.reserva()
+        if max_wait is not None and espera >= max_wait:
+            balde.devolve()
+            raise TimeoutError(
+                f'Vaga de ({banco}, {recurso}) só em {espera:.3f}s; '
+                f'o máximo é {max_wait:.3f}s'
+            )
+        if espera > 0:
+            MetricsCollector().histogram(
+                'rate_limiter.wait', espera, tags={'bank': banco, 'resource': recurso}
+            )
+        return espera
+
+    def adquire(self, banco: str, recurso: str, max_wait: float | None = None) -> float:
+        """Espera a vez de ``(banco, recurso)``. Devolve os segundos esperados.
+
+        Raises:
+            TimeoutError: Se a vaga só viria depois de ``max_wait``, sem esperar
+        """
+        espera = self.reserva(banco, recurso, max_wait)
+        if espera > 0:
+            time.sleep(espera)
+        return espera
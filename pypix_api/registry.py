@@ -0,0 +1,349 @@
+"""Registro de clientes por lojista (*multi-tenant*).
+
+Um processo que atende milhares de lojistas — cada um com o seu
+``client_id`` e o seu certificado — não pode manter um cliente de banco vivo
+por lojista: cada um carrega uma sessão com pool de conexões e um token. Nem
+pode criar um cliente por requisição, pagando handshake mTLS e ``POST`` de
+token toda vez. O :class:`ClientRegistry` fica no meio: cria o cliente do
+lojista no primeiro uso, mantém os mais recentes e fecha os que saem.
+
+Um cliente sai do registro quando:
+
+- o registro está cheio e ele é o usado há mais tempo (LRU);
+- está sem uso há mais de ``ttl`` segundos;
+- :meth:`ClientRegistry.evict` é chamado para o lojista (ex.: troca de
+  certificado).
+
+Com ``keep_warm_interval``, uma thread renova os tokens dos lojistas usados
+nos últimos ``hot_window`` segundos antes que vençam, para que a requisição de
+um lojista ativo nunca espere pelo ``POST`` de token.
+
+As métricas vão para o :class:`~pypix_api.metrics.MetricsCollector` como
+``client_registry.hit``, ``client_registry.miss`` e
+``client_registry.eviction`` (com a tag ``reason``: ``lru``, ``ttl`` ou
+``manual``), e também ficam em :meth:`ClientRegistry.stats`.
+
+Exemplo::
+
+    def cria_cliente(lojista: str) -> SicoobPixAPI:
+        cadastro = carrega_cadastro(lojista)
+        oauth = OAuth2Client(
+            token_url=SicoobPixAPI.TOKEN_URL,
+            client_id=cadastro.client_id,
+            cert_pfx=cadastro.pfx,
+            pwd_pfx=cadastro.senha_pfx,
+        )
+        return SicoobPixAPI(oauth=oauth)
+
+    clientes = ClientRegistry(cria_cliente, max_clients=500, ttl=900)
+    clientes.get('loja-42').consultar_cob(txid)
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from pypix_api.metrics import MetricsCollector
+from pypix_api.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+C = TypeVar('C')
+
+
+@dataclass(frozen=True)
+class EstatisticasRegistro:
+    """Contadores de um :class:`ClientRegistry` desde a criação.
+
+    Attributes:
+        hits: ``get`` atendidos por um cliente já criado
+        misses: ``get`` que criaram o cliente
+        evictions: Clientes retirados do registro (e fechados)
+        size: Clientes no registro agora
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fração dos ``get`` atendidos sem criar cliente."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _Entrada(Generic[C]):
+    """Um cliente do registro e quando foi usado pela última vez."""
+
+    __slots__ = ('cliente', 'usado_em')
+
+    def __init__(self, cliente: C, usado_em: float) -> None:
+        self.cliente = cliente
+        self.usado_em = usado_em
+
+
+class ClientRegistry(Generic[C]):
+    """Clientes de banco por lojista, criados sob demanda e descartados por
+    LRU e por tempo sem uso.
+
+    Seguro entre threads. Chamadas simultâneas de :meth:`get` para um lojista
+    ainda sem cliente criam um só cliente, e a criação de um lojista não
+    bloqueia os ``get`` dos outros.
+
+    Um cliente retirado é fechado (``close()``). Quem ainda o estava usando
+    termina a requisição em andamento, mas deve pedir o cliente de novo ao
+    registro nas próximas — não guarde a referência.
+
+    Pensado para os clientes síncronos. Os assíncronos precisam de ``await``
+    para fechar e renovar o token, o que o registro não faz.
+
+    Args:
+        factory: Cria o cliente de um lojista a partir da sua chave
+        max_clients: Máximo de clientes no registro
+        ttl: Segundos sem uso após os quais o cliente é descartado. ``None``
+            (padrão) descarta só por LRU
+        keep_warm_interval: Intervalo, em segundos, da thread que renova os
+            tokens dos lojistas ativos. ``None`` (padrão) não cria a thread;
+            :meth:`keep_warm` pode ser chamado pela aplicação
+        hot_window: Um lojista usado nos últimos ``hot_window`` segundos tem o
+            token mantido válido
+        refresh_ahead: Renova o token quando faltam menos de
+            ``refresh_ahead`` segundos para vencer. Deve ser maior que
+            ``keep_warm_interval`` para que nenhum token vença entre duas
+            rodadas
+
+    Raises:
+        ValueError: Se ``max_clients`` não for positivo
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[Hashable], C],
+        max_clients: int = 1000,
+        ttl: float | None = None,
+        keep_warm_interval: float | None = None,
+        hot_window: float = 300.0,
+        refresh_ahead: float = 300.0,
+    ) -> None:
+        if max_clients < 1:
+            raise ValueError('max_clients deve ser positivo')
+        self.factory = factory
+        self.max_clients = max_clients
+        self.ttl = ttl
+        self.keep_warm_interval = keep_warm_interval
+        self.hot_window = hot_window
+        self.refresh_ahead = refresh_ahead
+        self._entradas: OrderedDict[Hashable, _Entrada[C]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._criacoes = SingleFlight()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._parar = threading.Event()
+        self._thread: threading.Thread | None = None
+        if keep_warm_interval is not None:
+            self._thread = threading.Thread(
+                target=self._mantem_aquecidos,
+                name='pypix-client-registry',
+                daemon=True,
+            )
+            self._thread.start()
+
+    def get(self, tenant: Hashable) -> C:
+        """Cliente de ``tenant``, criado no primeiro uso.
+
+        Raises:
+            Exception: O que ``factory`` levantar; nada fica no registro
+        """
+        agora = time.monotonic()
+        descartados: list[tuple[C, str]] = []
+        with self._lock:
+            entrada = self._entradas.get(tenant)
+            if entrada is not None and self._expirou(entrada, agora):
+                del self._entradas[tenant]
+                descartados.append((entrada.cliente, 'ttl'))
+                entrada = None
+            if entrada is not None:
+                entrada.usado_em = agora
+                self._entradas.move_to_end(tenant)
+                self._hits += 1
+        self._fecha(descartados)
+        if entrada is not None:
+            self._conta('client_registry.hit')
+            return entrada.cliente
+
+        cliente, compartilhado = self._criacoes.executa(
+            tenant, lambda: self._cria(tenant)
+        )
+        if compartilhado:
+            # Esperou a criação de outra chamada: não criou cliente
+            with self._lock:
+                self._hits += 1
+            self._conta('client_registry.hit')
+        return cliente
+
+    def evict(self, tenant: Hashable) -> bool:
+        """Retira e fecha o cliente de ``tenant``; ``False`` se não havia."""
+        with self._lock:
+            entrada = self._entradas.pop(tenant, None)
+        if entrada is None:
+            return False
+        self._fecha([(entrada.cliente, 'manual')])
+        return True
+
+    def expire(self) -> int:
+        """Retira os clientes sem uso há mais de ``ttl``; devolve quantos."""
+        with self._lock:
+            descartados = self._retira_expirados(time.monotonic())
+        self._fecha(descartados)
+        return len(descartados)
+
+    def keep_warm(self) -> int:
+        """Renova os tokens dos lojistas ativos que estão para vencer.
+
+        É o que a thread de ``keep_warm_interval`` executa a cada rodada.
+        Falhas são registradas no log e não interrompem os demais lojistas: a
+        próxima requisição do lojista tenta obter o token de novo.
+
+        Returns:
+            int: Quantos tokens foram renovados
+        """
+        agora = time.monotonic()
+        with self._lock:
+            ativos = [
+                (tenant, entrada.cliente)
+                for tenant, entrada in self._entradas.items()
+                if agora - entrada.usado_em <= self.hot_window
+            ]
+        renovados = 0
+        for tenant, cliente in ativos:
+            try:
+                renovados += self._renova_token(cliente)
+            except Exception:
+                logger.warning(
+                    'Falha ao renovar o token do lojista %r', tenant, exc_info=True
+                )
+        return renovados
+
+    def stats(self) -> EstatisticasRegistro:
+        """Contadores de uso do registro."""
+        with self._lock:
+            return EstatisticasRegistro(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entradas),
+            )
+
+    def close(self) -> None:
+        """Para a thread de renovação e fecha todos os clientes."""
+        self._parar.set()
+        if self._thread is not None:
+            self._thread.join()
+        with self._lock:
+            clientes = [e.cliente for e in self._entradas.values()]
+            self._entradas.clear()
+        for cliente in clientes:
+            _fecha_cliente(cliente)
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def __contains__(self, tenant: object) -> bool:
+        return tenant in self._entradas
+
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._lock:
+            return iter(list(self._entradas))
+
+    def __enter__(self) -> 'ClientRegistry[C]':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _cria(self, tenant: Hashable) -> C:
+        with self._lock:
+            # Criado por outra chamada entre o `get` e a entrada no voo
+            entrada = self._entradas.get(tenant)
+            if entrada is not None:
+                self._hits += 1
+        if entrada is not None:
+            self._conta('client_registry.hit')
+            return entrada.cliente
+        # Fora do lock: a criação decodifica certificado e pode ler arquivo
+        cliente = self.factory(tenant)
+        agora = time.monotonic()
+        with self._lock:
+            self._misses += 1
+            self._entradas[tenant] = _Entrada(cliente, agora)
+            descartados = self._retira_expirados(agora)
+            while len(self._entradas) > self.max_clients:
+                _, entrada = self._entradas.popitem(last=False)
+                descartados.append((entrada.cliente, 'lru'))
+        self._conta('client_registry.miss')
+        self._fecha(descartados)
+        return cliente
+
+    def _expirou(self, entrada: _Entrada[C], agora: float) -> bool:
+        return self.ttl is not None and agora - entrada.usado_em > self.ttl
+
+    def _retira_expirados(self, agora: float) -> list[tuple[C, str]]:
+        """Retira do início da fila (os menos recentes) os expirados.
+
+        Chamado com o lock. A ordem da fila é a do último uso, então o
+        primeiro não expirado encerra a busca.
+        """
+        descartados: list[tuple[C, str]] = []
+        while self._entradas:
+            tenant, entrada = next(iter(self._entradas.items()))
+            if not self._expirou(entrada, agora):
+                break
+            del self._entradas[tenant]
+            descartados.append((entrada.cliente, 'ttl'))
+        return descartados
+
+    def _fecha(self, descartados: list[tuple[C, str]]) -> None:
+        """Fecha os clientes retirados e conta as retiradas."""
+        if not descartados:
+            return
+        with self._lock:
+            self._evictions += len(descartados)
+        for cliente, motivo in descartados:
+            self._conta('client_registry.eviction', {'reason': motivo})
+            _fecha_cliente(cliente)
+
+    def _renova_token(self, cliente: Any) -> int:
+        if getattr(cliente, 'sandbox_mode', False):
+            return 0
+        scope = cliente._scopes_do_token()
+        if cliente.oauth.token_ttl(scope) >= self.refresh_ahead:
+            return 0
+        cliente.oauth.renew_token(scope)
+        return 1
+
+    def _mantem_aquecidos(self) -> None:
+        while not self._parar.wait(self.keep_warm_interval):
+            self.expire()
+            self.keep_warm()
+
+    @staticmethod
+    def _conta(metrica: str, tags: dict[str, str] | None = None) -> None:
+        MetricsCollector().increment(metrica, tags=tags)
+
+
+def _fecha_cliente(cliente: Any) -> None:
+    """Fecha ``cliente`` sem deixar a falha escapar para quem o retirou."""
+    fecha = getattr(cliente, 'close', None)
+    if fecha is None:
+        return
+    try:
+        fecha()
+    except Exception:
+        logger.warning('Falha ao fechar cliente retirado do registro', exc_info=True)
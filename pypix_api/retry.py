@@ -0,0 +1,154 @@
+"""Política de repetição automática das requisições ao PSP.
+
+Sem política (o padrão), ``BankPixAPIBase._request`` levanta na primeira falha,
+como sempre fez. Com :class:`RetryPolicy`, repete as falhas transitórias —
+timeout, falha de conexão e os status de :attr:`RetryPolicy.status` — mas só
+nas requisições que podem ser repetidas sem efeito colateral (ver
+:meth:`RetryPolicy.idempotente`).
+
+Três cuidados impedem que a repetição agrave uma indisponibilidade do PSP:
+
+- espera exponencial com *jitter* completo, para que clientes que falharam
+  juntos não repitam juntos;
+- ``Retry-After`` respeitado quando o PSP o informa — e, se a espera pedida
+  passar de :attr:`RetryPolicy.retry_after_max`, a falha é devolvida na hora;
+- um orçamento por cliente (:class:`OrcamentoRetry`): cada requisição deposita
+  uma fração de repetição e cada repetição gasta uma inteira. Com o PSP fora do
+  ar, as repetições ficam limitadas a ``budget_ratio`` do tráfego, em vez de
+  multiplicá-lo por ``max_retries``.
+"""
+
+import random
+import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests
+
+#: Verbos que nunca alteram estado no PSP.
+METODOS_SEGUROS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+
+#: Status que indicam falha transitória: limite de requisições e PSP ou
+#: gateway indisponível.
+STATUS_TRANSITORIOS = frozenset({429, 502, 503, 504})
+
+#: ``PUT`` em que o identificador do recurso é escolhido pelo cliente: repetir
+#: grava o mesmo recurso de novo, em vez de criar outro. São as operações da
+#: tabela de idempotência do README marcadas como "pode repetir".
+PUTS_IDEMPOTENTES = re.compile(
+    r'^/(?:cob|cobv|cobr|lotecobv|webhook)/[^/]+$'
+    r'|^/pix/[^/]+/devolucao/[^/]+$'
+    r'|^/(?:webhookrec|webhookcobr)$'
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Configuração da repetição automática.
+
+    Attributes:
+        max_retries: Repetições além da primeira tentativa
+        backoff_base: Espera da primeira repetição, em segundos; dobra a cada
+            nova tentativa. A espera efetiva é sorteada entre zero e esse
+            valor (*full jitter*)
+        backoff_max: Teto da espera exponencial, em segundos
+        status: Status HTTP que indicam falha transitória
+        retry_after_max: Maior ``Retry-After`` aceito, em segundos. Acima
+            disso, a falha é devolvida sem esperar
+        budget_ratio: Fração de repetição depositada no orçamento a cada
+            requisição nova
+        budget_max: Saldo máximo (e inicial) do orçamento, em repetições
+    """
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    status: frozenset[int] = STATUS_TRANSITORIOS
+    retry_after_max: float = 60.0
+    budget_ratio: float = 0.1
+    budget_max: float = 10.0
+
+    def __post_init__(self) -> None:
+        if self.max_retries < 0:
+            raise ValueError('max_retries não pode ser negativo.')
+        if self.backoff_base < 0 or self.backoff_max < 0:
+            raise ValueError('backoff_base e backoff_max não podem ser negativos.')
+        if self.budget_ratio < 0 or self.budget_max < 0:
+            raise ValueError('budget_ratio e budget_max não podem ser negativos.')
+
+    def idempotente(self, method: str, path: str) -> bool:
+        """Indica se a requisição pode ser repetida sem efeito colateral.
+
+        ``GET`` sempre; ``PUT`` só quando o identificador é do cliente (ver
+        :data:`PUTS_IDEMPOTENTES`). ``POST`` e ``PATCH`` nunca: o primeiro pode
+        criar um segundo recurso, o segundo sobe o contador de revisão.
+
+        Args:
+            method: Verbo HTTP
+            path: Caminho relativo à base, como recebido por ``_request``
+        """
+        metodo = method.upper()
+        if metodo in METODOS_SEGUROS:
+            return True
+        return metodo == 'PUT' and PUTS_IDEMPOTENTES.match(path) is not None
+
+    def backoff(self, tentativa: int) -> float:
+        """Espera antes da repetição de número ``tentativa`` (a partir de 0)."""
+        teto = min(self.backoff_max, self.backoff_base * (2**tentativa))
+        return random.uniform(0, teto)  # noqa: S311 - jitter, não segredo
+
+
+class OrcamentoRetry:
+    """Orçamento de repetições de um cliente, seguro entre threads.
+
+    Começa cheio, com ``budget_max`` repetições. Cada requisição nova deposita
+    ``budget_ratio``; cada repetição saca uma. Sem saldo, a falha é devolvida
+    na hora.
+    """
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        self._ratio = policy.budget_ratio
+        self._maximo = policy.budget_max
+        self._saldo = policy.budget_max
+        self._lock = threading.Lock()
+
+    @property
+    def saldo(self) -> float:
+        """Repetições disponíveis no momento."""
+        return self._saldo
+
+    def deposita(self) -> None:
+        """Registra uma requisição nova."""
+        with self._lock:
+            self._saldo = min(self._maximo, self._saldo + self._ratio)
+
+    def saca(self) -> bool:
+        """Reserva uma repetição. Devolve False se não houver saldo."""
+        with self._lock:
+            if self._saldo < 1:
+                return False
+            self._saldo -= 1
+            return True
+
+
+def retry_after(response: requests.Response) -> float | None:
+    """Segundos pedidos pelo PSP no header ``Retry-After``.
+
+    Aceita as duas formas da RFC 9110: segundos e data HTTP. Devolve ``None``
+    se o header estiver ausente ou ilegível.
+    """
+    valor = response.headers.get('Retry-After')
+    if not valor:
+        return None
+    valor = valor.strip()
+    if valor.isdigit():
+        return float(valor)
+    try:
+        data = parsedate_to_datetime(valor)
+    except (TypeError, ValueError):
+        return None
+    if data.tzinfo is None:
+        data = data.replace(tzinfo=timezone.utc)
+    return max(0.0, (data - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,182 @@
+"""Tabela de rotas da API Pix, compilada a partir do ``openapi.yaml``.
+
+Cada operação da especificação do BACEN vira uma :class:`Rota` com um nome
+estável — os segmentos literais do caminho, ``item`` no lugar de cada
+parâmetro e o verbo: ``PUT /cob/{txid}`` → ``cob.item.put``,
+``DELETE /loc/{id}/txid`` → ``loc.item.txid.delete``. O nome não depende dos
+identificadores da chamada, então serve de rótulo de métrica sem explodir a
+cardinalidade.
+
+Cada classe de banco compila a sua :class:`TabelaDeRotas` uma vez (ver
+``BankPixAPIBase.rotas()``), já com o prefixo de versão que o banco usa em
+cada caminho — o Sicredi, por exemplo, põe ``/cob/{txid}`` em ``v3`` e
+``/cob`` em ``v2``. Resolver a URL de uma requisição passa a ser uma consulta
+num dicionário indexado pelo primeiro segmento e pelo número de segmentos do
+caminho.
+
+As operações vêm de :mod:`pypix_api._rotas_openapi`, gerado por
+``scripts/gera_rotas.py``.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+
+from pypix_api._rotas_openapi import ROTAS_OPENAPI
+
+
+def nome_da_operacao(metodo: str, modelo: str) -> str:
+    """Nome estável de uma operação.
+
+    Args:
+        metodo: Verbo HTTP (``'PUT'``)
+        modelo: Caminho da especificação, com os parâmetros entre chaves
+            (``'/cob/{txid}'``)
+
+    Returns:
+        str: ``'cob.item.put'``
+    """
+    segmentos = [
+        'item' if segmento.startswith('{') else segmento
+        for segmento in modelo.strip('/').split('/')
+    ]
+    return '.'.join([*segmentos, metodo.lower()])
+
+
+def _sem_barra_final(path: str) -> str:
+    """``path`` sem as ``/`` finais: ``'/cob/'`` tem a forma de ``'/cob'``."""
+    return path.rstrip('/') or '/'
+
+
+@dataclass(frozen=True)
+class Rota:
+    """Uma operação da API Pix, já com o prefixo de versão do banco.
+
+    Attributes:
+        nome: Nome estável da operação (``'cob.item.put'``), também usado
+            como rótulo de métrica
+        metodo: Verbo HTTP
+        modelo: Caminho da especificação (``'/cob/{txid}'``)
+        recurso: Primeiro segmento do caminho (``'cob'``)
+        url: Modelo da URL relativa à raiz do banco, com o prefixo de versão
+            (``'/v3/cob/{txid}'`` no Sicredi, ``'/cob/{txid}'`` nos demais)
+    """
+
+    nome: str
+    metodo: str
+    modelo: str
+    recurso: str
+    url: str
+
+    def formata(self, **parametros: str) -> str:
+        """URL relativa à raiz do banco com os parâmetros preenchidos."""
+        return self.url.format(**parametros)
+
+
+class _Caminho:
+    """Um caminho da especificação e as operações que ele aceita."""
+
+    __slots__ = ('literais', 'operacoes', 'prefixo')
+
+    def __init__(self, modelo: str, prefixo: str) -> None:
+        self.prefixo = prefixo
+        # Posições (no `path.split('/')`) que precisam bater literalmente,
+        # fora a 1, que já faz parte da chave do índice
+        self.literais = tuple(
+            (posicao, segmento)
+            for posicao, segmento in enumerate(modelo.split('/'))
+            if posicao > 1 and not segmento.startswith('{')
+        )
+        self.operacoes: dict[str, Rota] = {}
+
+
+class TabelaDeRotas:
+    """Rotas de um banco, indexadas por nome e pela forma do caminho.
+
+    Args:
+        prefixo_de_versao: Prefixo de versão do banco para um caminho da
+            especificação (``'/v3'``, ou ``''`` sem versionamento)
+        rotas: Pares ``(verbo, modelo)``; por padrão, os do ``openapi.yaml``
+    """
+
+    def __init__(
+        self,
+        prefixo_de_versao: Callable[[str], str],
+        rotas: Iterable[tuple[str, str]] = ROTAS_OPENAPI,
+    ) -> None:
+        self._por_nome: dict[str, Rota] = {}
+        self._por_forma: dict[tuple[str, int], list[_Caminho]] = {}
+        # Prefixo por forma do caminho, quando todos os caminhos da forma o
+        # compartilham — o caso comum, já que a versão costuma ir por recurso
+        self._prefixos: dict[tuple[str, int], str] = {}
+        caminhos: dict[str, _Caminho] = {}
+        for metodo, modelo in rotas:
+            caminho = caminhos.get(modelo)
+            if caminho is None:
+                caminho = caminhos[modelo] = _Caminho(modelo, prefixo_de_versao(modelo))
+                segmentos = modelo.split('/')
+                forma = (segmentos[1], len(segmentos))
+                self._por_forma.setdefault(forma, []).append(caminho)
+            rota = Rota(
+                nome=nome_da_operacao(metodo, modelo),
+                metodo=metodo,
+                modelo=modelo,
+                recurso=modelo.split('/')[1],
+                url=caminho.prefixo + modelo,
+            )
+            caminho.operacoes[metodo] = rota
+            self._por_nome[rota.nome] = rota
+        for forma, candidatos in self._por_forma.items():
+            if len({caminho.prefixo for caminho in candidatos}) == 1:
+                self._prefixos[forma] = candidatos[0].prefixo
+
+    def __getitem__(self, nome: str) -> Rota:
+        return self._por_nome[nome]
+
+    def __contains__(self, nome: object) -> bool:
+        return nome in self._por_nome
+
+    def __iter__(self) -> Iterator[Rota]:
+        return iter(self._por_nome.values())
+
+    def __len__(self) -> int:
+        return len(self._por_nome)
+
+    def _caminho(self, path: str) -> _Caminho | None:
+        segmentos = _sem_barra_final(path).split('/')
+        if len(segmentos) < 2:
+            return None
+        for caminho in self._por_forma.get((segmentos[1], len(segmentos)), ()):
+            for posicao, valor in caminho.literais:
+                if segmentos[posicao] != valor:
+                    break
+            else:
+                return caminho
+        return None
+
+    def prefixo(self, path: str) -> str | None:
+        """Prefixo de versão de um caminho concreto (``'/cob/abc'``). Uma
+        ``/`` final não conta: ``'/cob/'`` tem a forma de ``'/cob'``.
+
+        Returns:
+            str | None: O prefixo, ou ``None`` se nenhum caminho da
+            especificação tiver a mesma forma (ex.: endpoints próprios de um
+            banco)
+        """
+        path = _sem_barra_final(path)
+        fim = path.find('/', 1)
+        primeiro = path[1:] if fim < 0 else path[1:fim]
+        forma = (primeiro, path.count('/') + 1)
+        prefixo = self._prefixos.get(forma)
+        if prefixo is not None or forma not in self._por_forma:
+            return prefixo
+        caminho = self._caminho(path)
+        return None if caminho is None else caminho.prefixo
+
+    def resolve(self, metodo: str, path: str) -> Rota | None:
+        """Operação de uma requisição concreta (``'GET'``, ``'/cob/abc'``).
+
+        Returns:
+            Rota | None: A rota, ou ``None`` fora da especificação
+        """
+        caminho = self._caminho(path)
+        return None if caminho is None else caminho.operacoes.get(metodo)
@@ -0,0 +1,177 @@
+"""Coalescência de consultas idênticas em andamento (*single-flight*).
+
+Durante uma rajada de *polling* do status de um pagamento, vários pontos da
+aplicação chamam ``consultar_cob(txid)`` com o mesmo ``txid`` quase ao mesmo
+tempo — e cada chamada vira uma requisição ao PSP, gastando cota do limite de
+taxa. Com ``single_flight=True`` no banco, a primeira consulta sai e as
+idênticas que chegam enquanto ela está em andamento esperam e recebem o mesmo
+resultado (ou uma cópia da mesma exceção). Nada fica em cache: a consulta seguinte, depois
+da resposta, sai de novo.
+
+Duas consultas são idênticas quando têm o mesmo caminho, os mesmos ``params`` e
+os mesmos ``extra_headers``. Só ``GET`` é coalescido.
+
+As consultas que pegaram carona são contadas no
+:class:`~pypix_api.metrics.MetricsCollector` como ``single_flight.shared``, com
+as tags ``bank`` e ``resource``.
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+from pypix_api.metrics import MetricsCollector
+
+T = TypeVar('T')
+
+
+def chave_da_consulta(
+    path: str,
+    params: dict[str, Any] | None,
+    extra_headers: dict[str, str] | None,
+) -> tuple[Hashable, ...]:
+    """Chave que identifica consultas idênticas."""
+    return (
+        path,
+        tuple(sorted((k, str(v)) for k, v in (params or {}).items())),
+        tuple(sorted((k.lower(), v) for k, v in (extra_headers or {}).items())),
+    )
+
+
+def _erro_proprio(erro: BaseException) -> BaseException:
+    """Cópia de ``erro`` para quem esperou a execução de outra chamada.
+
+    Levantar o mesmo objeto em várias threads sobrescreve o ``__traceback__``
+    dele a cada ``raise``, e cada uma veria o *traceback* das outras. A cópia
+    tem o mesmo tipo, ``args`` e atributos, sem passar pelo ``__init__``
+    (cujos parâmetros nem sempre são os ``args``).
+    """
+    try:
+        proprio = type(erro).__new__(type(erro), *erro.args)
+    except Exception:  # pragma: no cover - exceção que não se deixa copiar
+        return erro
+    proprio.args = erro.args
+    proprio.__dict__.update(erro.__dict__)
+    return proprio
+
+
+class _Voo:
+    """Uma consulta em andamento e quem espera por ela."""
+
+    def __init__(self) -> None:
+        self.pronto = threading.Event()
+        self.resultado: Any = None
+        self.erro: BaseException | None = None
+
+
+class SingleFlight:
+    """Registro das consultas em andamento de um cliente.
+
+    Seguro entre threads. Atende tanto o cliente síncrono (:meth:`executa`)
+    quanto o assíncrono (:meth:`executa_async`), com registros separados.
+    """
+
+    def __init__(self) -> None:
+        self._voos: dict[Hashable, _Voo] = {}
+        self._tarefas: dict[Hashable, asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+    def executa(
+        self,
+        chave: Hashable,
+        funcao: Callable[[], T],
+        timeout: float | None = None,
+    ) -> tuple[T, bool]:
+        """Executa ``funcao`` ou espera a execução idêntica em andamento.
+
+        Args:
+            chave: Identifica as execuções idênticas
+            funcao: A execução
+            timeout: Espera máxima pela execução de outra chamada. ``None``
+                espera até o fim
+
+        Returns:
+            tuple: O resultado e se ele foi compartilhado com outra chamada
+
+        Raises:
+            TimeoutError: Se a execução de outra chamada passar de ``timeout``
+            BaseException: A exceção levantada pela execução compartilhada;
+                quem esperou recebe uma cópia, encadeada à original
+        """
+        with self._lock:
+            voo = self._voos.get(chave)
+            lider = voo is None
+            if lider:
+                voo = self._voos[chave] = _Voo()
+        if not lider:
+            if not voo.pronto.wait(timeout):
+                raise TimeoutError(
+                    f'Consulta idêntica ainda em andamento após {timeout}s'
+                )
+            if voo.erro is not None:
+                raise _erro_proprio(voo.erro) from voo.erro
+            return voo.resultado, True
+
+        try:
+            voo.resultado = funcao()
+            return voo.resultado, False
+        except BaseException as exc:
+            voo.erro = exc
+            raise
+        finally:
+            with self._lock:
+                del self._voos[chave]
+            voo.pronto.set()
+
+    async def executa_async(
+        self,
+        chave: Hashable,
+        funcao: Callable[[], Awaitable[T]],
+        timeout: float | None = None,
+    ) -> tuple[T, bool]:
+        """Versão assíncrona de :meth:`executa`.
+
+        A execução roda numa tarefa própria: cancelar uma das chamadas que a
+        esperam — ou esgotar o ``timeout`` de uma delas — não cancela a das
+        outras.
+
+        Raises:
+            asyncio.TimeoutError: Se a execução passar de ``timeout``
+        """
+        tarefa = self._tarefas.get(chave)
+        compartilhado = tarefa is not None
+        if tarefa is None:
+            tarefa = asyncio.ensure_future(funcao())
+            self._tarefas[chave] = tarefa
+            tarefa.add_done_callback(lambda _: self._encerra(chave))
+        try:
+            if timeout is None:
+                return await asyncio.shield(tarefa), compartilhado
+            return await asyncio.wait_for(
+                asyncio.shield(tarefa), timeout
+            ), compartilhado
+        except Exception as exc:
+            # Só a exceção da execução compartilhada; o `timeout` de quem
+            # esperou é dele
+            if (
+                compartilhado
+                and tarefa.done()
+                and not tarefa.cancelled()
+                and tarefa.exception() is exc
+            ):
+                raise _erro_proprio(exc) from exc
+            raise
+
+    def _encerra(self, chave: Hashable) -> None:
+        tarefa = self._tarefas.pop(chave)
+        # Marca a exceção como lida mesmo que todos tenham desistido de esperar
+        if not tarefa.cancelled():
+            tarefa.exception()
+
+    @staticmethod
+    def conta(banco: str, recurso: str) -> None:
+        """Incrementa ``single_flight.shared``."""
+        MetricsCollector().increment(
+            'single_flight.shared', tags={'bank': banco, 'resource': recurso}
+        )
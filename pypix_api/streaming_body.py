@@ -0,0 +1,177 @@
+"""Corpos JSON gerados em partes, sem o corpo inteiro na memória.
+
+Um ``lotecobv`` com dezenas de milhares de ``cobsv`` ocupa, montado como
+``dict`` e depois codificado, centenas de MB no *worker* de cobrança. Com
+:class:`StreamingBody`, a lista vem de um iterador e cada cobrança é
+codificada na hora de ir para o socket, em partes de ``chunk_size`` bytes,
+com ``Transfer-Encoding: chunked``::
+
+    def cobrancas():
+        for fatura in faturas_do_mes():
+            yield {'txid': fatura.txid, 'calendario': ..., 'valor': ...}
+
+    banco.criar_lote_cobv(id_lote, {'descricao': 'Outubro', 'cobsv': cobrancas()})
+
+``criar_lote_cobv`` e ``alterar_lote_cobv`` reconhecem um ``cobsv`` que não
+é lista e montam o :class:`StreamingBody` sozinhos; passe um pronto para
+escolher o ``chunk_size``. Cada cobrança é codificada pelo ``json_codec`` do
+banco, se houver.
+
+Um gerador só pode ser percorrido uma vez: com ele, a requisição não é
+repetida pelo ``retry``. Uma lista ou outro iterável que se possa percorrer
+de novo (ex.: uma consulta que reabre o cursor a cada ``iter``) é repetido
+normalmente.
+"""
+
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Mapping
+from typing import Any
+
+from pypix_api.json_codec import JsonCodec, StdlibJsonCodec
+
+#: Tamanho padrão de cada parte enviada, em bytes.
+CHUNK_SIZE_PADRAO = 64 * 1024
+
+
+def eh_lista_sob_demanda(valor: Any) -> bool:
+    """Se ``valor`` é um iterável a codificar como lista JSON, item a item.
+
+    ``list`` e ``tuple`` continuam com o codec, de uma vez: já estão na
+    memória.
+    """
+    return isinstance(valor, Iterable) and not isinstance(
+        valor, str | bytes | bytearray | list | tuple | Mapping
+    )
+
+
+class StreamingBody:
+    """Corpo JSON com listas geradas sob demanda.
+
+    Args:
+        structure: O corpo. Os valores do primeiro nível que forem iteráveis
+            de outro tipo que não ``list``, ``tuple``, ``dict``, ``str`` e
+            ``bytes`` (um gerador, por exemplo) viram listas JSON codificadas
+            item a item
+        chunk_size: Tamanho mínimo, em bytes, de cada parte enviada (a
+            última pode ser menor)
+
+    Raises:
+        ValueError: Se ``structure`` não tiver nenhuma lista sob demanda ou
+            se ``chunk_size`` não for positivo
+    """
+
+    def __init__(
+        self, structure: Mapping[str, Any], chunk_size: int = CHUNK_SIZE_PADRAO
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError('chunk_size deve ser positivo.')
+        self._estrutura = dict(structure)
+        self._listas = frozenset(
+            chave
+            for chave, valor in self._estrutura.items()
+            if eh_lista_sob_demanda(valor)
+        )
+        if not self._listas:
+            raise ValueError('O corpo não tem nenhuma lista sob demanda.')
+        self.chunk_size = chunk_size
+        # Um iterador devolve a si mesmo em `iter`: só passa uma vez
+        self.replayable = all(
+            iter(self._estrutura[chave]) is not self._estrutura[chave]
+            for chave in self._listas
+        )
+        self._consumido = False
+
+    def chunks(self, codec: JsonCodec | None = None) -> Iterator[bytes]:
+        """Partes do corpo codificado, geradas conforme são consumidas.
+
+        Args:
+            codec: Codec de cada valor. ``None`` usa
+                :class:`~pypix_api.json_codec.StdlibJsonCodec`
+
+        Raises:
+            RuntimeError: Se o corpo não for ``replayable`` e já tiver sido
+                percorrido
+        """
+        if not self.replayable:
+            if self._consumido:
+                raise RuntimeError(
+                    'O corpo em partes já foi percorrido e sua fonte é um '
+                    'iterador de uma passagem só.'
+                )
+            self._consumido = True
+        return self._gera(codec or StdlibJsonCodec())
+
+    def _gera(self, codec: JsonCodec) -> Iterator[bytes]:
+        tamanho = self.chunk_size
+        parte = bytearray(b'{')
+        for indice, (chave, valor) in enumerate(self._estrutura.items()):
+            if indice:
+                parte += b','
+            parte += codec.dumps(chave)
+            parte += b':'
+            if chave not in self._listas:
+                parte += codec.dumps(valor)
+                continue
+            parte += b'['
+            for posicao, item in enumerate(valor):
+                if posicao:
+                    parte += b','
+                parte += codec.dumps(item)
+                if len(parte) >= tamanho:
+                    yield bytes(parte)
+                    parte.clear()
+            parte += b']'
+        parte += b'}'
+        yield bytes(parte)
+
+
+def em_partes(body: Any) -> Any:
+    """``body`` como :class:`StreamingBody` quando tiver lista sob demanda no
+    primeiro nível; do contrário, ``body`` como veio."""
+    if isinstance(body, Mapping) and any(
+        eh_lista_sob_demanda(valor) for valor in body.values()
+    ):
+        return StreamingBody(body)
+    return body
+
+
+class PartesDoCorpo:
+    """Corpo em partes já pronto para o transporte.
+
+    Cada iteração chama ``fonte`` de novo: o ``requests`` e o ``httpx``
+    percorrem o corpo uma vez por tentativa.
+    """
+
+    __slots__ = ('_fonte',)
+
+    def __init__(self, fonte: Callable[[], Iterator[bytes]]) -> None:
+        self._fonte = fonte
+
+    def transforma(
+        self, etapa: Callable[[Iterator[bytes]], Iterator[bytes]]
+    ) -> 'PartesDoCorpo':
+        """Mesmo tipo de corpo, com ``etapa`` aplicada às partes (ex.: gzip)."""
+        fonte = self._fonte
+        return type(self)(lambda: etapa(fonte()))
+
+
+class CorpoEmPartes(PartesDoCorpo):
+    """:class:`PartesDoCorpo` para o ``data=`` dos clientes síncronos."""
+
+    __slots__ = ()
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self._fonte()
+
+
+class CorpoEmPartesAsync(PartesDoCorpo):
+    """:class:`PartesDoCorpo` para o ``content=`` do ``httpx.AsyncClient``.
+
+    Só assíncrono: o ``httpx`` trata qualquer ``Iterable`` como corpo
+    síncrono, que o cliente assíncrono recusa.
+    """
+
+    __slots__ = ()
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for parte in self._fonte():
+            yield parte
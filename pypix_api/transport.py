@@ -0,0 +1,337 @@
+"""Transportes HTTP plugáveis.
+
+Por padrão, banco e token saem por uma ``requests.Session``. O ``requests``
+cobra, a cada chamada, trabalho que a biblioteca não usa: *hooks*, *cookie
+jar*, ``merge_environment_settings`` (que lê variáveis de proxy do ambiente) e
+a montagem do ``PreparedRequest``. Um transporte só envia método, URL, headers,
+corpo e timeout e devolve status, headers e bytes (:class:`Transport`);
+:class:`TransportSession` o expõe com a interface de ``requests.Session`` usada
+pela biblioteca, de modo que ``BankPixAPIBase._request`` e
+``OAuth2Client.get_token`` funcionam sobre ele sem mudança alguma.
+
+- :class:`Urllib3Transport`: direto sobre o ``PoolManager`` do ``urllib3``,
+  com o mesmo mTLS (PEM ou PFX). Ative com
+  ``OAuth2Client(..., transport='urllib3')``.
+- :class:`RequestsTransport`: o ``requests`` atrás da mesma interface — a
+  referência de comportamento, e a base para transportes que só decoram o
+  envio.
+
+Um transporte próprio (ex.: com *tracing* ou um cliente HTTP da casa) entra
+como ``OAuth2Client(..., transport=MeuTransporte())``. Falhas de transporte
+devem ser levantadas como ``requests.Timeout`` e ``requests.ConnectionError``,
+para que o mapeamento de erros dos bancos continue o mesmo.
+"""
+
+import json as jsonlib
+import ssl
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+from urllib.parse import urlencode
+
+import requests
+import urllib3
+from requests.structures import CaseInsensitiveDict
+from requests.utils import (
+    DEFAULT_CA_BUNDLE_PATH,
+    default_headers,
+    get_encoding_from_headers,
+)
+from urllib3.exceptions import (
+    ConnectTimeoutError,
+    HTTPError,
+    NewConnectionError,
+    ReadTimeoutError,
+    SSLError,
+)
+
+from pypix_api.http import Timeout
+from pypix_api.pool import PoolConfig, classes_de_pool, opcoes_keepalive
+
+
+@dataclass(frozen=True)
+class TransportResponse:
+    """Resposta já lida por um transporte.
+
+    Attributes:
+        status: Status HTTP
+        headers: Headers da resposta
+        content: Corpo, já descomprimido
+        reason: Frase de status (ex.: ``'OK'``)
+        url: URL requisitada
+    """
+
+    status: int
+    headers: Mapping[str, str] = field(default_factory=dict)
+    content: bytes = b''
+    reason: str = ''
+    url: str = ''
+
+
+class Transport(Protocol):
+    """Interface de um transporte: uma requisição, a resposta inteira."""
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        body: bytes | Iterable[bytes] | None,
+        timeout: Timeout | None,
+    ) -> TransportResponse:
+        """Envia a requisição e lê a resposta inteira.
+
+        Args:
+            method: Verbo HTTP
+            url: URL completa, já com a *query string*
+            headers: Headers da requisição
+            body: Corpo já codificado, ou ``None``. Um corpo gerado em partes
+                (ver :mod:`pypix_api.streaming_body`) chega como iterável de
+                ``bytes``, a enviar com ``Transfer-Encoding: chunked``
+            timeout: No formato do ``requests``: um número ou a tupla
+                ``(conexão, leitura)``
+
+        Raises:
+            requests.Timeout: Se a requisição exceder o tempo limite
+            requests.ConnectionError: Para as demais falhas de transporte
+        """
+        ...
+
+    def close(self) -> None:
+        """Fecha as conexões abertas."""
+        ...
+
+
+class RequestsTransport:
+    """Transporte sobre uma ``requests.Session``.
+
+    Args:
+        session: Sessão já configurada (ex.: a de
+            :func:`pypix_api.auth.mtls.get_session_with_mtls`). ``None`` cria
+            uma sem mTLS
+    """
+
+    def __init__(self, session: requests.Session | None = None) -> None:
+        self.session = session if session is not None else requests.Session()
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        body: bytes | Iterable[bytes] | None,
+        timeout: Timeout | None,
+    ) -> TransportResponse:
+        resposta = self.session.request(
+            method, url, headers=dict(headers), data=body, timeout=timeout
+        )
+        return TransportResponse(
+            status=resposta.status_code,
+            headers=resposta.headers,
+            content=resposta.content,
+            reason=resposta.reason or '',
+            url=resposta.url,
+        )
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class Urllib3Transport:
+    """Transporte direto sobre o ``PoolManager`` do ``urllib3``.
+
+    Sem *hooks*, *cookies*, proxies do ambiente nem redirecionamentos — nada
+    disso é usado com um PSP. A verificação do certificado do PSP usa o mesmo
+    bundle de CAs do ``requests``.
+
+    Args:
+        ssl_context: Contexto com o certificado de cliente (ver
+            :func:`pypix_api.auth.mtls.get_ssl_context_with_mtls`). ``None``
+            usa a validação padrão, sem mTLS (``sandbox_mode``)
+        pool: Pool de conexões, com a mesma semântica da sessão ``requests``
+            (``max_idle``, ``tcp_keepalive``, ``retry_on_reset`` e
+            ``source_addresses`` inclusive)
+    """
+
+    def __init__(
+        self, ssl_context: ssl.SSLContext | None = None, pool: PoolConfig | None = None
+    ) -> None:
+        self.ssl_context = ssl_context
+        self.poolmanager: urllib3.PoolManager | None = None
+        self.reconfigura(pool or PoolConfig())
+
+    def reconfigura(self, pool: PoolConfig) -> None:
+        """Troca o pool de conexões. As conexões abertas são fechadas."""
+        if self.poolmanager is not None:
+            self.poolmanager.clear()
+        opcoes: dict[str, Any] = {}
+        if self.ssl_context is not None:
+            opcoes['ssl_context'] = self.ssl_context
+        else:
+            opcoes['ca_certs'] = DEFAULT_CA_BUNDLE_PATH
+        if pool.tcp_keepalive is not None:
+            opcoes['socket_options'] = opcoes_keepalive(pool.tcp_keepalive)
+        self.poolmanager = urllib3.PoolManager(
+            num_pools=pool.pool_connections,
+            maxsize=pool.pool_maxsize,
+            block=pool.pool_block,
+            **opcoes,
+        )
+        classes = classes_de_pool(pool)
+        if classes is not None:
+            self.poolmanager.pool_classes_by_scheme = classes
+        self._fecha_conexao = not pool.keep_alive
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        body: bytes | Iterable[bytes] | None,
+        timeout: Timeout | None,
+    ) -> TransportResponse:
+        if self._fecha_conexao:
+            headers = {**headers, 'Connection': 'close'}
+        try:
+            resposta = self.poolmanager.request(
+                method,
+                url,
+                body=body,
+                headers=headers,
+                timeout=timeout_urllib3(timeout),
+                retries=False,
+                redirect=False,
+            )
+        except ConnectTimeoutError as exc:
+            # NewConnectionError é subclasse de ConnectTimeoutError no urllib3,
+            # mas é recusa ou DNS
+            if isinstance(exc, NewConnectionError):
+                raise requests.ConnectionError(str(exc)) from exc
+            raise requests.ConnectTimeout(str(exc)) from exc
+        except ReadTimeoutError as exc:
+            raise requests.ReadTimeout(str(exc)) from exc
+        except SSLError as exc:
+            raise requests.exceptions.SSLError(str(exc)) from exc
+        except HTTPError as exc:
+            raise requests.ConnectionError(str(exc)) from exc
+        return TransportResponse(
+            status=resposta.status,
+            headers=resposta.headers,
+            content=resposta.data,
+            reason=resposta.reason or '',
+            url=url,
+        )
+
+    def close(self) -> None:
+        self.poolmanager.clear()
+
+
+def timeout_urllib3(timeout: Timeout | None) -> urllib3.Timeout:
+    """Converte o ``timeout`` no formato do ``requests`` para ``urllib3.Timeout``."""
+    if isinstance(timeout, tuple):
+        conexao, leitura = timeout
+        return urllib3.Timeout(connect=conexao, read=leitura)
+    return urllib3.Timeout(connect=timeout, read=timeout)
+
+
+class TransportSession:
+    """Sessão com a interface de ``requests.Session`` usada pela biblioteca,
+    sobre um :class:`Transport`.
+
+    Codifica ``params``, ``json`` e ``data`` como o ``requests`` (campos
+    ``None`` ficam de fora da *query string* e do formulário) e devolve
+    ``requests.Response``.
+
+    Args:
+        transport: Transporte das requisições
+    """
+
+    def __init__(self, transport: Transport) -> None:
+        self.transport = transport
+        # Os mesmos headers padrão do requests: o PSP vê a mesma requisição
+        self.headers: dict[str, str] = dict(default_headers())
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str] | None = None,
+        params: Any = None,
+        json: Any = None,
+        data: Any = None,
+        timeout: Timeout | None = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Executa a requisição, com a semântica de ``requests.Session.request``.
+
+        Raises:
+            TypeError: Para argumentos do ``requests`` sem equivalente aqui
+                (ex.: ``files``, ``stream``)
+            requests.Timeout: Se a requisição exceder o tempo limite
+            requests.ConnectionError: Para as demais falhas de transporte
+        """
+        if kwargs:
+            raise TypeError(
+                f'Argumentos não suportados por TransportSession: {", ".join(kwargs)}'
+            )
+        enviados = {**self.headers, **(headers or {})}
+        if params:
+            url = _com_query(url, params)
+        corpo: bytes | Iterable[bytes] | None = None
+        if data is not None:
+            corpo = _corpo_de(data, enviados)
+        elif json is not None:
+            # allow_nan=False, como o requests: NaN não é JSON
+            corpo = jsonlib.dumps(json, allow_nan=False).encode('utf-8')
+            enviados.setdefault('Content-Type', 'application/json')
+        resposta = self.transport.send(method, url, enviados, corpo, timeout)
+        return resposta_para_requests(resposta)
+
+    def post(self, url: str, data: Any = None, **kwargs: Any) -> requests.Response:
+        return self.request('POST', url, data=data, **kwargs)
+
+    def close(self) -> None:
+        """Fecha as conexões abertas."""
+        self.transport.close()
+
+
+def _com_query(url: str, params: Any) -> str:
+    pares = params.items() if isinstance(params, Mapping) else params
+    query = urlencode(
+        [(chave, valor) for chave, valor in pares if valor is not None], doseq=True
+    )
+    if not query:
+        return url
+    return f'{url}{"&" if "?" in url else "?"}{query}'
+
+
+def _corpo_de(data: Any, headers: dict[str, str]) -> bytes | Iterable[bytes]:
+    if isinstance(data, bytes):
+        return data
+    if isinstance(data, str):
+        return data.encode('utf-8')
+    if not isinstance(data, Mapping):
+        # Corpo em partes: o transporte envia conforme são geradas
+        return data
+    headers.setdefault('Content-Type', 'application/x-www-form-urlencoded')
+    return urlencode(
+        {chave: valor for chave, valor in data.items() if valor is not None},
+        doseq=True,
+    ).encode('ascii')
+
+
+def resposta_para_requests(resposta: TransportResponse) -> requests.Response:
+    """Converte um :class:`TransportResponse` em ``requests.Response``.
+
+    Como em :func:`pypix_api.http.resposta_httpx_para_requests`: todo o
+    tratamento de resposta dos bancos foi escrito sobre o ``requests.Response``.
+    """
+    response = requests.Response()
+    response.status_code = resposta.status
+    response._content = resposta.content
+    response.headers = CaseInsensitiveDict(resposta.headers)
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.reason = resposta.reason
+    response.url = resposta.url
+    return response
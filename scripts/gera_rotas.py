@@ -0,0 +1,86 @@
+"""Gera ``pypix_api/_rotas_openapi.py`` a partir do ``openapi.yaml`` do BACEN.
+
+Uso::
+
+    python scripts/gera_rotas.py            # reescreve o módulo
+    python scripts/gera_rotas.py --check    # falha se o módulo estiver desatualizado
+
+Lê apenas a seção ``paths:`` — caminhos no 2º nível de indentação e verbos no
+3º —, sem depender de um parser YAML. As URLs de payload do QR Code
+(``/{pixUrlAccessToken}``, ``/rec/{recUrlAccessToken}``...) ficam de fora: são
+servidas pelo PSP ao pagador, não consumidas pelo cliente da API.
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+OPENAPI = RAIZ / 'openapi.yaml'
+DESTINO = RAIZ / 'pypix_api' / '_rotas_openapi.py'
+
+VERBOS = ('get', 'put', 'post', 'patch', 'delete')
+
+_CAMINHO = re.compile(r'^  "?(/[^":]*)"?:\s*$')
+_VERBO = re.compile(r'^    (' + '|'.join(VERBOS) + r'):\s*$')
+
+
+def le_rotas(caminho: Path = OPENAPI) -> list[tuple[str, str]]:
+    """Pares ``(verbo, modelo)`` da seção ``paths:``, na ordem do arquivo."""
+    rotas: list[tuple[str, str]] = []
+    em_paths = False
+    modelo = None
+    for linha in caminho.read_text(encoding='utf-8').splitlines():
+        if not linha.strip():
+            continue
+        if not linha.startswith(' '):
+            em_paths = linha.rstrip() == 'paths:'
+            modelo = None
+            continue
+        if not em_paths:
+            continue
+        if achado := _CAMINHO.match(linha):
+            modelo = achado.group(1)
+            if 'UrlAccessToken}' in modelo:
+                modelo = None
+        elif modelo is not None and (achado := _VERBO.match(linha)):
+            rotas.append((achado.group(1).upper(), modelo))
+    return rotas
+
+
+def gera_modulo(rotas: list[tuple[str, str]]) -> str:
+    """Código-fonte de ``_rotas_openapi.py``."""
+    linhas = [
+        '"""Operações da API Pix do BACEN (``openapi.yaml``).',
+        '',
+        'Gerado por ``scripts/gera_rotas.py`` — não edite à mão.',
+        '"""',
+        '',
+        'ROTAS_OPENAPI: tuple[tuple[str, str], ...] = (',
+    ]
+    linhas += [f"    ('{verbo}', '{modelo}')," for verbo, modelo in rotas]
+    linhas.append(')')
+    return '\n'.join(linhas) + '\n'
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--check', action='store_true', help='Só verifica se o módulo está em dia'
+    )
+    args = parser.parse_args()
+
+    codigo = gera_modulo(le_rotas())
+    if args.check:
+        if DESTINO.read_text(encoding='utf-8') != codigo:
+            print(f'{DESTINO.name} desatualizado: rode scripts/gera_rotas.py')
+            return 1
+        return 0
+    DESTINO.write_text(codigo, encoding='utf-8')
+    print(f'{DESTINO.relative_to(RAIZ)} gerado')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""Servidores locais usados como PSP de mentira nos benchmarks.
+
+Respondem sempre o mesmo corpo JSON, para que o benchmark meça o cliente e o
+transporte, e não o servidor.
+"""
+
+import json
+import socket
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+CORPO_PADRAO: dict[str, Any] = {
+    'txid': '7978c0c97ea847e78e8849634473c1f1',
+    'status': 'ATIVA',
+    'calendario': {'criacao': '2025-01-01T10:00:00Z', 'expiracao': 3600},
+    'valor': {'original': '123.45'},
+    'chave': 'chave@exemplo.com',
+}
+
+
+@contextmanager
+def servidor_http1(corpo: dict[str, Any] | None = None) -> Iterator[str]:
+    """Servidor HTTP/1.1 com keep-alive. Devolve a URL base."""
+    dados = json.dumps(corpo or CORPO_PADRAO).encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # Resposta num único write e sem Nagle: sem isto, o delayed ACK do TCP
+        # soma ~40ms a cada requisição e o benchmark mede o kernel.
+        wbufsize = -1
+        disable_nagle_algorithm = True
+
+        def _responde(self) -> None:
+            tamanho = int(self.headers.get('Content-Length') or 0)
+            if tamanho:
+                self.rfile.read(tamanho)
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(dados)))
+            self.end_headers()
+            self.wfile.write(dados)
+
+        do_GET = do_PUT = do_POST = do_PATCH = _responde
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    servidor = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    servidor.daemon_threads = True
+    thread = threading.Thread(target=servidor.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f'http://127.0.0.1:{servidor.server_address[1]}'
+    finally:
+        servidor.shutdown()
+        servidor.server_close()
+
+
+def _atende_h2(conexao: socket.socket, dados: bytes) -> None:
+    import h2.config
+    import h2.connection
+    import h2.events
+
+    h2_conn = h2.connection.H2Connection(
+        config=h2.config.H2Configuration(client_side=False)
+    )
+    h2_conn.initiate_connection()
+    conexao.sendall(h2_conn.data_to_send())
+    with conexao:
+        while True:
+            try:
+                recebido = conexao.recv(65535)
+            except OSError:
+                return
+            if not recebido:
+                return
+            for evento in h2_conn.receive_data(recebido):
+                if isinstance(evento, h2.events.DataReceived):
+                    h2_conn.acknowledge_received_data(
+                        evento.flow_controlled_length, evento.stream_id
+                    )
+                elif isinstance(evento, h2.events.StreamEnded):
+                    h2_conn.send_headers(
+                        evento.stream_id,
+                        [
+                            (':status', '200'),
+                            ('content-type', 'application/json'),
+                            ('content-length', str(len(dados))),
+                        ],
+                    )
+                    h2_conn.send_data(evento.stream_id, dados, end_stream=True)
+            conexao.sendall(h2_conn.data_to_send())
+
+
+@contextmanager
+def servidor_h2c(corpo: dict[str, Any] | None = None) -> Iterator[str]:
+    """Servidor HTTP/2 sem TLS (*prior knowledge*). Devolve a URL base.
+
+    O cliente precisa falar HTTP/2 direto, sem negociação: no ``httpx``,
+    ``httpx.Client(http1=False, http2=True)``.
+    """
+    dados = json.dumps(corpo or CORPO_PADRAO).encode()
+    escuta = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    escuta.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    escuta.bind(('127.0.0.1', 0))
+    escuta.listen(64)
+    ativo = threading.Event()
+    ativo.set()
+
+    def aceita() -> None:
+        while ativo.is_set():
+            try:
+                conexao, _ = escuta.accept()
+            except OSError:
+                return
+            threading.Thread(
+                target=_atende_h2, args=(conexao, dados), daemon=True
+            ).start()
+
+    threading.Thread(target=aceita, daemon=True).start()
+    try:
+        yield f'http://127.0.0.1:{escuta.getsockname()[1]}'
+    finally:
+        ativo.clear()
+        escuta.close()
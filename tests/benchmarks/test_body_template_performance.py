@@ -0,0 +1,44 @@
+"""
+Benchmarks da montagem do corpo de ``criar_cob``.
+
+Compara montar o ``dict`` e codificá-lo inteiro a cada chamada — o caminho do
+``json=body`` — com :class:`BodyTemplate`, que só codifica os campos que mudam
+e os junta à parte fixa já codificada.
+"""
+
+import pytest
+
+from pypix_api.body_template import BodyTemplate, Placeholder
+from pypix_api.json_codec import StdlibJsonCodec
+
+
+def cob(valor, mensagem):
+    return {
+        'calendario': {'expiracao': 3600},
+        'devedor': {'cnpj': '12345678000195', 'nome': 'Empresa de Serviços SA'},
+        'valor': {'original': valor, 'modalidadeAlteracao': 0},
+        'chave': '7d9f0335-8dcc-4054-9bf9-0dbd61d36906',
+        'solicitacaoPagador': mensagem,
+        'infoAdicionais': [
+            {'nome': 'Loja', 'valor': 'Centro'},
+            {'nome': 'Canal', 'valor': 'Checkout'},
+        ],
+    }
+
+
+@pytest.mark.benchmark(group='corpo-cob')
+def test_dict_e_json_dumps(benchmark) -> None:
+    codec = StdlibJsonCodec()
+
+    corpo = benchmark(lambda: codec.dumps(cob('37.00', 'Pedido 123')))
+
+    assert b'"37.00"' in corpo
+
+
+@pytest.mark.benchmark(group='corpo-cob')
+def test_body_template(benchmark) -> None:
+    modelo = BodyTemplate(cob(Placeholder('valor'), Placeholder('mensagem')))
+
+    corpo = benchmark(modelo.render, valor='37.00', mensagem='Pedido 123')
+
+    assert corpo == StdlibJsonCodec().dumps(cob('37.00', 'Pedido 123'))
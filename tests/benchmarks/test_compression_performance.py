@@ -0,0 +1,35 @@
+"""
+Benchmarks do gzip de um lote de 1000 ``cobsv``.
+
+Mede o custo de CPU de cada nível de :class:`CompressionPolicy` no corpo de
+``criar_lote_cobv`` — o que se paga para enviar uma fração dos bytes.
+"""
+
+import pytest
+
+from pypix_api.compression import gzip_do_corpo
+from pypix_api.json_codec import StdlibJsonCodec
+
+CORPO = StdlibJsonCodec().dumps(
+    {
+        'descricao': 'Cobranças de outubro',
+        'cobsv': [
+            {
+                'calendario': {'dataDeVencimento': '2026-10-31'},
+                'txid': f'fatura{indice:020d}',
+                'devedor': {'cpf': '12345678909', 'nome': 'Fulano de Tal'},
+                'valor': {'original': f'{indice % 500}.45'},
+                'chave': '7d9f0335-8dcc-4054-9bf9-0dbd61d36906',
+            }
+            for indice in range(1000)
+        ],
+    }
+)
+
+
+@pytest.mark.benchmark(group='compressao-lote')
+@pytest.mark.parametrize('nivel', [1, 6, 9])
+def test_gzip_do_lote(benchmark, nivel: int) -> None:
+    comprimido = benchmark(gzip_do_corpo, CORPO, nivel)
+
+    assert len(comprimido) < len(CORPO) / 5
@@ -0,0 +1,100 @@
+"""
+Benchmarks do transporte HTTP/2 contra o caminho HTTP/1.1 do requests.
+
+Os dois caminhos passam pelo ``BankPixAPIBase._request`` completo, contra
+servidores locais (ver ``servidores.py``): HTTP/1.1 com keep-alive e HTTP/2
+sem TLS. Sem TLS, o ganho do HTTP/2 aqui vem só da multiplexação — contra um
+PSP real, cada conexão poupada é também um handshake mTLS poupado.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+httpx = pytest.importorskip('httpx')
+pytest.importorskip('h2')
+
+from pypix_api.auth.oauth2 import OAuth2Client  # noqa: E402
+from pypix_api.banks.base import BankPixAPIBase  # noqa: E402
+from pypix_api.http2 import Http2Session  # noqa: E402
+from pypix_api.pool import PoolConfig  # noqa: E402
+from tests.benchmarks.servidores import servidor_h2c, servidor_http1  # noqa: E402
+
+THREADS = 16
+CHAMADAS_POR_RODADA = 64
+
+
+def cria_banco(base_url: str, session=None) -> BankPixAPIBase:
+    class BancoLocal(BankPixAPIBase):
+        BASE_URL = base_url
+        TOKEN_URL = f'{base_url}/oauth/token'
+
+        def get_base_url(self) -> str:
+            return self.BASE_URL
+
+        def get_bank_code(self) -> str:
+            return '756'
+
+    oauth = OAuth2Client(
+        token_url=BancoLocal.TOKEN_URL,
+        client_id='bench',
+        sandbox_mode=True,
+        pool=PoolConfig(pool_maxsize=THREADS),
+    )
+    if session is not None:
+        oauth.session = session
+    return BancoLocal(oauth=oauth, sandbox_mode=True)
+
+
+@pytest.fixture(scope='module')
+def banco_http1():
+    with servidor_http1() as url:
+        yield cria_banco(url)
+
+
+@pytest.fixture(scope='module')
+def banco_h2():
+    with servidor_h2c() as url:
+        cliente = httpx.Client(http1=False, http2=True)
+        yield cria_banco(url, Http2Session(client=cliente))
+        cliente.close()
+
+
+class TestHttp2Performance:
+    """Compara o custo por chamada e o throughput concorrente."""
+
+    @pytest.mark.benchmark(group='transporte-sequencial')
+    def test_requests_http1_sequencial(self, benchmark, banco_http1):
+        resultado = benchmark(banco_http1.consultar_cob, 'txid')
+        assert resultado['status'] == 'ATIVA'
+
+    @pytest.mark.benchmark(group='transporte-sequencial')
+    def test_http2_sequencial(self, benchmark, banco_h2):
+        resultado = benchmark(banco_h2.consultar_cob, 'txid')
+        assert resultado['status'] == 'ATIVA'
+
+    @pytest.mark.benchmark(group='transporte-concorrente')
+    def test_requests_http1_concorrente(self, benchmark, banco_http1):
+        with ThreadPoolExecutor(THREADS) as executor:
+
+            def rodada():
+                return list(
+                    executor.map(
+                        banco_http1.consultar_cob, ['txid'] * CHAMADAS_POR_RODADA
+                    )
+                )
+
+            resultados = benchmark(rodada)
+        assert len(resultados) == CHAMADAS_POR_RODADA
+
+    @pytest.mark.benchmark(group='transporte-concorrente')
+    def test_http2_concorrente(self, benchmark, banco_h2):
+        with ThreadPoolExecutor(THREADS) as executor:
+
+            def rodada():
+                return list(
+                    executor.map(banco_h2.consultar_cob, ['txid'] * CHAMADAS_POR_RODADA)
+                )
+
+            resultados = benchmark(rodada)
+        assert len(resultados) == CHAMADAS_POR_RODADA
@@ -0,0 +1,140 @@
+"""
+Benchmarks dos codecs JSON sobre cargas realistas de PSP.
+
+Cargas: uma página de 100 Pix recebidos (``consultar_pix``), uma página de 100
+cobranças com vencimento (``listar_cobv``) e um lote de 1000 cobranças
+(``criar_lote_cobv``). A linha de base é o que o ``requests`` faz sem codec:
+``json.dumps`` com os separadores padrão na ida e ``json.loads`` na volta.
+``orjson`` e ``msgspec`` só entram quando instalados.
+"""
+
+import json
+from typing import Any
+
+import pytest
+
+from pypix_api.json_codec import MsgspecCodec, OrjsonCodec, StdlibJsonCodec
+
+
+def pix_recebido(i: int) -> dict[str, Any]:
+    return {
+        'endToEndId': f'E0000000020250101100000000{i:06d}',
+        'txid': f'7978c0c97ea847e78e8849634473{i:04d}',
+        'valor': f'{i}.45',
+        'chave': 'chave@exemplo.com',
+        'horario': '2025-01-01T10:00:00.000Z',
+        'infoPagador': 'Pagamento referente ao pedido nº 1234 — João',
+        'devolucoes': [
+            {
+                'id': f'D{i}',
+                'rtrId': f'D0000000020250101100000000{i:06d}',
+                'valor': '1.00',
+                'horario': {'solicitacao': '2025-01-01T10:05:00.000Z'},
+                'status': 'DEVOLVIDO',
+            }
+        ],
+    }
+
+
+def cobv(i: int) -> dict[str, Any]:
+    return {
+        'calendario': {'dataDeVencimento': '2025-12-31', 'validadeAposVencimento': 30},
+        'txid': f'fc9a4366ff3d4964b5dbc6c91a8{i:05d}',
+        'loc': {'id': i, 'location': f'pix.exemplo.com/qr/v2/cobv/{i}'},
+        'status': 'ATIVA',
+        'devedor': {'cpf': '12345678909', 'nome': 'Francisco da Silva'},
+        'valor': {
+            'original': f'{i}.90',
+            'multa': {'modalidade': '2', 'valorPerc': '15.00'},
+            'juros': {'modalidade': '2', 'valorPerc': '2.00'},
+            'desconto': {
+                'modalidade': '1',
+                'descontoDataFixa': [{'data': '2025-11-30', 'valorPerc': '30.00'}],
+            },
+        },
+        'chave': '5f84a4c5-c5cb-4599-9f13-7eb4d419dacc',
+        'solicitacaoPagador': 'Cobrança dos serviços prestados.',
+    }
+
+
+CARGAS = {
+    'consultar_pix': {
+        'parametros': {
+            'inicio': '2025-01-01T00:00:00Z',
+            'fim': '2025-01-02T00:00:00Z',
+            'paginacao': {'paginaAtual': 0, 'itensPorPagina': 100},
+        },
+        'pix': [pix_recebido(i) for i in range(100)],
+    },
+    'listar_cobv': {
+        'parametros': {'paginacao': {'paginaAtual': 0, 'itensPorPagina': 100}},
+        'cobs': [cobv(i) for i in range(100)],
+    },
+    'lotecobv': {
+        'descricao': 'Cobranças dos alunos do turno vespertino',
+        'cobsv': [cobv(i) for i in range(1000)],
+    },
+}
+
+
+class CodecDoRequests:
+    """O que o requests faz hoje com ``json=`` e ``response.json()``."""
+
+    nome = 'requests'
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, allow_nan=False).encode('utf-8')
+
+    def loads(self, dados: bytes) -> Any:
+        return json.loads(dados)
+
+
+def codecs() -> list[Any]:
+    params = [
+        pytest.param(CodecDoRequests, id='requests'),
+        pytest.param(StdlibJsonCodec, id='json'),
+    ]
+    for classe, modulo in ((OrjsonCodec, 'orjson'), (MsgspecCodec, 'msgspec')):
+        params.append(
+            pytest.param(
+                classe,
+                id=modulo,
+                marks=pytest.mark.skipif(
+                    not _instalado(modulo), reason=f'{modulo} não instalado'
+                ),
+            )
+        )
+    return params
+
+
+def _instalado(modulo: str) -> bool:
+    import importlib.util
+
+    return importlib.util.find_spec(modulo) is not None
+
+
+@pytest.mark.parametrize('carga', list(CARGAS))
+@pytest.mark.parametrize('classe', codecs())
+@pytest.mark.benchmark(group='json-dumps')
+def test_codifica(benchmark, classe: type, carga: str) -> None:
+    codec = classe()
+    dados = benchmark(codec.dumps, CARGAS[carga])
+    assert json.loads(dados) == CARGAS[carga]
+
+
+@pytest.mark.parametrize('carga', list(CARGAS))
+@pytest.mark.parametrize('classe', codecs())
+@pytest.mark.benchmark(group='json-loads')
+def test_decodifica(benchmark, classe: type, carga: str) -> None:
+    codec = classe()
+    dados = json.dumps(CARGAS[carga], ensure_ascii=False).encode()
+    assert benchmark(codec.loads, dados) == CARGAS[carga]
+
+
+@pytest.mark.parametrize('carga', list(CARGAS))
+def test_separadores_compactos_reduzem_o_corpo(carga: str) -> None:
+    padrao = CodecDoRequests().dumps(CARGAS[carga])
+    compacto = StdlibJsonCodec().dumps(CARGAS[carga])
+
+    # ~8% a menos nestas cargas, sem contar os escapes \uXXXX evitados
+    assert len(compacto) < 0.95 * len(padrao)
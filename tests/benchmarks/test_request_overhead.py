@@ -0,0 +1,96 @@
+"""
+Benchmarks do custo do cliente por requisição, sem rede.
+
+A sessão devolve sempre a mesma resposta pronta, então o que se mede é só o
+trabalho do ``BankPixAPIBase._request`` em volta de ``session.request``:
+headers, token, URL e tratamento da resposta. A linha de base é a chamada crua
+a ``session.request`` com os mesmos argumentos.
+"""
+
+from typing import Any
+
+import pytest
+
+from pypix_api.auth.oauth2 import OAuth2Client
+from pypix_api.banks.base import BankPixAPIBase
+from pypix_api.http import DEFAULT_TIMEOUT
+from tests.conftest import make_response
+
+RESPOSTA = make_response(200, {'txid': 'tx1', 'status': 'ATIVA'})
+URL = 'https://banco.exemplo/api/cob/tx1'
+
+
+class SessaoInstantanea:
+    """Sessão que responde na hora, sem o custo de um ``Mock``."""
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        return RESPOSTA
+
+
+class BancoFicticio(BankPixAPIBase):
+    BASE_URL = 'https://banco.exemplo/api'
+    TOKEN_URL = 'https://banco.exemplo/token'
+
+    def get_base_url(self) -> str:
+        return self.BASE_URL
+
+    def get_bank_code(self) -> str:
+        return '748'
+
+
+def cria_banco(sandbox_mode: bool) -> BancoFicticio:
+    oauth = OAuth2Client(
+        token_url=BancoFicticio.TOKEN_URL, client_id='bench', sandbox_mode=True
+    )
+    oauth.session = SessaoInstantanea()
+    banco = BancoFicticio(oauth=oauth, sandbox_mode=sandbox_mode)
+    # Token válido em cache, como no regime de produção
+    chave = oauth._chave_de_cache(banco._scopes_do_token())
+    oauth.token_cache[chave] = {'access_token': 'tok', 'expires_at': 2**40}
+    return banco
+
+
+@pytest.mark.benchmark(group='request-overhead')
+def test_session_request_cru(benchmark) -> None:
+    sessao = SessaoInstantanea()
+    headers = {
+        'Authorization': 'Bearer tok',
+        'Content-Type': 'application/json',
+        'User-Agent': 'PyPixAPIClient/0.1',
+        'client_id': 'bench',
+    }
+
+    resposta = benchmark(
+        lambda: sessao.request('GET', URL, headers=headers, timeout=DEFAULT_TIMEOUT)
+    )
+    assert resposta.status_code == 200
+
+
+@pytest.mark.parametrize('sandbox_mode', [True, False], ids=['sandbox', 'token'])
+@pytest.mark.benchmark(group='request-overhead')
+def test_request_do_banco(benchmark, sandbox_mode: bool) -> None:
+    banco = cria_banco(sandbox_mode)
+
+    resposta = benchmark(banco._request, 'GET', '/cob/tx1')
+    assert resposta.status_code == 200
+
+
+@pytest.mark.benchmark(group='request-overhead')
+def test_consultar_cob(benchmark) -> None:
+    banco = cria_banco(sandbox_mode=False)
+
+    assert benchmark(banco.consultar_cob, 'tx1') == {'txid': 'tx1', 'status': 'ATIVA'}
+
+
+def test_custo_do_cliente_fica_em_microssegundos() -> None:
+    import time
+
+    banco = cria_banco(sandbox_mode=True)
+    vezes = 2000
+    inicio = time.perf_counter()
+    for _ in range(vezes):
+        banco._request('GET', '/cob/tx1')
+    por_chamada = (time.perf_counter() - inicio) / vezes
+
+    # Folgado para máquinas de CI lentas; na prática fica em poucos µs
+    assert por_chamada < 200e-6
@@ -0,0 +1,83 @@
+"""
+Benchmarks do custo por requisição de cada transporte.
+
+Todos contra o mesmo servidor HTTP/1.1 local com keep-alive (ver
+``servidores.py``), que responde sempre o mesmo corpo: a diferença entre os
+grupos é o trabalho do cliente. ``transporte-envio`` mede só o envio — a
+``requests.Session`` crua contra :class:`Urllib3Transport` —, e
+``transporte-banco`` a chamada completa do ``BankPixAPIBase``, com
+``transport='http1'`` e ``transport='urllib3'``.
+"""
+
+import pytest
+
+from pypix_api.auth.oauth2 import OAuth2Client
+from pypix_api.banks.base import BankPixAPIBase
+from pypix_api.http import DEFAULT_TIMEOUT
+from pypix_api.transport import RequestsTransport, Urllib3Transport
+from tests.benchmarks.servidores import servidor_http1
+
+HEADERS = {
+    'Authorization': 'Bearer tok',
+    'Content-Type': 'application/json',
+    'client_id': 'bench',
+}
+
+
+def cria_banco(base_url: str, transport: str) -> BankPixAPIBase:
+    class BancoLocal(BankPixAPIBase):
+        BASE_URL = base_url
+        TOKEN_URL = f'{base_url}/oauth/token'
+
+        def get_base_url(self) -> str:
+            return self.BASE_URL
+
+        def get_bank_code(self) -> str:
+            return '756'
+
+    oauth = OAuth2Client(
+        token_url=BancoLocal.TOKEN_URL,
+        client_id='bench',
+        sandbox_mode=True,
+        transport=transport,
+    )
+    return BancoLocal(oauth=oauth, sandbox_mode=True)
+
+
+@pytest.fixture(scope='module')
+def url():
+    with servidor_http1() as base:
+        yield base
+
+
+@pytest.mark.benchmark(group='transporte-envio')
+def test_envio_requests(benchmark, url) -> None:
+    transporte = RequestsTransport()
+    alvo = f'{url}/cob/txid'
+
+    resposta = benchmark(transporte.send, 'GET', alvo, HEADERS, None, DEFAULT_TIMEOUT)
+
+    assert resposta.status == 200
+    transporte.close()
+
+
+@pytest.mark.benchmark(group='transporte-envio')
+def test_envio_urllib3(benchmark, url) -> None:
+    transporte = Urllib3Transport()
+    alvo = f'{url}/cob/txid'
+
+    resposta = benchmark(transporte.send, 'GET', alvo, HEADERS, None, DEFAULT_TIMEOUT)
+
+    assert resposta.status == 200
+    transporte.close()
+
+
+@pytest.mark.benchmark(group='transporte-banco')
+@pytest.mark.parametrize('transport', ['http1', 'urllib3'])
+def test_consulta_completa(benchmark, url, transport: str) -> None:
+    banco = cria_banco(url, transport)
+
+    resultado = benchmark(banco.consultar_cob, 'txid')
+
+    assert resultado['status'] == 'ATIVA'
+    banco.close()
@@ -3,12 +3,13 @@
 import json
 import os
 from collections.abc import Generator
-from typing import Any
-from unittest.mock import Mock, patch
+from typing import Any, ClassVar
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 import requests
 
+from pypix_api.banks.base import BankPixAPIBase
 from pypix_api.http import DEFAULT_TIMEOUT
 
 
@@ -85,6 +86,85 @@ def make_response(
     return response
 
 
+class BancoFicticio(BankPixAPIBase):
+    """Banco mínimo para exercitar a ``BankPixAPIBase`` sem um PSP real."""
+
+    BASE_URL = 'https://banco.exemplo/api'
+    TOKEN_URL = 'https://banco.exemplo/token'
+    SCOPES: ClassVar[list[str]] = ['dummy.scope']
+
+    def __init__(self, *args: Any, base_url: str | None = None, **kwargs: Any) -> None:
+        self._base_url = base_url or self.BASE_URL
+        super().__init__(*args, **kwargs)
+
+    def get_base_url(self) -> str:
+        return self._base_url
+
+    def get_bank_code(self) -> str:
+        return '748'
+
+
+def cria_oauth() -> MagicMock:
+    """OAuth2 mockado: sessão ``MagicMock`` e token fixo."""
+    oauth = MagicMock()
+    oauth.session = MagicMock()
+    oauth.client_id = 'client-123'
+    oauth.get_token.return_value = 'token-abc'
+    return oauth
+
+
+def cria_api(resposta: requests.Response | None = None, **kwargs: Any) -> BancoFicticio:
+    """:class:`BancoFicticio` sobre :func:`cria_oauth`.
+
+    Args:
+        resposta: Retorno padrão de ``session.request``
+        **kwargs: Repassados ao banco (``retry``, ``hedge``, ...)
+    """
+    oauth = cria_oauth()
+    if resposta is not None:
+        oauth.session.request.return_value = resposta
+    return BancoFicticio(oauth=oauth, **kwargs)
+
+
+class Relogio:
+    """Relógio falso, avançado pelo teste.
+
+    Serve como o módulo ``time`` (``monotonic`` e ``sleep``, que avança o
+    relógio e guarda a espera) ou como função de tempo injetada (chamando a
+    instância).
+    """
+
+    def __init__(self) -> None:
+        self.agora = 1000.0
+        self.esperas: list[float] = []
+
+    def __call__(self) -> float:
+        return self.agora
+
+    def monotonic(self) -> float:
+        return self.agora
+
+    def sleep(self, segundos: float) -> None:
+        self.esperas.append(segundos)
+        self.agora += segundos
+
+
+@pytest.fixture
+def relogio(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> Relogio:
+    """:class:`Relogio` no lugar do ``time`` dos módulos do marker ``relogio``.
+
+    Substitui o módulo ``time`` visto por eles, e não ``time.monotonic``
+    global, para não afetar as threads de fora do teste::
+
+        pytestmark = pytest.mark.relogio('pypix_api.pool')
+    """
+    falso = Relogio()
+    marker = request.node.get_closest_marker('relogio')
+    for modulo in marker.args if marker else ():
+        monkeypatch.setattr(f'{modulo}.time', falso)
+    return falso
+
+
 def assert_requisicao(
     session: Mock,
     metodo: str,
@@ -341,6 +421,9 @@ def pytest_configure(config):
     )
     config.addinivalue_line('markers', 'mock: marca testes como testes com mock')
     config.addinivalue_line('markers', 'slow: marca testes como lentos')
+    config.addinivalue_line(
+        'markers', 'relogio(*modulos): módulos cujo time é o relógio falso'
+    )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -0,0 +1,175 @@
+"""Testes do timeout de leitura adaptativo (``adaptive_timeout``)."""
+
+import asyncio
+from typing import Any
+
+import pytest
+import requests
+
+from pypix_api.adaptive_timeout import AdaptiveTimeoutPolicy, AdaptiveTimeouts
+from pypix_api.exceptions import PixTimeoutException
+from pypix_api.metrics import MetricsCollector
+from tests.conftest import cria_api, make_response
+
+POLITICA = AdaptiveTimeoutPolicy(
+    min_samples=10, window_size=100, recompute_every=1, min_read=0.5
+)
+
+
+def alimenta(timeouts: AdaptiveTimeouts, operacao: str, latencias: list[float]) -> None:
+    for latencia in latencias:
+        timeouts.observa('748', operacao, latencia)
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'percentile': 1.0},
+        {'multiplier': 0.5},
+        {'min_read': 0},
+        {'min_samples': 0},
+        {'min_samples': 10, 'window_size': 5},
+        {'recompute_every': 0},
+    ],
+)
+def test_politica_invalida(kwargs: dict[str, Any]) -> None:
+    with pytest.raises(ValueError):
+        AdaptiveTimeoutPolicy(**kwargs)
+
+
+def test_sem_amostras_suficientes_usa_o_configurado() -> None:
+    timeouts = AdaptiveTimeouts(POLITICA)
+    alimenta(timeouts, 'cob.item.get', [0.2] * 9)
+
+    assert timeouts.leitura('748', 'cob.item.get', 30.0) is None
+    assert timeouts.leitura('748', 'pix.get', 30.0) is None
+
+
+def test_multiplo_do_percentil_entre_piso_e_teto() -> None:
+    timeouts = AdaptiveTimeouts(POLITICA)
+    alimenta(timeouts, 'cob.item.get', [0.2] * 99 + [0.4])
+    alimenta(timeouts, 'pix.get', [0.01] * 20)
+    alimenta(timeouts, 'lotecobv.item.put', [20.0] * 20)
+
+    assert timeouts.leitura('748', 'cob.item.get', 30.0) == pytest.approx(1.2)
+    assert timeouts.leitura('748', 'pix.get', 30.0) == 0.5
+    assert timeouts.leitura('748', 'lotecobv.item.put', 30.0) == 30.0
+    assert timeouts.leitura('748', 'lotecobv.item.put', None) == 60.0
+
+
+def test_percentil_recalculado_a_cada_recompute_every() -> None:
+    timeouts = AdaptiveTimeouts(AdaptiveTimeoutPolicy(min_samples=10, min_read=0.1))
+    alimenta(timeouts, 'cob.item.get', [0.2] * 10)
+    assert timeouts.leitura('748', 'cob.item.get', None) == pytest.approx(0.6)
+
+    alimenta(timeouts, 'cob.item.get', [1.0] * 9)
+    assert timeouts.leitura('748', 'cob.item.get', None) == pytest.approx(0.6)
+    alimenta(timeouts, 'cob.item.get', [1.0])
+    assert timeouts.leitura('748', 'cob.item.get', None) == pytest.approx(3.0)
+
+
+def test_requisicao_usa_a_leitura_da_operacao() -> None:
+    timeouts = AdaptiveTimeouts(POLITICA)
+    api = cria_api(make_response(200, {'ok': True}), adaptive_timeout=timeouts)
+    alimenta(timeouts, 'cob.item.get', [0.2] * 20)
+
+    api.consultar_cob('tx1')
+    assert api.session.request.call_args.kwargs['timeout'] == (
+        5.0,
+        pytest.approx(0.6),
+    )
+
+    api.consultar_pix_por_e2eid('e2e')
+    assert api.session.request.call_args.kwargs['timeout'] == api.timeout
+
+
+def test_timeout_explicito_nao_e_alterado() -> None:
+    timeouts = AdaptiveTimeouts(POLITICA)
+    api = cria_api(make_response(200, {'ok': True}), adaptive_timeout=timeouts)
+    alimenta(timeouts, 'cob.item.get', [0.2] * 20)
+
+    api._request('GET', '/cob/tx1', timeout=7.0)
+
+    assert api.session.request.call_args.kwargs['timeout'] == 7.0
+
+
+def test_latencias_das_respostas_sao_observadas() -> None:
+    timeouts = AdaptiveTimeouts(POLITICA)
+    api = cria_api(make_response(200, {'ok': True}), adaptive_timeout=timeouts)
+
+    for _ in range(10):
+        api.consultar_cob('tx1')
+
+    assert ('748', 'cob.item.get') in timeouts.timeouts()
+
+
+def test_timeout_de_leitura_empurra_o_limite_para_cima() -> None:
+    timeouts = AdaptiveTimeouts(POLITICA)
+    api = cria_api(make_response(200, {'ok': True}), adaptive_timeout=timeouts)
+    alimenta(timeouts, 'cob.item.get', [0.2] * 20)
+    antes = timeouts.leitura('748', 'cob.item.get', 30.0)
+    api.session.request.side_effect = requests.ReadTimeout('lento')
+
+    for _ in range(3):
+        with pytest.raises(PixTimeoutException):
+            api.consultar_cob('tx1')
+
+    assert timeouts.leitura('748', 'cob.item.get', 30.0) > antes
+
+
+def test_timeout_de_conexao_nao_e_latencia() -> None:
+    timeouts = AdaptiveTimeouts(POLITICA)
+    api = cria_api(make_response(200, {'ok': True}), adaptive_timeout=timeouts)
+    api.session.request.side_effect = requests.ConnectTimeout('sem rota')
+
+    with pytest.raises(PixTimeoutException):
+        api.consultar_cob('tx1')
+
+    assert timeouts.timeouts() == {}
+
+
+def test_limite_publicado_como_gauge() -> None:
+    coletor = MetricsCollector()
+    coletor.clear_metrics()
+    timeouts = AdaptiveTimeouts(POLITICA)
+
+    alimenta(timeouts, 'cob.item.get', [0.2] * 10)
+
+    chave = 'adaptive_timeout.read:{"bank": "748", "operation": "cob.item.get"}'
+    assert coletor.gauges[chave] == pytest.approx(0.6)
+
+
+def test_limite_que_muda_a_cada_resposta_nao_inunda_as_metricas() -> None:
+    coletor = MetricsCollector()
+    coletor.clear_metrics()
+    timeouts = AdaptiveTimeouts(POLITICA)
+
+    alimenta(timeouts, 'cob.item.get', [0.2 + i / 100 for i in range(100)])
+
+    gauges = [m for m in coletor.metrics if m.name == 'adaptive_timeout.read']
+    assert len(gauges) == 1
+    assert len(timeouts.timeouts()) == 1
+
+
+def test_cliente_assincrono_usa_a_leitura_da_operacao() -> None:
+    httpx = pytest.importorskip('httpx')
+    from pypix_api.auth.async_oauth2 import AsyncOAuth2Client
+    from pypix_api.banks.sicoob import AsyncSicoobPixAPI
+
+    recebidos: list[dict[str, float]] = []
+
+    def responde(request: Any) -> Any:
+        recebidos.append(request.extensions['timeout'])
+        return httpx.Response(200, json={})
+
+    timeouts = AdaptiveTimeouts(POLITICA)
+    for _ in range(20):
+        timeouts.observa('756', 'cob.item.get', 0.2)
+    oauth = AsyncOAuth2Client(token_url='https://auth.exemplo/token', sandbox_mode=True)
+    oauth.session = httpx.AsyncClient(transport=httpx.MockTransport(responde))
+    banco = AsyncSicoobPixAPI(oauth=oauth, sandbox_mode=True, adaptive_timeout=timeouts)
+
+    asyncio.run(banco.consultar_cob('tx1'))
+
+    assert recebidos[0]['read'] == pytest.approx(0.6)
+    assert recebidos[0]['connect'] == 5.0
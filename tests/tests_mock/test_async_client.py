@@ -0,0 +1,296 @@
+"""Testes dos clientes assíncronos (``AsyncOAuth2Client`` e ``Async*PixAPI``).
+
+O transporte é um ``httpx.MockTransport``: a requisição passa pelo
+``httpx.AsyncClient`` real, e só a rede é substituída.
+"""
+
+import asyncio
+import json
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+httpx = pytest.importorskip('httpx')
+
+from pypix_api.auth.async_oauth2 import AsyncOAuth2Client  # noqa: E402
+from pypix_api.banks.async_base import AsyncBankPixAPIBase  # noqa: E402
+from pypix_api.banks.bb import AsyncBBPixAPI  # noqa: E402
+from pypix_api.banks.sicoob import AsyncSicoobPixAPI  # noqa: E402
+from pypix_api.banks.sicredi import AsyncSicrediPixAPI  # noqa: E402
+from pypix_api.exceptions import (  # noqa: E402
+    PixConexaoException,
+    PixErroValidacaoException,
+    PixNaoAutorizadoException,
+    PixRecursoNaoEncontradoException,
+    PixTimeoutException,
+)
+
+TOKEN_URL = 'https://banco.exemplo/oauth/token'
+TOKEN_OK = {'access_token': 'token-async', 'expires_in': 3600}
+
+
+def cria_oauth(
+    handler: Callable[[Any], Any], client_secret: str | None = None
+) -> AsyncOAuth2Client:
+    oauth = AsyncOAuth2Client(
+        token_url=TOKEN_URL,
+        client_id='client-123',
+        client_secret=client_secret,
+        sandbox_mode=True,
+    )
+    oauth.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return oauth
+
+
+def roteador(
+    respostas: dict[str, Any], chamadas: list[Any] | None = None
+) -> Callable[[Any], Any]:
+    """Responde por caminho; o endpoint de token sempre concede ``TOKEN_OK``."""
+
+    def handler(request: Any) -> Any:
+        if chamadas is not None:
+            chamadas.append(request)
+        if str(request.url) == TOKEN_URL:
+            return httpx.Response(200, json=TOKEN_OK)
+        resposta = respostas[request.url.path]
+        if isinstance(resposta, Exception):
+            raise resposta
+        return resposta
+
+    return handler
+
+
+def cria_banco(
+    respostas: dict[str, Any],
+    chamadas: list[Any] | None = None,
+    classe: type[AsyncBankPixAPIBase] = AsyncSicoobPixAPI,
+) -> AsyncBankPixAPIBase:
+    oauth = cria_oauth(roteador(respostas, chamadas))
+    banco = classe(oauth=oauth)
+    # Fora do sandbox_mode para exercitar o token assíncrono
+    banco.sandbox_mode = False
+    return banco
+
+
+# --- AsyncOAuth2Client -------------------------------------------------------
+
+
+def test_get_token_assincrono_usa_cache() -> None:
+    chamadas: list[Any] = []
+    oauth = cria_oauth(roteador({}, chamadas))
+
+    async def cenario() -> tuple[str, str]:
+        primeiro = await oauth.get_token('cob.read cob.write')
+        segundo = await oauth.get_token('cob.write cob.read')
+        return primeiro, segundo
+
+    assert asyncio.run(cenario()) == ('token-async', 'token-async')
+    assert len(chamadas) == 1
+
+
+def test_get_token_concorrente_faz_um_unico_post() -> None:
+    chamadas: list[Any] = []
+    oauth = cria_oauth(roteador({}, chamadas))
+
+    async def cenario() -> list[str]:
+        return await asyncio.gather(*(oauth.get_token('cob.read') for _ in range(50)))
+
+    assert set(asyncio.run(cenario())) == {'token-async'}
+    assert len(chamadas) == 1
+
+
+def test_get_token_assincrono_monta_o_mesmo_corpo_do_sincrono() -> None:
+    chamadas: list[Any] = []
+    oauth = cria_oauth(roteador({}, chamadas))
+
+    asyncio.run(oauth.get_token('cob.read'))
+
+    corpo = chamadas[0].content.decode()
+    assert 'grant_type=client_credentials' in corpo
+    assert 'client_id=client-123' in corpo
+
+
+def test_get_token_assincrono_com_basic_nao_envia_client_id_no_corpo() -> None:
+    chamadas: list[Any] = []
+    oauth = cria_oauth(roteador({}, chamadas), client_secret='segredo')
+
+    asyncio.run(oauth.get_token('cob.read'))
+
+    assert chamadas[0].headers['Authorization'].startswith('Basic ')
+    assert 'client_id' not in chamadas[0].content.decode()
+
+
+def test_erro_do_token_assincrono_usa_o_mapeamento_do_sincrono() -> None:
+    oauth = cria_oauth(
+        lambda request: httpx.Response(401, json={'error': 'invalid_client'})
+    )
+
+    with pytest.raises(PixNaoAutorizadoException, match='invalid_client'):
+        asyncio.run(oauth.get_token('cob.read'))
+
+
+def test_timeout_do_token_assincrono() -> None:
+    def handler(request: Any) -> Any:
+        raise httpx.ReadTimeout('lento', request=request)
+
+    oauth = cria_oauth(handler)
+
+    with pytest.raises(PixTimeoutException):
+        asyncio.run(oauth.get_token('cob.read'))
+
+
+# --- Async*PixAPI ------------------------------------------------------------
+
+
+def test_consultar_cob_assincrono() -> None:
+    chamadas: list[Any] = []
+    banco = cria_banco(
+        {'/pix/api/v2/cob/tx1': httpx.Response(200, json={'txid': 'tx1'})},
+        chamadas,
+    )
+
+    resultado = asyncio.run(banco.consultar_cob('tx1', revisao=2))
+
+    assert resultado == {'txid': 'tx1'}
+    requisicao = chamadas[-1]
+    assert requisicao.method == 'GET'
+    assert requisicao.url.params['revisao'] == '2'
+    assert requisicao.headers['Authorization'] == 'Bearer token-async'
+    assert requisicao.headers['client_id'] == 'client-123'
+
+
+def test_criar_cob_assincrono_envia_o_corpo_json() -> None:
+    chamadas: list[Any] = []
+    body = {'valor': {'original': '10.00'}, 'chave': 'chave@exemplo.com'}
+    banco = cria_banco(
+        {'/pix/api/v2/cob/tx1': httpx.Response(201, json={'txid': 'tx1'})},
+        chamadas,
+    )
+
+    asyncio.run(banco.criar_cob('tx1', body))
+
+    assert chamadas[-1].method == 'PUT'
+    assert json.loads(chamadas[-1].content) == body
+
+
+def test_sicredi_assincrono_resolve_a_versao_por_recurso() -> None:
+    chamadas: list[Any] = []
+    banco = cria_banco(
+        {'/api/v3/cob/tx1': httpx.Response(200, json={'txid': 'tx1'})},
+        chamadas,
+        classe=AsyncSicrediPixAPI,
+    )
+
+    asyncio.run(banco.consultar_cob('tx1'))
+
+    assert chamadas[-1].url.path == '/api/v3/cob/tx1'
+
+
+def test_bb_assincrono_expoe_os_metodos_proprios() -> None:
+    banco = cria_banco(
+        {'/pix/v2/pix-bb': httpx.Response(200, json={'pix': []})},
+        classe=AsyncBBPixAPI,
+    )
+
+    resultado = asyncio.run(
+        banco.consultar_pix_bb(
+            inicio='2025-01-01T00:00:00Z', fim='2025-01-02T00:00:00Z'
+        )
+    )
+
+    assert resultado == {'pix': []}
+
+
+def test_exclusao_assincrona_devolve_bool() -> None:
+    banco = cria_banco({'/pix/api/v2/webhookrec': httpx.Response(204)})
+
+    assert asyncio.run(banco.excluir_webhook_rec()) is True
+
+
+def test_lote_assincrono_aceita_202_sem_corpo() -> None:
+    banco = cria_banco({'/pix/api/v2/lotecobv/l1': httpx.Response(202)})
+
+    assert asyncio.run(banco.criar_lote_cobv('l1', {'cobsv': []})) == {}
+
+
+@pytest.mark.parametrize(
+    ('status', 'excecao'),
+    [(400, PixErroValidacaoException), (404, PixRecursoNaoEncontradoException)],
+)
+def test_erro_assincrono_tem_o_mesmo_mapeamento_do_sincrono(
+    status: int, excecao: type[Exception]
+) -> None:
+    corpo = {
+        'type': 'https://pix.bcb.gov.br/api/v2/error/Erro',
+        'title': 'Erro',
+        'status': status,
+        'detail': 'motivo',
+        'violacoes': [{'razao': 'inválido', 'propriedade': 'valor'}],
+    }
+    banco = cria_banco(
+        {
+            '/pix/api/v2/cob/tx1': httpx.Response(
+                status, json=corpo, headers={'Content-Type': 'application/problem+json'}
+            )
+        }
+    )
+
+    with pytest.raises(excecao) as exc_info:
+        asyncio.run(banco.consultar_cob('tx1'))
+
+    assert exc_info.value.violacoes == corpo['violacoes']
+
+
+def test_falhas_de_transporte_assincronas() -> None:
+    banco = cria_banco(
+        {
+            '/pix/api/v2/cob/lento': httpx.ReadTimeout('lento'),
+            '/pix/api/v2/cob/fora': httpx.ConnectError('dns'),
+        }
+    )
+
+    with pytest.raises(PixTimeoutException):
+        asyncio.run(banco.consultar_cob('lento'))
+    with pytest.raises(PixConexaoException, match='dns'):
+        asyncio.run(banco.consultar_cob('fora'))
+
+
+def test_validacao_de_argumento_levanta_antes_do_await() -> None:
+    banco = cria_banco({})
+
+    with pytest.raises(ValueError, match='CPF e CNPJ'):
+        banco.consultar_cobs('2025-01-01', '2025-01-02', cpf='1', cnpj='2')
+
+
+def test_extra_headers_nao_pode_redefinir_autenticacao() -> None:
+    chamadas: list[Any] = []
+    banco = cria_banco({}, chamadas)
+
+    with pytest.raises(ValueError, match='autenticação'):
+        asyncio.run(
+            banco._request('GET', '/cob/x', extra_headers={'Authorization': 'x'})
+        )
+    assert chamadas == []
+
+
+def test_chamadas_concorrentes_compartilham_o_token() -> None:
+    chamadas: list[Any] = []
+    banco = cria_banco(
+        {
+            f'/pix/api/v2/cob/tx{i}': httpx.Response(200, json={'i': i})
+            for i in range(20)
+        },
+        chamadas,
+    )
+
+    async def cenario() -> list[dict[str, Any]]:
+        async with banco:
+            return await asyncio.gather(
+                *(banco.consultar_cob(f'tx{i}') for i in range(20))
+            )
+
+    resultados = asyncio.run(cenario())
+
+    assert [r['i'] for r in resultados] == list(range(20))
+    assert sum(1 for c in chamadas if str(c.url) == TOKEN_URL) == 1
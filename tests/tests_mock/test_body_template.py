@@ -0,0 +1,146 @@
+"""Testes dos corpos pré-codificados (``pypix_api.body_template``)."""
+
+import asyncio
+import json
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from pypix_api.body_template import BodyTemplate, Placeholder
+from pypix_api.json_codec import StdlibJsonCodec
+from tests import conftest
+from tests.conftest import BancoFicticio, make_response
+
+
+def cria_api(**kwargs: Any) -> BancoFicticio:
+    return conftest.cria_api(make_response(201, {'txid': 'tx1'}), **kwargs)
+
+
+def cob(valor: Any, mensagem: Any) -> dict[str, Any]:
+    return {
+        'calendario': {'expiracao': 3600},
+        'devedor': {'cnpj': '12345678000195', 'nome': 'Empresa de Serviços SA'},
+        'valor': {'original': valor, 'modalidadeAlteracao': 0},
+        'chave': '7d9f0335-8dcc-4054-9bf9-0dbd61d36906',
+        'solicitacaoPagador': mensagem,
+        'infoAdicionais': [{'nome': 'Loja', 'valor': 'Centro'}],
+    }
+
+
+MODELO = BodyTemplate(cob(Placeholder('valor'), Placeholder('mensagem')))
+
+
+def test_render_igual_ao_corpo_codificado_inteiro() -> None:
+    corpo = MODELO.render(valor='37.00', mensagem='Pedido nº 123 — "urgente"')
+
+    esperado = cob('37.00', 'Pedido nº 123 — "urgente"')
+    assert corpo == StdlibJsonCodec().dumps(esperado)
+    assert json.loads(corpo) == esperado
+
+
+def test_campo_repetido_e_valores_compostos() -> None:
+    modelo = BodyTemplate(
+        {'a': Placeholder('x'), 'lista': [Placeholder('x'), Placeholder('d')]}
+    )
+
+    corpo = modelo.render(x=1.5, d={'nome': None})
+
+    assert json.loads(corpo) == {'a': 1.5, 'lista': [1.5, {'nome': None}]}
+    assert modelo.fields == {'x', 'd'}
+
+
+@pytest.mark.parametrize(
+    'valores',
+    [{'valor': '1.00'}, {'valor': '1.00', 'mensagem': 'm', 'txid': 't'}],
+)
+def test_render_exige_exatamente_os_campos(valores: dict[str, Any]) -> None:
+    with pytest.raises(TypeError, match='Campos do modelo'):
+        MODELO.render(**valores)
+
+
+def test_modelo_sem_campo_variavel() -> None:
+    with pytest.raises(ValueError, match='Placeholder'):
+        BodyTemplate({'chave': 'fixa'})
+
+
+def test_nome_de_campo_invalido() -> None:
+    with pytest.raises(ValueError, match='inválido'):
+        Placeholder('valor.original')
+
+
+def test_valor_nao_serializavel() -> None:
+    with pytest.raises(TypeError):
+        MODELO.render(valor=object(), mensagem='m')
+
+
+@pytest.mark.parametrize(
+    ('metodo', 'args', 'verbo', 'path'),
+    [
+        ('criar_cob', ('tx1',), 'PUT', '/cob/tx1'),
+        ('criar_cob_auto_txid', (), 'POST', '/cob'),
+        ('revisar_cob', ('tx1',), 'PATCH', '/cob/tx1'),
+        ('criar_cobv', ('tx1',), 'PUT', '/cobv/tx1'),
+        ('revisar_cobv', ('tx1',), 'PATCH', '/cobv/tx1'),
+        ('criar_lote_cobv', ('l1',), 'PUT', '/lotecobv/l1'),
+        ('alterar_lote_cobv', ('l1',), 'PATCH', '/lotecobv/l1'),
+    ],
+)
+def test_metodos_aceitam_bytes(
+    metodo: str, args: tuple[str, ...], verbo: str, path: str
+) -> None:
+    api = cria_api()
+    corpo = MODELO.render(valor='10.00', mensagem='m')
+
+    getattr(api, metodo)(*args, corpo)
+
+    chamada = api.session.request.call_args
+    assert chamada.args == (verbo, f'https://banco.exemplo/api{path}')
+    assert chamada.kwargs['data'] is corpo
+    assert 'json' not in chamada.kwargs
+    assert chamada.kwargs['headers']['Content-Type'] == 'application/json'
+
+
+def test_bytes_nao_passam_pelo_json_codec() -> None:
+    codec = MagicMock()
+    api = cria_api(json_codec=codec)
+    codec.loads.side_effect = json.loads
+
+    api.criar_cob('tx1', b'{"valor":{"original":"1.00"}}')
+
+    codec.dumps.assert_not_called()
+    enviado = api.session.request.call_args.kwargs['data']
+    assert enviado == b'{"valor":{"original":"1.00"}}'
+
+
+def test_dict_continua_como_json() -> None:
+    api = cria_api()
+
+    api.criar_cob('tx1', {'valor': {'original': '1.00'}})
+
+    assert api.session.request.call_args.kwargs['json'] == {
+        'valor': {'original': '1.00'}
+    }
+
+
+def test_cliente_assincrono_envia_os_bytes() -> None:
+    httpx = pytest.importorskip('httpx')
+    from pypix_api.auth.async_oauth2 import AsyncOAuth2Client
+    from pypix_api.banks.sicoob import AsyncSicoobPixAPI
+
+    recebidos: list[Any] = []
+
+    async def responde(request: Any) -> Any:
+        recebidos.append(request)
+        return httpx.Response(201, json={'txid': 'tx1'})
+
+    oauth = AsyncOAuth2Client(token_url='https://auth.exemplo/token', sandbox_mode=True)
+    oauth.session = httpx.AsyncClient(transport=httpx.MockTransport(responde))
+    banco = AsyncSicoobPixAPI(oauth=oauth, sandbox_mode=True)
+    corpo = MODELO.render(valor='10.00', mensagem='m')
+
+    asyncio.run(banco.criar_cob('tx1', corpo))
+
+    (request,) = recebidos
+    assert request.content == corpo
+    assert request.headers['Content-Type'] == 'application/json'
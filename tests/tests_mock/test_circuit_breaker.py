@@ -0,0 +1,302 @@
+"""Testes do circuit breaker por banco e recurso."""
+
+import asyncio
+
+import pytest
+import requests
+
+from pypix_api.banks.base import recurso_do_path
+from pypix_api.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerRegistry,
+)
+from pypix_api.exceptions import (
+    PixAPIException,
+    PixCircuitoAbertoException,
+    PixErroServidorException,
+    PixErroValidacaoException,
+    PixTimeoutException,
+)
+from pypix_api.metrics import MetricsCollector
+from pypix_api.retry import RetryPolicy
+from tests.conftest import BancoFicticio, Relogio, cria_api, make_response
+
+CONFIG = CircuitBreakerConfig(window_size=4, minimum_calls=4, open_duration=10)
+
+
+def circuito_com_relogio(
+    registro: CircuitBreakerRegistry, recurso: str = 'cob'
+) -> Relogio:
+    relogio = Relogio()
+    registro.circuito('748', recurso)._agora = relogio
+    return relogio
+
+
+def falha_n_vezes(api: BancoFicticio, vezes: int) -> None:
+    api.session.request.side_effect = requests.Timeout('lento')
+    for _ in range(vezes):
+        with pytest.raises(PixTimeoutException):
+            api.consultar_cob('tx1')
+
+
+def test_recurso_e_o_primeiro_segmento() -> None:
+    assert recurso_do_path('/cob/tx1') == 'cob'
+    assert recurso_do_path('/pix/e2e/devolucao/d1') == 'pix'
+    assert recurso_do_path('/webhookrec') == 'webhookrec'
+
+
+def test_abre_apos_o_limite_de_falhas_e_falha_na_hora() -> None:
+    registro = CircuitBreakerRegistry(CONFIG)
+    circuito_com_relogio(registro)
+    api = cria_api(circuit_breaker=registro)
+
+    falha_n_vezes(api, 4)
+
+    with pytest.raises(PixCircuitoAbertoException) as exc_info:
+        api.consultar_cob('tx1')
+    assert api.session.request.call_count == 4
+    assert exc_info.value.recurso == 'cob'
+    assert exc_info.value.banco == '748'
+    assert exc_info.value.reabre_em == pytest.approx(10)
+    assert isinstance(exc_info.value, PixAPIException)
+    assert registro.estados() == {('748', 'cob'): 'open'}
+
+
+def test_abaixo_do_minimo_de_chamadas_nao_abre() -> None:
+    registro = CircuitBreakerRegistry(CONFIG)
+    api = cria_api(circuit_breaker=registro)
+
+    falha_n_vezes(api, 3)
+
+    assert registro.circuito('748', 'cob').estado == 'closed'
+
+
+def test_status_5xx_conta_como_falha_e_4xx_nao() -> None:
+    registro = CircuitBreakerRegistry(CONFIG)
+    api = cria_api(circuit_breaker=registro)
+
+    api.session.request.return_value = make_response(400, {'detail': 'inválido'})
+    for _ in range(4):
+        with pytest.raises(PixErroValidacaoException):
+            api.consultar_cob('tx1')
+    assert registro.circuito('748', 'cob').estado == 'closed'
+
+    api.session.request.return_value = make_response(500, {'detail': 'erro'})
+    for _ in range(2):
+        with pytest.raises(PixErroServidorException):
+            api.consultar_cob('tx1')
+    # 2 falhas em 4 chamadas: 50%
+    assert registro.circuito('748', 'cob').estado == 'open'
+
+
+def test_circuito_e_por_recurso() -> None:
+    registro = CircuitBreakerRegistry(CONFIG)
+    circuito_com_relogio(registro)
+    api = cria_api(circuit_breaker=registro)
+    falha_n_vezes(api, 4)
+
+    api.session.request.side_effect = None
+    api.session.request.return_value = make_response(200, {'pix': []})
+    assert api.consultar_pix_por_e2eid('e2e') == {'pix': []}
+
+
+def test_meio_aberto_sonda_e_fecha_com_sucesso() -> None:
+    registro = CircuitBreakerRegistry(CONFIG)
+    relogio = circuito_com_relogio(registro)
+    api = cria_api(circuit_breaker=registro)
+    falha_n_vezes(api, 4)
+
+    relogio.agora += 10
+    assert registro.circuito('748', 'cob').estado == 'half_open'
+    api.session.request.side_effect = None
+    api.session.request.return_value = make_response(200, {'txid': 'tx1'})
+
+    assert api.consultar_cob('tx1') == {'txid': 'tx1'}
+    assert registro.circuito('748', 'cob').estado == 'closed'
+
+
+def test_meio_aberto_reabre_se_a_sondagem_falhar() -> None:
+    registro = CircuitBreakerRegistry(CONFIG)
+    relogio = circuito_com_relogio(registro)
+    api = cria_api(circuit_breaker=registro)
+    falha_n_vezes(api, 4)
+
+    relogio.agora += 10
+    falha_n_vezes(api, 1)
+
+    assert registro.circuito('748', 'cob').estado == 'open'
+    with pytest.raises(PixCircuitoAbertoException):
+        api.consultar_cob('tx1')
+
+
+def test_meio_aberto_limita_as_sondagens_simultaneas() -> None:
+    circuito = CircuitBreaker('748', 'cob', CONFIG)
+    relogio = Relogio()
+    circuito._agora = relogio
+    for _ in range(4):
+        circuito.registra(circuito.antes(), True, 0.1)
+
+    relogio.agora += 10
+    circuito.antes()  # sondagem em andamento
+    with pytest.raises(PixCircuitoAbertoException):
+        circuito.antes()
+
+
+def circuito_aberto() -> tuple[CircuitBreaker, Relogio]:
+    circuito = CircuitBreaker('748', 'cob', CONFIG)
+    relogio = Relogio()
+    circuito._agora = relogio
+    for _ in range(4):
+        circuito.registra(circuito.antes(), True, 0.1)
+    return circuito, relogio
+
+
+def test_sondagem_abandonada_e_liberada_apos_open_duration() -> None:
+    circuito, relogio = circuito_aberto()
+    relogio.agora += 10
+    perdida = circuito.antes()  # quem levou a sondagem nunca registra
+
+    relogio.agora += 5
+    with pytest.raises(PixCircuitoAbertoException):
+        circuito.antes()
+    relogio.agora += 5
+    sondagem = circuito.antes()
+    circuito.registra(sondagem, False, 0.1)
+
+    assert circuito.estado == 'closed'
+    # O resultado tardio da sondagem abandonada é descartado
+    circuito.registra(perdida, True, 0.1)
+    assert circuito.estado == 'closed'
+
+
+def test_chamada_de_geracao_anterior_nao_decide_a_sondagem() -> None:
+    circuito = CircuitBreaker('748', 'cob', CONFIG)
+    relogio = Relogio()
+    circuito._agora = relogio
+    lenta = circuito.antes()  # autorizada com o circuito fechado
+    for _ in range(4):
+        circuito.registra(circuito.antes(), True, 0.1)
+    relogio.agora += 10
+    sondagem = circuito.antes()
+
+    # A chamada antiga termina bem durante a sondagem: não fecha o circuito
+    circuito.registra(lenta, False, 12.0)
+    assert circuito.estado == 'half_open'
+    with pytest.raises(PixCircuitoAbertoException):
+        circuito.antes()
+
+    circuito.registra(sondagem, True, 0.1)
+    assert circuito.estado == 'open'
+
+
+def test_resultado_desconhecido_libera_a_sondagem_sem_contar() -> None:
+    circuito, relogio = circuito_aberto()
+    relogio.agora += 10
+
+    circuito.registra(circuito.antes(), None, 0.1)
+
+    assert circuito.estado == 'half_open'
+    circuito.registra(circuito.antes(), False, 0.1)
+    assert circuito.estado == 'closed'
+
+
+def test_erro_do_chamador_nao_conta_como_falha() -> None:
+    registro = CircuitBreakerRegistry(CONFIG)
+    api = cria_api(circuit_breaker=registro)
+    api.session.request.side_effect = TypeError('não serializável')
+
+    for _ in range(4):
+        with pytest.raises(TypeError):
+            api.consultar_cob('tx1')
+    api.session.request.side_effect = requests.exceptions.InvalidURL('url')
+    for _ in range(4):
+        with pytest.raises(PixAPIException):
+            api.consultar_cob('tx1')
+
+    assert registro.circuito('748', 'cob').estado == 'closed'
+
+
+def test_cancelamento_assincrono_nao_conta_como_falha() -> None:
+    httpx = pytest.importorskip('httpx')
+    from pypix_api.auth.async_oauth2 import AsyncOAuth2Client
+    from pypix_api.banks.sicoob import AsyncSicoobPixAPI
+
+    def cancela(request: httpx.Request) -> httpx.Response:
+        raise asyncio.CancelledError
+
+    oauth = AsyncOAuth2Client(token_url='https://auth.exemplo/token', sandbox_mode=True)
+    oauth.session = httpx.AsyncClient(transport=httpx.MockTransport(cancela))
+    registro = CircuitBreakerRegistry(CONFIG)
+    banco = AsyncSicoobPixAPI(oauth=oauth, sandbox_mode=True, circuit_breaker=registro)
+
+    for _ in range(4):
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(banco.consultar_cob('tx1'))
+
+    assert registro.circuito('756', 'cob').estado == 'closed'
+
+
+def test_abre_por_latencia() -> None:
+    circuito = CircuitBreaker(
+        '748',
+        'cob',
+        CircuitBreakerConfig(
+            window_size=4,
+            minimum_calls=4,
+            slow_call_duration=1.0,
+            slow_call_rate_threshold=0.75,
+        ),
+    )
+    for duracao in (2.0, 2.0, 0.1, 2.0):
+        circuito.registra(circuito.antes(), False, duracao)
+
+    assert circuito.estado == 'open'
+
+
+def test_circuito_aberto_nao_e_repetido_pela_politica_de_retry() -> None:
+    registro = CircuitBreakerRegistry(CONFIG)
+    circuito_com_relogio(registro)
+    api = cria_api(
+        circuit_breaker=registro, retry=RetryPolicy(max_retries=5, backoff_base=0)
+    )
+    api.session.request.side_effect = requests.Timeout('lento')
+
+    with pytest.raises(PixCircuitoAbertoException):
+        api.consultar_cob('tx1')
+    # As 4 primeiras tentativas abrem o circuito; a quinta nem sai
+    assert api.session.request.call_count == 4
+
+
+def test_registro_compartilhado_entre_clientes() -> None:
+    registro = CircuitBreakerRegistry(CONFIG)
+    circuito_com_relogio(registro)
+    falha_n_vezes(cria_api(circuit_breaker=registro), 4)
+
+    outro = cria_api(circuit_breaker=registro)
+    with pytest.raises(PixCircuitoAbertoException):
+        outro.consultar_cob('tx1')
+    outro.session.request.assert_not_called()
+
+
+def test_estado_publicado_no_metrics_collector() -> None:
+    metricas = MetricsCollector()
+    if not metricas.enabled:
+        pytest.skip('métricas desabilitadas no ambiente')
+    registro = CircuitBreakerRegistry(CONFIG)
+    circuito_com_relogio(registro, recurso='lotecobv')
+    api = cria_api(circuit_breaker=registro)
+    api.session.request.side_effect = requests.Timeout('lento')
+    for _ in range(4):
+        with pytest.raises(PixTimeoutException):
+            api.consultar_lote_cobv(1)
+
+    chave = 'circuit_breaker.state:{"bank": "748", "resource": "lotecobv"}'
+    assert metricas.gauges[chave] == 2
+
+
+def test_config_invalida() -> None:
+    with pytest.raises(ValueError, match='minimum_calls'):
+        CircuitBreakerConfig(window_size=5, minimum_calls=6)
+    with pytest.raises(ValueError, match='failure_rate_threshold'):
+        CircuitBreakerConfig(failure_rate_threshold=0)
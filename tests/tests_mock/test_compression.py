@@ -0,0 +1,284 @@
+"""Testes da compressão de corpos e listagens (``pypix_api.compression``)."""
+
+import asyncio
+import gzip
+import json
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from pypix_api.auth.oauth2 import OAuth2Client
+from pypix_api.compression import CompressionPolicy, eh_listagem
+from pypix_api.metrics import MetricsCollector
+from pypix_api.retry import RetryPolicy
+from tests import conftest
+from tests.conftest import BancoFicticio, make_response
+
+
+def cria_api(**kwargs: Any) -> BancoFicticio:
+    return conftest.cria_api(make_response(200, {'id': 'l1'}), **kwargs)
+
+
+def lote(quantidade: int) -> dict[str, Any]:
+    return {
+        'descricao': 'Cobranças de outubro',
+        'cobsv': [
+            {
+                'calendario': {'dataDeVencimento': '2026-10-31'},
+                'txid': f'fatura{indice:020d}',
+                'devedor': {'cpf': '12345678909', 'nome': 'Fulano de Tal'},
+                'valor': {'original': '123.45'},
+                'chave': '7d9f0335-8dcc-4054-9bf9-0dbd61d36906',
+            }
+            for indice in range(quantidade)
+        ],
+    }
+
+
+def contador(nome: str, operacao: str) -> int:
+    tags = json.dumps({'bank': '748', 'operation': operacao}, sort_keys=True)
+    return MetricsCollector().counters[f'{nome}:{tags}']
+
+
+@pytest.fixture(autouse=True)
+def metricas_limpas() -> Iterator[None]:
+    MetricsCollector().clear_metrics()
+    yield
+    MetricsCollector().clear_metrics()
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [{'min_size': -1}, {'level': 0}, {'level': 10}, {'operations': []}],
+)
+def test_politica_invalida(kwargs: dict[str, Any]) -> None:
+    with pytest.raises(ValueError):
+        CompressionPolicy(**kwargs)
+
+
+@pytest.mark.parametrize(
+    ('method', 'operacao', 'esperado'),
+    [
+        ('GET', 'cob.get', True),
+        ('GET', 'lotecobv.get', True),
+        ('GET', 'cob.item.get', False),
+        ('PUT', 'lotecobv.item.put', False),
+    ],
+)
+def test_eh_listagem(method: str, operacao: str, esperado: bool) -> None:
+    assert eh_listagem(method, operacao) is esperado
+
+
+def test_sem_politica_nada_muda() -> None:
+    api = cria_api()
+
+    api.criar_lote_cobv('l1', lote(200))
+
+    chamada = api.session.request.call_args
+    assert 'json' in chamada.kwargs
+    assert 'Content-Encoding' not in chamada.kwargs['headers']
+
+
+def test_lote_grande_vai_comprimido() -> None:
+    api = cria_api(compression=CompressionPolicy(min_size=1024))
+    corpo = lote(200)
+
+    api.criar_lote_cobv('l1', corpo)
+
+    chamada = api.session.request.call_args
+    enviado = chamada.kwargs['data']
+    assert chamada.kwargs['headers']['Content-Encoding'] == 'gzip'
+    assert chamada.kwargs['headers']['Content-Type'] == 'application/json'
+    assert 'json' not in chamada.kwargs
+    assert json.loads(gzip.decompress(enviado)) == corpo
+    original = len(gzip.decompress(enviado))
+    assert len(enviado) < original / 5
+    operacao = 'lotecobv.item.put'
+    assert contador('compression.request.uncompressed_bytes', operacao) == original
+    assert contador('compression.request.compressed_bytes', operacao) == len(enviado)
+
+
+def test_corpo_abaixo_do_limite_vai_sem_compressao() -> None:
+    api = cria_api(compression=CompressionPolicy(min_size=1024))
+
+    api.criar_cob('tx1', {'valor': {'original': '1.00'}})
+
+    chamada = api.session.request.call_args
+    assert 'Content-Encoding' not in chamada.kwargs['headers']
+    assert json.loads(chamada.kwargs['data']) == {'valor': {'original': '1.00'}}
+    assert not MetricsCollector().counters
+
+
+def test_operations_restringe_a_compressao() -> None:
+    api = cria_api(
+        compression=CompressionPolicy(min_size=0, operations={'lotecobv.item.put'})
+    )
+
+    api.alterar_lote_cobv('l1', lote(50))
+    alteracao = api.session.request.call_args
+    api.criar_lote_cobv('l1', lote(50))
+    criacao = api.session.request.call_args
+
+    assert 'Content-Encoding' not in alteracao.kwargs['headers']
+    assert criacao.kwargs['headers']['Content-Encoding'] == 'gzip'
+
+
+def test_corpo_pre_codificado_e_json_codec() -> None:
+    codec = MagicMock()
+    codec.dumps.return_value = b'{"a":1}' * 100
+    codec.loads.side_effect = json.loads
+    api = cria_api(json_codec=codec, compression=CompressionPolicy(min_size=100))
+
+    api.criar_lote_cobv('l1', {'a': 1})
+    por_codec = api.session.request.call_args.kwargs['data']
+    api.criar_cob('tx1', b'{"b":2}' * 100)
+    em_bytes = api.session.request.call_args.kwargs['data']
+
+    assert gzip.decompress(por_codec) == b'{"a":1}' * 100
+    assert gzip.decompress(em_bytes) == b'{"b":2}' * 100
+
+
+def test_repeticao_reenvia_o_mesmo_corpo_comprimido() -> None:
+    api = cria_api(
+        compression=CompressionPolicy(min_size=0),
+        retry=RetryPolicy(max_retries=1, backoff_base=0),
+    )
+    api.session.request.side_effect = [
+        make_response(503, {'status': 503}),
+        make_response(200, {'id': 'l1'}),
+    ]
+
+    api.criar_lote_cobv('l1', lote(5))
+
+    primeira, segunda = api.session.request.call_args_list
+    assert primeira.kwargs['data'] == segunda.kwargs['data']
+    assert contador('compression.request.compressed_bytes', 'lotecobv.item.put') == (
+        len(primeira.kwargs['data'])
+    )
+
+
+def test_listagem_pede_resposta_comprimida_e_mede() -> None:
+    api = cria_api(compression=CompressionPolicy())
+    resposta = make_response(200, {'lotes': [{'id': 'l1'}] * 100})
+    resposta.headers['Content-Encoding'] = 'gzip'
+    resposta.headers['Content-Length'] = '180'
+    api.session.request.return_value = resposta
+
+    api.listar_lotes_cobv('2026-10-01T00:00:00Z', '2026-10-31T00:00:00Z')
+    listagem = api.session.request.call_args
+    api.consultar_lote_cobv('l1')
+    consulta = api.session.request.call_args
+
+    assert listagem.kwargs['headers']['Accept-Encoding'] == 'gzip, deflate'
+    assert 'Accept-Encoding' not in consulta.kwargs['headers']
+    operacao = 'lotecobv.get'
+    assert contador('compression.response.compressed_bytes', operacao) == 180
+    assert contador('compression.response.uncompressed_bytes', operacao) == len(
+        resposta.content
+    )
+    assert not any(
+        'lotecobv.item.get' in chave for chave in MetricsCollector().counters
+    )
+
+
+def test_accept_encoding_none_deixa_o_header_com_o_transporte() -> None:
+    api = cria_api(compression=CompressionPolicy(accept_encoding=None))
+
+    api.consultar_cobs('2026-10-01T00:00:00Z', '2026-10-31T00:00:00Z')
+
+    assert 'Accept-Encoding' not in api.session.request.call_args.kwargs['headers']
+
+
+@contextmanager
+def servidor_gzip(recebidos: list[bytes]) -> Iterator[str]:
+    """Descomprime o corpo recebido e responde comprimido, sem
+    ``Content-Length`` (até fechar a conexão)."""
+    resposta = gzip.compress(json.dumps({'lotes': [{'id': 'l1'}] * 200}).encode())
+
+    class Handler(BaseHTTPRequestHandler):
+        def _responde(self) -> None:
+            corpo = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+            if self.headers.get('Content-Encoding') == 'gzip':
+                corpo = gzip.decompress(corpo)
+            recebidos.append(corpo)
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Encoding', 'gzip')
+            self.end_headers()
+            self.wfile.write(resposta)
+
+        do_GET = do_PUT = _responde
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    servidor = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    servidor.daemon_threads = True
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    try:
+        yield f'http://127.0.0.1:{servidor.server_address[1]}'
+    finally:
+        servidor.shutdown()
+        servidor.server_close()
+
+
+@pytest.mark.parametrize('transport', ['http1', 'urllib3'])
+def test_contra_servidor_local(transport: str) -> None:
+    recebidos: list[bytes] = []
+    with servidor_gzip(recebidos) as url:
+        oauth = OAuth2Client(
+            token_url=f'{url}/token',
+            client_id='c',
+            sandbox_mode=True,
+            transport=transport,
+        )
+        banco = BancoFicticio(
+            oauth=oauth,
+            sandbox_mode=True,
+            base_url=url,
+            compression=CompressionPolicy(min_size=1024),
+        )
+
+        banco.criar_lote_cobv('l1', lote(100))
+        listagem = banco.listar_lotes_cobv(
+            '2026-10-01T00:00:00Z', '2026-10-31T00:00:00Z'
+        )
+
+    assert json.loads(recebidos[0]) == lote(100)
+    assert len(listagem['lotes']) == 200
+    if transport == 'http1':
+        # Sem Content-Length, só o `requests` expõe o que foi lido do socket
+        assert contador(
+            'compression.response.compressed_bytes', 'lotecobv.get'
+        ) < contador('compression.response.uncompressed_bytes', 'lotecobv.get')
+
+
+def test_cliente_assincrono_comprime_em_content() -> None:
+    httpx = pytest.importorskip('httpx')
+    from pypix_api.auth.async_oauth2 import AsyncOAuth2Client
+    from pypix_api.banks.sicoob import AsyncSicoobPixAPI
+
+    recebidos: list[Any] = []
+
+    async def responde(request: Any) -> Any:
+        recebidos.append(request)
+        return httpx.Response(200, json={'id': 'l1'})
+
+    oauth = AsyncOAuth2Client(token_url='https://auth.exemplo/token', sandbox_mode=True)
+    oauth.session = httpx.AsyncClient(transport=httpx.MockTransport(responde))
+    banco = AsyncSicoobPixAPI(
+        oauth=oauth, sandbox_mode=True, compression=CompressionPolicy(min_size=1024)
+    )
+
+    asyncio.run(banco.criar_lote_cobv('l1', lote(100)))
+    asyncio.run(banco.listar_lotes_cobv('2026-10-01T00:00:00Z', '2026-10-31T00:00:00Z'))
+
+    criacao, listagem = recebidos
+    assert criacao.headers['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(criacao.content)) == lote(100)
+    assert listagem.headers['Accept-Encoding'] == 'gzip, deflate'
@@ -0,0 +1,281 @@
+"""Testes do limite adaptativo de requisições simultâneas (``concurrency``)."""
+
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+import requests
+
+from pypix_api.concurrency import AdaptiveConcurrencyLimiter, ConcurrencyPolicy
+from pypix_api.deadline import deadline
+from pypix_api.exceptions import PixTimeoutException
+from pypix_api.metrics import MetricsCollector
+from tests import conftest
+from tests.conftest import BancoFicticio, make_response
+
+
+def cria_api(**kwargs: Any) -> BancoFicticio:
+    return conftest.cria_api(make_response(200, {'ok': True}), **kwargs)
+
+
+def ocupa(limitador: AdaptiveConcurrencyLimiter, vagas: int) -> list[float]:
+    return [limitador.adquire(0) for _ in range(vagas)]
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'min_limit': 0},
+        {'initial_limit': 300},
+        {'min_limit': 20, 'initial_limit': 10},
+        {'backoff': 1.0},
+        {'latency_tolerance': 1.0},
+        {'window_size': 0},
+        {'max_wait': 0},
+    ],
+)
+def test_politica_invalida(kwargs: dict[str, Any]) -> None:
+    with pytest.raises(ValueError):
+        ConcurrencyPolicy(**kwargs)
+
+
+def test_limite_cresce_uma_vaga_por_janela_de_sucessos() -> None:
+    limitador = AdaptiveConcurrencyLimiter(ConcurrencyPolicy(initial_limit=4))
+    fichas = ocupa(limitador, 4)
+
+    # Sempre com o limite tomado: +1/4 quatro vezes, +1/5 cinco vezes, ...
+    for _ in range(4 + 5 + 6 + 3):
+        limitador.libera(fichas.pop(0), 0.1)
+        fichas.append(limitador.adquire(0))
+
+    assert limitador.limit == 7
+
+
+def test_limite_nao_cresce_sem_uso() -> None:
+    limitador = AdaptiveConcurrencyLimiter(ConcurrencyPolicy(initial_limit=10))
+
+    for _ in range(100):
+        limitador.libera(limitador.adquire(), 0.1)
+
+    assert limitador.limit == 10
+
+
+def test_sobrecarga_reduz_uma_vez_por_rajada() -> None:
+    politica = ConcurrencyPolicy(initial_limit=20, backoff=0.5, min_limit=4)
+    limitador = AdaptiveConcurrencyLimiter(politica)
+    fichas = ocupa(limitador, 10)
+
+    # Dez 429 de requisições que já estavam em voo: uma redução só
+    for ficha in fichas:
+        limitador.libera(ficha, 0.1, overloaded=True)
+    assert limitador.limit == 10
+
+    for _ in range(5):
+        limitador.libera(limitador.adquire(), None, overloaded=True)
+    assert limitador.limit == 4
+
+
+def test_latencia_acima_da_tolerancia_conta_como_sobrecarga() -> None:
+    politica = ConcurrencyPolicy(
+        initial_limit=10, latency_tolerance=2.0, window_size=5, backoff=0.5
+    )
+    limitador = AdaptiveConcurrencyLimiter(politica)
+    for _ in range(5):
+        limitador.libera(limitador.adquire(), 0.1)
+
+    limitador.libera(limitador.adquire(), 0.5)
+
+    assert limitador.limit == 5
+
+
+def test_fila_por_ordem_de_chegada_e_vaga_repassada() -> None:
+    limitador = AdaptiveConcurrencyLimiter(ConcurrencyPolicy(initial_limit=1))
+    (ficha,) = ocupa(limitador, 1)
+    ordem: list[int] = []
+
+    def espera(numero: int) -> None:
+        limitador.libera(limitador.adquire(5), None)
+        ordem.append(numero)
+
+    threads = []
+    for numero in range(3):
+        thread = threading.Thread(target=espera, args=(numero,))
+        thread.start()
+        threads.append(thread)
+        while limitador.queued < numero + 1:
+            pass
+    limitador.libera(ficha, None)
+    for thread in threads:
+        thread.join()
+
+    assert ordem == [0, 1, 2]
+    assert limitador.in_flight == 0
+    assert limitador.queued == 0
+
+
+def test_espera_esgotada_sai_da_fila() -> None:
+    limitador = AdaptiveConcurrencyLimiter(ConcurrencyPolicy(initial_limit=1))
+    ocupa(limitador, 1)
+
+    with pytest.raises(TimeoutError):
+        limitador.adquire(0.01)
+
+    assert limitador.queued == 0
+    assert limitador.in_flight == 1
+
+
+def test_limite_e_fila_publicados_como_gauges() -> None:
+    coletor = MetricsCollector()
+    coletor.clear_metrics()
+    limitador = AdaptiveConcurrencyLimiter(
+        ConcurrencyPolicy(initial_limit=2, backoff=0.5), name='756'
+    )
+    fichas = ocupa(limitador, 2)
+    with pytest.raises(TimeoutError):
+        limitador.adquire(0.01)
+
+    limitador.libera(fichas[0], 0.1, overloaded=True)
+
+    assert coletor.gauges['concurrency.limit:{"bank": "756"}'] == 1
+    assert coletor.gauges['concurrency.queue:{"bank": "756"}'] == 0
+
+
+def test_fila_grande_publica_poucos_gauges() -> None:
+    coletor = MetricsCollector()
+    coletor.clear_metrics()
+    limitador = AdaptiveConcurrencyLimiter(
+        ConcurrencyPolicy(initial_limit=1, max_limit=1), name='756'
+    )
+    (ficha,) = ocupa(limitador, 1)
+    esperas = [
+        threading.Thread(target=lambda: limitador.libera(limitador.adquire(5), 0.1))
+        for _ in range(50)
+    ]
+    for espera in esperas:
+        espera.start()
+    while limitador.queued < 50:
+        threading.Event().wait(0.001)
+
+    limitador.libera(ficha, 0.1)
+    for espera in esperas:
+        espera.join(5)
+
+    filas = [m.value for m in coletor.metrics if m.name == 'concurrency.queue']
+    # A fila mudou de tamanho 100 vezes: só o primeiro valor e o esvaziamento
+    assert filas == [1, 0]
+    assert limitador.queued == 0
+
+
+def test_sem_politica_nao_ha_limitador() -> None:
+    api = cria_api()
+
+    api.consultar_cob('tx1')
+
+    assert api.concurrency_limiter is None
+
+
+def test_requisicao_ocupa_e_devolve_a_vaga() -> None:
+    api = cria_api(concurrency=ConcurrencyPolicy(initial_limit=2))
+    limitador = api.concurrency_limiter
+    em_voo: list[int] = []
+
+    def responde(*args: Any, **kwargs: Any) -> Any:
+        em_voo.append(limitador.in_flight)
+        return make_response(200, {'ok': True})
+
+    api.session.request.side_effect = responde
+    api.consultar_cob('tx1')
+
+    assert em_voo == [1]
+    assert limitador.in_flight == 0
+    assert limitador.name == '748'
+
+
+@pytest.mark.parametrize(
+    ('resposta', 'excecao'),
+    [
+        (make_response(429, {'status': 429}), Exception),
+        (make_response(503, {'status': 503}), Exception),
+        (requests.ReadTimeout('lento'), PixTimeoutException),
+    ],
+)
+def test_sinais_de_sobrecarga_reduzem_o_limite(
+    resposta: Any, excecao: type[Exception]
+) -> None:
+    api = cria_api(concurrency=ConcurrencyPolicy(initial_limit=10, backoff=0.5))
+    if isinstance(resposta, Exception):
+        api.session.request.side_effect = resposta
+    else:
+        api.session.request.return_value = resposta
+
+    with pytest.raises(excecao):
+        api.consultar_cob('tx1')
+
+    assert api.concurrency_limiter.limit == 5
+    assert api.concurrency_limiter.in_flight == 0
+
+
+def test_erro_de_conexao_nao_reduz_o_limite() -> None:
+    api = cria_api(concurrency=ConcurrencyPolicy(initial_limit=10))
+    api.session.request.side_effect = requests.ConnectionError('recusada')
+
+    with pytest.raises(Exception, match='recusada'):
+        api.consultar_cob('tx1')
+
+    assert api.concurrency_limiter.limit == 10
+    assert api.concurrency_limiter.in_flight == 0
+
+
+def test_sem_vaga_dentro_do_prazo() -> None:
+    api = cria_api(concurrency=ConcurrencyPolicy(initial_limit=1))
+    ocupa(api.concurrency_limiter, 1)
+
+    with deadline(0.05), pytest.raises(PixTimeoutException, match='Sem vaga'):
+        api.consultar_cob('tx1')
+
+    api.session.request.assert_not_called()
+
+
+def test_max_wait_limita_a_espera() -> None:
+    api = cria_api(concurrency=ConcurrencyPolicy(initial_limit=1, max_wait=0.01))
+    ocupa(api.concurrency_limiter, 1)
+
+    with pytest.raises(PixTimeoutException, match='Sem vaga'):
+        api.consultar_cob('tx1')
+
+    assert api.concurrency_limiter.queued == 0
+    api.session.request.assert_not_called()
+
+
+def test_cliente_assincrono_espera_vaga_sem_bloquear() -> None:
+    httpx = pytest.importorskip('httpx')
+    from pypix_api.auth.async_oauth2 import AsyncOAuth2Client
+    from pypix_api.banks.sicoob import AsyncSicoobPixAPI
+
+    simultaneas = 0
+    pico = 0
+
+    async def responde(request: Any) -> Any:
+        nonlocal simultaneas, pico
+        simultaneas += 1
+        pico = max(pico, simultaneas)
+        await asyncio.sleep(0.01)
+        simultaneas -= 1
+        return httpx.Response(200, json={})
+
+    oauth = AsyncOAuth2Client(token_url='https://auth.exemplo/token', sandbox_mode=True)
+    oauth.session = httpx.AsyncClient(transport=httpx.MockTransport(responde))
+    banco = AsyncSicoobPixAPI(
+        oauth=oauth,
+        sandbox_mode=True,
+        concurrency=ConcurrencyPolicy(initial_limit=3, max_limit=3),
+    )
+
+    async def lote() -> None:
+        await asyncio.gather(*(banco.consultar_cob(f'tx{i}') for i in range(12)))
+
+    asyncio.run(lote())
+
+    assert pico == 3
+    assert banco.concurrency_limiter.in_flight == 0
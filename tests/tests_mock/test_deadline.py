@@ -0,0 +1,215 @@
+"""Testes do prazo de ponta a ponta (``deadline``)."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from pypix_api.auth.oauth2 import OAuth2Client
+from pypix_api.deadline import deadline, limita_timeout, prazo_atual
+from pypix_api.exceptions import PixTimeoutException
+from pypix_api.hedge import HedgePolicy
+from pypix_api.rate_limit import RateLimit, RateLimiter
+from pypix_api.retry import RetryPolicy
+from tests.conftest import BancoFicticio, Relogio, make_response
+
+pytestmark = pytest.mark.relogio('pypix_api.deadline')
+
+
+@pytest.fixture
+def esperas(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    registradas: list[float] = []
+    falso = SimpleNamespace(sleep=registradas.append, perf_counter=time.perf_counter)
+    monkeypatch.setattr('pypix_api.banks.base.time', falso)
+    return registradas
+
+
+def cria_api(**kwargs: Any) -> BancoFicticio:
+    oauth = OAuth2Client(
+        token_url=BancoFicticio.TOKEN_URL, client_id='c', sandbox_mode=True
+    )
+    oauth.session = MagicMock()
+    oauth.session.post.return_value = make_response(
+        200, {'access_token': 'tok', 'expires_in': 3600}
+    )
+    oauth.session.request.return_value = make_response(200, {'ok': True})
+    return BancoFicticio(oauth=oauth, **kwargs)
+
+
+def timeout_enviado(api: BancoFicticio) -> Any:
+    return api.session.request.call_args.kwargs['timeout']
+
+
+def test_prazo_aninhado_so_encurta(relogio: Relogio) -> None:
+    with deadline(5.0) as externo:
+        with deadline(10.0) as interno:
+            assert interno is externo
+        with deadline(1.0) as curto:
+            assert curto.restante() == 1.0
+        assert prazo_atual() is externo
+    assert prazo_atual() is None
+
+
+def test_prazo_precisa_ser_positivo() -> None:
+    with pytest.raises(ValueError, match='positivo'):
+        with deadline(0):
+            pass
+    with pytest.raises(ValueError, match='deadline'):
+        cria_api(deadline=-1)
+
+
+def test_timeout_e_reduzido_ao_restante(relogio: Relogio) -> None:
+    assert limita_timeout((5.0, 30.0), 'x') == (5.0, 30.0)
+
+    with deadline(10.0):
+        relogio.agora += 8
+        assert limita_timeout((5.0, 30.0), 'x') == (2.0, 2.0)
+        assert limita_timeout((5.0, None), 'x') == (2.0, 2.0)
+        assert limita_timeout(1.0, 'x') == 1.0
+        relogio.agora += 2
+        with pytest.raises(PixTimeoutException, match=r'Prazo de 10\.0s'):
+            limita_timeout(1.0, 'x')
+
+
+def test_sem_prazo_o_timeout_nao_muda() -> None:
+    api = cria_api()
+
+    api.consultar_cob('tx1')
+
+    assert timeout_enviado(api) == api.timeout
+
+
+def test_token_e_requisicao_dividem_o_prazo(relogio: Relogio) -> None:
+    api = cria_api(deadline=10.0)
+
+    def token_lento(*args: Any, **kwargs: Any) -> Any:
+        assert kwargs['timeout'] == (5.0, 10.0)
+        relogio.agora += 7
+        return make_response(200, {'access_token': 'tok', 'expires_in': 3600})
+
+    api.oauth.session.post.side_effect = token_lento
+
+    api.consultar_cob('tx1')
+
+    assert timeout_enviado(api) == (3.0, 3.0)
+
+
+def test_prazo_gasto_no_token_nao_envia_a_requisicao(relogio: Relogio) -> None:
+    api = cria_api(deadline=5.0)
+
+    def token_lento(*args: Any, **kwargs: Any) -> Any:
+        relogio.agora += 5
+        return make_response(200, {'access_token': 'tok', 'expires_in': 3600})
+
+    api.oauth.session.post.side_effect = token_lento
+
+    with pytest.raises(PixTimeoutException, match='GET https://banco'):
+        api.consultar_cob('tx1')
+    api.session.request.assert_not_called()
+
+
+def test_repeticao_que_nao_cabe_no_prazo_nao_e_feita(
+    relogio: Relogio, esperas: list[float]
+) -> None:
+    api = cria_api(deadline=3.0, retry=RetryPolicy(max_retries=3))
+    resposta = make_response(503, {'status': 503})
+    resposta.headers['Retry-After'] = '5'
+    api.session.request.return_value = resposta
+
+    with pytest.raises(Exception, match='503'):
+        api.consultar_cob('tx1')
+
+    assert api.session.request.call_count == 1
+    assert esperas == []
+    # O orçamento não foi gasto numa repetição que não aconteceu
+    assert api._orcamento_retry.saldo == pytest.approx(api.retry.budget_max)
+
+
+def test_repeticoes_param_quando_o_prazo_acaba(
+    relogio: Relogio, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def dorme(segundos: float) -> None:
+        relogio.agora += segundos
+
+    monkeypatch.setattr(
+        'pypix_api.banks.base.time',
+        SimpleNamespace(sleep=dorme, perf_counter=time.perf_counter),
+    )
+    api = cria_api(deadline=2.5, retry=RetryPolicy(max_retries=10))
+    resposta = make_response(503, {'status': 503})
+    resposta.headers['Retry-After'] = '1'
+    api.session.request.return_value = resposta
+
+    with pytest.raises(Exception, match='503'):
+        api.consultar_cob('tx1')
+
+    # Em t=0 e t=1; a de t=2 deixaria a próxima espera para depois do prazo
+    assert api.session.request.call_count == 3
+
+
+def test_vez_no_limitador_alem_do_prazo(relogio: Relogio) -> None:
+    limitador = RateLimiter({('748', 'cob'): RateLimit(rate=0.1, burst=1)})
+    api = cria_api(deadline=2.0, rate_limiter=limitador)
+    api.consultar_cob('tx1')
+
+    with pytest.raises(PixTimeoutException, match='vez de GET'):
+        api.consultar_cob('tx1')
+    assert api.session.request.call_count == 1
+    # A vaga não usada volta para o balde
+    assert limitador.balde('748', 'cob')._fichas == pytest.approx(0, abs=0.01)
+
+
+def test_consulta_coalescida_respeita_o_prazo() -> None:
+    api = cria_api(single_flight=True)
+    liberada = threading.Event()
+    chegou = threading.Event()
+
+    def lenta(*args: Any, **kwargs: Any) -> Any:
+        chegou.set()
+        liberada.wait(5)
+        return make_response(200, {'ok': True})
+
+    api.session.request.side_effect = lenta
+    lider = threading.Thread(target=api.consultar_cob, args=('tx1',))
+    lider.start()
+    chegou.wait(5)
+    try:
+        with deadline(0.05), pytest.raises(PixTimeoutException, match='idêntica'):
+            api.consultar_cob('tx1')
+    finally:
+        liberada.set()
+        lider.join()
+
+
+def test_prazo_acompanha_a_consulta_no_executor_do_hedge(relogio: Relogio) -> None:
+    api = cria_api(hedge=HedgePolicy(delay=5.0))
+
+    with deadline(2.0):
+        api.consultar_cob('tx1')
+
+    assert timeout_enviado(api) == (2.0, 2.0)
+
+
+def test_cliente_assincrono_reduz_o_timeout() -> None:
+    httpx = pytest.importorskip('httpx')
+    from pypix_api.auth.async_oauth2 import AsyncOAuth2Client
+    from pypix_api.banks.sicoob import AsyncSicoobPixAPI
+
+    recebidos: list[dict[str, float]] = []
+
+    def responde(request: Any) -> Any:
+        recebidos.append(request.extensions['timeout'])
+        return httpx.Response(200, json={})
+
+    oauth = AsyncOAuth2Client(token_url='https://auth.exemplo/token', sandbox_mode=True)
+    oauth.session = httpx.AsyncClient(transport=httpx.MockTransport(responde))
+    banco = AsyncSicoobPixAPI(oauth=oauth, sandbox_mode=True, deadline=1.0)
+
+    asyncio.run(banco.consultar_cob('tx1'))
+
+    assert recebidos[0]['connect'] <= 1.0
+    assert recebidos[0]['read'] <= 1.0
@@ -0,0 +1,215 @@
+"""Testes das consultas duplicadas (``hedge=HedgePolicy(...)``)."""
+
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+import requests
+
+from pypix_api.exceptions import PixTimeoutException
+from pypix_api.hedge import HedgePolicy, Hedger
+from tests import conftest
+from tests.conftest import BancoFicticio, make_response
+
+
+@pytest.fixture
+def liberada() -> Any:
+    """Evento que destrava as respostas lentas ao fim do teste."""
+    evento = threading.Event()
+    yield evento
+    evento.set()
+
+
+def cria_api(hedge: HedgePolicy, respostas: list[Any]) -> BancoFicticio:
+    """Banco cuja sessão devolve ``respostas`` em ordem, uma por requisição.
+
+    Um ``threading.Event`` na lista bloqueia a requisição até ser liberado e
+    então devolve um 200 com ``{'lenta': True}``.
+    """
+    fila = iter(respostas)
+    lock = threading.Lock()
+
+    def request(*args: Any, **kwargs: Any) -> Any:
+        with lock:
+            resposta = next(fila)
+        if isinstance(resposta, threading.Event):
+            resposta.wait(5)
+            return make_response(200, {'lenta': True})
+        if isinstance(resposta, Exception):
+            raise resposta
+        return resposta
+
+    api = conftest.cria_api(hedge=hedge)
+    api.session.request.side_effect = request
+    return api
+
+
+def test_original_lenta_perde_para_a_copia(liberada: threading.Event) -> None:
+    api = cria_api(
+        HedgePolicy(delay=0.01), [liberada, make_response(200, {'copia': True})]
+    )
+
+    assert api.consultar_cob('tx1') == {'copia': True}
+    assert api.session.request.call_count == 2
+
+
+def test_original_rapida_nao_e_duplicada() -> None:
+    api = cria_api(HedgePolicy(delay=1.0), [make_response(200, {'txid': 'tx1'})])
+
+    assert api.consultar_cob('tx1') == {'txid': 'tx1'}
+    assert api.session.request.call_count == 1
+
+
+def test_sem_amostras_suficientes_nao_duplica() -> None:
+    api = cria_api(HedgePolicy(min_samples=5), [make_response(200, {})] * 3)
+
+    for _ in range(3):
+        api.consultar_cob('tx1')
+
+    assert api._hedger.atraso('cob') is None
+    assert api.session.request.call_count == 3
+
+
+def test_so_get_e_duplicado() -> None:
+    api = cria_api(HedgePolicy(delay=0), [make_response(201, {'txid': 'tx1'})])
+
+    api.criar_cob_auto_txid({'valor': {'original': '1.00'}})
+
+    assert api.session.request.call_count == 1
+
+
+def test_teto_de_copias(liberada: threading.Event) -> None:
+    lenta = threading.Event()
+    api = cria_api(
+        HedgePolicy(delay=0.01, max_hedge_ratio=0),
+        [lenta, make_response(200, {'copia': True}), lenta],
+    )
+
+    assert api.consultar_cob('tx1') == {'copia': True}
+    # Saldo esgotado: a segunda consulta espera a original
+    threading.Timer(0.05, lenta.set).start()
+    assert api.consultar_cob('tx1') == {'lenta': True}
+    assert api.session.request.call_count == 3
+
+
+def test_copia_que_falha_nao_derruba_a_original() -> None:
+    lenta = threading.Event()
+    api = cria_api(HedgePolicy(delay=0.01), [lenta, requests.Timeout('lento')])
+    threading.Timer(0.05, lenta.set).start()
+
+    assert api.consultar_cob('tx1') == {'lenta': True}
+
+
+def test_as_duas_falham_levanta_a_falha_da_original() -> None:
+    api = cria_api(
+        HedgePolicy(delay=0),
+        [requests.Timeout('original'), requests.ConnectionError('copia')],
+    )
+
+    with pytest.raises(PixTimeoutException, match='original'):
+        api.consultar_cob('tx1')
+
+
+def test_sem_thread_livre_a_consulta_vai_pela_thread_de_quem_chama(
+    liberada: threading.Event,
+) -> None:
+    api = cria_api(
+        HedgePolicy(delay=0, max_workers=2), [make_response(200, {'txid': 'tx1'})]
+    )
+    threads: list[threading.Thread] = []
+    responde = api.session.request.side_effect
+
+    def request(*args: Any, **kwargs: Any) -> Any:
+        threads.append(threading.current_thread())
+        return responde(*args, **kwargs)
+
+    api.session.request.side_effect = request
+    executor = api._executor_hedge
+    for _ in range(2):
+        assert executor.envia(liberada.wait, 5) is not None
+
+    assert api.consultar_cob('tx1') == {'txid': 'tx1'}
+    # Nada esperou em fila e nenhuma cópia saiu
+    assert threads == [threading.current_thread()]
+    assert executor.envia(liberada.wait, 5) is None
+
+
+def test_sem_thread_livre_a_copia_nao_sai_nem_gasta_o_saldo(
+    liberada: threading.Event,
+) -> None:
+    lenta = threading.Event()
+    api = cria_api(
+        HedgePolicy(delay=0.01, max_workers=2),
+        [lenta, make_response(200, {'copia': True})],
+    )
+    api._executor_hedge.envia(liberada.wait, 5)
+    saldo = api._hedger._saldo
+    threading.Timer(0.05, lenta.set).start()
+
+    assert api.consultar_cob('tx1') == {'lenta': True}
+    assert api.session.request.call_count == 1
+    assert api._hedger._saldo == pytest.approx(saldo + 0.05)
+
+
+def test_atraso_e_o_percentil_das_latencias() -> None:
+    hedger = Hedger(HedgePolicy(min_samples=10))
+    for latencia in range(1, 101):
+        hedger.observa('cob', latencia / 100)
+
+    assert hedger.atraso('cob') == pytest.approx(0.96)
+    assert hedger.atraso('pix') is None
+
+
+def test_saldo_de_copias_e_reposto_pelas_consultas() -> None:
+    hedger = Hedger(HedgePolicy(delay=0, max_hedge_ratio=0.5, budget_max=1))
+
+    hedger.atraso('cob')
+    assert hedger.pode_duplicar()
+    assert not hedger.pode_duplicar()
+    hedger.atraso('cob')
+    hedger.atraso('cob')
+    assert hedger.pode_duplicar()
+
+
+def test_politica_invalida() -> None:
+    with pytest.raises(ValueError, match='percentile'):
+        HedgePolicy(percentile=1)
+    with pytest.raises(ValueError, match='min_samples'):
+        HedgePolicy(min_samples=0)
+
+
+def test_cliente_assincrono_cancela_a_perdedora() -> None:
+    httpx = pytest.importorskip('httpx')
+    from pypix_api.auth.async_oauth2 import AsyncOAuth2Client
+    from pypix_api.banks.sicoob import AsyncSicoobPixAPI
+
+    canceladas: list[str] = []
+    chamadas = 0
+
+    async def handler(request: Any) -> Any:
+        nonlocal chamadas
+        chamadas += 1
+        if chamadas == 1:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                canceladas.append('original')
+                raise
+        return httpx.Response(200, json={'chamada': chamadas})
+
+    oauth = AsyncOAuth2Client(token_url='https://auth.exemplo/token', sandbox_mode=True)
+    oauth.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    banco = AsyncSicoobPixAPI(
+        oauth=oauth, sandbox_mode=True, hedge=HedgePolicy(delay=0.01)
+    )
+
+    async def cenario() -> Any:
+        resultado = await banco.consultar_cob('tx1')
+        await asyncio.sleep(0)
+        return resultado
+
+    assert asyncio.run(cenario()) == {'chamada': 2}
+    assert canceladas == ['original']
+    # O hedge assíncrono não usa threads
+    assert banco._executor_hedge is None
@@ -0,0 +1,112 @@
+"""Testes do transporte HTTP/2 (``Http2Session``) e da opção ``transport``."""
+
+import json
+from typing import Any
+
+import pytest
+import requests
+
+httpx = pytest.importorskip('httpx')
+pytest.importorskip('h2')
+
+from pypix_api.auth.oauth2 import OAuth2Client  # noqa: E402
+from pypix_api.banks.sicoob import SicoobPixAPI  # noqa: E402
+from pypix_api.exceptions import (  # noqa: E402
+    PixConexaoException,
+    PixRecursoNaoEncontradoException,
+    PixTimeoutException,
+)
+from pypix_api.http2 import Http2Session  # noqa: E402
+
+TOKEN_URL = 'https://auth.exemplo/token'
+
+
+def sessao(handler: Any) -> Http2Session:
+    return Http2Session(client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+
+def cria_banco(handler: Any) -> SicoobPixAPI:
+    oauth = OAuth2Client(
+        token_url=TOKEN_URL, client_id='client', sandbox_mode=True, transport='h2'
+    )
+    oauth.session = sessao(handler)
+    return SicoobPixAPI(oauth=oauth, sandbox_mode=True)
+
+
+def test_oauth2client_com_transport_h2_usa_http2session() -> None:
+    oauth = OAuth2Client(
+        token_url=TOKEN_URL, client_id='client', sandbox_mode=True, transport='h2'
+    )
+
+    assert isinstance(oauth.session, Http2Session)
+    assert oauth.transport == 'h2'
+
+
+def test_transport_desconhecido_levanta_value_error() -> None:
+    with pytest.raises(ValueError, match='Transporte desconhecido'):
+        OAuth2Client(token_url=TOKEN_URL, sandbox_mode=True, transport='h3')
+
+
+def test_resposta_chega_como_requests_response() -> None:
+    banco = cria_banco(lambda request: httpx.Response(200, json={'txid': 'tx1'}))
+
+    assert banco.consultar_cob('tx1') == {'txid': 'tx1'}
+
+
+def test_request_repassa_params_corpo_e_headers() -> None:
+    recebidas: list[Any] = []
+
+    def handler(request: Any) -> Any:
+        recebidas.append(request)
+        return httpx.Response(201, json={})
+
+    banco = cria_banco(handler)
+    banco.criar_cob('tx1', {'valor': {'original': '1.00'}})
+    banco.consultar_cob('tx1', revisao=3)
+
+    assert json.loads(recebidas[0].content) == {'valor': {'original': '1.00'}}
+    assert recebidas[0].headers['Authorization'].startswith('Bearer ')
+    assert recebidas[1].url.params['revisao'] == '3'
+
+
+def test_erro_do_psp_tem_o_mesmo_mapeamento() -> None:
+    banco = cria_banco(
+        lambda request: httpx.Response(
+            404, json={'title': 'Não encontrada', 'detail': 'cobrança inexistente'}
+        )
+    )
+
+    with pytest.raises(PixRecursoNaoEncontradoException, match='inexistente'):
+        banco.consultar_cob('tx1')
+
+
+def test_timeout_vira_requests_timeout_e_excecao_da_biblioteca() -> None:
+    def handler(request: Any) -> Any:
+        raise httpx.ReadTimeout('lento', request=request)
+
+    with pytest.raises(requests.Timeout):
+        sessao(handler).request('GET', 'https://psp.exemplo/cob')
+    with pytest.raises(PixTimeoutException):
+        cria_banco(handler).consultar_cob('tx1')
+
+
+def test_falha_de_conexao_vira_pix_conexao() -> None:
+    def handler(request: Any) -> Any:
+        raise httpx.ConnectError('recusada', request=request)
+
+    with pytest.raises(PixConexaoException, match='recusada'):
+        cria_banco(handler).consultar_cob('tx1')
+
+
+def test_post_de_token_descarta_campos_none() -> None:
+    recebidas: list[Any] = []
+
+    def handler(request: Any) -> Any:
+        recebidas.append(request)
+        return httpx.Response(200, json={})
+
+    sessao(handler).post(
+        TOKEN_URL, data={'grant_type': 'client_credentials', 'client_id': None}
+    )
+
+    assert recebidas[0].content == b'grant_type=client_credentials'
@@ -0,0 +1,252 @@
+"""Testes da cadeia de interceptadores (``interceptors``)."""
+
+import asyncio
+import logging
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from pypix_api.exceptions import PixRecursoNaoEncontradoException
+from pypix_api.interceptors import (
+    Interceptor,
+    LoggingInterceptor,
+    MetricsInterceptor,
+    RequestCall,
+    TimingInterceptor,
+)
+from pypix_api.metrics import MetricsCollector
+from tests import conftest
+from tests.conftest import BancoFicticio, make_response
+
+
+def cria_api(**kwargs: Any) -> BancoFicticio:
+    return conftest.cria_api(make_response(200, {'txid': 'tx1'}), **kwargs)
+
+
+class Registro(Interceptor):
+    def __init__(self, nome: str, eventos: list[str]) -> None:
+        self.nome = nome
+        self.eventos = eventos
+
+    def before(self, call: RequestCall) -> None:
+        self.eventos.append(f'{self.nome}.before')
+
+    def after(self, call: RequestCall, response: requests.Response) -> None:
+        self.eventos.append(f'{self.nome}.after')
+
+    def on_exception(self, call: RequestCall, exc: Exception) -> None:
+        self.eventos.append(f'{self.nome}.{type(exc).__name__}')
+
+
+class Cache(Interceptor):
+    def __init__(self) -> None:
+        self.respostas: dict[str, requests.Response] = {}
+
+    def intercept(self, call: RequestCall, call_next: Any) -> requests.Response:
+        if call.path not in self.respostas:
+            self.respostas[call.path] = call_next(call)
+        return self.respostas[call.path]
+
+
+class RepeteUmaVez(Interceptor):
+    def intercept(self, call: RequestCall, call_next: Any) -> requests.Response:
+        try:
+            return call_next(call)
+        except PixRecursoNaoEncontradoException:
+            return call_next(call)
+
+
+def test_ordem_da_cadeia() -> None:
+    eventos: list[str] = []
+    api = cria_api(interceptors=[Registro('a', eventos), Registro('b', eventos)])
+
+    assert api.consultar_cob('tx1') == {'txid': 'tx1'}
+
+    assert eventos == ['a.before', 'b.before', 'b.after', 'a.after']
+
+
+def test_excecao_passa_pelos_ganchos() -> None:
+    eventos: list[str] = []
+    api = cria_api(interceptors=[Registro('a', eventos), Registro('b', eventos)])
+    api.session.request.return_value = make_response(404, {'status': 404})
+
+    with pytest.raises(PixRecursoNaoEncontradoException):
+        api.consultar_cob('tx1')
+
+    assert eventos == [
+        'a.before',
+        'b.before',
+        'b.PixRecursoNaoEncontradoException',
+        'a.PixRecursoNaoEncontradoException',
+    ]
+
+
+def test_interceptador_responde_sem_chamar_o_psp() -> None:
+    api = cria_api(interceptors=[Cache()])
+
+    api.consultar_cob('tx1')
+    api.consultar_cob('tx1')
+
+    api.session.request.assert_called_once()
+
+
+def test_interceptador_repete_a_chamada() -> None:
+    api = cria_api(interceptors=[RepeteUmaVez()])
+    api.session.request.side_effect = [
+        make_response(404, {'status': 404}),
+        make_response(200, {'txid': 'tx1'}),
+    ]
+
+    assert api.consultar_cob('tx1') == {'txid': 'tx1'}
+    assert api.session.request.call_count == 2
+
+
+def test_interceptador_altera_headers_e_kwargs() -> None:
+    class Enriquece(Interceptor):
+        def before(self, call: RequestCall) -> None:
+            call.extra_headers = {'X-Correlation-Id': 'abc'}
+            call.kwargs['params'] = {'revisao': 2}
+
+    api = cria_api(interceptors=[Enriquece()])
+
+    api.consultar_cob('tx1')
+
+    enviado = api.session.request.call_args.kwargs
+    assert enviado['headers']['X-Correlation-Id'] == 'abc'
+    assert enviado['params'] == {'revisao': 2}
+
+
+def test_header_de_autenticacao_continua_proibido() -> None:
+    class Sequestra(Interceptor):
+        def before(self, call: RequestCall) -> None:
+            call.extra_headers = {'Authorization': 'Bearer outro'}
+
+    api = cria_api(interceptors=[Sequestra()])
+
+    with pytest.raises(ValueError, match='Authorization'):
+        api.consultar_cob('tx1')
+    api.session.request.assert_not_called()
+
+
+def test_chamada_descreve_a_operacao() -> None:
+    chamadas: list[RequestCall] = []
+    api = cria_api(interceptors=[TimingInterceptor(chamadas.append)])
+
+    api.consultar_cob('tx1')
+
+    (call,) = chamadas
+    assert call.method == 'GET'
+    assert call.path == '/cob/tx1'
+    assert call.operation == api.operacao('GET', '/cob/tx1')
+    assert call.bank == '748'
+    assert call.elapsed is not None
+    assert call.elapsed >= 0
+
+
+def test_sem_interceptadores_nao_monta_chamada(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    api = cria_api()
+    monkeypatch.setattr(api, '_chamada', MagicMock(side_effect=AssertionError))
+
+    api.consultar_cob('tx1')
+
+    assert api.interceptors == ()
+    assert api._cadeia is None
+
+
+def test_logging_interceptor(caplog: pytest.LogCaptureFixture) -> None:
+    logger = logging.getLogger('teste.interceptors')
+    api = cria_api(
+        interceptors=[LoggingInterceptor(logger, level=logging.INFO)],
+        sandbox_mode=True,
+    )
+
+    with caplog.at_level(logging.INFO, logger='teste.interceptors'):
+        api.consultar_cob('tx1')
+        api.session.request.return_value = make_response(404, {'status': 404})
+        with pytest.raises(PixRecursoNaoEncontradoException):
+            api.consultar_cob('tx1')
+
+    sucesso, falha = caplog.records
+    assert sucesso.levelno == logging.INFO
+    assert 'GET /cob/tx1' in sucesso.getMessage()
+    assert '-> 200' in sucesso.getMessage()
+    assert falha.levelno == logging.WARNING
+    assert 'PixRecursoNaoEncontradoException' in falha.getMessage()
+    assert 'token' not in sucesso.getMessage().lower()
+
+
+def test_logging_interceptor_destaca_chamada_lenta(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    logger = logging.getLogger('teste.interceptors')
+    api = cria_api(interceptors=[LoggingInterceptor(logger, slow_threshold=0.0)])
+
+    with caplog.at_level(logging.WARNING, logger='teste.interceptors'):
+        api.consultar_cob('tx1')
+
+    (registro,) = caplog.records
+    assert '(lenta)' in registro.getMessage()
+
+
+def test_metrics_interceptor() -> None:
+    coletor = MetricsCollector()
+    coletor.clear_metrics()
+    api = cria_api(interceptors=[MetricsInterceptor()])
+
+    api.consultar_cob('tx1')
+    api.session.request.return_value = make_response(404, {'status': 404})
+    with pytest.raises(PixRecursoNaoEncontradoException):
+        api.consultar_cob('tx1')
+
+    sucesso, falha = coletor.api_calls
+    assert sucesso.endpoint == api.operacao('GET', '/cob/tx1')
+    assert sucesso.status_code == 200
+    assert sucesso.bank == '748'
+    assert sucesso.error is None
+    assert falha.status_code == 404
+    assert falha.error == 'PixRecursoNaoEncontradoException'
+
+
+def test_cliente_assincrono() -> None:
+    httpx = pytest.importorskip('httpx')
+    from pypix_api.auth.async_oauth2 import AsyncOAuth2Client
+    from pypix_api.banks.sicoob import AsyncSicoobPixAPI
+
+    eventos: list[str] = []
+    enviadas = 0
+
+    async def responde(request: Any) -> Any:
+        nonlocal enviadas
+        enviadas += 1
+        return httpx.Response(200, json={'txid': 'tx1'})
+
+    oauth = AsyncOAuth2Client(token_url='https://auth.exemplo/token', sandbox_mode=True)
+    oauth.session = httpx.AsyncClient(transport=httpx.MockTransport(responde))
+
+    class CacheAsync(Cache):
+        async def intercept_async(
+            self, call: RequestCall, call_next: Any
+        ) -> requests.Response:
+            if call.path not in self.respostas:
+                self.respostas[call.path] = await call_next(call)
+            return self.respostas[call.path]
+
+    banco = AsyncSicoobPixAPI(
+        oauth=oauth,
+        sandbox_mode=True,
+        interceptors=[Registro('a', eventos), CacheAsync()],
+    )
+
+    async def duas() -> None:
+        assert await banco.consultar_cob('tx1') == {'txid': 'tx1'}
+        assert await banco.consultar_cob('tx1') == {'txid': 'tx1'}
+        await oauth.aclose()
+
+    asyncio.run(duas())
+
+    assert eventos == ['a.before', 'a.after'] * 2
+    assert enviadas == 1
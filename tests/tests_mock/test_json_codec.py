@@ -0,0 +1,120 @@
+"""Testes do codec JSON plugável (``json_codec=``)."""
+
+import asyncio
+import sys
+from typing import Any
+
+import pytest
+
+from pypix_api.exceptions import PixErroServidorException
+from pypix_api.json_codec import (
+    MsgspecCodec,
+    OrjsonCodec,
+    StdlibJsonCodec,
+    detecta_codec,
+    resolve_codec,
+)
+from tests.conftest import cria_api, make_response
+
+CORPO = {'calendario': {'expiracao': 3600}, 'valor': {'original': '1.00'}, 'x': 'ç'}
+
+
+class CodecContado(StdlibJsonCodec):
+    def __init__(self) -> None:
+        self.decodificados = 0
+
+    def loads(self, dados: bytes) -> Any:
+        self.decodificados += 1
+        return super().loads(dados)
+
+
+def test_corpo_sai_compacto_em_bytes() -> None:
+    api = cria_api(json_codec='json')
+    api.session.request.return_value = make_response(201, {'txid': 'tx1'})
+
+    api.criar_cob('tx1', CORPO)
+
+    kwargs = api.session.request.call_args.kwargs
+    assert 'json' not in kwargs
+    esperado = '{"calendario":{"expiracao":3600},"valor":{"original":"1.00"},"x":"ç"}'
+    assert kwargs['data'] == esperado.encode()
+    assert kwargs['headers']['Content-Type'] == 'application/json'
+
+
+def test_sem_codec_o_json_fica_com_o_requests() -> None:
+    api = cria_api(json_codec=None)
+    api.session.request.return_value = make_response(201, {'txid': 'tx1'})
+
+    api.criar_cob('tx1', CORPO)
+
+    assert api.session.request.call_args.kwargs['json'] == CORPO
+
+
+def test_resposta_e_decodificada_pelo_codec() -> None:
+    codec = CodecContado()
+    api = cria_api(json_codec=codec)
+    api.session.request.return_value = make_response(200, {'txid': 'tx1'})
+
+    assert api.consultar_cob('tx1') == {'txid': 'tx1'}
+    assert codec.decodificados == 1
+
+
+@pytest.mark.parametrize('corpo', [b'<html>erro</html>', b'null', b'[1, 2]'])
+def test_corpo_de_erro_malformado_continua_tolerado(corpo: bytes) -> None:
+    api = cria_api(json_codec='json')
+    api.session.request.return_value = make_response(500, content=corpo)
+
+    with pytest.raises(PixErroServidorException) as exc_info:
+        api.consultar_cob('tx1')
+    assert exc_info.value.status == 500
+
+
+def test_nome_desconhecido() -> None:
+    with pytest.raises(ValueError, match='Codec JSON desconhecido'):
+        resolve_codec('simdjson')
+
+
+def test_auto_cai_no_json_da_biblioteca_padrao(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, 'orjson', None)
+    monkeypatch.setitem(sys.modules, 'msgspec', None)
+
+    assert isinstance(detecta_codec(), StdlibJsonCodec)
+    assert isinstance(resolve_codec('auto'), StdlibJsonCodec)
+
+
+@pytest.mark.parametrize(
+    ('classe', 'modulo'),
+    [(StdlibJsonCodec, None), (OrjsonCodec, 'orjson'), (MsgspecCodec, 'msgspec')],
+)
+def test_codecs_sao_equivalentes(classe: type, modulo: str | None) -> None:
+    if modulo is not None:
+        pytest.importorskip(modulo)
+    codec = classe()
+
+    dados = codec.dumps(CORPO)
+
+    assert b' ' not in dados
+    assert codec.loads(dados) == CORPO
+    with pytest.raises(ValueError):
+        codec.loads(b'{"incompleto":')
+
+
+def test_cliente_assincrono_envia_o_corpo_codificado() -> None:
+    httpx = pytest.importorskip('httpx')
+    from pypix_api.auth.async_oauth2 import AsyncOAuth2Client
+    from pypix_api.banks.sicoob import AsyncSicoobPixAPI
+
+    recebidos: list[bytes] = []
+
+    def handler(request: Any) -> Any:
+        recebidos.append(request.content)
+        return httpx.Response(201, json={'txid': 'tx1'})
+
+    oauth = AsyncOAuth2Client(token_url='https://auth.exemplo/token', sandbox_mode=True)
+    oauth.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    banco = AsyncSicoobPixAPI(oauth=oauth, sandbox_mode=True, json_codec='json')
+
+    assert asyncio.run(banco.criar_cob('tx1', {'valor': {'original': '1.00'}})) == {
+        'txid': 'tx1'
+    }
+    assert recebidos == [b'{"valor":{"original":"1.00"}}']
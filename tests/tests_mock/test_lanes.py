@@ -0,0 +1,179 @@
+"""Testes das faixas de tráfego (``priority``)."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from pypix_api.auth.oauth2 import OAuth2Client
+from pypix_api.concurrency import ConcurrencyPolicy
+from pypix_api.lanes import BULK, CRITICAL, TOKEN
+from pypix_api.metrics import MetricsCollector
+from pypix_api.pool import PoolConfig
+from tests.benchmarks.servidores import servidor_http1
+from tests.conftest import BancoFicticio, make_response
+
+
+def cria_oauth() -> OAuth2Client:
+    return OAuth2Client(
+        token_url=BancoFicticio.TOKEN_URL, client_id='c', sandbox_mode=True
+    )
+
+
+@pytest.mark.parametrize('priority', ['', TOKEN])
+def test_faixa_invalida(priority: str) -> None:
+    with pytest.raises(ValueError, match=r'priority|token'):
+        BancoFicticio(oauth=cria_oauth(), priority=priority)
+
+
+def test_cada_faixa_tem_a_sua_sessao() -> None:
+    oauth = cria_oauth()
+
+    compartilhado = BancoFicticio(oauth=oauth)
+    checkout = BancoFicticio(oauth=oauth, priority=CRITICAL)
+    relatorio = BancoFicticio(oauth=oauth, priority=BULK)
+    outro_relatorio = BancoFicticio(oauth=oauth, priority=BULK)
+
+    assert compartilhado.session is oauth.session
+    assert checkout.session is not oauth.session
+    assert relatorio.session is not checkout.session
+    assert outro_relatorio.session is relatorio.session
+    sessoes = {id(oauth.session), id(checkout.session), id(relatorio.session)}
+    assert id(oauth.token_session) not in sessoes
+
+
+def test_threads_pedindo_a_mesma_faixa_recebem_uma_so_sessao() -> None:
+    oauth = cria_oauth()
+    criadas: list[Any] = []
+    nova_sessao = oauth._nova_sessao
+
+    def nova_sessao_lenta(pool: Any) -> Any:
+        time.sleep(0.01)
+        criadas.append(nova_sessao(pool))
+        return criadas[-1]
+
+    oauth._nova_sessao = nova_sessao_lenta
+    largada = threading.Barrier(8)
+
+    def pede() -> Any:
+        largada.wait()
+        return oauth.lane_session(BULK)
+
+    with ThreadPoolExecutor(8) as executor:
+        sessoes = list(executor.map(lambda _: pede(), range(8)))
+
+    # Uma da faixa e uma de token; nenhuma aberta e descartada
+    assert len(criadas) == 2
+    assert {id(sessao) for sessao in sessoes} == {id(oauth.lane_session(BULK))}
+
+
+def test_sem_faixas_o_token_usa_a_sessao_compartilhada() -> None:
+    oauth = cria_oauth()
+    BancoFicticio(oauth=oauth)
+
+    assert oauth.token_session is oauth.session
+
+
+def test_pool_configura_so_a_faixa() -> None:
+    oauth = cria_oauth()
+
+    relatorio = BancoFicticio(
+        oauth=oauth, priority=BULK, pool=PoolConfig(pool_maxsize=3, pool_block=True)
+    )
+
+    adapter = relatorio.session.get_adapter('https://banco.exemplo')
+    assert adapter._pool_maxsize == 3
+    assert adapter._pool_block is True
+    compartilhado = oauth.session.get_adapter('https://banco.exemplo')
+    assert compartilhado._pool_maxsize == 10
+
+
+def test_token_sai_pela_faixa_de_token() -> None:
+    oauth = cria_oauth()
+    relatorio = BancoFicticio(oauth=oauth, priority=BULK)
+    oauth.token_session.post = MagicMock(
+        return_value=make_response(200, {'access_token': 'tok', 'expires_in': 3600})
+    )
+    relatorio.session.request = MagicMock(return_value=make_response(200, {}))
+    relatorio.session.post = MagicMock()
+
+    relatorio.consultar_cob('tx1')
+
+    oauth.token_session.post.assert_called_once()
+    relatorio.session.post.assert_not_called()
+    assert relatorio.session.request.call_args.kwargs['headers']['Authorization'] == (
+        'Bearer tok'
+    )
+
+
+def test_pool_tomado_pelo_lote_nao_bloqueia_o_checkout() -> None:
+    oauth = cria_oauth()
+    with servidor_http1() as url:
+        relatorio = BancoFicticio(
+            base_url=url,
+            oauth=oauth,
+            sandbox_mode=True,
+            priority=BULK,
+            pool=PoolConfig(pool_maxsize=1, pool_block=True),
+        )
+        checkout = BancoFicticio(
+            base_url=url, oauth=oauth, sandbox_mode=True, priority=CRITICAL
+        )
+        relatorio.consultar_cob('tx1')
+        # A única conexão do lote fica presa numa "exportação" em andamento
+        pools = relatorio.session.get_adapter(url).poolmanager.pools
+        (pool,) = [pools[chave] for chave in pools.keys()]
+        presa = pool._get_conn()
+        try:
+            inicio = time.perf_counter()
+            checkout.consultar_cob('tx1')
+            assert time.perf_counter() - inicio < 1.0
+        finally:
+            pool._put_conn(presa)
+
+
+def test_gauges_de_concorrencia_levam_a_faixa() -> None:
+    coletor = MetricsCollector()
+    coletor.clear_metrics()
+    relatorio = BancoFicticio(
+        oauth=cria_oauth(),
+        priority=BULK,
+        concurrency=ConcurrencyPolicy(initial_limit=2, backoff=0.5),
+    )
+    limitador = relatorio.concurrency_limiter
+
+    limitador.libera(limitador.adquire(), 0.1, overloaded=True)
+
+    assert coletor.gauges['concurrency.limit:{"bank": "748", "lane": "bulk"}'] == 1
+
+
+def test_close_fecha_as_sessoes_das_faixas() -> None:
+    oauth = cria_oauth()
+    BancoFicticio(oauth=oauth, priority=BULK)
+    sessoes = [oauth.session, oauth.lane_session(BULK), oauth.token_session]
+    for sessao in sessoes:
+        sessao.close = MagicMock()
+
+    oauth.close()
+
+    for sessao in sessoes:
+        sessao.close.assert_called_once()
+
+
+def test_cliente_assincrono_tem_faixas() -> None:
+    pytest.importorskip('httpx')
+    from pypix_api.auth.async_oauth2 import AsyncOAuth2Client
+    from pypix_api.banks.sicoob import AsyncSicoobPixAPI
+
+    oauth = AsyncOAuth2Client(token_url='https://auth.exemplo/token', sandbox_mode=True)
+    relatorio = AsyncSicoobPixAPI(oauth=oauth, sandbox_mode=True, priority=BULK)
+
+    assert relatorio.session is not oauth.session
+    assert oauth.token_session is not oauth.session
+    asyncio.run(oauth.aclose())
+    assert relatorio.session.is_closed
+    assert oauth.token_session.is_closed
@@ -0,0 +1,172 @@
+"""Testes do cache de ``SSLContext`` do mTLS."""
+
+import datetime
+import gc
+import ssl
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+import requests
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.serialization import pkcs12
+from cryptography.x509.oid import NameOID
+
+from pypix_api.auth.mtls import (
+    AdapterMtls,
+    contexto_pkcs12,
+    contextos_em_cache,
+    get_session_with_mtls,
+    get_ssl_context_with_mtls,
+)
+from tests.benchmarks.servidores import servidor_http1
+
+
+def gera_certificado(nome: str) -> tuple[ec.EllipticCurvePrivateKey, x509.Certificate]:
+    """Certificado autoassinado para ``nome``, válido por um dia."""
+    chave = ec.generate_private_key(ec.SECP256R1())
+    sujeito = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, nome)])
+    agora = datetime.datetime.now(datetime.timezone.utc)
+    certificado = (
+        x509.CertificateBuilder()
+        .subject_name(sujeito)
+        .issuer_name(sujeito)
+        .public_key(chave.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(agora - datetime.timedelta(minutes=1))
+        .not_valid_after(agora + datetime.timedelta(days=1))
+        .add_extension(x509.SubjectAlternativeName([x509.DNSName(nome)]), False)
+        .sign(chave, hashes.SHA256())
+    )
+    return chave, certificado
+
+
+def gera_pfx(nome: str, senha: bytes) -> bytes:
+    chave, certificado = gera_certificado(nome)
+    return pkcs12.serialize_key_and_certificates(
+        nome.encode(),
+        chave,
+        certificado,
+        None,
+        serialization.BestAvailableEncryption(senha),
+    )
+
+
+@pytest.fixture(scope='module')
+def pfx() -> bytes:
+    return gera_pfx('loja-1', b'senha')
+
+
+def adapter_de(session: requests.Session) -> AdapterMtls:
+    adapter = session.get_adapter('https://api.exemplo')
+    assert isinstance(adapter, AdapterMtls)
+    return adapter
+
+
+def test_clientes_com_o_mesmo_certificado_compartilham_o_contexto(
+    pfx: bytes, tmp_path: Path
+) -> None:
+    arquivo = tmp_path / 'loja.pfx'
+    arquivo.write_bytes(pfx)
+
+    primeira = get_session_with_mtls(cert_pfx=pfx, pwd_pfx='senha')
+    segunda = get_session_with_mtls(cert_pfx=str(arquivo), pwd_pfx='senha')
+
+    contexto = adapter_de(primeira).ssl_context
+    assert adapter_de(segunda).ssl_context is contexto
+    assert get_ssl_context_with_mtls(cert_pfx=pfx, pwd_pfx='senha') is contexto
+    # O bundle de CAs já vem carregado
+    assert contexto.cert_store_stats()['x509_ca'] > 0
+
+
+def test_certificados_diferentes_tem_contextos_diferentes(pfx: bytes) -> None:
+    outro = gera_pfx('loja-2', b'senha')
+
+    assert contexto_pkcs12(pfx, 'senha') is not contexto_pkcs12(outro, 'senha')
+
+
+def test_senha_errada_nao_entra_no_cache(pfx: bytes) -> None:
+    antes = contextos_em_cache()
+
+    with pytest.raises(ValueError):
+        contexto_pkcs12(pfx, 'errada')
+    assert contextos_em_cache() == antes
+
+
+def test_contexto_sai_do_cache_quando_ninguem_usa() -> None:
+    session = get_session_with_mtls(cert_pfx=gera_pfx('temporaria', b's'), pwd_pfx='s')
+    antes = contextos_em_cache()
+
+    session.close()
+    del session
+    gc.collect()
+
+    assert contextos_em_cache() == antes - 1
+
+
+def test_bundle_de_cas_nao_e_recarregado_a_cada_conexao(pfx: bytes) -> None:
+    adapter = adapter_de(get_session_with_mtls(cert_pfx=pfx, pwd_pfx='senha'))
+    pool = adapter.poolmanager.connection_from_url('https://api.exemplo')
+
+    adapter.cert_verify(pool, 'https://api.exemplo', True, None)
+
+    assert pool.cert_reqs == 'CERT_REQUIRED'
+    assert pool.ca_certs is None
+
+
+def test_verify_false_usa_um_adapter_proprio(pfx: bytes) -> None:
+    adapter = adapter_de(get_session_with_mtls(cert_pfx=pfx, pwd_pfx='senha'))
+    contexto = adapter.ssl_context
+
+    with servidor_http1() as url:
+        requisicao = requests.Request('GET', url).prepare()
+        resposta = adapter.send(requisicao, verify=False, timeout=5)
+
+    assert resposta.status_code == 200
+    assert adapter._proprio is not None
+    assert adapter._proprio.ssl_context is not contexto
+    assert contexto.check_hostname is True
+
+
+def test_servidor_fora_do_bundle_continua_recusado(pfx: bytes, tmp_path: Path) -> None:
+    chave, certificado = gera_certificado('localhost')
+    pem = tmp_path / 'servidor.pem'
+    pem.write_bytes(
+        certificado.public_bytes(serialization.Encoding.PEM)
+        + chave.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    contexto_servidor = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    contexto_servidor.load_cert_chain(pem)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    servidor = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    servidor.socket = contexto_servidor.wrap_socket(servidor.socket, server_side=True)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    url = f'https://localhost:{servidor.server_address[1]}'
+    try:
+        session = get_session_with_mtls(cert_pfx=pfx, pwd_pfx='senha')
+        compartilhado = session.get_adapter(url).ssl_context
+        cas = compartilhado.cert_store_stats()['x509_ca']
+        with pytest.raises(requests.exceptions.SSLError):
+            session.get(url, timeout=5)
+        # Com o certificado do servidor como bundle próprio, a conexão sai —
+        # sem que ele passe a valer no contexto dos outros clientes
+        assert session.get(url, timeout=5, verify=str(pem)).status_code == 200
+        assert compartilhado.cert_store_stats()['x509_ca'] == cas
+    finally:
+        servidor.shutdown()
+        servidor.server_close()
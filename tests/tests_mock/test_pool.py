@@ -0,0 +1,107 @@
+"""Testes do dimensionamento e das estatísticas do pool de conexões."""
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from pypix_api.auth.oauth2 import OAuth2Client
+from pypix_api.banks.sicoob import SicoobPixAPI
+from pypix_api.pool import PoolConfig, configura_pool, estatisticas_do_pool
+
+URL = 'https://api.sicoob.com.br/pix/api/v2'
+
+
+def pool_do_host(session: requests.Session, url: str = URL):
+    return session.get_adapter(url).poolmanager.connection_from_url(url)
+
+
+def test_configura_pool_redimensiona_o_adapter_existente() -> None:
+    session = requests.Session()
+    adapter = session.get_adapter(URL)
+
+    configura_pool(
+        session, PoolConfig(pool_connections=4, pool_maxsize=32, pool_block=True)
+    )
+
+    # O mesmo adapter — no mTLS, é ele que guarda o SSLContext
+    assert session.get_adapter(URL) is adapter
+    pool = pool_do_host(session)
+    assert pool.pool.maxsize == 32
+    assert pool.block is True
+    assert adapter.poolmanager.pools._maxsize == 4
+
+
+def test_keep_alive_desligado_pede_connection_close() -> None:
+    session = requests.Session()
+
+    configura_pool(session, PoolConfig(keep_alive=False))
+    assert session.headers['Connection'] == 'close'
+
+    configura_pool(session, PoolConfig())
+    assert 'Connection' not in session.headers
+
+
+@pytest.mark.parametrize('campo', ['pool_connections', 'pool_maxsize'])
+def test_pool_config_recusa_tamanho_nao_positivo(campo: str) -> None:
+    with pytest.raises(ValueError, match='positivos'):
+        PoolConfig(**{campo: 0})
+
+
+def test_estatisticas_contam_conexoes_em_uso_ociosas_e_criadas() -> None:
+    session = requests.Session()
+    configura_pool(session, PoolConfig(pool_maxsize=5))
+    pool = pool_do_host(session)
+
+    # Retirar do pool vazio cria a conexão (sem abrir socket)
+    primeira = pool._get_conn()
+    segunda = pool._get_conn()
+    stats = estatisticas_do_pool(session)
+    assert stats.em_uso == 2
+    assert stats.ociosas == 0
+    assert stats.conexoes_criadas == 2
+
+    pool._put_conn(primeira)
+    stats = estatisticas_do_pool(session)
+    assert stats.em_uso == 1
+    assert stats.ociosas == 1
+    assert stats.maxsize == 5
+    assert list(stats.por_host) == ['https://api.sicoob.com.br:443']
+
+    pool._put_conn(segunda)
+    assert estatisticas_do_pool(session).em_uso == 0
+
+
+def test_estatisticas_de_sessao_sem_pools() -> None:
+    stats = estatisticas_do_pool(requests.Session())
+    assert stats.conexoes_criadas == 0
+    assert stats.por_host == {}
+
+
+def test_estatisticas_de_sessao_que_nao_e_do_requests() -> None:
+    assert estatisticas_do_pool(object()).maxsize == 0
+
+
+def test_oauth2client_aplica_o_pool() -> None:
+    oauth = OAuth2Client(
+        token_url='https://auth.exemplo/token',
+        client_id='client',
+        sandbox_mode=True,
+        pool=PoolConfig(pool_maxsize=64),
+    )
+
+    assert pool_do_host(oauth.session).pool.maxsize == 64
+    assert oauth.pool_stats().maxsize == 64
+
+
+def test_banco_reconfigura_a_sessao_compartilhada() -> None:
+    oauth = MagicMock()
+    oauth.session = requests.Session()
+    oauth.client_id = 'client'
+
+    banco = SicoobPixAPI(oauth=oauth, pool=PoolConfig(pool_maxsize=48, pool_block=True))
+
+    pool = pool_do_host(oauth.session)
+    assert pool.pool.maxsize == 48
+    assert pool.block is True
+    assert banco.pool_stats().maxsize == 48
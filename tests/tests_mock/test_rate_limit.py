@@ -0,0 +1,176 @@
+"""Testes do limitador de taxa por banco e recurso."""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from pypix_api.auth.oauth2 import OAuth2Client
+from pypix_api.rate_limit import RateLimit, RateLimiter, TokenBucket
+from tests.conftest import BancoFicticio, Relogio, make_response
+
+pytestmark = pytest.mark.relogio('pypix_api.rate_limit')
+
+
+def cria_api(limitador: RateLimiter) -> BancoFicticio:
+    oauth = OAuth2Client(token_url=BancoFicticio.TOKEN_URL, sandbox_mode=True)
+    oauth.session = MagicMock()
+    oauth.session.request.return_value = make_response(200, {'ok': True})
+    return BancoFicticio(oauth=oauth, sandbox_mode=True, rate_limiter=limitador)
+
+
+def test_rajada_sai_na_hora_e_o_excedente_espera_em_fila(relogio: Relogio) -> None:
+    balde = TokenBucket(RateLimit(rate=2, burst=3))
+
+    esperas = [balde.reserva() for _ in range(5)]
+
+    assert esperas == [0.0, 0.0, 0.0, 0.5, 1.0]
+
+
+def test_balde_reabastece_com_o_tempo(relogio: Relogio) -> None:
+    balde = TokenBucket(RateLimit(rate=10, burst=1))
+
+    assert balde.reserva() == 0.0
+    relogio.agora += 0.1
+    assert balde.reserva() == 0.0
+    relogio.agora += 60
+    assert balde.reserva() == 0.0
+    # O balde não acumula além do burst
+    assert balde.reserva() == pytest.approx(0.1)
+
+
+def test_burst_padrao_e_um_segundo_de_cota() -> None:
+    assert RateLimit(rate=20).capacidade == 20
+    assert RateLimit(rate=0.5).capacidade == 1
+
+
+def test_limite_invalido() -> None:
+    with pytest.raises(ValueError, match='rate'):
+        RateLimit(rate=0)
+    with pytest.raises(ValueError, match='burst'):
+        RateLimit(rate=1, burst=0.5)
+
+
+def test_limite_mais_especifico_e_o_aplicado() -> None:
+    limitador = RateLimiter(
+        {
+            ('748', 'cob'): RateLimit(rate=1),
+            ('748', '*'): RateLimit(rate=2),
+            ('*', 'oauth'): RateLimit(rate=3),
+            ('*', '*'): RateLimit(rate=4),
+        }
+    )
+
+    assert limitador.balde('748', 'cob').limite.rate == 1
+    assert limitador.balde('748', 'pix').limite.rate == 2
+    assert limitador.balde('756', 'oauth').limite.rate == 3
+    assert limitador.balde('756', 'pix').limite.rate == 4
+    assert RateLimiter().balde('748', 'cob') is None
+
+
+def test_request_espera_a_vez_do_recurso(relogio: Relogio) -> None:
+    api = cria_api(RateLimiter({('748', 'cob'): RateLimit(rate=4, burst=1)}))
+
+    for _ in range(3):
+        api.consultar_cob('tx1')
+    api.consultar_pix_por_e2eid('e2e')  # recurso sem limite
+
+    # O relógio falso avança a cada espera: cada vaga fica 0.25s após a anterior
+    assert relogio.esperas == [0.25, 0.25]
+    assert api.session.request.call_count == 4
+
+
+def test_limitador_compartilhado_entre_clientes(relogio: Relogio) -> None:
+    limitador = RateLimiter({('748', '*'): RateLimit(rate=1, burst=1)})
+    a, b = cria_api(limitador), cria_api(limitador)
+
+    a.consultar_cob('tx1')
+    b.consultar_cob('tx1')
+
+    assert relogio.esperas == [1.0]
+
+
+def test_token_usa_o_recurso_oauth(relogio: Relogio) -> None:
+    limitador = RateLimiter({('748', 'oauth'): RateLimit(rate=1, burst=1)})
+    oauth = OAuth2Client(
+        token_url=BancoFicticio.TOKEN_URL, client_id='c', sandbox_mode=True
+    )
+    oauth.session = MagicMock()
+    oauth.session.post.return_value = make_response(
+        200, {'access_token': 'tok', 'expires_in': 3600}
+    )
+    BancoFicticio(oauth=oauth, rate_limiter=limitador)
+
+    assert oauth.bank_code == '748'
+    oauth.get_token('cob.read')
+    oauth.get_token('cob.read')  # cache: não consome cota
+    oauth.get_token('pix.read')
+
+    assert oauth.session.post.call_count == 2
+    assert relogio.esperas == [1.0]
+
+
+def test_limitador_proprio_do_oauth_nao_e_substituido() -> None:
+    proprio = RateLimiter()
+    oauth = OAuth2Client(
+        token_url=BancoFicticio.TOKEN_URL, sandbox_mode=True, rate_limiter=proprio
+    )
+
+    BancoFicticio(oauth=oauth, sandbox_mode=True, rate_limiter=RateLimiter())
+
+    assert oauth.rate_limiter is proprio
+
+
+def test_reservas_concorrentes_nao_perdem_fichas() -> None:
+    balde = TokenBucket(RateLimit(rate=1, burst=1))
+    esperas: list[float] = []
+    lock = threading.Lock()
+
+    def reserva() -> None:
+        espera = balde.reserva()
+        with lock:
+            esperas.append(espera)
+
+    threads = [threading.Thread(target=reserva) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Cada thread reservou uma vaga distinta na fila
+    assert sorted(round(e) for e in esperas) == list(range(20))
+
+
+def test_cliente_assincrono_espera_sem_bloquear(
+    monkeypatch: pytest.MonkeyPatch, relogio: Relogio
+) -> None:
+    httpx = pytest.importorskip('httpx')
+    from pypix_api.auth.async_oauth2 import AsyncOAuth2Client
+    from pypix_api.banks.sicoob import AsyncSicoobPixAPI
+
+    esperas: list[float] = []
+
+    async def dorme(segundos: float) -> None:
+        esperas.append(segundos)
+
+    monkeypatch.setattr(
+        'pypix_api.banks.async_base.asyncio', SimpleNamespace(sleep=dorme)
+    )
+    oauth = AsyncOAuth2Client(token_url='https://auth.exemplo/token', sandbox_mode=True)
+    oauth.session = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+    )
+    banco = AsyncSicoobPixAPI(
+        oauth=oauth,
+        sandbox_mode=True,
+        rate_limiter=RateLimiter({('756', 'cob'): RateLimit(rate=2, burst=1)}),
+    )
+
+    async def cenario() -> None:
+        await banco.consultar_cob('tx1')
+        await banco.consultar_cob('tx1')
+
+    asyncio.run(cenario())
+    assert esperas == [0.0, 0.5]
@@ -0,0 +1,195 @@
+"""Testes do registro de clientes por lojista (``ClientRegistry``)."""
+
+import threading
+import time
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from pypix_api.auth.oauth2 import OAuth2Client
+from pypix_api.banks.sicoob import SicoobPixAPI
+from pypix_api.metrics import MetricsCollector
+from pypix_api.registry import ClientRegistry
+from tests.conftest import Relogio
+
+pytestmark = pytest.mark.relogio('pypix_api.registry')
+
+
+class Cliente:
+    def __init__(self, tenant: str) -> None:
+        self.tenant = tenant
+        self.fechado = False
+
+    def close(self) -> None:
+        self.fechado = True
+
+
+def test_cria_no_primeiro_uso_e_reaproveita() -> None:
+    registro = ClientRegistry(Cliente)
+
+    primeiro = registro.get('loja-1')
+
+    assert registro.get('loja-1') is primeiro
+    assert registro.get('loja-2') is not primeiro
+    stats = registro.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 2, 2)
+    assert stats.hit_ratio == pytest.approx(1 / 3)
+
+
+def test_lru_retira_e_fecha_o_menos_recente() -> None:
+    registro = ClientRegistry(Cliente, max_clients=2)
+    a = registro.get('a')
+    b = registro.get('b')
+    registro.get('a')
+
+    registro.get('c')
+
+    assert list(registro) == ['a', 'c']
+    assert b.fechado
+    assert not a.fechado
+    assert registro.stats().evictions == 1
+
+
+def test_ttl_descarta_sem_uso(relogio: Relogio) -> None:
+    registro = ClientRegistry(Cliente, ttl=60)
+    antigo = registro.get('a')
+    ocioso = registro.get('b')
+
+    relogio.agora += 30
+    registro.get('a')
+    relogio.agora += 45
+
+    assert registro.get('a') is antigo
+    assert registro.expire() == 1
+    assert ocioso.fechado
+    assert 'b' not in registro
+
+    relogio.agora += 61
+    assert registro.get('a') is not antigo
+    assert antigo.fechado
+
+
+def test_evict_manual() -> None:
+    registro = ClientRegistry(Cliente)
+    cliente = registro.get('a')
+
+    assert registro.evict('a')
+    assert not registro.evict('a')
+    assert cliente.fechado
+
+
+def test_criacao_simultanea_cria_um_so_cliente() -> None:
+    liberado = threading.Event()
+    criados: list[str] = []
+
+    def fabrica(tenant: str) -> Cliente:
+        criados.append(tenant)
+        liberado.wait(5)
+        return Cliente(tenant)
+
+    registro = ClientRegistry(fabrica)
+    resultados: list[Any] = []
+    threads = [
+        threading.Thread(target=lambda: resultados.append(registro.get('a')))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    liberado.set()
+    for thread in threads:
+        thread.join()
+
+    assert criados == ['a']
+    assert len({id(r) for r in resultados}) == 1
+    stats = registro.stats()
+    assert (stats.hits, stats.misses) == (7, 1)
+
+
+def test_falha_da_fabrica_nao_entra_no_registro() -> None:
+    fabrica = MagicMock(side_effect=[ValueError('sem cadastro'), Cliente('a')])
+    registro = ClientRegistry(fabrica)
+
+    with pytest.raises(ValueError, match='sem cadastro'):
+        registro.get('a')
+    assert len(registro) == 0
+    assert registro.get('a').tenant == 'a'
+
+
+def test_metricas_no_collector() -> None:
+    coletor = MetricsCollector()
+    coletor.clear_metrics()
+    registro = ClientRegistry(Cliente, max_clients=1)
+
+    registro.get('a')
+    registro.get('a')
+    registro.get('b')
+
+    assert coletor.counters['client_registry.miss:{}'] == 2
+    assert coletor.counters['client_registry.hit:{}'] == 1
+    assert coletor.counters['client_registry.eviction:{"reason": "lru"}'] == 1
+
+
+def test_close_fecha_todos() -> None:
+    with ClientRegistry(Cliente) as registro:
+        clientes = [registro.get(t) for t in 'abc']
+
+    assert all(c.fechado for c in clientes)
+    assert len(registro) == 0
+
+
+def cria_banco(tenant: str) -> SicoobPixAPI:
+    oauth = OAuth2Client(
+        token_url=SicoobPixAPI.TOKEN_URL, client_id=tenant, sandbox_mode=True
+    )
+    oauth.session = MagicMock()
+    oauth.session.post.return_value.json.return_value = {
+        'access_token': f'token-{tenant}',
+        'expires_in': 600,
+    }
+    oauth.session.post.return_value.status_code = 200
+    return SicoobPixAPI(oauth=oauth)
+
+
+def test_keep_warm_renova_so_lojistas_ativos_perto_de_vencer(
+    relogio: Relogio,
+) -> None:
+    registro = ClientRegistry(cria_banco, hot_window=60, refresh_ahead=120)
+    ativo = registro.get('ativo')
+    frio = registro.get('frio')
+    folgado = registro.get('folgado')
+    for banco in (ativo, frio, folgado):
+        banco.oauth.get_token(banco._scopes_do_token())
+    escopo = ativo._scopes_do_token()
+    chave = ativo.oauth._chave_de_cache(escopo)
+    ativo.oauth.token_cache[chave]['expires_at'] = time.time() + 90
+    frio.oauth.token_cache[chave]['expires_at'] = time.time() + 90
+
+    relogio.agora += 120
+    registro.get('ativo')
+    registro.get('folgado')
+
+    assert registro.keep_warm() == 1
+    assert ativo.oauth.session.post.call_count == 2
+    assert ativo.oauth.token_ttl(escopo) > 500
+    assert frio.oauth.session.post.call_count == 1
+    assert folgado.oauth.session.post.call_count == 1
+
+
+def test_keep_warm_segue_apos_falha() -> None:
+    registro = ClientRegistry(cria_banco)
+    quebrado = registro.get('quebrado')
+    quebrado.oauth.session.post.side_effect = ConnectionError('fora do ar')
+    registro.get('ok')
+
+    assert registro.keep_warm() == 1
+
+
+def test_banco_close_fecha_a_sessao() -> None:
+    banco = cria_banco('a')
+
+    with banco:
+        pass
+
+    banco.session.close.assert_called_once_with()
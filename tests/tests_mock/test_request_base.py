@@ -543,3 +543,45 @@ def test_erro_sem_violacoes_nao_quebra() -> None:
 
     assert exc_info.value.violacoes == []
     assert 'Violações' not in str(exc_info.value)
+
+
+# --- Preparação da requisição -------------------------------------------------
+
+
+def test_headers_sao_montados_uma_vez_por_token() -> None:
+    api = cria_api()
+    api.session.request.return_value = make_response(200, {'ok': True})
+
+    api._request('GET', '/cob/tx1', extra_headers={'x-trace': '1'})
+    api._request('GET', '/cob/tx1')
+    primeiro, segundo = (
+        c.kwargs['headers'] for c in api.session.request.call_args_list
+    )
+
+    # Cada chamada recebe a sua cópia: o extra de uma não vaza para a outra
+    assert primeiro['x-trace'] == '1'
+    assert 'x-trace' not in segundo
+    assert primeiro is not segundo
+
+    api.oauth.get_token.return_value = 'token-novo'
+    api.consultar_cob('tx1')
+    assert api.session.request.call_args.kwargs['headers']['Authorization'] == (
+        'Bearer token-novo'
+    )
+
+
+def test_sandbox_le_o_token_uma_vez(monkeypatch: pytest.MonkeyPatch) -> None:
+    leituras: list[bool] = []
+    monkeypatch.setattr('dotenv.load_dotenv', lambda: leituras.append(True))
+    monkeypatch.setenv('SANDBOX_TOKEN', 'tok-sandbox')
+    oauth = MagicMock()
+    oauth.client_id = 'client-123'
+    api = BancoFicticio(oauth=oauth, sandbox_mode=True)
+    api.session.request.return_value = make_response(200, {'ok': True})
+
+    for _ in range(3):
+        api.consultar_cob('tx1')
+
+    assert leituras == [True]
+    headers = api.session.request.call_args.kwargs['headers']
+    assert headers['Authorization'] == 'Bearer tok-sandbox'
@@ -0,0 +1,238 @@
+"""Testes da repetição automática (``retry=RetryPolicy(...)``) do ``_request``."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+import requests
+
+from pypix_api.error_handling import ErrorRecovery
+from pypix_api.exceptions import (
+    PixConexaoException,
+    PixErroServicoIndisponivelException,
+    PixErroServidorException,
+    PixTimeoutException,
+)
+from pypix_api.retry import OrcamentoRetry, RetryPolicy, retry_after
+from tests.conftest import cria_api, make_response
+
+
+@pytest.fixture
+def esperas(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    # Troca o módulo ``time`` visto por base.py, e não ``time.sleep`` global,
+    # para não afetar as threads de fora do teste (ex.: flush de métricas).
+    registradas: list[float] = []
+    falso = SimpleNamespace(sleep=registradas.append, perf_counter=time.perf_counter)
+    monkeypatch.setattr('pypix_api.banks.base.time', falso)
+    return registradas
+
+
+def resposta(status: int, retry_after: str | None = None) -> requests.Response:
+    response = make_response(status, {'status': status})
+    if retry_after is not None:
+        response.headers['Retry-After'] = retry_after
+    return response
+
+
+def test_sem_politica_levanta_na_primeira_falha(esperas: list[float]) -> None:
+    api = cria_api()
+    api.session.request.return_value = resposta(503)
+
+    with pytest.raises(PixErroServicoIndisponivelException):
+        api.consultar_cob('tx1')
+    assert api.session.request.call_count == 1
+    assert esperas == []
+
+
+def test_get_repete_503_ate_o_sucesso(esperas: list[float]) -> None:
+    api = cria_api(retry=RetryPolicy(backoff_base=1.0))
+    api.session.request.side_effect = [
+        resposta(503),
+        resposta(502),
+        make_response(200, {'txid': 'tx1'}),
+    ]
+
+    assert api.consultar_cob('tx1') == {'txid': 'tx1'}
+    assert api.session.request.call_count == 3
+    assert len(esperas) == 2
+    # full jitter: sorteado entre 0 e base * 2**tentativa
+    assert 0 <= esperas[0] <= 1.0
+    assert 0 <= esperas[1] <= 2.0
+
+
+def test_timeout_e_conexao_sao_repetidos_no_get(esperas: list[float]) -> None:
+    api = cria_api(retry=RetryPolicy())
+    api.session.request.side_effect = [
+        requests.Timeout('lento'),
+        requests.ConnectionError('reset'),
+        make_response(200, {'txid': 'tx1'}),
+    ]
+
+    assert api.consultar_cob('tx1') == {'txid': 'tx1'}
+    assert len(esperas) == 2
+
+
+def test_esgota_as_tentativas_e_levanta_a_ultima_falha(esperas: list[float]) -> None:
+    api = cria_api(retry=RetryPolicy(max_retries=2))
+    api.session.request.side_effect = requests.Timeout('lento')
+
+    with pytest.raises(PixTimeoutException):
+        api.consultar_cob('tx1')
+    assert api.session.request.call_count == 3
+    assert len(esperas) == 2
+
+
+def test_put_cob_txid_e_repetido(esperas: list[float]) -> None:
+    api = cria_api(retry=RetryPolicy())
+    api.session.request.side_effect = [resposta(503), make_response(201, {})]
+
+    api.criar_cob('tx1', {'valor': {'original': '1.00'}})
+
+    assert api.session.request.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ('chamada', 'metodo'),
+    [
+        (lambda api: api.criar_cob_auto_txid({'valor': {}}), 'POST'),
+        (lambda api: api.revisar_cob('tx1', {'status': 'x'}), 'PATCH'),
+    ],
+)
+def test_post_e_patch_nunca_sao_repetidos(
+    esperas: list[float], chamada: Any, metodo: str
+) -> None:
+    api = cria_api(retry=RetryPolicy())
+    api.session.request.side_effect = requests.Timeout('lento')
+
+    with pytest.raises(PixTimeoutException):
+        chamada(api)
+    assert api.session.request.call_args.args[0] == metodo
+    assert api.session.request.call_count == 1
+    assert esperas == []
+
+
+def test_status_fora_da_politica_nao_e_repetido(esperas: list[float]) -> None:
+    api = cria_api(retry=RetryPolicy())
+    api.session.request.return_value = resposta(500)
+
+    with pytest.raises(PixErroServidorException):
+        api.consultar_cob('tx1')
+    assert api.session.request.call_count == 1
+
+
+def test_retry_after_em_segundos_substitui_o_backoff(esperas: list[float]) -> None:
+    api = cria_api(retry=RetryPolicy())
+    api.session.request.side_effect = [
+        resposta(429, retry_after='7'),
+        make_response(200, {}),
+    ]
+
+    api.consultar_cob('tx1')
+
+    assert esperas == [7.0]
+
+
+def test_retry_after_acima_do_maximo_devolve_a_falha(esperas: list[float]) -> None:
+    api = cria_api(retry=RetryPolicy(retry_after_max=30))
+    api.session.request.return_value = resposta(503, retry_after='120')
+
+    with pytest.raises(PixErroServicoIndisponivelException):
+        api.consultar_cob('tx1')
+    assert esperas == []
+
+
+def test_retry_after_em_data_http() -> None:
+    daqui_a_pouco = datetime.now(timezone.utc) + timedelta(seconds=30)
+    response = resposta(503, retry_after=format_datetime(daqui_a_pouco, usegmt=True))
+
+    assert 25 <= retry_after(response) <= 30
+    assert retry_after(resposta(503, retry_after='amanhã')) is None
+    assert retry_after(resposta(503)) is None
+
+
+def test_orcamento_limita_as_repeticoes(esperas: list[float]) -> None:
+    api = cria_api(retry=RetryPolicy(max_retries=5, budget_max=2, budget_ratio=0))
+    api.session.request.return_value = resposta(503)
+
+    with pytest.raises(PixErroServicoIndisponivelException):
+        api.consultar_cob('tx1')
+    with pytest.raises(PixErroServicoIndisponivelException):
+        api.consultar_cob('tx1')
+
+    # 2 repetições no orçamento: a primeira chamada gasta as duas, a segunda
+    # não repete.
+    assert api.session.request.call_count == 4
+    assert len(esperas) == 2
+
+
+def test_orcamento_e_reposto_pelas_requisicoes() -> None:
+    orcamento = OrcamentoRetry(RetryPolicy(budget_max=1, budget_ratio=0.5))
+
+    assert orcamento.saca()
+    assert not orcamento.saca()
+    orcamento.deposita()
+    orcamento.deposita()
+    assert orcamento.saca()
+    for _ in range(10):
+        orcamento.deposita()
+    assert orcamento.saldo == 1
+
+
+def test_politica_recusa_valores_negativos() -> None:
+    with pytest.raises(ValueError, match='max_retries'):
+        RetryPolicy(max_retries=-1)
+
+
+@pytest.mark.parametrize(
+    ('metodo', 'path', 'esperado'),
+    [
+        ('GET', '/cob/tx1', True),
+        ('PUT', '/cob/tx1', True),
+        ('PUT', '/cobv/tx1', True),
+        ('PUT', '/webhook/chave', True),
+        ('PUT', '/pix/e2e/devolucao/d1', True),
+        ('PUT', '/cob/tx1/outra', False),
+        ('POST', '/cob', False),
+        ('PATCH', '/cob/tx1', False),
+        ('DELETE', '/webhook/chave', False),
+    ],
+)
+def test_idempotencia(metodo: str, path: str, esperado: bool) -> None:
+    assert RetryPolicy().idempotente(metodo, path) is esperado
+
+
+def test_should_retry_reconhece_as_excecoes_da_biblioteca() -> None:
+    assert ErrorRecovery.should_retry(PixTimeoutException('lento'))
+    assert ErrorRecovery.should_retry(PixConexaoException('reset'))
+    assert ErrorRecovery.should_retry(PixErroServicoIndisponivelException(status=503))
+    assert not ErrorRecovery.should_retry(PixErroServidorException(status=500))
+
+
+def test_cliente_assincrono_repete_sem_bloquear(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    httpx = pytest.importorskip('httpx')
+    from pypix_api.auth.async_oauth2 import AsyncOAuth2Client
+    from pypix_api.banks.sicoob import AsyncSicoobPixAPI
+
+    esperas: list[float] = []
+
+    async def dorme(segundos: float) -> None:
+        esperas.append(segundos)
+
+    monkeypatch.setattr(
+        'pypix_api.banks.async_base.asyncio', SimpleNamespace(sleep=dorme)
+    )
+    respostas = iter([httpx.Response(503), httpx.Response(200, json={'txid': 'tx1'})])
+    oauth = AsyncOAuth2Client(token_url='https://auth.exemplo/token', sandbox_mode=True)
+    oauth.session = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: next(respostas))
+    )
+    banco = AsyncSicoobPixAPI(oauth=oauth, sandbox_mode=True, retry=RetryPolicy())
+
+    assert asyncio.run(banco.consultar_cob('tx1')) == {'txid': 'tx1'}
+    assert len(esperas) == 1
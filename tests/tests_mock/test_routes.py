@@ -0,0 +1,113 @@
+"""Testes da tabela de rotas compilada do ``openapi.yaml``."""
+
+import runpy
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from pypix_api._rotas_openapi import ROTAS_OPENAPI
+from pypix_api.banks.bb import BBPixAPI
+from pypix_api.banks.sicoob import SicoobPixAPI
+from pypix_api.banks.sicredi import AsyncSicrediPixAPI, SicrediPixAPI
+from pypix_api.routes import TabelaDeRotas, nome_da_operacao
+
+RAIZ = Path(__file__).resolve().parents[2]
+
+
+def cria_banco(classe: type) -> object:
+    oauth = MagicMock()
+    oauth.session = MagicMock()
+    oauth.client_id = 'client-123'
+    return classe(oauth=oauth, sandbox_mode=True)
+
+
+def test_modulo_gerado_esta_em_dia_com_o_openapi() -> None:
+    gerador = runpy.run_path(str(RAIZ / 'scripts' / 'gera_rotas.py'))
+
+    assert gerador['le_rotas'](RAIZ / 'openapi.yaml') == list(ROTAS_OPENAPI)
+
+
+@pytest.mark.parametrize(
+    ('metodo', 'modelo', 'nome'),
+    [
+        ('PUT', '/cob/{txid}', 'cob.item.put'),
+        ('GET', '/cob', 'cob.get'),
+        ('DELETE', '/loc/{id}/txid', 'loc.item.txid.delete'),
+        ('PUT', '/pix/{e2eid}/devolucao/{id}', 'pix.item.devolucao.item.put'),
+    ],
+)
+def test_nome_da_operacao(metodo: str, modelo: str, nome: str) -> None:
+    assert nome_da_operacao(metodo, modelo) == nome
+
+
+def test_nomes_sao_unicos() -> None:
+    tabela = TabelaDeRotas(lambda modelo: '')
+
+    assert len(tabela) == len(ROTAS_OPENAPI)
+    assert 'cob.item.put' in tabela
+
+
+@pytest.mark.parametrize(
+    ('metodo', 'path', 'nome'),
+    [
+        ('GET', '/cob/tx1', 'cob.item.get'),
+        ('POST', '/cob', 'cob.post'),
+        ('DELETE', '/locrec/42/idRec', 'locrec.item.idRec.delete'),
+        ('POST', '/cobr/tx1/retentativa/2025-01-01', 'cobr.item.retentativa.item.post'),
+    ],
+)
+def test_resolve_caminho_concreto(metodo: str, path: str, nome: str) -> None:
+    rota = SicrediPixAPI.rotas().resolve(metodo, path)
+
+    assert rota is not None
+    assert rota.nome == nome
+
+
+def test_fora_da_especificacao() -> None:
+    tabela = SicrediPixAPI.rotas()
+
+    assert tabela.resolve('GET', '/pix-bb') is None
+    assert tabela.resolve('DELETE', '/cob/tx1') is None
+    assert tabela.prefixo('/loc/1/txid/extra') is None
+
+
+def test_versao_do_banco_entra_no_modelo_da_url() -> None:
+    rotas = SicrediPixAPI.rotas()
+
+    assert rotas['cob.item.put'].url == '/v3/cob/{txid}'
+    assert rotas['cob.post'].url == '/v2/cob'
+    assert rotas['rec.item.get'].formata(idRec='r1') == '/v1/rec/r1'
+    assert SicoobPixAPI.rotas()['cob.item.put'].url == '/cob/{txid}'
+
+
+@pytest.mark.parametrize(
+    ('path', 'url'),
+    [('/cob/', '/v2/cob/'), ('/cob/tx1/', '/v3/cob/tx1/'), ('/rec/', '/v1/rec/')],
+)
+def test_barra_final_nao_muda_a_versao(path: str, url: str) -> None:
+    api = cria_banco(SicrediPixAPI)
+
+    assert api._endpoint_url(path) == f'https://api-pix-h.sicredi.com.br/api{url}'
+    assert SicrediPixAPI.rotas().resolve('GET', path) is not None
+
+
+def test_tabela_e_compilada_uma_vez_por_classe() -> None:
+    assert SicrediPixAPI.rotas() is SicrediPixAPI.rotas()
+    assert AsyncSicrediPixAPI.rotas() is not SicrediPixAPI.rotas()
+    assert SicoobPixAPI.rotas() is not SicrediPixAPI.rotas()
+
+
+def test_caminho_proprio_do_banco_usa_o_prefixo_do_banco() -> None:
+    api = cria_banco(SicrediPixAPI)
+
+    assert api._endpoint_url('/pix-bb') == (
+        'https://api-pix-h.sicredi.com.br/api/v2/pix-bb'
+    )
+
+
+def test_operacao_e_rotulo_de_baixa_cardinalidade() -> None:
+    api = cria_banco(BBPixAPI)
+
+    assert api.operacao('PUT', '/cob/abc') == 'cob.item.put'
+    assert api.operacao('GET', '/pix-bb/devolucoes') == 'pix-bb.get'
@@ -0,0 +1,154 @@
+"""Testes da coalescência de consultas idênticas (``single_flight=True``)."""
+
+import asyncio
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from pypix_api.exceptions import PixRecursoNaoEncontradoException
+from pypix_api.single_flight import SingleFlight, chave_da_consulta
+from tests import conftest
+from tests.conftest import BancoFicticio, make_response
+
+
+def cria_api(resposta: Any) -> tuple[BancoFicticio, threading.Event]:
+    """Banco cuja sessão segura cada requisição até o evento ser liberado."""
+    liberada = threading.Event()
+
+    def request(*args: Any, **kwargs: Any) -> Any:
+        liberada.wait(5)
+        return resposta
+
+    api = conftest.cria_api(single_flight=True)
+    api.session.request.side_effect = request
+    return api, liberada
+
+
+def em_paralelo(vezes: int, chamada: Any, liberada: threading.Event) -> list[Any]:
+    """Dispara ``chamada`` em ``vezes`` threads e libera a sessão depois."""
+    resultados: list[Any] = []
+    lock = threading.Lock()
+
+    def executa() -> None:
+        try:
+            resultado = chamada()
+        except Exception as exc:
+            resultado = exc
+        with lock:
+            resultados.append(resultado)
+
+    threads = [threading.Thread(target=executa) for _ in range(vezes)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    liberada.set()
+    for thread in threads:
+        thread.join()
+    return resultados
+
+
+def test_consultas_identicas_saem_uma_vez() -> None:
+    api, liberada = cria_api(make_response(200, {'txid': 'tx1'}))
+
+    resultados = em_paralelo(5, lambda: api.consultar_cob('tx1'), liberada)
+
+    assert resultados == [{'txid': 'tx1'}] * 5
+    assert api.session.request.call_count == 1
+    # Cada chamador decodifica o seu dicionário
+    assert len({id(r) for r in resultados}) == 5
+
+
+def test_erro_e_entregue_a_todos() -> None:
+    api, liberada = cria_api(make_response(404, {'detail': 'não existe'}))
+
+    resultados = em_paralelo(3, lambda: api.consultar_cob('tx1'), liberada)
+
+    assert all(isinstance(r, PixRecursoNaoEncontradoException) for r in resultados)
+    assert api.session.request.call_count == 1
+    # Cada thread levanta a sua exceção, encadeada à da consulta que saiu
+    assert len({id(r) for r in resultados}) == 3
+    (original,) = [r for r in resultados if r.__cause__ is None]
+    for erro in resultados:
+        assert str(erro) == str(original)
+        assert erro.status == original.status
+        assert erro.__cause__ in (None, original)
+
+
+def test_consultas_diferentes_nao_sao_coalescidas() -> None:
+    api, liberada = cria_api(make_response(200, {}))
+    txids = iter(['tx1', 'tx2', 'tx3'])
+    lock = threading.Lock()
+
+    def consulta() -> Any:
+        with lock:
+            txid = next(txids)
+        return api.consultar_cob(txid)
+
+    em_paralelo(3, consulta, liberada)
+
+    assert api.session.request.call_count == 3
+
+
+def test_nada_fica_em_cache() -> None:
+    api, liberada = cria_api(make_response(200, {'txid': 'tx1'}))
+    liberada.set()
+
+    api.consultar_cob('tx1')
+    api.consultar_cob('tx1')
+
+    assert api.session.request.call_count == 2
+
+
+def test_escrita_nunca_e_coalescida() -> None:
+    api, liberada = cria_api(make_response(201, {'txid': 'tx1'}))
+
+    em_paralelo(
+        2, lambda: api.criar_cob('tx1', {'valor': {'original': '1.00'}}), liberada
+    )
+
+    assert api.session.request.call_count == 2
+
+
+def test_chave_considera_params_e_headers() -> None:
+    base = chave_da_consulta('/cob', {'inicio': 'a', 'fim': 'b'}, None)
+
+    assert base == chave_da_consulta('/cob', {'fim': 'b', 'inicio': 'a'}, {})
+    assert base != chave_da_consulta('/cob', {'inicio': 'a', 'fim': 'c'}, None)
+    assert base != chave_da_consulta(
+        '/cob', {'inicio': 'a', 'fim': 'b'}, {'x-tenant': '1'}
+    )
+
+
+def test_executa_devolve_se_o_resultado_foi_compartilhado() -> None:
+    voos = SingleFlight()
+
+    assert voos.executa('k', lambda: 42) == (42, False)
+
+
+def test_cliente_assincrono_coalesce_e_isola_cancelamento() -> None:
+    httpx = pytest.importorskip('httpx')
+    from pypix_api.auth.async_oauth2 import AsyncOAuth2Client
+    from pypix_api.banks.sicoob import AsyncSicoobPixAPI
+
+    chamadas = 0
+
+    async def handler(request: Any) -> Any:
+        nonlocal chamadas
+        chamadas += 1
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={'txid': 'tx1'})
+
+    oauth = AsyncOAuth2Client(token_url='https://auth.exemplo/token', sandbox_mode=True)
+    oauth.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    banco = AsyncSicoobPixAPI(oauth=oauth, sandbox_mode=True, single_flight=True)
+
+    async def cenario() -> list[Any]:
+        tarefas = [asyncio.ensure_future(banco.consultar_cob('tx1')) for _ in range(4)]
+        await asyncio.sleep(0.01)
+        tarefas[0].cancel()
+        return await asyncio.gather(*tarefas[1:])
+
+    assert asyncio.run(cenario()) == [{'txid': 'tx1'}] * 3
+    assert chamadas == 1
@@ -0,0 +1,185 @@
+"""Testes dos endereços locais de saída (``PoolConfig.source_addresses``)."""
+
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+import requests
+
+from pypix_api.auth.oauth2 import OAuth2Client
+from pypix_api.pool import (
+    EnderecosDeOrigem,
+    PoolConfig,
+    abre_conexoes,
+    configura_pool,
+    estatisticas_do_pool,
+)
+from tests.conftest import Relogio
+
+ENDERECOS = ('127.0.0.2', '127.0.0.3')
+
+
+@contextmanager
+def servidor(origens: list[str], demora: float = 0.0) -> Iterator[str]:
+    """Servidor HTTP/1.1 com *keep-alive* que anota o IP de cada requisição."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self) -> None:
+            origens.append(self.client_address[0])
+            if demora and self.path.startswith('/lenta'):
+                time.sleep(demora)
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', '2')
+            self.end_headers()
+            self.wfile.write(b'{}')
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    http = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    http.daemon_threads = True
+    threading.Thread(target=http.serve_forever, daemon=True).start()
+    try:
+        yield f'http://127.0.0.1:{http.server_address[1]}'
+    finally:
+        http.shutdown()
+        http.server_close()
+
+
+def sessao(**kwargs: Any) -> requests.Session:
+    sessao = requests.Session()
+    configura_pool(sessao, PoolConfig(source_addresses=ENDERECOS, **kwargs))
+    return sessao
+
+
+@pytest.mark.parametrize(
+    ('kwargs', 'erro'),
+    [
+        ({'source_addresses': ()}, ValueError),
+        ({'source_addresses': ('10.0.0.300',)}, ValueError),
+        ({'source_addresses': ('10.0.0.1', '10.0.0.1')}, ValueError),
+        ({'source_addresses': '10.0.0.1'}, TypeError),
+        ({'source_balancing': 'random'}, ValueError),
+    ],
+)
+def test_config_invalida(kwargs: dict[str, Any], erro: type[Exception]) -> None:
+    with pytest.raises(erro):
+        PoolConfig(**kwargs)
+
+
+def test_config_normaliza_os_enderecos() -> None:
+    config = PoolConfig(source_addresses=['10.0.0.1', '::0001'])
+
+    assert config.source_addresses == ('10.0.0.1', '::1')
+
+
+def test_rodizio_alterna_os_enderecos() -> None:
+    origens: list[str] = []
+    with servidor(origens) as url:
+        cliente = sessao()
+        for _ in range(6):
+            cliente.get(f'{url}/cob/tx1').raise_for_status()
+        estatisticas = estatisticas_do_pool(cliente)
+
+    assert origens == [*ENDERECOS] * 3
+    assert estatisticas.por_endereco_local == {'127.0.0.2': 3, '127.0.0.3': 3}
+    # Uma conexão por endereço, reaproveitada a cada volta do rodízio
+    assert estatisticas.conexoes_criadas == 2
+    assert estatisticas.por_host[url].requisicoes == 6
+
+
+def test_menor_carga_evita_o_endereco_ocupado() -> None:
+    origens: list[str] = []
+    with servidor(origens, demora=0.5) as url:
+        cliente = sessao(source_balancing='least_load', pool_maxsize=4)
+        with ThreadPoolExecutor(1) as executor:
+            lenta = executor.submit(cliente.get, f'{url}/lenta')
+            while not origens:
+                time.sleep(0.01)
+            for _ in range(3):
+                cliente.get(f'{url}/cob/tx1').raise_for_status()
+            lenta.result().raise_for_status()
+
+    ocupado = origens[0]
+    assert origens[1:] == [e for e in ENDERECOS if e != ocupado] * 3
+
+
+def test_menor_carga_desempata_em_rodizio() -> None:
+    enderecos = EnderecosDeOrigem(ENDERECOS, 'least_load')
+
+    escolhidos = []
+    for _ in range(4):
+        escolhidos.append(enderecos.adquire())
+        enderecos.libera(escolhidos[-1])
+
+    assert escolhidos == [*ENDERECOS] * 2
+    assert enderecos.requisicoes == {'127.0.0.2': 2, '127.0.0.3': 2}
+    assert enderecos.em_andamento == {'127.0.0.2': 0, '127.0.0.3': 0}
+
+
+def test_warmup_distribui_as_conexoes() -> None:
+    origens: list[str] = []
+    with servidor(origens) as url:
+        cliente = sessao(pool_maxsize=4)
+        abertas = abre_conexoes(cliente, url, 4)
+        for _ in range(4):
+            cliente.get(f'{url}/cob/tx1').raise_for_status()
+        estatisticas = estatisticas_do_pool(cliente)
+
+    assert abertas == 4
+    assert estatisticas.conexoes_criadas == 4
+    assert sorted(origens) == sorted([*ENDERECOS] * 2)
+
+
+def test_com_max_idle_e_retry_on_reset() -> None:
+    origens: list[str] = []
+    with servidor(origens) as url:
+        cliente = sessao(max_idle=60.0, retry_on_reset=True)
+        for _ in range(4):
+            cliente.get(f'{url}/cob/tx1').raise_for_status()
+
+    assert origens == [*ENDERECOS] * 2
+
+
+@pytest.mark.relogio('pypix_api.pool')
+def test_ociosa_trocada_passa_pelo_max_idle(relogio: Relogio) -> None:
+    origens: list[str] = []
+    with servidor(origens) as url:
+        cliente = sessao(max_idle=50.0)
+        cliente.get(f'{url}/cob/tx1').raise_for_status()
+        relogio.agora += 40
+        cliente.get(f'{url}/cob/tx1').raise_for_status()
+        relogio.agora += 20
+        # Sai do pool a de 127.0.0.3, ociosa há 20 s, e é trocada pela de
+        # 127.0.0.2, ociosa há 60 s: essa é refeita
+        cliente.get(f'{url}/cob/tx1').raise_for_status()
+        estatisticas = estatisticas_do_pool(cliente)
+
+    assert origens == ['127.0.0.2', '127.0.0.3', '127.0.0.2']
+    assert estatisticas.recicladas == 1
+    assert estatisticas.conexoes_criadas == 3
+
+
+def test_oauth2client_com_urllib3() -> None:
+    origens: list[str] = []
+    with servidor(origens) as url:
+        oauth = OAuth2Client(
+            token_url=f'{url}/token',
+            sandbox_mode=True,
+            transport='urllib3',
+            pool=PoolConfig(source_addresses=ENDERECOS),
+        )
+        for _ in range(4):
+            oauth.session.request('GET', f'{url}/cob/tx1').raise_for_status()
+        estatisticas = oauth.pool_stats()
+
+    assert origens == [*ENDERECOS] * 2
+    assert estatisticas.por_endereco_local == {'127.0.0.2': 2, '127.0.0.3': 2}
@@ -0,0 +1,185 @@
+"""Testes da reciclagem de conexões ociosas e do reenvio após *reset*."""
+
+import socket
+import struct
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pytest
+import requests
+
+from pypix_api.pool import PoolConfig, configura_pool, estatisticas_do_pool
+from tests.benchmarks.servidores import servidor_http1
+from tests.conftest import Relogio
+
+RESPOSTA = (
+    b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n'
+    b'Content-Length: 12\r\n\r\n{"ok": true}'
+)
+
+
+pytestmark = pytest.mark.relogio('pypix_api.pool')
+
+
+def _le_requisicao(conexao: socket.socket) -> bool:
+    dados = b''
+    while b'\r\n\r\n' not in dados:
+        parte = conexao.recv(65536)
+        if not parte:
+            return False
+        dados += parte
+    cabecalho, _, corpo = dados.partition(b'\r\n\r\n')
+    for linha in cabecalho.split(b'\r\n'):
+        nome, _, valor = linha.partition(b':')
+        if nome.lower() == b'content-length':
+            faltam = int(valor) - len(corpo)
+            while faltam > 0:
+                faltam -= len(conexao.recv(faltam))
+    return True
+
+
+@contextmanager
+def servidor_que_derruba() -> Iterator[str]:
+    """Responde a primeira requisição de cada conexão e derruba (RST) a segunda.
+
+    Imita o balanceador que descartou a conexão ociosa sem avisar: o cliente
+    só descobre ao reaproveitá-la.
+    """
+    servidor = socket.create_server(('127.0.0.1', 0))
+    servidor.settimeout(0.2)
+    parar = threading.Event()
+
+    def atende(conexao: socket.socket) -> None:
+        with conexao:
+            if not _le_requisicao(conexao):
+                return
+            conexao.sendall(RESPOSTA)
+            if _le_requisicao(conexao):
+                conexao.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0)
+                )
+
+    def aceita() -> None:
+        while not parar.is_set():
+            try:
+                conexao, _ = servidor.accept()
+            except TimeoutError:
+                continue
+            threading.Thread(target=atende, args=(conexao,), daemon=True).start()
+
+    thread = threading.Thread(target=aceita, daemon=True)
+    thread.start()
+    try:
+        yield f'http://127.0.0.1:{servidor.getsockname()[1]}'
+    finally:
+        parar.set()
+        thread.join()
+        servidor.close()
+
+
+def sessao(**kwargs: object) -> requests.Session:
+    session = requests.Session()
+    configura_pool(session, PoolConfig(**kwargs))  # type: ignore[arg-type]
+    return session
+
+
+@pytest.mark.parametrize(
+    ('kwargs', 'mensagem'),
+    [
+        ({'max_idle': 0}, 'max_idle'),
+        ({'tcp_keepalive': 0.5}, 'tcp_keepalive'),
+    ],
+)
+def test_pool_config_invalido(kwargs: dict[str, float], mensagem: str) -> None:
+    with pytest.raises(ValueError, match=mensagem):
+        PoolConfig(**kwargs)
+
+
+def test_conexao_ociosa_alem_de_max_idle_e_reciclada(relogio: Relogio) -> None:
+    session = sessao(max_idle=30.0)
+    with servidor_http1() as url:
+        session.get(url)
+        relogio.agora += 29
+        session.get(url)
+        assert estatisticas_do_pool(session).conexoes_criadas == 1
+
+        relogio.agora += 31
+        session.get(url)
+
+    stats = estatisticas_do_pool(session)
+    assert stats.conexoes_criadas == 2
+    assert stats.recicladas == 1
+    assert stats.requisicoes == 3
+
+
+def test_sem_max_idle_a_conexao_e_reaproveitada(relogio: Relogio) -> None:
+    session = sessao()
+    with servidor_http1() as url:
+        session.get(url)
+        relogio.agora += 3600
+        session.get(url)
+
+    stats = estatisticas_do_pool(session)
+    assert stats.conexoes_criadas == 1
+    assert stats.recicladas == 0
+
+
+def test_get_em_conexao_derrubada_e_reenviado_uma_vez() -> None:
+    session = sessao(retry_on_reset=True)
+    with servidor_que_derruba() as url:
+        assert session.get(url).json() == {'ok': True}
+        assert session.get(url).json() == {'ok': True}
+
+    stats = estatisticas_do_pool(session)
+    assert stats.reenvios == 1
+    assert stats.conexoes_criadas == 2
+
+
+def test_post_em_conexao_derrubada_nao_e_reenviado() -> None:
+    session = sessao(retry_on_reset=True)
+    with servidor_que_derruba() as url:
+        session.get(url)
+        with pytest.raises(requests.ConnectionError):
+            session.post(url, json={'valor': '1.00'})
+
+    assert estatisticas_do_pool(session).reenvios == 0
+
+
+def test_sem_retry_on_reset_o_erro_chega_ao_chamador() -> None:
+    session = sessao()
+    with servidor_que_derruba() as url:
+        session.get(url)
+        with pytest.raises(requests.ConnectionError):
+            session.get(url)
+
+
+def test_tcp_keepalive_liga_as_sondas() -> None:
+    session = sessao(tcp_keepalive=30)
+    with servidor_http1() as url:
+        session.get(url)
+        pools = session.get_adapter(url).poolmanager.pools
+        (pool,) = [pools[chave] for chave in pools.keys()]
+        conexao = pool._get_conn()
+        try:
+            opcao = conexao.sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+            assert opcao != 0
+            if hasattr(socket, 'TCP_KEEPIDLE'):
+                ocioso = conexao.sock.getsockopt(
+                    socket.IPPROTO_TCP, socket.TCP_KEEPIDLE
+                )
+                assert ocioso == 30
+        finally:
+            pool._put_conn(conexao)
+
+
+def test_http2_usa_max_idle_como_keepalive_expiry() -> None:
+    pytest.importorskip('h2')
+    from pypix_api.http2 import Http2Session
+
+    session = Http2Session(pool=PoolConfig(max_idle=45.0))
+    try:
+        pool = session.client._transport._pool
+        assert pool._keepalive_expiry == 45.0
+    finally:
+        session.client.close()
@@ -0,0 +1,302 @@
+"""Testes dos corpos gerados em partes (``pypix_api.streaming_body``)."""
+
+import asyncio
+import gzip
+import json
+import threading
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from pypix_api.auth.oauth2 import OAuth2Client
+from pypix_api.compression import CompressionPolicy
+from pypix_api.exceptions import PixErroServicoIndisponivelException
+from pypix_api.metrics import MetricsCollector
+from pypix_api.retry import RetryPolicy
+from pypix_api.streaming_body import CorpoEmPartes, StreamingBody, em_partes
+from pypix_api.transport import TransportResponse, TransportSession
+from tests import conftest
+from tests.conftest import BancoFicticio, make_response
+
+
+class Cobrancas:
+    """Iterável que pode ser percorrido de novo, como um cursor reaberto."""
+
+    def __init__(self, quantidade: int) -> None:
+        self.quantidade = quantidade
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return cobrancas(self.quantidade)
+
+
+def cobranca(indice: int) -> dict[str, Any]:
+    return {
+        'calendario': {'dataDeVencimento': '2026-10-31'},
+        'txid': f'fatura{indice:020d}',
+        'devedor': {'cpf': '12345678909', 'nome': 'Fulano de Tal'},
+        'valor': {'original': '123.45'},
+        'chave': '7d9f0335-8dcc-4054-9bf9-0dbd61d36906',
+    }
+
+
+def cobrancas(quantidade: int) -> Iterator[dict[str, Any]]:
+    for indice in range(quantidade):
+        yield cobranca(indice)
+
+
+def lote(quantidade: int) -> dict[str, Any]:
+    return {'descricao': 'Outubro', 'cobsv': [cobranca(i) for i in range(quantidade)]}
+
+
+def cria_api(**kwargs: Any) -> BancoFicticio:
+    return conftest.cria_api(make_response(202, {'id': 'l1'}), **kwargs)
+
+
+def enviado(api: BancoFicticio, indice: int = -1) -> bytes:
+    """Corpo de uma chamada à sessão, como o ``requests`` o enviaria."""
+    partes = api.session.request.call_args_list[indice].kwargs['data']
+    assert isinstance(partes, CorpoEmPartes)
+    return b''.join(partes)
+
+
+def test_partes_formam_o_json_do_lote() -> None:
+    corpo = StreamingBody({'descricao': 'Outubro', 'cobsv': cobrancas(300)}, 4096)
+
+    partes = list(corpo.chunks())
+
+    assert len(partes) > 1
+    assert all(len(parte) >= 4096 for parte in partes[:-1])
+    assert json.loads(b''.join(partes)) == lote(300)
+
+
+def test_lista_vazia_e_campos_depois_da_lista() -> None:
+    corpo = StreamingBody({'cobsv': iter([]), 'descricao': 'fim'})
+
+    assert json.loads(b''.join(corpo.chunks())) == {'cobsv': [], 'descricao': 'fim'}
+
+
+@pytest.mark.parametrize(
+    ('estrutura', 'chunk_size'),
+    [({'cobsv': [cobranca(0)]}, 1024), ({'cobsv': cobrancas(1)}, 0)],
+)
+def test_corpo_invalido(estrutura: dict[str, Any], chunk_size: int) -> None:
+    with pytest.raises(ValueError):
+        StreamingBody(estrutura, chunk_size)
+
+
+def test_gerador_so_passa_uma_vez() -> None:
+    corpo = StreamingBody({'cobsv': cobrancas(2)})
+
+    b''.join(corpo.chunks())
+
+    assert not corpo.replayable
+    with pytest.raises(RuntimeError, match='uma passagem'):
+        corpo.chunks()
+
+
+def test_iteravel_reabrivel_passa_de_novo() -> None:
+    corpo = StreamingBody({'cobsv': Cobrancas(3)})
+
+    primeira = b''.join(corpo.chunks())
+
+    assert corpo.replayable
+    assert b''.join(corpo.chunks()) == primeira
+
+
+def test_em_partes_so_com_lista_sob_demanda() -> None:
+    assert em_partes(lote(1)) == lote(1)
+    assert em_partes(b'{}') == b'{}'
+    assert isinstance(em_partes({'cobsv': cobrancas(1)}), StreamingBody)
+
+
+@pytest.mark.parametrize('metodo', ['criar_lote_cobv', 'alterar_lote_cobv'])
+def test_metodos_enviam_em_partes(metodo: str) -> None:
+    api = cria_api()
+
+    getattr(api, metodo)('l1', {'descricao': 'Outubro', 'cobsv': cobrancas(50)})
+
+    chamada = api.session.request.call_args
+    assert 'json' not in chamada.kwargs
+    assert chamada.kwargs['headers']['Content-Type'] == 'application/json'
+    assert json.loads(enviado(api)) == lote(50)
+
+
+def test_itens_passam_pelo_json_codec() -> None:
+    codec = MagicMock()
+    codec.dumps.side_effect = lambda obj: json.dumps(obj).encode()
+    codec.loads.side_effect = json.loads
+    api = cria_api(json_codec=codec)
+
+    api.criar_lote_cobv('l1', {'descricao': 'Outubro', 'cobsv': cobrancas(3)})
+
+    assert json.loads(enviado(api)) == lote(3)
+    assert codec.dumps.call_count == 2 + 1 + 3
+
+
+def test_gerador_nao_e_repetido() -> None:
+    api = cria_api(retry=RetryPolicy(max_retries=3, backoff_base=0))
+    api.session.request.return_value = make_response(503, {'status': 503})
+
+    with pytest.raises(PixErroServicoIndisponivelException):
+        api.criar_lote_cobv('l1', {'descricao': 'Outubro', 'cobsv': cobrancas(5)})
+
+    assert api.session.request.call_count == 1
+
+
+def test_iteravel_reabrivel_e_repetido_com_o_mesmo_corpo() -> None:
+    api = cria_api(retry=RetryPolicy(max_retries=1, backoff_base=0))
+    api.session.request.side_effect = [
+        make_response(503, {'status': 503}),
+        make_response(202, {'id': 'l1'}),
+    ]
+
+    api.criar_lote_cobv('l1', {'descricao': 'Outubro', 'cobsv': Cobrancas(5)})
+
+    assert enviado(api, 0) == enviado(api, 1)
+    assert json.loads(enviado(api, 1)) == lote(5)
+
+
+def test_compressao_em_partes() -> None:
+    MetricsCollector().clear_metrics()
+    api = cria_api(compression=CompressionPolicy(min_size=10**9))
+
+    api.criar_lote_cobv('l1', {'descricao': 'Outubro', 'cobsv': cobrancas(200)})
+
+    headers = api.session.request.call_args.kwargs['headers']
+    comprimido = enviado(api)
+    original = gzip.decompress(comprimido)
+    assert headers['Content-Encoding'] == 'gzip'
+    assert json.loads(original) == lote(200)
+    tags = json.dumps({'bank': '748', 'operation': 'lotecobv.item.put'}, sort_keys=True)
+    contadores = MetricsCollector().counters
+    assert contadores[f'compression.request.uncompressed_bytes:{tags}'] == len(original)
+    assert contadores[f'compression.request.compressed_bytes:{tags}'] == len(comprimido)
+    MetricsCollector().clear_metrics()
+
+
+def test_transport_session_repassa_as_partes() -> None:
+    recebidos: list[Any] = []
+
+    class Transporte:
+        def send(self, method: str, url: str, headers: Any, body: Any, timeout: Any):
+            recebidos.append(b''.join(body))
+            return TransportResponse(202, {}, b'{"id": "l1"}')
+
+        def close(self) -> None:
+            pass
+
+    sessao = TransportSession(Transporte())
+
+    sessao.request('PUT', 'https://x/lotecobv/l1', data=iter([b'{"a":', b'1}']))
+
+    assert recebidos == [b'{"a":1}']
+
+
+@contextmanager
+def servidor_chunked(recebidos: list[dict[str, Any]]) -> Iterator[str]:
+    """Lê o corpo em *chunks* sem guardá-lo: só o tamanho e as pontas."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_PUT(self) -> None:
+            total = 0
+            inicio = fim = b''
+            while True:
+                tamanho = int(self.rfile.readline().strip(), 16)
+                if not tamanho:
+                    self.rfile.readline()
+                    break
+                parte = self.rfile.read(tamanho)
+                self.rfile.readline()
+                inicio = inicio or parte[:40]
+                fim = parte[-20:]
+                total += tamanho
+            recebidos.append(
+                {
+                    'transfer_encoding': self.headers.get('Transfer-Encoding'),
+                    'total': total,
+                    'inicio': inicio,
+                    'fim': fim,
+                }
+            )
+            self.send_response(202)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', '11')
+            self.end_headers()
+            self.wfile.write(b'{"id":"l1"}')
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    servidor = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    servidor.daemon_threads = True
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    try:
+        yield f'http://127.0.0.1:{servidor.server_address[1]}'
+    finally:
+        servidor.shutdown()
+        servidor.server_close()
+
+
+@pytest.mark.parametrize('transport', ['http1', 'urllib3'])
+def test_lote_grande_com_memoria_constante(transport: str) -> None:
+    recebidos: list[dict[str, Any]] = []
+    quantidade = 20_000
+    with servidor_chunked(recebidos) as url:
+        oauth = OAuth2Client(
+            token_url=f'{url}/token',
+            client_id='c',
+            sandbox_mode=True,
+            transport=transport,
+        )
+        banco = BancoFicticio(oauth=oauth, sandbox_mode=True, base_url=url)
+        banco.criar_lote_cobv('l0', {'descricao': 'aquece', 'cobsv': cobrancas(1)})
+
+        tracemalloc.start()
+        try:
+            resposta = banco.criar_lote_cobv(
+                'l1', {'descricao': 'Outubro', 'cobsv': cobrancas(quantidade)}
+            )
+            _, pico = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    assert resposta == {'id': 'l1'}
+    recebido = recebidos[-1]
+    assert recebido['transfer_encoding'] == 'chunked'
+    assert recebido['inicio'].startswith(b'{"descricao":"Outubro"')
+    assert recebido['fim'].endswith(b'}]}')
+    assert recebido['total'] > 4_000_000
+    # O lote inteiro passa de 4 MB; na memória, só uma parte de cada vez
+    assert pico < 1_000_000
+
+
+def test_cliente_assincrono_envia_em_partes() -> None:
+    httpx = pytest.importorskip('httpx')
+    from pypix_api.auth.async_oauth2 import AsyncOAuth2Client
+    from pypix_api.banks.sicoob import AsyncSicoobPixAPI
+
+    recebidos: list[Any] = []
+
+    async def responde(request: Any) -> Any:
+        await request.aread()
+        recebidos.append(request)
+        return httpx.Response(202, json={'id': 'l1'})
+
+    oauth = AsyncOAuth2Client(token_url='https://auth.exemplo/token', sandbox_mode=True)
+    oauth.session = httpx.AsyncClient(transport=httpx.MockTransport(responde))
+    banco = AsyncSicoobPixAPI(oauth=oauth, sandbox_mode=True)
+
+    asyncio.run(
+        banco.criar_lote_cobv('l1', {'descricao': 'Outubro', 'cobsv': cobrancas(100)})
+    )
+
+    (request,) = recebidos
+    assert request.headers['Transfer-Encoding'] == 'chunked'
+    assert json.loads(request.content) == lote(100)
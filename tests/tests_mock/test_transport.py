@@ -0,0 +1,277 @@
+"""Testes dos transportes plugáveis (``pypix_api.transport``)."""
+
+import json
+import socket
+import threading
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import pytest
+import requests
+from cryptography.hazmat.primitives import serialization
+
+from pypix_api.auth.mtls import contexto_pkcs12, get_ssl_context_with_mtls
+from pypix_api.auth.oauth2 import OAuth2Client
+from pypix_api.exceptions import (
+    PixConexaoException,
+    PixRecursoNaoEncontradoException,
+    PixTimeoutException,
+)
+from pypix_api.http import Timeout
+from pypix_api.pool import PoolConfig
+from pypix_api.transport import (
+    RequestsTransport,
+    TransportResponse,
+    TransportSession,
+    Urllib3Transport,
+)
+from tests.benchmarks.servidores import servidor_http1
+from tests.conftest import BancoFicticio
+from tests.tests_mock.test_mtls import gera_certificado, gera_pfx
+
+
+class Gravador:
+    """Transporte que guarda o que recebeu e devolve uma resposta pronta."""
+
+    def __init__(self, resposta: TransportResponse | None = None) -> None:
+        self.resposta = resposta or TransportResponse(
+            200, {'Content-Type': 'application/json'}, b'{"txid": "tx1"}', 'OK'
+        )
+        self.enviadas: list[dict[str, Any]] = []
+        self.fechado = False
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        body: bytes | None,
+        timeout: Timeout | None,
+    ) -> TransportResponse:
+        self.enviadas.append(
+            {
+                'method': method,
+                'url': url,
+                'headers': dict(headers),
+                'body': body,
+                'timeout': timeout,
+            }
+        )
+        return self.resposta
+
+    def close(self) -> None:
+        self.fechado = True
+
+
+def cria_banco(transport: Any, **kwargs: Any) -> BancoFicticio:
+    oauth = OAuth2Client(
+        token_url=BancoFicticio.TOKEN_URL,
+        client_id='c',
+        sandbox_mode=True,
+        transport=transport,
+    )
+    return BancoFicticio(oauth=oauth, sandbox_mode=True, **kwargs)
+
+
+@contextmanager
+def servidor_mudo() -> Iterator[str]:
+    """Aceita conexões e nunca responde."""
+    servidor = socket.create_server(('127.0.0.1', 0))
+    conexoes: list[socket.socket] = []
+
+    def aceita() -> None:
+        while True:
+            try:
+                conexoes.append(servidor.accept()[0])
+            except OSError:
+                return
+
+    threading.Thread(target=aceita, daemon=True).start()
+    try:
+        yield f'http://127.0.0.1:{servidor.getsockname()[1]}'
+    finally:
+        servidor.close()
+        for conexao in conexoes:
+            conexao.close()
+
+
+def test_transporte_desconhecido() -> None:
+    with pytest.raises(ValueError, match='Transporte desconhecido'):
+        OAuth2Client(token_url='https://t', sandbox_mode=True, transport=object())
+
+
+def test_transporte_proprio_recebe_a_requisicao_pronta() -> None:
+    gravador = Gravador()
+    banco = cria_banco(gravador)
+
+    banco.criar_cob('tx1', {'valor': {'original': '1.00'}})
+    banco.consultar_cob('tx1', revisao=3)
+
+    criacao, consulta = gravador.enviadas
+    assert criacao['method'] == 'PUT'
+    assert criacao['url'] == 'https://banco.exemplo/api/cob/tx1'
+    assert json.loads(criacao['body']) == {'valor': {'original': '1.00'}}
+    assert criacao['headers']['Content-Type'] == 'application/json'
+    assert criacao['headers']['Authorization'].startswith('Bearer ')
+    assert criacao['timeout'] == banco.timeout
+    assert consulta['url'] == 'https://banco.exemplo/api/cob/tx1?revisao=3'
+    assert consulta['body'] is None
+
+
+def test_sessao_codifica_como_o_requests() -> None:
+    gravador = Gravador()
+    sessao = TransportSession(gravador)
+
+    sessao.request(
+        'GET', 'https://x/cob?a=1', params={'b': ['1', '2'], 'c': None}, data=None
+    )
+    sessao.post('https://x/token', data={'grant_type': 'cc', 'client_id': None})
+
+    consulta, token = gravador.enviadas
+    assert consulta['url'] == 'https://x/cob?a=1&b=1&b=2'
+    assert consulta['headers']['User-Agent'].startswith('python-requests/')
+    assert token['body'] == b'grant_type=cc'
+    assert token['headers']['Content-Type'] == 'application/x-www-form-urlencoded'
+
+
+def test_sessao_recusa_argumentos_sem_equivalente() -> None:
+    with pytest.raises(TypeError, match='stream'):
+        TransportSession(Gravador()).request('GET', 'https://x', stream=True)
+
+
+def test_resposta_chega_como_requests_response() -> None:
+    gravador = Gravador(
+        TransportResponse(
+            404,
+            {'Content-Type': 'application/problem+json'},
+            json.dumps({'title': 'Não encontrada', 'detail': 'inexistente'}).encode(),
+        )
+    )
+    banco = cria_banco(gravador)
+
+    with pytest.raises(PixRecursoNaoEncontradoException, match='inexistente'):
+        banco.consultar_cob('tx1')
+
+
+def test_close_fecha_o_transporte() -> None:
+    gravador = Gravador()
+    banco = cria_banco(gravador)
+
+    banco.close()
+
+    assert gravador.fechado
+
+
+def test_requests_transport_tem_o_mesmo_resultado() -> None:
+    with servidor_http1() as url:
+        banco = cria_banco(RequestsTransport(), base_url=url)
+
+        assert banco.consultar_cob('tx1')['status'] == 'ATIVA'
+
+
+def test_urllib3_contra_servidor_local() -> None:
+    with servidor_http1() as url:
+        banco = cria_banco('urllib3', base_url=url, pool=PoolConfig(pool_maxsize=2))
+
+        assert banco.criar_cob('tx1', {'valor': {'original': '1.00'}})['txid']
+        assert banco.consultar_cob('tx1')['status'] == 'ATIVA'
+        estatisticas = banco.pool_stats()
+
+    assert isinstance(banco.session.transport, Urllib3Transport)
+    assert estatisticas.requisicoes == 2
+    assert estatisticas.conexoes_criadas == 1
+    assert estatisticas.maxsize == 2
+
+
+def test_urllib3_warmup_abre_conexoes() -> None:
+    with servidor_http1() as url:
+        banco = cria_banco('urllib3', base_url=url, pool=PoolConfig(pool_maxsize=4))
+
+        relatorio = banco.warmup(connections=3)
+        banco.consultar_cob('tx1')
+
+        assert relatorio.conexoes_api == 3
+        assert banco.pool_stats().conexoes_criadas == 3
+
+
+def test_urllib3_falha_de_conexao() -> None:
+    with servidor_http1() as url:
+        pass
+    banco = cria_banco('urllib3', base_url=url)
+
+    with pytest.raises(PixConexaoException):
+        banco.consultar_cob('tx1')
+
+
+def test_urllib3_timeout_de_leitura() -> None:
+    with servidor_mudo() as url:
+        banco = cria_banco('urllib3', base_url=url, timeout=(1.0, 0.05))
+
+        with pytest.raises(PixTimeoutException) as excinfo:
+            banco.consultar_cob('tx1')
+
+    assert isinstance(excinfo.value.__cause__, requests.ReadTimeout)
+
+
+def test_urllib3_keep_alive_desligado() -> None:
+    gravados: list[str] = []
+    with servidor_http1() as url:
+        transporte = Urllib3Transport(pool=PoolConfig(keep_alive=False))
+        original = transporte.poolmanager.request
+
+        def grava(method: str, url: str, **kwargs: Any) -> Any:
+            gravados.append(kwargs['headers']['Connection'])
+            return original(method, url, **kwargs)
+
+        transporte.poolmanager.request = grava
+        transporte.send('GET', f'{url}/cob/tx1', {}, None, 1.0)
+
+    assert gravados == ['close']
+
+
+def test_urllib3_com_mtls_pfx_usa_o_contexto_compartilhado() -> None:
+    pfx = gera_pfx('loja-urllib3', b'senha')
+
+    oauth = OAuth2Client(
+        token_url='https://t', cert_pfx=pfx, pwd_pfx='senha', transport='urllib3'
+    )
+
+    gerenciador = oauth.session.transport.poolmanager
+    assert gerenciador.connection_pool_kw['ssl_context'] is contexto_pkcs12(
+        pfx, 'senha'
+    )
+
+
+def test_urllib3_com_mtls_pem(tmp_path: Path) -> None:
+    chave, certificado = gera_certificado('loja-pem')
+    cert = tmp_path / 'cert.pem'
+    pvk = tmp_path / 'chave.pem'
+    cert.write_bytes(certificado.public_bytes(serialization.Encoding.PEM))
+    pvk.write_bytes(
+        chave.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+
+    oauth = OAuth2Client(
+        token_url='https://t', cert=str(cert), pvk=str(pvk), transport='urllib3'
+    )
+    faixa = oauth.lane_session('bulk', PoolConfig(pool_maxsize=3))
+
+    contexto = get_ssl_context_with_mtls(cert=str(cert), pvk=str(pvk))
+    for sessao in (oauth.session, faixa, oauth.token_session):
+        kw = sessao.transport.poolmanager.connection_pool_kw
+        assert kw['ssl_context'] is contexto
+    assert faixa.transport.poolmanager.connection_pool_kw['maxsize'] == 3
+
+
+def test_cliente_assincrono_recusa_transporte_sincrono() -> None:
+    pytest.importorskip('httpx')
+    from pypix_api.auth.async_oauth2 import AsyncOAuth2Client
+
+    with pytest.raises(ValueError, match='assíncrono'):
+        AsyncOAuth2Client(token_url='https://t', sandbox_mode=True, transport='urllib3')
@@ -0,0 +1,107 @@
+"""Testes do aquecimento de conexões e token (``warmup()``)."""
+
+import asyncio
+import socket
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from pypix_api.exceptions import PixConexaoException
+from pypix_api.pool import (
+    PoolConfig,
+    abre_conexoes,
+    configura_pool,
+    estatisticas_do_pool,
+)
+from tests.benchmarks.servidores import servidor_http1
+from tests.conftest import BancoFicticio
+
+
+def cria_api(base_url: str, token_url: str, session: Any = None) -> BancoFicticio:
+    oauth = MagicMock()
+    oauth.session = requests.Session() if session is None else session
+    oauth.token_session = oauth.session
+    oauth.client_id = 'client-123'
+    oauth.token_url = token_url
+    oauth.timeout = (1.0, 1.0)
+    oauth.get_token.return_value = 'token-abc'
+    return BancoFicticio(oauth=oauth, base_url=base_url)
+
+
+def porta_fechada() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def test_abre_conexoes_com_api_e_token_e_obtem_o_token() -> None:
+    with servidor_http1() as url:
+        # `localhost` e `127.0.0.1` são hosts — e pools — diferentes
+        token_url = url.replace('127.0.0.1', 'localhost') + '/oauth/token'
+        api = cria_api(url, token_url)
+
+        relatorio = api.warmup(connections=3)
+
+        assert relatorio.conexoes_api == 3
+        assert relatorio.conexoes_token == 1
+        assert list(relatorio.fases) == ['conexoes_api', 'conexoes_token', 'token']
+        assert relatorio.total == sum(relatorio.fases.values())
+        api.oauth.get_token.assert_called_once_with(api._scopes_do_token())
+        stats = api.pool_stats()
+        assert stats.ociosas == 4
+        assert stats.conexoes_criadas == 4
+
+        api.consultar_cob('tx1')
+        # A requisição reaproveitou uma conexão aquecida
+        assert api.pool_stats().conexoes_criadas == 4
+
+
+def test_conexoes_ja_abertas_nao_sao_refeitas() -> None:
+    with servidor_http1() as url:
+        session = requests.Session()
+
+        assert abre_conexoes(session, url, 2) == 2
+        assert abre_conexoes(session, url, 2) == 2
+        assert estatisticas_do_pool(session).conexoes_criadas == 2
+
+
+def test_limitado_ao_tamanho_do_pool() -> None:
+    with servidor_http1() as url:
+        session = requests.Session()
+        configura_pool(session, PoolConfig(pool_maxsize=2))
+
+        assert abre_conexoes(session, url, 5) == 2
+
+
+def test_falha_de_conexao_reprova_o_aquecimento() -> None:
+    url = f'http://127.0.0.1:{porta_fechada()}'
+    api = cria_api(url, f'{url}/oauth/token')
+
+    with pytest.raises(PixConexaoException, match=r'127\.0\.0\.1'):
+        api.warmup()
+    api.oauth.get_token.assert_not_called()
+
+
+def test_sessao_que_nao_e_do_requests_so_obtem_o_token() -> None:
+    api = cria_api('https://banco.exemplo', 'https://banco.exemplo/token', MagicMock())
+
+    relatorio = api.warmup(connections=4)
+
+    assert relatorio.conexoes_api == relatorio.conexoes_token == 0
+    api.oauth.get_token.assert_called_once()
+
+
+def test_cliente_assincrono_obtem_o_token() -> None:
+    pytest.importorskip('httpx')
+    from pypix_api.auth.async_oauth2 import AsyncOAuth2Client
+    from pypix_api.banks.sicoob import AsyncSicoobPixAPI
+
+    oauth = AsyncOAuth2Client(token_url='https://auth.exemplo/token', sandbox_mode=True)
+    banco = AsyncSicoobPixAPI(oauth=oauth, sandbox_mode=True)
+
+    relatorio = asyncio.run(banco.warmup())
+
+    assert list(relatorio.fases) == ['token']
+    assert relatorio.conexoes_api == 0